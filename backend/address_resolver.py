@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+한국 주소 정규화 + 행정구역 코드 매핑 엔진
+여러 분석기가 각자 하던 시도 정규식 순차 검사 / 행 단위 주소 파싱을 하나로 통합
+- 시도명·별칭 전체를 하나의 정규식 대안(alternation)으로 컴파일 → 주소당 한 번 검색
+- 시도 → 시군구 → 읍면동 이름(토큰) 트라이로 표준 이름과 법정동 코드(10자리) 결정
+- 주소 앞부분(행정구역 토큰)이 같으면 결과 재사용 (접두 메모이제이션)
+- pandas Series 단위 처리: 고유 접두만 한 번씩 해석한 뒤 코드 배열로 되돌려 배치
+
+시군구/읍면동 코드는 행정표준코드관리시스템의 '법정동코드 전체자료'(탭 구분 텍스트)를
+ADDRESS_CODE_TABLE_PATH 또는 data/legal_dong_codes.txt에서 읽는다. 파일이 없으면
+시도 코드만 매핑하고 시군구/읍면동은 이름 규칙으로 추출한다.
+"""
+
+import os
+import re
+import logging
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CODE_TABLE_PATH = os.path.join(os.path.dirname(__file__), 'data', 'legal_dong_codes.txt')
+
+# (법정동 시도 코드, 표준 명칭, 약칭, 별칭)
+SIDO_TABLE = [
+    ('11', '서울특별시', '서울', ('서울시', '서울')),
+    ('26', '부산광역시', '부산', ('부산시', '부산')),
+    ('27', '대구광역시', '대구', ('대구시', '대구')),
+    ('28', '인천광역시', '인천', ('인천시', '인천')),
+    ('29', '광주광역시', '광주', ('광주시', '광주')),
+    ('30', '대전광역시', '대전', ('대전시', '대전')),
+    ('31', '울산광역시', '울산', ('울산시', '울산')),
+    ('36', '세종특별자치시', '세종', ('세종시', '세종')),
+    ('41', '경기도', '경기', ('경기',)),
+    ('51', '강원특별자치도', '강원', ('강원도', '강원')),
+    ('43', '충청북도', '충북', ('충북',)),
+    ('44', '충청남도', '충남', ('충남',)),
+    ('52', '전북특별자치도', '전북', ('전라북도', '전북')),
+    ('46', '전라남도', '전남', ('전남',)),
+    ('47', '경상북도', '경북', ('경북',)),
+    ('48', '경상남도', '경남', ('경남',)),
+    ('50', '제주특별자치도', '제주', ('제주도', '제주')),
+]
+
+# 주소 앞 몇 개 토큰까지 행정구역으로 보는지 (시도 + 시 + 구 + 읍면동)
+PREFIX_TOKENS = 4
+
+_SIGUNGU_TOKEN = re.compile(r'^[가-힣]+(?:시|군|구)$')
+_EUPMYEONDONG_TOKEN = re.compile(r'^[가-힣0-9]+(?:읍|면|동|가)$')
+_PARENTHESES = re.compile(r'\([^)]*\)')
+
+
+class ResolvedAddress(NamedTuple):
+    sido: Optional[str]
+    sido_short: Optional[str]
+    sigungu: Optional[str]
+    eupmyeondong: Optional[str]
+    admin_code: Optional[str]   # 가장 하위로 확인된 구역의 법정동 코드 (10자리)
+    sido_code: Optional[str]    # 2자리
+    sigungu_code: Optional[str]  # 5자리
+
+
+EMPTY_RESULT = ResolvedAddress(None, None, None, None, None, None, None)
+RESULT_COLUMNS = list(ResolvedAddress._fields)
+
+
+class _Node:
+    """행정구역 트라이 노드 (자식은 토큰 → 노드)"""
+
+    __slots__ = ('name', 'level', 'code', 'children', 'parent')
+
+    def __init__(self, name: str, level: str, code: Optional[str] = None, parent: Optional['_Node'] = None):
+        self.name = name
+        self.level = level
+        self.code = code
+        self.children: Dict[str, '_Node'] = {}
+        self.parent = parent
+
+
+def _level_for_code(code: str) -> str:
+    if code[2:] == '00000000':
+        return 'sido'
+    if code[5:] == '00000':
+        return 'sigungu'
+    if code[8:] == '00':
+        return 'eupmyeondong'
+    return 'ri'
+
+
+class AddressResolver:
+    """주소 → 표준 행정구역 이름/코드"""
+
+    def __init__(self, code_table_path: Optional[str] = DEFAULT_CODE_TABLE_PATH, cache_size: int = 200000):
+        self.cache_size = cache_size
+        self._prefix_cache: Dict[str, ResolvedAddress] = {}
+        self.stats = {'resolved': 0, 'cache_hits': 0}
+
+        # 1. 시도 노드 + 별칭
+        self.root = _Node('', 'root')
+        self.sido_by_alias: Dict[str, _Node] = {}
+        self.sido_short: Dict[str, str] = {}
+        for code, name, short, aliases in SIDO_TABLE:
+            node = _Node(name, 'sido', code + '00000000', self.root)
+            self.root.children[name] = node
+            self.sido_short[name] = short
+            for alias in (name,) + aliases:
+                self.sido_by_alias[alias] = node
+
+        # 2. 시도 별칭 전체를 하나의 정규식으로 (긴 이름 우선, 한글 단어 경계)
+        alternation = '|'.join(re.escape(alias) for alias in sorted(self.sido_by_alias, key=len, reverse=True))
+        self.sido_pattern = re.compile(rf'(?<![가-힣])(?:{alternation})(?![가-힣])')
+
+        # 3. 시군구/읍면동 (코드표가 있으면)
+        self.sigungu_by_name: Dict[str, List[_Node]] = {}
+        self.has_code_table = False
+        path = os.environ.get('ADDRESS_CODE_TABLE_PATH', code_table_path)
+        if path and os.path.exists(path):
+            self.load_code_table(path)
+
+    # ------------------------------------------------------------------
+    # 코드표
+    # ------------------------------------------------------------------
+    def load_code_table(self, path: str):
+        """법정동코드 전체자료 읽기 (코드<TAB>명칭<TAB>폐지여부, cp949/utf-8)"""
+        rows = None
+        for encoding in ('utf-8-sig', 'cp949'):
+            try:
+                with open(path, encoding=encoding) as f:
+                    rows = [line.rstrip('\r\n').split('\t') for line in f]
+                break
+            except UnicodeDecodeError:
+                continue
+        if rows is None:
+            logger.warning(f"⚠️ 법정동 코드표 인코딩 인식 실패: {path}")
+            return
+
+        entries = []
+        for row in rows:
+            if len(row) < 2 or not row[0].isdigit() or len(row[0]) != 10:
+                continue  # 헤더/빈 줄
+            if len(row) >= 3 and row[2].strip() == '폐지':
+                continue
+            entries.append((row[0], row[1].split()))
+        # 상위 구역을 먼저 넣어야 하위 구역이 올바른 부모에 연결됨
+        entries.sort(key=lambda entry: len(entry[1]))
+
+        loaded = 0
+        for code, tokens in entries:
+            if self._insert(code, tokens):
+                loaded += 1
+        self.has_code_table = True
+        self._prefix_cache.clear()
+        logger.info(f"🗺️ 법정동 코드표 로드: {loaded:,}개 구역 ({path})")
+
+    def _insert(self, code: str, tokens: List[str]) -> bool:
+        if not tokens:
+            return False
+        sido = self.sido_by_alias.get(tokens[0])
+        if sido is None:
+            return False
+        level = _level_for_code(code)
+        if level == 'sido':
+            return True
+        node = sido
+        for token in tokens[1:-1]:
+            child = node.children.get(token)
+            if child is None:
+                # 중간 구역 행이 없는 경우 (예: 구가 없는 시의 행정구)
+                child = node.children[token] = _Node(token, 'sigungu', None, node)
+            node = child
+        leaf_name = tokens[-1]
+        leaf = node.children.get(leaf_name)
+        if leaf is None:
+            leaf = node.children[leaf_name] = _Node(leaf_name, level, code, node)
+        else:
+            leaf.level, leaf.code = level, code
+        if level == 'sigungu':
+            self.sigungu_by_name.setdefault(leaf_name, []).append(leaf)
+        return True
+
+    # ------------------------------------------------------------------
+    # 해석
+    # ------------------------------------------------------------------
+    @staticmethod
+    def address_prefix(address: str) -> str:
+        """행정구역 판단에 쓰는 주소 앞부분 (괄호 제거 후 앞 PREFIX_TOKENS개 토큰)"""
+        if '(' in address:
+            address = _PARENTHESES.sub(' ', address)
+        return ' '.join(address.split()[:PREFIX_TOKENS])
+
+    def resolve(self, address) -> ResolvedAddress:
+        """주소 하나 해석 (같은 접두는 캐시에서 반환)"""
+        if not isinstance(address, str) or not address.strip():
+            return EMPTY_RESULT
+        return self.resolve_prefix(self.address_prefix(address))
+
+    def resolve_prefix(self, prefix: str) -> ResolvedAddress:
+        cached = self._prefix_cache.get(prefix)
+        if cached is not None:
+            self.stats['cache_hits'] += 1
+            return cached
+        result = self._resolve_tokens(prefix)
+        if len(self._prefix_cache) >= self.cache_size:
+            self._prefix_cache.clear()
+        self._prefix_cache[prefix] = result
+        self.stats['resolved'] += 1
+        return result
+
+    def _resolve_tokens(self, prefix: str) -> ResolvedAddress:
+        tokens = prefix.split()
+        if not tokens:
+            return EMPTY_RESULT
+
+        # 1. 시도: 정규식 한 번으로 가장 앞의 시도명/별칭 찾기
+        match = self.sido_pattern.search(prefix)
+        if match:
+            node = self.sido_by_alias[match.group(0)]
+            start = len(prefix[:match.end()].split())
+        else:
+            # 시도 없이 시군구부터 시작하는 주소: 이름이 유일한 시군구면 채택
+            candidates = self.sigungu_by_name.get(tokens[0], [])
+            if len(candidates) != 1:
+                return self._fallback(None, tokens)
+            node = candidates[0]
+            start = 1
+
+        # 2. 트라이를 따라 시군구 → 읍면동
+        rest = tokens[start:]
+        for token in tokens[start:]:
+            child = node.children.get(token)
+            if child is None:
+                break
+            node = child
+            rest = rest[1:]
+
+        if not self.has_code_table or node.level == 'sido':
+            return self._fallback(node if node.level == 'sido' else self._sido_of(node), tokens[start:])
+        result = self._result(node)
+        if result.eupmyeondong is None and rest and _EUPMYEONDONG_TOKEN.match(rest[0]):
+            # 코드표에 없는 읍면동 (신설/행정동 이름): 이름만 채움
+            result = result._replace(eupmyeondong=rest[0])
+        return result
+
+    def _sido_of(self, node: _Node) -> _Node:
+        while node.level != 'sido':
+            node = node.parent
+        return node
+
+    def _result(self, node: _Node) -> ResolvedAddress:
+        """트라이 노드 → 결과 (상위 노드를 따라 올라가며 이름 조합)"""
+        sigungu_parts: List[str] = []
+        eupmyeondong = None
+        sigungu_code = None
+        cursor = node
+        while cursor.level != 'sido':
+            if cursor.level in ('eupmyeondong', 'ri'):
+                if cursor.level == 'eupmyeondong':
+                    eupmyeondong = cursor.name
+            else:
+                sigungu_parts.append(cursor.name)
+                if sigungu_code is None and cursor.code:
+                    sigungu_code = cursor.code[:5]
+            cursor = cursor.parent
+        sido = cursor
+        admin_code = node.code or (sigungu_code + '00000' if sigungu_code else sido.code)
+        return ResolvedAddress(
+            sido.name, self.sido_short[sido.name],
+            ' '.join(reversed(sigungu_parts)) or None, eupmyeondong,
+            admin_code, sido.code[:2], sigungu_code
+        )
+
+    def _fallback(self, sido: Optional[_Node], tokens: List[str]) -> ResolvedAddress:
+        """코드표에 없는 구역: 이름 규칙으로 시군구/읍면동 추출 (코드는 시도까지만)"""
+        sigungu_parts: List[str] = []
+        eupmyeondong = None
+        for token in tokens:
+            if eupmyeondong is None and not sigungu_parts and _SIGUNGU_TOKEN.match(token):
+                sigungu_parts.append(token)
+            elif sigungu_parts and len(sigungu_parts) == 1 and token.endswith('구') and _SIGUNGU_TOKEN.match(token):
+                sigungu_parts.append(token)  # 성남시 분당구
+            elif _EUPMYEONDONG_TOKEN.match(token):
+                eupmyeondong = token
+                break
+            elif sigungu_parts:
+                break
+        if sido is None and not sigungu_parts:
+            return EMPTY_RESULT
+        return ResolvedAddress(
+            sido.name if sido else None, self.sido_short[sido.name] if sido else None,
+            ' '.join(sigungu_parts) or None, eupmyeondong,
+            sido.code if sido else None, sido.code[:2] if sido else None, None
+        )
+
+    # ------------------------------------------------------------------
+    # 일괄 처리
+    # ------------------------------------------------------------------
+    def resolve_many(self, addresses: Iterable) -> List[ResolvedAddress]:
+        return [self.resolve(address) for address in addresses]
+
+    def resolve_series(self, addresses: 'pd.Series') -> 'pd.DataFrame':
+        """주소 Series → 결과 DataFrame (같은 인덱스, 컬럼: RESULT_COLUMNS)
+
+        접두 추출은 문자열 컬럼 연산으로 한 번에, 해석은 고유 접두마다 한 번만 수행한다.
+        """
+        if not PANDAS_AVAILABLE:
+            raise ImportError("pandas가 설치되어 있지 않습니다")
+        text = addresses.where(addresses.notna(), '').astype(str)
+        prefixes = (text.str.replace(_PARENTHESES, ' ', regex=True)
+                    .str.split().str[:PREFIX_TOKENS].str.join(' '))
+        codes, uniques = pd.factorize(prefixes)
+        resolved = pd.DataFrame([self.resolve_prefix(prefix) for prefix in uniques], columns=RESULT_COLUMNS)
+        if resolved.empty:
+            return pd.DataFrame(index=addresses.index, columns=RESULT_COLUMNS)
+        result = resolved.take(codes)
+        result.index = addresses.index
+        logger.info(f"📍 주소 {len(addresses):,}건 해석 (고유 접두 {len(uniques):,}개)")
+        return result
+
+    def get_stats(self) -> Dict:
+        return {**self.stats, 'cached_prefixes': len(self._prefix_cache),
+                'has_code_table': self.has_code_table}
+
+
+_default_resolver: Optional[AddressResolver] = None
+
+
+def get_address_resolver() -> AddressResolver:
+    """프로세스 공용 인스턴스 (코드표는 처음 한 번만 읽음)"""
+    global _default_resolver
+    if _default_resolver is None:
+        _default_resolver = AddressResolver()
+    return _default_resolver
@@ -6,6 +6,7 @@
 
 import sqlite3
 import json
+import time
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Set
@@ -17,13 +18,19 @@ import matplotlib.patches as mpatches
 from matplotlib.patches import FancyBboxPatch
 import numpy as np
 
+from connectivity_graph import ConnectivityGraph, rank_groups, take_excluding
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message)s')
 logger = logging.getLogger(__name__)
 
+# 정책 관심사 키워드 (의안명 포함 여부)
+POLICY_KEYWORDS = ("환경", "복지", "교육", "경제", "안전", "보건")
+
 class AdvancedConnectivityAnalyzer:
     def __init__(self, db_path: str = "data/legislative_data_standalone.db"):
         self.db_path = db_path
+        self.graph: Optional[ConnectivityGraph] = None  # 전체 의원 연결 그래프 (첫 분석 시 구축)
         self.init_database()
         
         # 연결성 유형별 색상 정의
@@ -100,36 +107,166 @@ class AdvancedConnectivityAnalyzer:
         conn.close()
         logger.info("고도화된 연결성 분석 데이터베이스 초기화 완료")
     
-    def analyze_politician_connectivity(self, politician_name: str) -> Dict:
-        """개별 정치인의 연결성 분석"""
+    def build_connectivity_graph(self) -> ConnectivityGraph:
+        """전체 의원 연결 그래프 구축
+        
+        의안/프로필을 한 번씩만 읽고 위원회·정당·지역·정책·날짜별 발의 건수를 메모리에서 집계한 뒤
+        의원별 6종 연결을 find_*_connections와 같은 규칙(상위 N명, 강도 계산)으로 만든다.
+        """
+        started = time.perf_counter()
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
         try:
-            # 1. 기본 입법 활동 데이터 수집
+            # 1. 전체 의안 (발의일 내림차순 - 의원별 의안 순서를 개별 조회와 동일하게 유지)
             cursor.execute('''
                 SELECT 
+                    b.rowid, b.proposer_name,
                     b.bill_id, b.bill_name, b.proposal_date, b.committee_name,
                     b.co_proposers, a.bill_category, a.policy_impact_score
                 FROM real_assembly_bills_22nd b
                 LEFT JOIN real_bill_analysis_22nd a ON b.bill_id = a.bill_id
-                WHERE b.proposer_name = ?
                 ORDER BY b.proposal_date DESC
-            ''', (politician_name,))
-            
-            bills = cursor.fetchall()
+            ''')
+            bill_rows = cursor.fetchall()
             
-            # 2. 의원 프로필 정보 수집
+            # 2. 전체 의원 프로필
             cursor.execute('''
-                SELECT party, district, committee, political_orientation
+                SELECT politician_name, party, district, committee, political_orientation
                 FROM politician_profiles
-                WHERE politician_name = ?
-            ''', (politician_name,))
+            ''')
+            profiles: Dict[str, Tuple] = {}
+            for name, *profile in cursor.fetchall():
+                profiles.setdefault(name, tuple(profile))
+        finally:
+            conn.close()
+        
+        # 3. 그룹별 발의 건수 집계 (의안 행당 1회)
+        bills_by_politician: Dict[str, List] = defaultdict(list)
+        bill_counts: Counter = Counter()
+        committee_counts: Dict[str, Counter] = defaultdict(Counter)
+        date_counts: Dict[str, Counter] = defaultdict(Counter)
+        keyword_counts: Dict[str, Counter] = defaultdict(Counter)
+        counted_rows: Set[int] = set()
+        
+        for rowid, proposer, *bill in bill_rows:
+            if not proposer:
+                continue
+            bills_by_politician[proposer].append(tuple(bill))
+            if rowid in counted_rows:
+                continue  # 분석 테이블 조인으로 중복된 행
+            counted_rows.add(rowid)
+            
+            bill_counts[proposer] += 1
+            bill_name, proposal_date, committee_name = bill[1] or "", bill[2], bill[3]
+            if committee_name:
+                committee_counts[committee_name][proposer] += 1
+            if proposal_date:
+                date_counts[proposal_date][proposer] += 1
+            for keyword in POLICY_KEYWORDS:
+                if keyword in bill_name:
+                    keyword_counts[keyword][proposer] += 1
+        
+        party_counts: Dict[str, Counter] = defaultdict(Counter)
+        district_counts: Dict[str, Counter] = defaultdict(Counter)
+        for name, count in bill_counts.items():
+            profile = profiles.get(name)
+            if not profile:
+                continue
+            if profile[0]:
+                party_counts[profile[0]][name] = count
+            if profile[1]:
+                district_counts[profile[1]][name] = count
+        
+        ranked_committees = rank_groups(committee_counts)
+        ranked_parties = rank_groups(party_counts)
+        ranked_dates = rank_groups(date_counts)
+        ranked_keywords = rank_groups(keyword_counts)
+        ranked_regions: Dict[str, List[tuple]] = {}  # 지역명 포함 매칭은 지역별로 한 번만 계산
+        
+        # 4. 의원별 연결 생성
+        graph = ConnectivityGraph()
+        for politician_name in sorted(set(bills_by_politician) | set(profiles)):
+            bills = bills_by_politician.get(politician_name, [])
+            profile = profiles.get(politician_name)
+            graph.node(politician_name, profile=profile, bill_count=bill_counts.get(politician_name, 0))
+            
+            connections = self.find_legislative_connections(politician_name, bills, None)
+            
+            if profile and profile[2]:
+                committee = profile[2]
+                for member, bill_count in take_excluding(ranked_committees.get(committee, ()), 10, politician_name):
+                    connections.append(self._group_connection(
+                        member, "위원회_연결", min(bill_count * 0.1, 1.0), f"같은 위원회: {committee}",
+                        {"committee": committee, "bill_count": bill_count, "connection_level": "위원회"}))
             
-            profile = cursor.fetchone()
+            if profile and profile[0]:
+                party = profile[0]
+                for member, bill_count in take_excluding(ranked_parties.get(party, ()), 10, politician_name):
+                    connections.append(self._group_connection(
+                        member, "정치적_연결", min(bill_count * 0.05, 1.0), f"같은 정당: {party}",
+                        {"party": party, "bill_count": bill_count, "connection_level": "정당"}))
             
-            # 3. 연결성 분석 수행
-            connections = self.find_connections(politician_name, bills, profile, cursor)
+            if profile and profile[1]:
+                district = profile[1]
+                if district not in ranked_regions:
+                    merged: Counter = Counter()
+                    for other_district, counts in district_counts.items():
+                        if district in other_district:
+                            merged.update(counts)
+                    ranked_regions[district] = rank_groups({district: merged})[district]
+                for member, bill_count in take_excluding(ranked_regions[district], 5, politician_name):
+                    connections.append(self._group_connection(
+                        member, "지역_연결", min(bill_count * 0.08, 1.0), f"같은 지역: {district}",
+                        {"district": district, "bill_count": bill_count, "connection_level": "지역"}))
+            
+            for keyword in self.extract_policy_keywords(bills)[:5]:
+                for member, bill_count in take_excluding(ranked_keywords.get(keyword, ()), 3, politician_name):
+                    connections.append(self._group_connection(
+                        member, "정책_연결", min(bill_count * 0.1, 1.0), f"유사 정책: {keyword}",
+                        {"policy_keyword": keyword, "bill_count": bill_count, "connection_level": "정책"}))
+            
+            proposal_dates = [bill[2] for bill in bills if bill[2]]
+            for date in proposal_dates[:5]:
+                for member, bill_count in take_excluding(ranked_dates.get(date, ()), 3, politician_name):
+                    connections.append(self._group_connection(
+                        member, "시간_연결", min(bill_count * 0.2, 1.0), f"동시기 활동: {date}",
+                        {"activity_date": date, "bill_count": bill_count, "connection_level": "시간"}))
+            
+            for connection in connections:
+                graph.add_connection(politician_name, connection["connected_to"],
+                                     connection["connection_strength"], connection)
+        
+        graph.finalize(started)
+        self.graph = graph
+        return graph
+    
+    def _group_connection(self, member: str, connection_type: str, strength: float,
+                          meaning: str, details: Dict) -> Dict:
+        """그룹(위원회/정당/지역/정책/시간) 연결 항목"""
+        return {
+            "connected_to": member,
+            "connection_type": connection_type,
+            "connection_strength": strength,
+            "connection_meaning": meaning,
+            "connection_details": details,
+            "target_type": "정치인"
+        }
+    
+    def get_connectivity_graph(self, refresh: bool = False) -> ConnectivityGraph:
+        """연결 그래프 반환 (없거나 refresh=True면 구축)"""
+        if self.graph is None or refresh:
+            self.build_connectivity_graph()
+        return self.graph
+    
+    def analyze_politician_connectivity(self, politician_name: str) -> Dict:
+        """개별 정치인의 연결성 분석 (사전 구축된 연결 그래프 조회)"""
+        try:
+            graph = self.get_connectivity_graph()
+            
+            # 1~3. 프로필/연결 조회
+            profile = graph.get_attributes(politician_name).get("profile")
+            connections = graph.get_connections(politician_name)
             
             # 4. 연결성 점수 계산
             connectivity_scores = self.calculate_connectivity_scores(connections)
@@ -150,6 +287,7 @@ class AdvancedConnectivityAnalyzer:
                 },
                 "connections": connections,
                 "scores": connectivity_scores,
+                "graph_centrality": graph.get_centrality(politician_name),
                 "main_connection_points": main_connection_points,
                 "network_data": network_data
             }
@@ -157,8 +295,6 @@ class AdvancedConnectivityAnalyzer:
         except Exception as e:
             logger.error(f"연결성 분석 실패 ({politician_name}): {e}")
             return {}
-        finally:
-            conn.close()
     
     def find_connections(self, politician_name: str, bills: List, profile: Tuple, cursor) -> List[Dict]:
         """연결 관계 찾기"""
@@ -437,18 +573,7 @@ class AdvancedConnectivityAnalyzer:
             bill_category = bill[5] if bill[5] else ""
             
             # 간단한 키워드 추출 (실제로는 더 정교한 NLP 필요)
-            if "환경" in bill_name:
-                keywords.append("환경")
-            if "복지" in bill_name:
-                keywords.append("복지")
-            if "교육" in bill_name:
-                keywords.append("교육")
-            if "경제" in bill_name:
-                keywords.append("경제")
-            if "안전" in bill_name:
-                keywords.append("안전")
-            if "보건" in bill_name:
-                keywords.append("보건")
+            keywords.extend(keyword for keyword in POLICY_KEYWORDS if keyword in bill_name)
         
         # 키워드 빈도 계산
         keyword_counts = Counter(keywords)
@@ -634,6 +759,9 @@ class AdvancedConnectivityAnalyzer:
         politicians = cursor.fetchall()
         logger.info(f"총 {len(politicians)}명 정치인의 연결성 분석 시작")
         
+        # 전체 연결 그래프를 한 번 구축한 뒤 의원별로 조회
+        self.get_connectivity_graph(refresh=True)
+        
         analyzed_count = 0
         
         for politician in politicians:
@@ -670,20 +798,22 @@ class AdvancedConnectivityAnalyzer:
                     ))
                     
                     # 개별 연결 관계 저장
-                    for conn in analysis_result["connections"]:
-                        cursor.execute('''
-                            INSERT INTO individual_connections (
-                                politician_name, connected_to, connection_type,
-                                connection_strength, connection_meaning, connection_details
-                            ) VALUES (?, ?, ?, ?, ?, ?)
-                        ''', (
+                    cursor.executemany('''
+                        INSERT INTO individual_connections (
+                            politician_name, connected_to, connection_type,
+                            connection_strength, connection_meaning, connection_details
+                        ) VALUES (?, ?, ?, ?, ?, ?)
+                    ''', [
+                        (
                             politician_name,
-                            conn["connected_to"],
-                            conn["connection_type"],
-                            conn["connection_strength"],
-                            conn["connection_meaning"],
-                            json.dumps(conn["connection_details"], ensure_ascii=False)
-                        ))
+                            connection["connected_to"],
+                            connection["connection_type"],
+                            connection["connection_strength"],
+                            connection["connection_meaning"],
+                            json.dumps(connection["connection_details"], ensure_ascii=False)
+                        )
+                        for connection in analysis_result["connections"]
+                    ])
                     
                     analyzed_count += 1
                     
@@ -6,6 +6,7 @@ NewsBot 경량 API 서버 - Render 배포 전용 (2025-09-17 강제 업데이트
 
 import os
 import json
+import time
 import logging
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -39,8 +40,11 @@ from bills_info_api import bills_api
 from naver_api_service import naver_api
 # from election_api_service import election_api  # 보류: 선거 개시 전 데이터 비공개
 
+from connectivity_graph import ConnectivityGraph
+
 # 전역 데이터 저장 (개별 API에서 관리)
 politicians_data = []
+connectivity_graph = ConnectivityGraph()
 bills_data = {}
 news_data = {}
 trend_data = {}
@@ -179,6 +183,44 @@ except Exception as e:
     logger.error(f"성능 최적화 시스템 초기화 실패: {e}")
     performance_optimizer = None
 
+def build_connectivity_graph():
+    """위원회 연결 그래프 구축 (정치인 데이터 로드 후 1회)"""
+    global connectivity_graph
+    
+    started = time.perf_counter()
+    graph = ConnectivityGraph()
+    
+    # 위원회별로 묶어 같은 위원회 안에서만 점수 계산
+    committees = {}
+    for politician in politicians_data:
+        name = politician.get('name')
+        if not name:
+            continue
+        graph.node(name, politician=politician)
+        committee = politician.get('committee', '')
+        if committee:
+            committees.setdefault(committee, []).append(politician)
+    
+    for committee, members in committees.items():
+        for target in members:
+            for politician in members:
+                if politician.get('name') == target.get('name'):
+                    continue
+                score = calculate_connectivity_score(target, politician)
+                graph.add_connection(target['name'], politician['name'], score / 100, {
+                    'name': politician.get('name'),
+                    'party': politician.get('party'),
+                    'district': politician.get('district'),
+                    'committee': politician.get('committee'),
+                    'connectivity_score': score,
+                    'is_same_party': politician.get('party') == target.get('party'),
+                    'connection_type': 'committee',
+                    'connection_reason': f"{committee} 동료"
+                })
+    
+    graph.finalize(started, sort_key=lambda connection: -connection['connectivity_score'])
+    connectivity_graph = graph
+
 # 서버 시작 시 데이터 로드
 load_politicians_data()
 load_bills_data()
@@ -213,6 +255,7 @@ async def reload_data():
         load_bills_data()
         load_news_data()
         load_trend_data()
+        build_connectivity_graph()
         
         # 샘플 정당 확인
         sample_parties = []
@@ -670,27 +713,18 @@ async def get_politician_trend(politician_name: str):
 
 @app.get("/api/connectivity/{politician_name}")
 async def get_politician_connectivity(politician_name: str):
-    """정치인 연결성 분석"""
+    """정치인 연결성 분석 (사전 구축된 연결 그래프 조회)"""
     try:
-        # 해당 정치인 정보 찾기
-        target_politician = None
-        for politician in politicians_data:
-            if politician.get('name') == politician_name:
-                target_politician = politician
-                break
-        
-        if not target_politician:
+        if politician_name not in connectivity_graph:
             return {
                 "success": False,
                 "error": "정치인을 찾을 수 없습니다"
             }
         
-        # 연결성 분석
-        connectivity_data = analyze_connectivity(target_politician, politicians_data)
-        
         return {
             "success": True,
-            "data": connectivity_data,
+            "data": analyze_connectivity(politician_name),
+            "centrality": connectivity_graph.get_centrality(politician_name),
             "politician": politician_name,
             "source": "연결성 분석 시스템"
         }
@@ -699,42 +733,9 @@ async def get_politician_connectivity(politician_name: str):
         logger.error(f"연결성 분석 오류: {e}")
         raise HTTPException(status_code=500, detail="연결성 분석 실패")
 
-def analyze_connectivity(target_politician, all_politicians):
-    """정치인 연결성 분석 함수"""
-    try:
-        connections = []
-        target_committee = target_politician.get('committee', '')
-        target_party = target_politician.get('party', '')
-        
-        if not target_committee:
-            return []
-        
-        # 같은 상임위원회 의원들 찾기
-        for politician in all_politicians:
-            if (politician.get('name') != target_politician.get('name') and 
-                politician.get('committee') == target_committee):
-                
-                # 연결성 점수 계산
-                score = calculate_connectivity_score(target_politician, politician)
-                
-                connections.append({
-                    'name': politician.get('name'),
-                    'party': politician.get('party'),
-                    'district': politician.get('district'),
-                    'committee': politician.get('committee'),
-                    'connectivity_score': score,
-                    'is_same_party': politician.get('party') == target_party,
-                    'connection_type': 'committee',
-                    'connection_reason': f"{target_committee} 동료"
-                })
-        
-        # 점수순으로 정렬하고 상위 8명 반환
-        connections.sort(key=lambda x: x['connectivity_score'], reverse=True)
-        return connections[:8]
-        
-    except Exception as e:
-        logger.error(f"연결성 분석 계산 오류: {e}")
-        return []
+def analyze_connectivity(politician_name, limit=8):
+    """정치인 연결성 분석 함수 (같은 상임위 동료 점수순 상위 limit명)"""
+    return connectivity_graph.get_connections(politician_name, limit=limit)
 
 def calculate_connectivity_score(politician1, politician2):
     """두 정치인 간의 연결성 점수 계산"""
@@ -765,6 +766,9 @@ def calculate_connectivity_score(politician1, politician2):
         logger.error(f"연결성 점수 계산 오류: {e}")
         return 70
 
+# 연결 그래프는 점수 함수 정의 후 구축
+build_connectivity_graph()
+
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
     
@@ -9,6 +9,7 @@ from politician_service import politician_service
 from politician_analyzer import politician_analyzer
 from rate_limiter import rate_limiter
 from monitoring import system_monitor
+from metrics import route_template
 from database import db
 from assembly_api_service import assembly_api
 from processed_assembly_service import processed_assembly_service
@@ -71,7 +72,7 @@ async def rate_limit_middleware(request: Request, call_next):
     
     # 응답 시간 기록
     response_time = time.time() - start_time
-    system_monitor.record_request(response_time, response.status_code)
+    system_monitor.record_request(response_time, response.status_code, route_template(request.scope), request.method)
     
     return response
 
@@ -301,8 +302,7 @@ async def get_rate_limit_stats():
 async def reset_rate_limits():
     """Rate Limiting 초기화 (관리자용)"""
     # 실제 운영에서는 인증이 필요
-    rate_limiter.blocked_ips.clear()
-    rate_limiter.ip_requests.clear()
+    rate_limiter.reset()
     return {
         "success": True,
         "message": "Rate limits have been reset",
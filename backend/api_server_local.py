@@ -9,6 +9,7 @@ from politician_service import politician_service
 from politician_analyzer import politician_analyzer
 from rate_limiter import rate_limiter
 from monitoring import system_monitor
+from metrics import route_template
 from database import db
 from local_politician_service import LocalPoliticianService
 from meeting_processor import MeetingProcessor
@@ -59,7 +60,7 @@ async def rate_limit_middleware(request: Request, call_next):
     
     # 처리 시간 기록
     process_time = time.time() - start_time
-    system_monitor.record_request(client_ip, request.url.path, response.status_code, process_time)
+    system_monitor.record_request(process_time, response.status_code, route_template(request.scope), request.method)
     
     return response
 
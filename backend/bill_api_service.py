@@ -13,6 +13,8 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import logging
 
+from cosponsor_matrix import CoSponsorshipMatrix
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -22,6 +24,7 @@ class BillAPIService:
         self.api_key = api_key
         self.base_url = "https://open.assembly.go.kr/portal/openapi/ALLBILL"
         self.db_path = "bills_connectivity.db"
+        self.cosponsor_matrix = CoSponsorshipMatrix()
         self.init_database()
         
     def init_database(self):
@@ -102,6 +105,12 @@ class BillAPIService:
             )
         ''')
         
+        # 쌍 단위 증분 갱신용 인덱스
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_connectivity_pair
+            ON connectivity_network (politician_a, politician_b, connection_type)
+        ''')
+        
         conn.commit()
         conn.close()
         logger.info("데이터베이스 초기화 완료")
@@ -201,67 +210,37 @@ class BillAPIService:
         conn.close()
         logger.info(f"{saved_count}개 의안 저장 완료")
     
-    def analyze_sponsorship_relationships(self):
-        """발의자 관계 분석"""
+    def analyze_sponsorship_relationships(self, incremental: bool = True):
+        """발의자 관계 분석 (의안×의원 희소 행렬, 새 의안만 증분 반영)
+        
+        incremental=False면 행렬을 새로 만들고 co_sponsor 연결을 전부 다시 기록한다.
+        """
+        full = not incremental or not self.cosponsor_matrix.bill_ids
+        if full:
+            self.cosponsor_matrix = CoSponsorshipMatrix()
+        
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
         # 의안별 발의자 정보 추출
         cursor.execute('''
-            SELECT bill_id, ppsr_nm, ppsr_knd, ppsl_dt
+            SELECT bill_id, ppsr_nm, ppsl_dt
             FROM bills 
             WHERE ppsr_nm IS NOT NULL AND ppsr_nm != ''
-            ORDER BY ppsl_dt DESC
         ''')
         
-        bills_data = cursor.fetchall()
-        
-        # 발의자 관계 분석
-        relationships = {}
+        new_bills = self.cosponsor_matrix.add_bills(
+            (bill_id, self._parse_sponsors(ppsr_nm), ppsl_dt)
+            for bill_id, ppsr_nm, ppsl_dt in cursor.fetchall()
+        )
         
-        for bill_id, ppsr_nm, ppsr_knd, ppsl_dt in bills_data:
-            if not ppsr_nm or ppsr_nm == '':
-                continue
-                
-            # 발의자 이름 파싱 (여러 명일 수 있음)
-            sponsors = self._parse_sponsors(ppsr_nm)
-            
-            if len(sponsors) > 1:
-                # 공동발의 관계 구축
-                for i, sponsor_a in enumerate(sponsors):
-                    for j, sponsor_b in enumerate(sponsors):
-                        if i != j:
-                            key = tuple(sorted([sponsor_a, sponsor_b]))
-                            if key not in relationships:
-                                relationships[key] = {
-                                    'count': 0,
-                                    'last_date': ppsl_dt,
-                                    'bills': []
-                                }
-                            relationships[key]['count'] += 1
-                            relationships[key]['last_date'] = max(
-                                relationships[key]['last_date'], ppsl_dt
-                            )
-                            relationships[key]['bills'].append(bill_id)
-        
-        # 연결성 네트워크 테이블에 저장
-        cursor.execute('DELETE FROM connectivity_network WHERE connection_type = "co_sponsor"')
-        
-        for (politician_a, politician_b), data in relationships.items():
-            cursor.execute('''
-                INSERT INTO connectivity_network (
-                    politician_a, politician_b, connection_strength, 
-                    connection_type, bill_count, last_collaboration
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                politician_a, politician_b, data['count'],
-                'co_sponsor', data['count'], data['last_date']
-            ))
-        
-        conn.commit()
+        # 연결성 네트워크 테이블에 저장 (단일 트랜잭션)
+        written = self.cosponsor_matrix.write_to_db(conn, full=full)
         conn.close()
         
-        logger.info(f"{len(relationships)}개 발의자 관계 분석 완료")
+        relationships = self.cosponsor_matrix.relationships()
+        logger.info(f"{len(relationships)}개 발의자 관계 분석 완료 "
+                    f"(공동발의 의안 {new_bills}건 반영, {written}행 기록)")
         return relationships
     
     def _parse_sponsors(self, ppsr_nm: str) -> List[str]:
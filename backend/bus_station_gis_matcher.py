@@ -19,12 +19,61 @@ import os
 import numpy as np
 import math
 
+from address_resolver import get_address_resolver
+from spatial_index import DongSpatialIndex, PointIndex, haversine_m
+
 logger = logging.getLogger(__name__)
 
 class BusStationGISMatcher:
+    # 주요 도시 중심 좌표 (대략적)
+    CITY_CENTERS = {
+        '서울특별시': {'lat': 37.5665, 'lng': 126.9780, 'radius': 0.3},
+        '부산광역시': {'lat': 35.1796, 'lng': 129.0756, 'radius': 0.3},
+        '대구광역시': {'lat': 35.8714, 'lng': 128.6014, 'radius': 0.2},
+        '인천광역시': {'lat': 37.4563, 'lng': 126.7052, 'radius': 0.3},
+        '광주광역시': {'lat': 35.1595, 'lng': 126.8526, 'radius': 0.2},
+        '대전광역시': {'lat': 36.3504, 'lng': 127.3845, 'radius': 0.2},
+        '울산광역시': {'lat': 35.5384, 'lng': 129.3114, 'radius': 0.2},
+        '경기도': {'lat': 37.4138, 'lng': 127.5183, 'radius': 1.0},
+        '강원특별자치도': {'lat': 37.8228, 'lng': 128.1555, 'radius': 1.5},
+        '충청북도': {'lat': 36.6357, 'lng': 127.4917, 'radius': 0.8},
+        '충청남도': {'lat': 36.5184, 'lng': 126.8000, 'radius': 0.8},
+        '전라북도': {'lat': 35.7175, 'lng': 127.1530, 'radius': 0.8},
+        '전라남도': {'lat': 34.8679, 'lng': 126.9910, 'radius': 1.0},
+        '경상북도': {'lat': 36.4919, 'lng': 128.8889, 'radius': 1.2},
+        '경상남도': {'lat': 35.4606, 'lng': 128.2132, 'radius': 1.0},
+        '제주특별자치도': {'lat': 33.4996, 'lng': 126.5312, 'radius': 0.3}
+    }
+    
+    # 서울 주요 구 중심 좌표
+    SEOUL_DISTRICTS = {
+        '강남구': {'lat': 37.5172, 'lng': 127.0473},
+        '서초구': {'lat': 37.4837, 'lng': 127.0324},
+        '송파구': {'lat': 37.5145, 'lng': 127.1059},
+        '강동구': {'lat': 37.5301, 'lng': 127.1238},
+        '마포구': {'lat': 37.5664, 'lng': 126.9018},
+        '영등포구': {'lat': 37.5264, 'lng': 126.8962},
+        '용산구': {'lat': 37.5326, 'lng': 126.9910},
+        '중구': {'lat': 37.5641, 'lng': 126.9979},
+        '종로구': {'lat': 37.5735, 'lng': 126.9788}
+    }
+    
+    # 부산 주요 구 중심 좌표
+    BUSAN_DISTRICTS = {
+        '해운대구': {'lat': 35.1631, 'lng': 129.1635},
+        '부산진구': {'lat': 35.1623, 'lng': 129.0531},
+        '동래구': {'lat': 35.2049, 'lng': 129.0837},
+        '남구': {'lat': 35.1365, 'lng': 129.0840},
+        '중구': {'lat': 35.1040, 'lng': 129.0324}
+    }
+    
     def __init__(self):
         self.downloads_dir = "/Users/hopidaay/Downloads"
         self.output_dir = "/Users/hopidaay/newsbot-kr/backend"
+        self.address_resolver = get_address_resolver()
+        # 읍면동 경계/중심점 공간 색인 (로컬 파일이 있을 때, 처음 사용할 때 로드)
+        self._dong_index: Optional[DongSpatialIndex] = None
+        self._dong_index_loaded = False
         
         # 버스정류장 데이터 파일 경로
         self.bus_data_files = {
@@ -169,6 +218,13 @@ class BusStationGISMatcher:
             (valid_coords['longitude'] <= korea_bounds['lng_max'])
         ]
         
+        # 도시명 → 표준 시도/시군구/법정동 코드 (공용 주소 해석 엔진, 고유 도시명마다 한 번만 해석)
+        if 'city_name' in valid_coords.columns:
+            regions = self.address_resolver.resolve_series(valid_coords['city_name'])
+            valid_coords = valid_coords.assign(
+                sido=regions['sido'], sigungu=regions['sigungu'], admin_code=regions['admin_code']
+            )
+        
         logger.info(f"✅ 표준화 완료: {len(valid_coords):,}개 유효 정류장")
         return valid_coords
 
@@ -190,34 +246,23 @@ class BusStationGISMatcher:
         
         return distance
 
-    def reverse_geocoding_sample(self, df: pd.DataFrame, sample_size: int = 100) -> Dict:
-        """샘플 역지오코딩 (위경도 → 주소)"""
-        logger.info(f"🗺️ 샘플 역지오코딩 시작 (샘플 크기: {sample_size})")
+    def reverse_geocoding_sample(self, df: pd.DataFrame, sample_size: Optional[int] = 100) -> Dict:
+        """샘플 역지오코딩 (위경도 → 주소), sample_size=None이면 전체 정류장"""
+        logger.info(f"🗺️ 샘플 역지오코딩 시작 (샘플 크기: {sample_size or '전체'})")
         
         # 랜덤 샘플 선택
-        if len(df) > sample_size:
+        if sample_size is not None and len(df) > sample_size:
             sample_df = df.sample(n=sample_size, random_state=42)
         else:
-            sample_df = df.copy()
+            sample_df = df
         
-        geocoded_results = []
-        
-        for idx, row in sample_df.iterrows():
-            lat, lng = row['latitude'], row['longitude']
-            
-            # 간단한 지역 추정 (실제 API 호출 대신)
-            estimated_region = self.estimate_region_by_coordinates(lat, lng)
-            
-            geocoded_results.append({
-                'station_id': row['station_id'],
-                'station_name': row['station_name'],
-                'latitude': lat,
-                'longitude': lng,
-                'estimated_sido': estimated_region['sido'],
-                'estimated_sigungu': estimated_region['sigungu'],
-                'estimated_dong': estimated_region['dong'],
-                'confidence': estimated_region['confidence']
-            })
+        # 공간 색인으로 전체 샘플을 한 번에 배정 (실제 API 호출 대신)
+        regions = self.assign_stations_to_regions(sample_df)
+        geocoded_df = pd.concat([
+            sample_df[['station_id', 'station_name', 'latitude', 'longitude']],
+            regions
+        ], axis=1)
+        geocoded_results = geocoded_df.to_dict('records')
         
         logger.info(f"✅ 샘플 역지오코딩 완료: {len(geocoded_results)}개")
         return {
@@ -226,76 +271,101 @@ class BusStationGISMatcher:
             'success_rate': len(geocoded_results) / len(sample_df) if len(sample_df) > 0 else 0
         }
 
+    def get_dong_index(self) -> Optional[DongSpatialIndex]:
+        """읍면동 공간 색인 (경계/중심점 파일이 없으면 None)"""
+        if not self._dong_index_loaded:
+            self._dong_index = DongSpatialIndex.load_default()
+            self._dong_index_loaded = True
+        return self._dong_index
+
+    def assign_stations_to_regions(self, df: pd.DataFrame) -> pd.DataFrame:
+        """정류장 전체를 한 번에 읍면동에 배정
+
+        읍면동 공간 색인이 있으면 최근접 중심점 + 경계 포함 검사로, 없으면 도시 중심 좌표 규칙으로 추정한다.
+        반환 컬럼: estimated_sido, estimated_sigungu, estimated_dong, adm_cd, confidence
+        """
+        lats = df['latitude'].to_numpy(dtype=float)
+        lngs = df['longitude'].to_numpy(dtype=float)
+        dong_index = self.get_dong_index()
+        if dong_index is None:
+            return self.estimate_regions_by_coordinates(lats, lngs).set_axis(df.index)
+
+        assignment = dong_index.assign(lats, lngs)
+        dongs = pd.DataFrame(dong_index.dongs).iloc[assignment['index']]
+        # 경계 안으로 확인되면 1.0, 중심점만으로 배정되면 거리에 따라 감소 (2km에서 0.5)
+        confidence = np.where(assignment['inside'], 1.0,
+                              np.clip(1.0 - assignment['distance_m'] / 4000, 0.5, 0.9))
+        return pd.DataFrame({
+            'estimated_sido': dongs['sido'].to_numpy(),
+            'estimated_sigungu': dongs['sigungu'].to_numpy(),
+            'estimated_dong': dongs['dong'].to_numpy(),
+            'adm_cd': dongs['adm_cd'].to_numpy(),
+            'confidence': confidence
+        }, index=df.index)
+
+    def estimate_regions_by_coordinates(self, lats: np.ndarray, lngs: np.ndarray) -> pd.DataFrame:
+        """좌표 기반 지역 추정 (간단한 규칙 기반, 배열 단위)"""
+        names = list(self.CITY_CENTERS)
+        center_lats = np.array([self.CITY_CENTERS[name]['lat'] for name in names])
+        center_lngs = np.array([self.CITY_CENTERS[name]['lng'] for name in names])
+        radius_km = np.array([self.CITY_CENTERS[name]['radius'] for name in names]) * 100
+
+        # (정류장 수 × 도시 수) 거리 행렬 한 번 계산 → 반경 내 최근접 도시
+        distance_km = haversine_m(lats[:, None], lngs[:, None], center_lats[None, :], center_lngs[None, :]) / 1000
+        within = distance_km <= radius_km[None, :]
+        masked = np.where(within, distance_km, np.inf)
+        best = masked.argmin(axis=1)
+        best_distance = masked[np.arange(len(lats)), best]
+        matched = np.isfinite(best_distance)
+
+        sido = np.where(matched, np.array(names, dtype=object)[best], '미확인')
+        confidence = np.where(matched, np.maximum(0.5, 1.0 - best_distance / radius_km[best]), 0.0)
+        sigungu = np.where(matched, np.char.add(sido.astype(str), ' 내 지역').astype(object), '미확인')
+        dong = np.where(matched, '추정 필요', '미확인').astype(object)
+
+        # 세부 지역 추정 (서울/부산 구 중심 최근접)
+        for city, districts in (('서울특별시', self.SEOUL_DISTRICTS), ('부산광역시', self.BUSAN_DISTRICTS)):
+            rows = np.nonzero(sido == city)[0]
+            if not len(rows):
+                continue
+            gu_names = np.array(list(districts), dtype=object)
+            gu_lats = np.array([districts[gu]['lat'] for gu in gu_names])
+            gu_lngs = np.array([districts[gu]['lng'] for gu in gu_names])
+            nearest_gu = gu_names[haversine_m(lats[rows, None], lngs[rows, None],
+                                              gu_lats[None, :], gu_lngs[None, :]).argmin(axis=1)]
+            sigungu[rows] = nearest_gu
+            dong[rows] = [f"{gu} 내 동" for gu in nearest_gu]
+            if city == '서울특별시':
+                # 동 추정 (간단한 규칙)
+                gangnam = rows[nearest_gu == '강남구']
+                dong[gangnam] = np.where(lngs[gangnam] > 127.03, '역삼동', '신사동')
+                junggu = rows[nearest_gu == '중구']
+                dong[junggu] = np.where(lats[junggu] > 37.56, '명동', '을지로동')
+
+        return pd.DataFrame({
+            'estimated_sido': sido,
+            'estimated_sigungu': sigungu,
+            'estimated_dong': dong,
+            'adm_cd': None,
+            'confidence': confidence
+        })
+
     def estimate_region_by_coordinates(self, lat: float, lng: float) -> Dict:
         """좌표 기반 지역 추정 (간단한 규칙 기반)"""
-        
-        # 주요 도시 중심 좌표 (대략적)
-        city_centers = {
-            '서울특별시': {'lat': 37.5665, 'lng': 126.9780, 'radius': 0.3},
-            '부산광역시': {'lat': 35.1796, 'lng': 129.0756, 'radius': 0.3},
-            '대구광역시': {'lat': 35.8714, 'lng': 128.6014, 'radius': 0.2},
-            '인천광역시': {'lat': 37.4563, 'lng': 126.7052, 'radius': 0.3},
-            '광주광역시': {'lat': 35.1595, 'lng': 126.8526, 'radius': 0.2},
-            '대전광역시': {'lat': 36.3504, 'lng': 127.3845, 'radius': 0.2},
-            '울산광역시': {'lat': 35.5384, 'lng': 129.3114, 'radius': 0.2},
-            '경기도': {'lat': 37.4138, 'lng': 127.5183, 'radius': 1.0},
-            '강원특별자치도': {'lat': 37.8228, 'lng': 128.1555, 'radius': 1.5},
-            '충청북도': {'lat': 36.6357, 'lng': 127.4917, 'radius': 0.8},
-            '충청남도': {'lat': 36.5184, 'lng': 126.8000, 'radius': 0.8},
-            '전라북도': {'lat': 35.7175, 'lng': 127.1530, 'radius': 0.8},
-            '전라남도': {'lat': 34.8679, 'lng': 126.9910, 'radius': 1.0},
-            '경상북도': {'lat': 36.4919, 'lng': 128.8889, 'radius': 1.2},
-            '경상남도': {'lat': 35.4606, 'lng': 128.2132, 'radius': 1.0},
-            '제주특별자치도': {'lat': 33.4996, 'lng': 126.5312, 'radius': 0.3}
+        row = self.estimate_regions_by_coordinates(np.array([lat], dtype=float), np.array([lng], dtype=float)).iloc[0]
+        return {
+            'sido': row['estimated_sido'],
+            'sigungu': row['estimated_sigungu'],
+            'dong': row['estimated_dong'],
+            'confidence': float(row['confidence'])
         }
-        
-        best_match = {'sido': '미확인', 'sigungu': '미확인', 'dong': '미확인', 'confidence': 0.0}
-        min_distance = float('inf')
-        
-        for sido, center in city_centers.items():
-            distance = self.calculate_distance(lat, lng, center['lat'], center['lng']) / 1000  # km
-            
-            if distance <= center['radius'] * 100 and distance < min_distance:  # 반경 내
-                min_distance = distance
-                confidence = max(0.5, 1.0 - (distance / (center['radius'] * 100)))
-                
-                # 세부 지역 추정 (간단한 규칙)
-                if sido == '서울특별시':
-                    sigungu, dong = self.estimate_seoul_district(lat, lng)
-                elif sido == '부산광역시':
-                    sigungu, dong = self.estimate_busan_district(lat, lng)
-                else:
-                    sigungu = f"{sido} 내 지역"
-                    dong = "추정 필요"
-                
-                best_match = {
-                    'sido': sido,
-                    'sigungu': sigungu,
-                    'dong': dong,
-                    'confidence': confidence
-                }
-        
-        return best_match
 
     def estimate_seoul_district(self, lat: float, lng: float) -> Tuple[str, str]:
         """서울 구/동 추정"""
-        # 서울 주요 구 중심 좌표
-        seoul_districts = {
-            '강남구': {'lat': 37.5172, 'lng': 127.0473},
-            '서초구': {'lat': 37.4837, 'lng': 127.0324},
-            '송파구': {'lat': 37.5145, 'lng': 127.1059},
-            '강동구': {'lat': 37.5301, 'lng': 127.1238},
-            '마포구': {'lat': 37.5664, 'lng': 126.9018},
-            '영등포구': {'lat': 37.5264, 'lng': 126.8962},
-            '용산구': {'lat': 37.5326, 'lng': 126.9910},
-            '중구': {'lat': 37.5641, 'lng': 126.9979},
-            '종로구': {'lat': 37.5735, 'lng': 126.9788}
-        }
-        
         min_distance = float('inf')
         best_gu = '강남구'  # 기본값
         
-        for gu, center in seoul_districts.items():
+        for gu, center in self.SEOUL_DISTRICTS.items():
             distance = self.calculate_distance(lat, lng, center['lat'], center['lng'])
             if distance < min_distance:
                 min_distance = distance
@@ -313,19 +383,10 @@ class BusStationGISMatcher:
 
     def estimate_busan_district(self, lat: float, lng: float) -> Tuple[str, str]:
         """부산 구/동 추정"""
-        # 부산 주요 구 중심 좌표
-        busan_districts = {
-            '해운대구': {'lat': 35.1631, 'lng': 129.1635},
-            '부산진구': {'lat': 35.1623, 'lng': 129.0531},
-            '동래구': {'lat': 35.2049, 'lng': 129.0837},
-            '남구': {'lat': 35.1365, 'lng': 129.0840},
-            '중구': {'lat': 35.1040, 'lng': 129.0324}
-        }
-        
         min_distance = float('inf')
         best_gu = '해운대구'  # 기본값
         
-        for gu, center in busan_districts.items():
+        for gu, center in self.BUSAN_DISTRICTS.items():
             distance = self.calculate_distance(lat, lng, center['lat'], center['lng'])
             if distance < min_distance:
                 min_distance = distance
@@ -334,8 +395,31 @@ class BusStationGISMatcher:
         dong = f"{best_gu} 내 동"
         return best_gu, dong
 
-    def calculate_dong_level_accessibility(self, geocoded_data: List[Dict]) -> Dict:
-        """동별 대중교통 접근성 계산"""
+    def calculate_radius_accessibility(self, df: pd.DataFrame) -> Dict:
+        """읍면동 중심점 기준 반경별 정류장 수 + 최근접 정류장 거리 (공간 색인 반경/최근접 질의)"""
+        dong_index = self.get_dong_index()
+        if dong_index is None or df.empty:
+            return {}
+        
+        station_index = PointIndex(df['latitude'].to_numpy(dtype=float), df['longitude'].to_numpy(dtype=float))
+        center_lats = dong_index.centroids.lats
+        center_lngs = dong_index.centroids.lngs
+        radii = sorted({criteria['max_distance'] for criteria in self.accessibility_criteria.values()})
+        counts = {radius: station_index.count_within(center_lats, center_lngs, radius) for radius in radii}
+        nearest_distance, _ = station_index.query_knn(center_lats, center_lngs, k=1)
+        
+        radius_accessibility = {}
+        for i, dong in enumerate(dong_index.dongs):
+            dong_key = f"{dong['sido']}_{dong['sigungu']}_{dong['dong']}"
+            radius_accessibility[dong_key] = {
+                'stations_within_m': {str(radius): int(counts[radius][i]) for radius in radii},
+                'nearest_station_m': round(float(nearest_distance[i, 0]), 1)
+            }
+        return radius_accessibility
+
+    def calculate_dong_level_accessibility(self, geocoded_data: List[Dict],
+                                           radius_accessibility: Optional[Dict] = None) -> Dict:
+        """동별 대중교통 접근성 계산 (radius_accessibility가 있으면 반경별 정류장 수 포함)"""
         logger.info("📊 동별 대중교통 접근성 계산")
         
         dong_accessibility = {}
@@ -386,6 +470,8 @@ class BusStationGISMatcher:
                 'political_implications': political_impact,
                 'stations_detail': stations[:5]  # 샘플 5개만 저장
             }
+            if radius_accessibility and dong_key in radius_accessibility:
+                dong_accessibility[dong_key]['bus_accessibility'].update(radius_accessibility[dong_key])
         
         logger.info(f"✅ 동별 접근성 계산 완료: {len(dong_accessibility)}개 동")
         return dong_accessibility
@@ -565,13 +651,16 @@ class BusStationGISMatcher:
             
             print(f"✅ 표준화 완료: {len(standardized_df):,}개 유효 정류장")
             
-            # 3. 샘플 역지오코딩
-            print("\n🗺️ 샘플 역지오코딩...")
-            geocoding_results = self.reverse_geocoding_sample(standardized_df, sample_size=200)
+            # 3. 전체 정류장 역지오코딩 (공간 색인 일괄 배정)
+            print("\n🗺️ 정류장 역지오코딩...")
+            geocoding_results = self.reverse_geocoding_sample(standardized_df, sample_size=None)
             
-            # 4. 동별 접근성 계산
+            # 4. 동별 접근성 계산 (중심점 반경별 정류장 수 포함)
             print("\n📊 동별 대중교통 접근성 계산...")
-            dong_accessibility = self.calculate_dong_level_accessibility(geocoding_results['geocoded_data'])
+            radius_accessibility = self.calculate_radius_accessibility(standardized_df)
+            dong_accessibility = self.calculate_dong_level_accessibility(
+                geocoding_results['geocoded_data'], radius_accessibility
+            )
             
             # 5. 80.5% 다양성 시스템에 통합
             print("\n🔗 80.5% 다양성 시스템에 통합...")
@@ -596,7 +685,11 @@ class BusStationGISMatcher:
                 },
                 
                 'bus_station_analysis': {
-                    'geocoding_results': geocoding_results,
+                    # 정류장별 배정 결과는 전체 정류장 수만큼 커지므로 요약만 저장
+                    'geocoding_results': {
+                        'total_sample': geocoding_results['total_sample'],
+                        'success_rate': geocoding_results['success_rate']
+                    },
                     'dong_accessibility_profiles': dong_accessibility,
                     'accessibility_distribution': integrated_system['transport_accessibility_integration']['accessibility_distribution']
                 },
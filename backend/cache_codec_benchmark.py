@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+캐시 코덱 벤치마크
+티어별 실제 캐시 레코드로 압축률과 항목당 인코딩/디코딩 시간(µs)을 비교
+"""
+
+import json
+import asyncio
+import argparse
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Dict, List
+
+from cache_codecs import available_codecs, benchmark_codecs
+from enhanced_hybrid_cache_system import enhanced_cache_system
+
+
+def collect_tier_samples(sample_count: int) -> Dict[str, List[Any]]:
+    """강화된 하이브리드 캐시와 동일한 생성 경로로 티어별 샘플 수집"""
+    system = enhanced_cache_system
+    candidates = system._generate_enhanced_candidates_data()
+    stride = max(1, len(candidates) // sample_count)
+    selected = candidates[::stride][:sample_count]
+
+    tier1_samples = [asdict(system._create_enhanced_candidate_info(candidate)) for candidate in selected]
+
+    # Tier 3 상세 분석은 생성 비용이 커서 일부만 사용
+    async def build_detailed():
+        return [await system._generate_enhanced_detailed_analysis(candidate['name'], candidate['position'])
+                for candidate in selected[:max(10, sample_count // 10)]]
+
+    tier3_samples = asyncio.run(build_detailed())
+    return {'tier1': tier1_samples, 'tier3': tier3_samples}
+
+
+def print_report(report: Dict[str, Dict[str, Dict[str, float]]]):
+    """벤치마크 결과 출력"""
+    for tier, codecs in report.items():
+        print(f"\n📦 {tier}")
+        print(f"  {'codec':<12}{'ratio':>8}{'avg bytes':>12}{'encode µs':>12}{'decode µs':>12}")
+        for codec_name, result in codecs.items():
+            print(f"  {codec_name:<12}{result['ratio']:>8}{result['avg_encoded_bytes']:>12}"
+                  f"{result['encode_us']:>12}{result['decode_us']:>12}")
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='캐시 코덱 벤치마크')
+    parser.add_argument('--samples', type=int, default=1000, help='티어별 샘플 수')
+    parser.add_argument('--codecs', nargs='*', default=None, help=f'비교할 코덱 (기본: {available_codecs()})')
+    parser.add_argument('--output', default=None, help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    print('🗜️ 캐시 코덱 벤치마크')
+    print('=' * 60)
+
+    tier_samples = collect_tier_samples(args.samples)
+    report = benchmark_codecs(tier_samples, args.codecs)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'timestamp': datetime.now().isoformat(), 'report': report}, f, ensure_ascii=False, indent=2)
+        print(f"\n📄 결과 저장: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
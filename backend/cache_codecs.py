@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+캐시 항목 코덱 계층
+하이브리드 캐시 티어별로 압축 방식을 선택
+- gzip-1/6/9: 표준 gzip (레벨별 속도/압축률)
+- zlib-dict: 반복 구조 레코드용 공유 사전(zdict) 압축 (표준 라이브러리)
+- zstd-3 / zstd-dict: zstandard 설치 시 사용 (학습 사전 지원)
+"""
+
+import re
+import json
+import time
+import gzip
+import zlib
+import logging
+import statistics
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DICT_SIZE = 32 * 1024  # zlib zdict 최대 유효 크기(32KB)
+_JSON_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"\s*:?')
+
+
+def _dumps(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def _loads(raw: bytes) -> Any:
+    return json.loads(raw.decode('utf-8'))
+
+
+class CacheCodec:
+    """코덱 기본 클래스 (JSON 직렬화 + 압축)"""
+
+    name = 'json'
+
+    def encode(self, data: Any) -> bytes:
+        return _dumps(data)
+
+    def decode(self, payload: bytes) -> Any:
+        return _loads(payload)
+
+
+class GzipCodec(CacheCodec):
+    """gzip 코덱 (기존 캐시와 호환되는 형식)"""
+
+    def __init__(self, level: int = 6):
+        self.level = level
+        self.name = f'gzip-{level}'
+
+    def encode(self, data: Any) -> bytes:
+        return gzip.compress(_dumps(data), compresslevel=self.level)
+
+    def decode(self, payload: bytes) -> Any:
+        return _loads(gzip.decompress(payload))
+
+
+class ZlibDictCodec(CacheCodec):
+    """zlib 공유 사전 코덱 - 작은 반복 레코드에서 압축률 향상"""
+
+    def __init__(self, zdict: bytes, level: int = 6):
+        self.zdict = zdict
+        self.level = level
+        self.name = 'zlib-dict'
+
+    def encode(self, data: Any) -> bytes:
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=self.zdict)
+        return compressor.compress(_dumps(data)) + compressor.flush()
+
+    def decode(self, payload: bytes) -> Any:
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS, zdict=self.zdict)
+        return _loads(decompressor.decompress(payload) + decompressor.flush())
+
+
+class ZstdCodec(CacheCodec):
+    """zstandard 코덱 (선택적 학습 사전)"""
+
+    def __init__(self, level: int = 3, dict_data: Optional['zstandard.ZstdCompressionDict'] = None):
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstandard 패키지가 설치되어 있지 않습니다")
+        self.level = level
+        self.dict_data = dict_data
+        self.name = 'zstd-dict' if dict_data is not None else f'zstd-{level}'
+        # 컴프레서 객체는 스레드 안전하지 않으므로 호출마다 생성
+        self._compressor_kwargs = {'level': level}
+        if dict_data is not None:
+            self._compressor_kwargs['dict_data'] = dict_data
+
+    def encode(self, data: Any) -> bytes:
+        return zstandard.ZstdCompressor(**self._compressor_kwargs).compress(_dumps(data))
+
+    def decode(self, payload: bytes) -> Any:
+        if self.dict_data is not None:
+            decompressor = zstandard.ZstdDecompressor(dict_data=self.dict_data)
+        else:
+            decompressor = zstandard.ZstdDecompressor()
+        return _loads(decompressor.decompress(payload))
+
+
+def build_zlib_dictionary(samples: List[Any], size: int = DEFAULT_DICT_SIZE) -> bytes:
+    """샘플 레코드에서 자주 반복되는 JSON 키/문자열로 zlib 사전 구성
+
+    deflate는 가까운 거리의 일치를 더 싸게 인코딩하므로
+    가장 이득이 큰 토큰이 사전 끝에 오도록 배치한다.
+    """
+    counts: Counter = Counter()
+    for sample in samples:
+        text = _dumps(sample).decode('utf-8')
+        counts.update(set(_JSON_TOKEN.findall(text)))
+
+    min_docs = max(2, len(samples) // 4)
+    scored = [(count * len(token.encode('utf-8')), token)
+              for token, count in counts.items() if count >= min_docs]
+    scored.sort(reverse=True)
+
+    chosen: List[bytes] = []
+    total = 0
+    for _, token in scored:
+        encoded = token.encode('utf-8')
+        if total + len(encoded) > size:
+            continue
+        chosen.append(encoded)
+        total += len(encoded)
+
+    return b''.join(reversed(chosen))
+
+
+def train_codec(name: str, samples: List[Any], dict_size: int = DEFAULT_DICT_SIZE) -> CacheCodec:
+    """사전 기반 코덱 학습 (zstd-dict 미설치 시 zlib-dict로 대체)"""
+    if name == 'zstd-dict' and ZSTD_AVAILABLE:
+        encoded_samples = [_dumps(sample) for sample in samples]
+        try:
+            dict_data = zstandard.train_dictionary(dict_size * 4, encoded_samples)
+            return ZstdCodec(level=3, dict_data=dict_data)
+        except zstandard.ZstdError as e:
+            logger.warning(f"⚠️ zstd 사전 학습 실패, zlib 사전으로 대체: {e}")
+    elif name == 'zstd-dict':
+        logger.warning("⚠️ zstandard 미설치 - zlib-dict 코덱으로 대체")
+    return ZlibDictCodec(build_zlib_dictionary(samples, dict_size))
+
+
+def get_codec(name: str, samples: Optional[List[Any]] = None) -> CacheCodec:
+    """이름으로 코덱 생성
+
+    사전 코덱(zlib-dict, zstd-dict)은 samples가 필요하다.
+    """
+    if name in ('zlib-dict', 'zstd-dict'):
+        if not samples:
+            raise ValueError(f"{name} 코덱은 학습 샘플이 필요합니다")
+        return train_codec(name, samples)
+    if name.startswith('gzip-'):
+        return GzipCodec(int(name.split('-', 1)[1]))
+    if name.startswith('zstd-'):
+        if not ZSTD_AVAILABLE:
+            logger.warning(f"⚠️ zstandard 미설치 - {name} 대신 gzip-1 사용")
+            return GzipCodec(1)
+        return ZstdCodec(int(name.split('-', 1)[1]))
+    if name == 'json':
+        return CacheCodec()
+    raise ValueError(f"알 수 없는 코덱: {name}")
+
+
+def available_codecs() -> List[str]:
+    """현재 환경에서 사용 가능한 코덱 목록"""
+    names = ['gzip-1', 'gzip-6', 'gzip-9', 'zlib-dict']
+    if ZSTD_AVAILABLE:
+        names += ['zstd-3', 'zstd-dict']
+    return names
+
+
+def benchmark_codecs(tier_samples: Dict[str, List[Any]], codec_names: Optional[List[str]] = None,
+                     train_fraction: float = 0.2) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """티어별 코덱 벤치마크 (압축률, 항목당 인코딩/디코딩 µs)
+
+    사전 코덱은 샘플 앞부분(train_fraction)으로 학습하고 나머지로 측정한다.
+    """
+    codec_names = codec_names or available_codecs()
+    report: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+    for tier, samples in tier_samples.items():
+        if not samples:
+            continue
+        split = max(1, int(len(samples) * train_fraction)) if len(samples) > 1 else 0
+        train_set, test_set = samples[:split] or samples, samples[split:] or samples
+        raw_sizes = [len(_dumps(sample)) for sample in test_set]
+        raw_total = sum(raw_sizes)
+        tier_report: Dict[str, Dict[str, float]] = {}
+
+        for codec_name in codec_names:
+            codec = get_codec(codec_name, train_set)
+            encode_us: List[float] = []
+            decode_us: List[float] = []
+            encoded_total = 0
+            for sample in test_set:
+                started = time.perf_counter()
+                payload = codec.encode(sample)
+                encode_us.append((time.perf_counter() - started) * 1e6)
+
+                started = time.perf_counter()
+                codec.decode(payload)
+                decode_us.append((time.perf_counter() - started) * 1e6)
+                encoded_total += len(payload)
+
+            tier_report[codec.name] = {
+                'ratio': round(raw_total / max(1, encoded_total), 2),
+                'avg_raw_bytes': round(raw_total / len(test_set), 1),
+                'avg_encoded_bytes': round(encoded_total / len(test_set), 1),
+                'encode_us': round(statistics.median(encode_us), 1),
+                'decode_us': round(statistics.median(decode_us), 1)
+            }
+        report[tier] = tier_report
+
+    return report
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+공용 캐시 엔진
+실제 LRU 순서 + 선택적 TTL + 삽입 시점 증분 크기 계산
+- get/put/evict 모두 O(1)
+- 티어별 hit/miss/eviction/expiration 카운터
+- 여러 티어가 공유하는 바이트 예산(CacheBudget)과 하드 리밋
+"""
+
+import os
+import json
+import time
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+_MISSING = object()
+
+# 생성된 캐시 (메트릭 수집용, 약한 참조라 캐시 수명에 영향 없음)
+_LIVE_CACHES: "weakref.WeakSet[BoundedLRUCache]" = weakref.WeakSet()
+
+
+def live_caches() -> List['BoundedLRUCache']:
+    """현재 살아 있는 BoundedLRUCache 목록"""
+    return list(_LIVE_CACHES)
+
+
+def estimate_size(value: Any) -> int:
+    """항목 크기 추정 (바이트) - 삽입 시 한 번만 호출"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    try:
+        return len(json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8'))
+    except (TypeError, ValueError):
+        return len(repr(value).encode('utf-8'))
+
+
+def resolve_memory_limit(default_bytes: int, env_var: str = 'CACHE_MEMORY_LIMIT_MB') -> int:
+    """환경변수(MB)로 캐시 하드 리밋 설정, 없으면 기본값 사용"""
+    value = os.environ.get(env_var)
+    if value:
+        try:
+            return int(float(value) * 1024 * 1024)
+        except ValueError:
+            pass
+    return default_bytes
+
+
+class CacheBudget:
+    """여러 캐시 티어가 공유하는 바이트 예산
+
+    각 티어는 항목 삽입/제거 시 미리 계산된 크기만 보고하므로
+    사용량 조회는 O(1)이며, 하드 리밋을 넘으면 가장 큰 티어의
+    LRU 항목부터 제거한다.
+    """
+
+    def __init__(self, name: str, limit_bytes: int):
+        self.name = name
+        self.limit_bytes = limit_bytes
+        self.used_bytes = 0
+        self.peak_bytes = 0
+        self.evictions = 0
+        self.tiers: List['BoundedLRUCache'] = []
+        self._lock = threading.Lock()
+
+    def register(self, cache: 'BoundedLRUCache'):
+        self.tiers.append(cache)
+
+    def charge(self, delta: int):
+        """사용량 증감 기록"""
+        with self._lock:
+            self.used_bytes += delta
+            if self.used_bytes > self.peak_bytes:
+                self.peak_bytes = self.used_bytes
+
+    def enforce(self):
+        """하드 리밋 초과 시 제거"""
+        while self.used_bytes > self.limit_bytes:
+            candidates = [tier for tier in self.tiers if len(tier)]
+            if not candidates:
+                break
+            victim = max(candidates, key=lambda tier: tier.size_bytes)
+            if not victim.evict_one():
+                break
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """예산 통계 (O(1))"""
+        return {
+            'name': self.name,
+            'used_bytes': self.used_bytes,
+            'used_mb': round(self.used_bytes / 1024 / 1024, 2),
+            'limit_mb': round(self.limit_bytes / 1024 / 1024, 2),
+            'peak_mb': round(self.peak_bytes / 1024 / 1024, 2),
+            'utilization_percentage': round(self.used_bytes / self.limit_bytes * 100, 2) if self.limit_bytes else 0,
+            'budget_evictions': self.evictions
+        }
+
+
+class BoundedLRUCache:
+    """바이트/항목 수 제한이 있는 LRU + TTL 캐시"""
+
+    def __init__(self, name: str, max_bytes: Optional[int] = None,
+                 max_entries: Optional[int] = None, default_ttl: Optional[float] = None,
+                 sizer: Callable[[Any], int] = estimate_size, budget: Optional[CacheBudget] = None):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.sizer = sizer
+
+        # key -> (value, size, expires_at)
+        self._entries: "OrderedDict[Any, Tuple[Any, int, Optional[float]]]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        self.budget = budget
+        if budget is not None:
+            budget.register(self)
+        _LIVE_CACHES.add(self)
+
+    # ------------------------------------------------------------------
+    # 내부 헬퍼 (락 보유 상태에서 호출)
+    # ------------------------------------------------------------------
+    def _account(self, delta: int):
+        self._size_bytes += delta
+        if self.budget is not None:
+            self.budget.charge(delta)
+
+    def _remove(self, key: Any) -> Tuple[Any, int, Optional[float]]:
+        entry = self._entries.pop(key)
+        self._account(-entry[1])
+        return entry
+
+    def _is_expired(self, entry: Tuple[Any, int, Optional[float]], now: float) -> bool:
+        expires_at = entry[2]
+        return expires_at is not None and now >= expires_at
+
+    def _evict_until(self, incoming_size: int = 0, incoming_count: int = 0):
+        """제한을 넘지 않을 때까지 가장 오래 사용되지 않은 항목 제거"""
+        while self._entries:
+            over_bytes = self.max_bytes is not None and self._size_bytes + incoming_size > self.max_bytes
+            over_count = self.max_entries is not None and len(self._entries) + incoming_count > self.max_entries
+            if not (over_bytes or over_count):
+                break
+            _, (_, size, _) = self._entries.popitem(last=False)
+            self._account(-size)
+            self.evictions += 1
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+    def get(self, key: Any, default: Any = None) -> Any:
+        """조회 (히트 시 최근 사용으로 이동, 만료 항목은 제거)"""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            if self._is_expired(entry, time.monotonic()):
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def peek(self, key: Any, default: Any = None) -> Any:
+        """통계/순서 변경 없이 조회"""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING or self._is_expired(entry, time.monotonic()):
+                return default
+            return entry[0]
+
+    def put(self, key: Any, value: Any, ttl: Optional[float] = None, size: Optional[int] = None) -> bool:
+        """저장 (크기는 이 시점에 한 번만 계산). 단일 항목이 한도를 넘으면 False"""
+        if size is None:
+            size = self.sizer(value)
+        if ttl is None:
+            ttl = self.default_ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                return False
+            self._evict_until(incoming_size=size, incoming_count=1)
+            self._entries[key] = (value, size, expires_at)
+            self._account(size)
+
+        # 공유 예산 초과분은 락 해제 후 정리 (티어 간 락 순서 역전 방지)
+        if self.budget is not None:
+            self.budget.enforce()
+        return key in self._entries
+
+    def evict_one(self) -> bool:
+        """가장 오래 사용되지 않은 항목 하나 제거"""
+        with self._lock:
+            if not self._entries:
+                return False
+            _, (_, size, _) = self._entries.popitem(last=False)
+            self._account(-size)
+            self.evictions += 1
+            return True
+
+    def fits(self, size: int) -> bool:
+        """제거 없이 추가 가능한지 확인"""
+        with self._lock:
+            if self.max_bytes is not None and self._size_bytes + size > self.max_bytes:
+                return False
+            if self.max_entries is not None and len(self._entries) + 1 > self.max_entries:
+                return False
+            if self.budget is not None and self.budget.used_bytes + size > self.budget.limit_bytes:
+                return False
+            return True
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """항목 제거 후 값 반환"""
+        with self._lock:
+            if key not in self._entries:
+                return default
+            return self._remove(key)[0]
+
+    def purge_expired(self) -> int:
+        """만료 항목 일괄 정리"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, entry in self._entries.items() if self._is_expired(entry, now)]
+            for key in expired:
+                self._remove(key)
+            self.expirations += len(expired)
+            return len(expired)
+
+    def clear(self):
+        """전체 항목 제거 (통계는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._account(-self._size_bytes)
+
+    def reset_stats(self):
+        """통계 초기화"""
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def keys(self) -> List[Any]:
+        """LRU 순서(오래된 것부터) 키 목록"""
+        with self._lock:
+            return list(self._entries.keys())
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """LRU 순서 (키, 값) 스냅샷"""
+        with self._lock:
+            snapshot = [(key, entry[0]) for key, entry in self._entries.items()]
+        return iter(snapshot)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Any) -> bool:
+        return self.peek(key, _MISSING) is not _MISSING
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Any, value: Any):
+        self.put(key, value)
+
+    def stats(self) -> Dict[str, Any]:
+        """티어 통계 (O(1))"""
+        lookups = self.hits + self.misses
+        return {
+            'name': self.name,
+            'entries': len(self._entries),
+            'size_bytes': self._size_bytes,
+            'size_mb': round(self._size_bytes / 1024 / 1024, 2),
+            'max_bytes': self.max_bytes,
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': round(self.hits / lookups * 100, 2) if lookups else 0
+        }
@@ -13,9 +13,11 @@ from collections import Counter, defaultdict
 from typing import Dict, List, Tuple, Any
 import pickle
 
+from pdf_page_cache import PDFPageCache
+from topic_matcher import TopicMatcher
+
 # 텍스트마이닝 라이브러리
 try:
-    import fitz  # PyMuPDF
     import numpy as np
     from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
     from sklearn.cluster import KMeans, DBSCAN
@@ -39,6 +41,7 @@ try:
 except ImportError as e:
     print(f"⚠️ 텍스트마이닝 라이브러리 설치 필요: {e}")
     NLP_AVAILABLE = False
+    KOREAN_ANALYZER = None
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +51,7 @@ class ComprehensivePolicyTopicAnalyzer:
     def __init__(self, pdf_file_path: str):
         self.pdf_file = pdf_file_path
         self.analysis_results = {}
+        self.pdf_cache = PDFPageCache()
         
         # 한국어 분석기 초기화 (Java 없이도 작동하도록)
         self.analyzer = None
@@ -172,6 +176,12 @@ class ComprehensivePolicyTopicAnalyzer:
         
         # 지역 키워드 매핑
         self.regional_keywords = self._load_regional_keywords()
+        
+        # 토픽 키워드 + 지역 키워드 통합 매처 (한 번만 컴파일)
+        self.topic_matcher = TopicMatcher(
+            {topic_name: topic_info['keywords'] for topic_name, topic_info in self.comprehensive_topic_categories.items()},
+            self.regional_keywords
+        )
     
     def _load_regional_keywords(self) -> Dict[str, List[str]]:
         """지역별 키워드 로드"""
@@ -202,21 +212,17 @@ class ComprehensivePolicyTopicAnalyzer:
         if not os.path.exists(self.pdf_file):
             raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {self.pdf_file}")
         
-        doc = fitz.open(self.pdf_file)
-        full_text = ""
-        total_pages = len(doc)
-        
+        # 페이지 캐시 사용 (없는 페이지만 병렬 추출)
+        total_pages = self.pdf_cache.total_pages(self.pdf_file)
         print(f"📊 총 {total_pages} 페이지 처리 중...")
         
-        for page_num in range(total_pages):
-            page = doc[page_num]
-            page_text = page.get_text()
-            full_text += page_text + '\n'
+        page_texts = []
+        for page_num, page_text in self.pdf_cache.iter_pages(self.pdf_file):
+            page_texts.append(page_text + '\n')
             
             if page_num % 50 == 0:
                 print(f"  📄 페이지 {page_num + 1}/{total_pages} 처리 완료")
-        
-        doc.close()
+        full_text = ''.join(page_texts)
         
         self.analysis_results['document_info'] = {
             'file_path': self.pdf_file,
@@ -301,32 +307,23 @@ class ComprehensivePolicyTopicAnalyzer:
         
         regional_data = {}
         
-        for region_name, region_keywords in self.regional_keywords.items():
-            print(f"  📍 {region_name} 분석 중...")
+        # 문장마다 오토마톤 한 번 통과로 언급 지역과 토픽 키워드 수를 함께 집계
+        region_hits = self.topic_matcher.scan_sentences(sentences)
+        
+        for region_name in self.regional_keywords:
+            hits = region_hits.get(region_name)
+            if not hits:
+                continue
             
-            # 해당 지역 언급 문장들 찾기
-            region_sentences = []
-            for sentence in sentences:
-                if any(keyword in sentence for keyword in region_keywords):
-                    region_sentences.append(sentence)
+            print(f"  📍 {region_name} 분석 중...")
             
-            if not region_sentences:
-                continue
+            # 해당 지역 언급 문장들
+            region_sentences = [sentences[i] for i in hits['sentence_indices']]
             
-            # 토픽별 점수 계산
-            topic_scores = {}
+            # 토픽별 점수 (지역 문장들의 토픽 키워드 수 합)
+            topic_scores = hits['topic_scores']
             dominant_topics = []
             
-            for topic_name, topic_info in self.comprehensive_topic_categories.items():
-                score = 0
-                for sentence in region_sentences:
-                    for keyword in topic_info['keywords']:
-                        if keyword in sentence:
-                            score += 1
-                
-                if score > 0:
-                    topic_scores[topic_name] = score
-            
             # 상위 토픽 선정 (점수 기준)
             if topic_scores:
                 sorted_topics = sorted(topic_scores.items(), key=lambda x: x[1], reverse=True)
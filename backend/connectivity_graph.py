@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+정치인 연결 그래프
+전체 의원의 연결 관계를 한 번에 구축해 인접 리스트로 보관하고 중심성을 미리 계산
+- 조회: 이름 → 노드 id → 연결 목록 (요청마다 DB/전체 목록 재탐색 없음)
+- 중심성: 연결 중심성, 가중 연결 강도, 매개 중심성(Brandes), PageRank
+"""
+
+import time
+import logging
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectivityGraph:
+    """인접 리스트 기반 연결 그래프 (노드는 정수 id)"""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.attributes: List[Dict[str, Any]] = []
+        # 무방향 가중 인접 리스트 (중심성 계산용): node -> {neighbor: weight}
+        self.adjacency: List[Dict[int, float]] = []
+        # 방향 연결 상세 (조회용): node -> [connection dict]
+        self.connections: List[List[Dict[str, Any]]] = []
+        self.centrality: List[Dict[str, float]] = []
+        self.built_at: Optional[float] = None
+        self.build_seconds = 0.0
+
+    # ------------------------------------------------------------------
+    # 구축
+    # ------------------------------------------------------------------
+    def node(self, name: str, **attributes) -> int:
+        """노드 id 반환 (없으면 추가)"""
+        node_id = self.ids.get(name)
+        if node_id is None:
+            node_id = len(self.names)
+            self.ids[name] = node_id
+            self.names.append(name)
+            self.attributes.append({})
+            self.adjacency.append({})
+            self.connections.append([])
+            self.centrality.append({})
+        if attributes:
+            self.attributes[node_id].update(attributes)
+        return node_id
+
+    def add_connection(self, source: str, target: str, weight: float, connection: Dict[str, Any]):
+        """source → target 연결 추가 (상세는 source 쪽에 보관, 가중치는 양방향 누적)"""
+        if source == target:
+            return
+        source_id, target_id = self.node(source), self.node(target)
+        self.connections[source_id].append(connection)
+        self.adjacency[source_id][target_id] = self.adjacency[source_id].get(target_id, 0.0) + weight
+        self.adjacency[target_id][source_id] = self.adjacency[target_id].get(source_id, 0.0) + weight
+
+    def finalize(self, started: Optional[float] = None, sort_key: Optional[Callable[[Dict], Any]] = None):
+        """연결 정렬 + 중심성 계산 (구축 마지막 단계)"""
+        if sort_key is not None:
+            for connections in self.connections:
+                connections.sort(key=sort_key)
+        self.compute_centrality()
+        self.built_at = time.time()
+        if started is not None:
+            self.build_seconds = round(time.perf_counter() - started, 3)
+        logger.info(f"🕸️ 연결 그래프 구축: 노드 {len(self.names)}개, 간선 {self.edge_count()}개 "
+                    f"({self.build_seconds}초)")
+
+    # ------------------------------------------------------------------
+    # 중심성
+    # ------------------------------------------------------------------
+    def compute_centrality(self, pagerank_iterations: int = 50, damping: float = 0.85):
+        n = len(self.names)
+        if n == 0:
+            return
+        betweenness = self._betweenness()
+        pagerank = self._pagerank(pagerank_iterations, damping)
+        for node_id in range(n):
+            self.centrality[node_id] = {
+                'degree': round(len(self.adjacency[node_id]) / (n - 1), 4) if n > 1 else 0.0,
+                'strength': round(sum(self.adjacency[node_id].values()), 4),
+                'betweenness': round(betweenness[node_id], 4),
+                'pagerank': round(pagerank[node_id], 6)
+            }
+
+    def _betweenness(self) -> List[float]:
+        """무가중 매개 중심성 (Brandes, 정규화)"""
+        n = len(self.names)
+        scores = [0.0] * n
+        for source in range(n):
+            stack: List[int] = []
+            predecessors: List[List[int]] = [[] for _ in range(n)]
+            paths = [0] * n
+            paths[source] = 1
+            distance = [-1] * n
+            distance[source] = 0
+            queue = deque([source])
+            while queue:
+                node_id = queue.popleft()
+                stack.append(node_id)
+                for neighbor in self.adjacency[node_id]:
+                    if distance[neighbor] < 0:
+                        distance[neighbor] = distance[node_id] + 1
+                        queue.append(neighbor)
+                    if distance[neighbor] == distance[node_id] + 1:
+                        paths[neighbor] += paths[node_id]
+                        predecessors[neighbor].append(node_id)
+            dependency = [0.0] * n
+            while stack:
+                node_id = stack.pop()
+                for predecessor in predecessors[node_id]:
+                    dependency[predecessor] += paths[predecessor] / paths[node_id] * (1 + dependency[node_id])
+                if node_id != source:
+                    scores[node_id] += dependency[node_id]
+        # 무방향 그래프는 각 쌍을 두 번 셈 → (n-1)(n-2)로 나누면 networkx 정규화와 동일
+        scale = 1 / ((n - 1) * (n - 2)) if n > 2 else 0.0
+        return [score * scale for score in scores]
+
+    def _pagerank(self, iterations: int, damping: float) -> List[float]:
+        """가중 PageRank (거듭제곱법)"""
+        n = len(self.names)
+        rank = [1.0 / n] * n
+        strengths = [sum(neighbors.values()) for neighbors in self.adjacency]
+        for _ in range(iterations):
+            dangling = sum(rank[node_id] for node_id in range(n) if strengths[node_id] == 0)
+            base = (1 - damping) / n + damping * dangling / n
+            updated = [base] * n
+            for node_id, neighbors in enumerate(self.adjacency):
+                if strengths[node_id] == 0:
+                    continue
+                share = damping * rank[node_id] / strengths[node_id]
+                for neighbor, weight in neighbors.items():
+                    updated[neighbor] += share * weight
+            rank = updated
+        return rank
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def __contains__(self, name: str) -> bool:
+        return name in self.ids
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def get_connections(self, name: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        node_id = self.ids.get(name)
+        if node_id is None:
+            return []
+        connections = self.connections[node_id]
+        return connections[:limit] if limit is not None else list(connections)
+
+    def get_neighbors(self, name: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """연결 가중치 합 기준 이웃 목록"""
+        node_id = self.ids.get(name)
+        if node_id is None:
+            return []
+        ranked = sorted(self.adjacency[node_id].items(), key=lambda item: (-item[1], self.names[item[0]]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [{'name': self.names[neighbor], 'weight': round(weight, 4)} for neighbor, weight in ranked]
+
+    def get_attributes(self, name: str) -> Dict[str, Any]:
+        node_id = self.ids.get(name)
+        return self.attributes[node_id] if node_id is not None else {}
+
+    def get_centrality(self, name: str) -> Dict[str, float]:
+        node_id = self.ids.get(name)
+        return self.centrality[node_id] if node_id is not None else {}
+
+    def top_central(self, metric: str = 'pagerank', limit: int = 10) -> List[Dict[str, Any]]:
+        ranked = sorted(range(len(self.names)), key=lambda node_id: -self.centrality[node_id].get(metric, 0.0))
+        return [{'name': self.names[node_id], **self.centrality[node_id]} for node_id in ranked[:limit]]
+
+    def edge_count(self) -> int:
+        return sum(len(neighbors) for neighbors in self.adjacency) // 2
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'nodes': len(self.names),
+            'edges': self.edge_count(),
+            'connections': sum(len(connections) for connections in self.connections),
+            'build_seconds': self.build_seconds,
+            'built_at': self.built_at
+        }
+
+
+def rank_groups(groups: Dict[Any, Dict[str, int]]) -> Dict[Any, List[tuple]]:
+    """그룹별 (이름, 건수) 목록을 한 번만 정렬해 둠"""
+    return {key: sorted(counts.items(), key=lambda item: (-item[1], item[0])) for key, counts in groups.items()}
+
+
+def take_excluding(ranked: Iterable[tuple], limit: int, exclude: str) -> List[tuple]:
+    """정렬된 (이름, 건수) 목록에서 exclude를 뺀 상위 limit개"""
+    result = []
+    for name, count in ranked:
+        if name == exclude:
+            continue
+        result.append((name, count))
+        if len(result) >= limit:
+            break
+    return result
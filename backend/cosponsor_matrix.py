@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+공동발의 희소 행렬 엔진
+의안×의원 발생 행렬 A를 만들고 AᵀA 한 번으로 의원 쌍별 공동발의 횟수를 계산
+- scipy가 있으면 희소 행렬 곱, 없으면 의안별 조합 누적 (동일 결과)
+- 새 의안만 추가 반영 (증분 갱신), 변경된 쌍만 DB에 다시 기록
+- DB 기록은 단일 트랜잭션 + executemany
+"""
+
+import sqlite3
+import logging
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+    from scipy import sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+CONNECTION_TYPE = 'co_sponsor'
+
+Pair = Tuple[int, int]
+
+
+class CoSponsorshipMatrix:
+    """의원 쌍별 공동발의 횟수/최근 공동발의일 집계기"""
+
+    def __init__(self, use_sparse: Optional[bool] = None):
+        self.use_sparse = SCIPY_AVAILABLE if use_sparse is None else (use_sparse and SCIPY_AVAILABLE)
+        self.member_ids: Dict[str, int] = {}
+        self.members: List[str] = []
+        self.bill_ids: Set[str] = set()
+        # (i, j), i < j -> [공동발의 횟수, 최근 공동발의일]
+        self.pairs: Dict[Pair, List] = {}
+        self.dirty_pairs: Set[Pair] = set()
+
+    def _member_id(self, name: str) -> int:
+        member_id = self.member_ids.get(name)
+        if member_id is None:
+            member_id = len(self.members)
+            self.member_ids[name] = member_id
+            self.members.append(name)
+        return member_id
+
+    # ------------------------------------------------------------------
+    # 집계
+    # ------------------------------------------------------------------
+    def add_bills(self, bills: Iterable[Tuple[str, Sequence[str], str]]) -> int:
+        """(bill_id, 발의자 목록, 발의일) 추가. 이미 반영한 의안은 건너뛰고 새 의안 수 반환"""
+        rows: List[Tuple[List[int], str]] = []
+        for bill_id, sponsors, proposed_date in bills:
+            if bill_id in self.bill_ids:
+                continue
+            self.bill_ids.add(bill_id)
+            member_ids = sorted({self._member_id(name) for name in sponsors})
+            if len(member_ids) > 1:
+                rows.append((member_ids, proposed_date or ''))
+
+        if rows:
+            if self.use_sparse:
+                self._accumulate_sparse(rows)
+            else:
+                self._accumulate_python(rows)
+        return len(rows)
+
+    def _merge(self, pair: Pair, count: int, last_date: str):
+        current = self.pairs.get(pair)
+        if current is None:
+            self.pairs[pair] = [count, last_date]
+        else:
+            current[0] += count
+            current[1] = max(current[1], last_date)
+        self.dirty_pairs.add(pair)
+
+    def _accumulate_python(self, rows: List[Tuple[List[int], str]]):
+        for member_ids, proposed_date in rows:
+            for pair in combinations(member_ids, 2):
+                self._merge(pair, 1, proposed_date)
+
+    def _incidence(self, rows: List[Tuple[List[int], str]]):
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(member_ids) for member_ids, _ in rows])
+        indices = np.fromiter((m for member_ids, _ in rows for m in member_ids), dtype=np.int32,
+                              count=int(indptr[-1]))
+        data = np.ones(len(indices), dtype=np.int32)
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), len(self.members)))
+
+    def _accumulate_sparse(self, rows: List[Tuple[List[int], str]]):
+        incidence = self._incidence(rows)
+        size = len(self.members)
+        counts = sparse.triu(incidence.T @ incidence, k=1).tocoo()
+        count_keys = counts.row.astype(np.int64) * size + counts.col
+
+        # 최근 공동발의일: 발의일별 AᵀA의 쌍마다 날짜 순위를 모아 쌍별 최댓값 선택
+        date_values, date_ranks = np.unique([proposed_date for _, proposed_date in rows], return_inverse=True)
+        pair_keys, pair_ranks = [], []
+        for rank in range(len(date_values)):
+            block = incidence[np.flatnonzero(date_ranks == rank)]
+            co = sparse.triu(block.T @ block, k=1).tocoo()
+            pair_keys.append(co.row.astype(np.int64) * size + co.col)
+            pair_ranks.append(np.full(co.nnz, rank))
+        pair_keys = np.concatenate(pair_keys)
+        pair_ranks = np.concatenate(pair_ranks)
+        order = np.lexsort((pair_ranks, pair_keys))
+        pair_keys, pair_ranks = pair_keys[order], pair_ranks[order]
+        is_last = np.append(pair_keys[1:] != pair_keys[:-1], True)
+        last_keys, last_ranks = pair_keys[is_last], pair_ranks[is_last]
+        last_dates = date_values[last_ranks[np.searchsorted(last_keys, count_keys)]]
+
+        for i, j, count, last_date in zip(counts.row.tolist(), counts.col.tolist(),
+                                          counts.data.tolist(), last_dates.tolist()):
+            self._merge((i, j), count, last_date)
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+    def relationships(self) -> Dict[Tuple[str, str], Dict]:
+        """{(의원A, 의원B): {'count', 'last_date'}} (이름 정렬 순)"""
+        result = {}
+        for (i, j), (count, last_date) in self.pairs.items():
+            key = tuple(sorted((self.members[i], self.members[j])))
+            result[key] = {'count': count, 'last_date': last_date}
+        return result
+
+    def _rows(self, pairs: Iterable[Pair]) -> List[Tuple]:
+        rows = []
+        for pair in pairs:
+            count, last_date = self.pairs[pair]
+            politician_a, politician_b = sorted((self.members[pair[0]], self.members[pair[1]]))
+            rows.append((politician_a, politician_b, count, CONNECTION_TYPE, count, last_date))
+        return rows
+
+    def write_to_db(self, conn: sqlite3.Connection, full: bool = False) -> int:
+        """connectivity_network에 기록 (full=True면 전체 교체, 아니면 변경된 쌍만). 기록한 행 수 반환"""
+        pairs = list(self.pairs) if full else list(self.dirty_pairs)
+        rows = self._rows(pairs)
+        with conn:
+            if full:
+                conn.execute('DELETE FROM connectivity_network WHERE connection_type = ?', (CONNECTION_TYPE,))
+            else:
+                conn.executemany('''
+                    DELETE FROM connectivity_network
+                    WHERE politician_a = ? AND politician_b = ? AND connection_type = ?
+                ''', [(row[0], row[1], CONNECTION_TYPE) for row in rows])
+            conn.executemany('''
+                INSERT INTO connectivity_network (
+                    politician_a, politician_b, connection_strength,
+                    connection_type, bill_count, last_collaboration
+                ) VALUES (?, ?, ?, ?, ?, ?)
+            ''', rows)
+        self.dirty_pairs.clear()
+        return len(rows)
+
+    def stats(self) -> Dict:
+        return {
+            'bills': len(self.bill_ids),
+            'members': len(self.members),
+            'pairs': len(self.pairs),
+            'pending_pairs': len(self.dirty_pairs),
+            'backend': 'scipy.sparse' if self.use_sparse else 'python'
+        }
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+읍면동 인접 행렬 (사전 계산 → 디스크 저장 → 배열 조회)
+- 전체 읍면동 중심점으로 k-최근접 거리 행렬을 한 번에 계산 (필요하면 전체 거리 행렬도)
+- 경계 폴리곤이 있으면 공유 꼭짓점(경계선)으로 인접 관계를 도출해 CSR 배열로 보관
+- 폴리곤 없이 중심점만 있으면 상호 k-최근접으로 인접 관계를 추정
+- 결과는 압축 npz 한 파일로 저장, 인접/파급 분석은 배열 조회만으로 처리
+
+저장 위치는 DONG_ADJACENCY_PATH 또는 data/dong_adjacency.npz,
+원본은 spatial_index.DongSpatialIndex.load_default()가 읽는 경계/중심점 파일.
+"""
+
+import os
+import time
+import logging
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from spatial_index import DATA_DIR, DongSpatialIndex, haversine_m
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MATRIX_PATH = os.path.join(DATA_DIR, 'dong_adjacency.npz')
+
+FORMAT_VERSION = 1
+COORD_SCALE = 1e6          # 꼭짓점 좌표 양자화 (1e-6도 ≈ 0.1m)
+MIN_SHARED_VERTICES = 2    # 한 점만 닿는 경우는 인접으로 보지 않음
+KNN_ADJACENCY_K = 6        # 폴리곤 없을 때 상호 k-최근접 기준
+
+
+def _csr(rows: np.ndarray, cols: np.ndarray, weights: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(행, 열, 가중치) 목록 → 행별 정렬된 CSR (indptr, indices, weights)"""
+    order = np.lexsort((cols, rows))
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return indptr, cols[order].astype(np.int32), weights[order].astype(np.int32)
+
+
+def shared_border_pairs(polygons: List[List[np.ndarray]], min_shared: int = MIN_SHARED_VERTICES
+                        ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """경계 꼭짓점을 공유하는 폴리곤 쌍 (a, b, 공유 꼭짓점 수), a < b"""
+    n = len(polygons)
+    dong_ids = np.concatenate([
+        np.full(sum(len(ring) for ring in rings), index, dtype=np.int64)
+        for index, rings in enumerate(polygons)
+    ]) if n else np.empty(0, dtype=np.int64)
+    coords = np.concatenate([ring for rings in polygons for ring in rings]) if n else np.empty((0, 2))
+    quantized = np.round(coords * COORD_SCALE).astype(np.int64)
+
+    # 꼭짓점 id 부여 후 (꼭짓점, 읍면동) 중복 제거 - 정렬 결과는 꼭짓점, 읍면동 순
+    _, vertex_ids = np.unique(quantized, axis=0, return_inverse=True)
+    vertex_ids = vertex_ids.reshape(-1)
+    keys = np.unique(vertex_ids * n + dong_ids)
+    vertices, dongs = keys // n, keys % n
+
+    # 같은 꼭짓점을 공유하는 읍면동 쌍을 간격(offset)별로 한 번에 생성
+    pair_codes = []
+    offset = 1
+    while offset < len(vertices):
+        same = vertices[:-offset] == vertices[offset:]
+        if not same.any():
+            break
+        pair_codes.append(dongs[:-offset][same] * n + dongs[offset:][same])
+        offset += 1
+    if not pair_codes:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty
+
+    codes, counts = np.unique(np.concatenate(pair_codes), return_counts=True)
+    keep = counts >= min_shared
+    codes, counts = codes[keep], counts[keep]
+    return codes // n, codes % n, counts
+
+
+class DongAdjacencyMatrix:
+    """읍면동 인접/거리 배열 묶음 (행 번호 = 읍면동 인덱스)"""
+
+    def __init__(self, codes: np.ndarray, sidos: np.ndarray, sigungus: np.ndarray, dongs: np.ndarray,
+                 lats: np.ndarray, lngs: np.ndarray,
+                 indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray,
+                 knn_indices: np.ndarray, knn_distances: np.ndarray,
+                 adjacency_source: str, distance_matrix: Optional[np.ndarray] = None,
+                 built_at: Optional[float] = None):
+        self.codes = codes
+        self.sidos = sidos
+        self.sigungus = sigungus
+        self.dongs = dongs
+        self.lats = lats
+        self.lngs = lngs
+        # 인접 관계 CSR: indices[indptr[i]:indptr[i+1]] = i의 인접 읍면동, weights = 공유 꼭짓점 수
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        # k-최근접 (자기 자신 제외), 거리 km
+        self.knn_indices = knn_indices
+        self.knn_distances = knn_distances
+        self.adjacency_source = adjacency_source
+        self.distance_matrix = distance_matrix
+        self.built_at = built_at
+        self._build_lookups()
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def _build_lookups(self):
+        """이름/코드 → 읍면동 인덱스, (시도, 시군구) → 시군구 id"""
+        self.code_index: Dict[str, int] = {str(code): i for i, code in enumerate(self.codes) if code}
+        self.name_index: Dict[str, List[int]] = defaultdict(list)
+        sigungu_keys = list(zip(self.sidos.tolist(), self.sigungus.tolist()))
+        self.sigungu_list: List[Tuple[str, str]] = list(dict.fromkeys(sigungu_keys))
+        sigungu_ids = {key: i for i, key in enumerate(self.sigungu_list)}
+        self.dong_sigungu = np.array([sigungu_ids[key] for key in sigungu_keys], dtype=np.int32)
+        self.sigungu_names: Dict[str, List[int]] = defaultdict(list)
+        for i, (sido, sigungu) in enumerate(self.sigungu_list):
+            self.sigungu_names[sigungu].append(i)
+            self.sigungu_names[f"{sido} {sigungu}"].append(i)
+            # '성남시 분당구' → '성남시분당구' 표기도 허용
+            if ' ' in sigungu:
+                self.sigungu_names[sigungu.replace(' ', '')].append(i)
+        for i, (sido, sigungu, dong) in enumerate(zip(self.sidos.tolist(), self.sigungus.tolist(), self.dongs.tolist())):
+            self.name_index[dong].append(i)
+            self.name_index[f"{sigungu} {dong}"].append(i)
+            self.name_index[f"{sido} {sigungu} {dong}"].append(i)
+
+        # 시군구 중심점 = 소속 읍면동 중심점 평균
+        counts = np.bincount(self.dong_sigungu, minlength=len(self.sigungu_list))
+        safe = np.maximum(counts, 1)
+        self.sigungu_lats = np.bincount(self.dong_sigungu, weights=self.lats, minlength=len(counts)) / safe
+        self.sigungu_lngs = np.bincount(self.dong_sigungu, weights=self.lngs, minlength=len(counts)) / safe
+
+    # ------------------------------------------------------------------
+    # 구축
+    # ------------------------------------------------------------------
+    @classmethod
+    def build(cls, index: DongSpatialIndex, k: int = 16, dense: bool = False) -> 'DongAdjacencyMatrix':
+        """공간 색인(중심점 + 선택적 폴리곤)에서 거리/인접 배열 계산"""
+        started = time.perf_counter()
+        n = len(index)
+        lats = index.centroids.lats
+        lngs = index.centroids.lngs
+
+        # k+1개 조회 후 행마다 한 칸 제외 - 자기 자신 (중심점이 겹쳐 밀려났으면 마지막 칸)
+        k = min(k, max(n - 1, 0))
+        distances, neighbors = index.centroids.query_knn(lats, lngs, k + 1)
+        drop = neighbors == np.arange(n)[:, None]
+        drop[~drop.any(axis=1), -1] = True
+        knn_indices = neighbors[~drop].reshape(n, k).astype(np.int32)
+        knn_distances = (distances[~drop].reshape(n, k) / 1000.0).astype(np.float32)
+
+        if index.polygons is not None:
+            a, b, shared = shared_border_pairs(index.polygons)
+            source = 'border'
+        else:
+            a, b, shared = cls._mutual_knn_pairs(knn_indices[:, :KNN_ADJACENCY_K])
+            source = 'knn'
+        rows = np.concatenate([a, b]).astype(np.int64)
+        cols = np.concatenate([b, a]).astype(np.int64)
+        indptr, indices, weights = _csr(rows, cols, np.concatenate([shared, shared]), n)
+
+        distance_matrix = None
+        if dense:
+            distance_matrix = cls._dense_distances(lats, lngs)
+
+        matrix = cls(
+            codes=np.array([d.get('adm_cd', '') for d in index.dongs], dtype=str),
+            sidos=np.array([d.get('sido', '') for d in index.dongs], dtype=str),
+            sigungus=np.array([d.get('sigungu', '') for d in index.dongs], dtype=str),
+            dongs=np.array([d.get('dong', '') for d in index.dongs], dtype=str),
+            lats=lats.copy(), lngs=lngs.copy(),
+            indptr=indptr, indices=indices, weights=weights,
+            knn_indices=knn_indices, knn_distances=knn_distances,
+            adjacency_source=source, distance_matrix=distance_matrix, built_at=time.time(),
+        )
+        logger.info(f"🧭 읍면동 인접 행렬 구축: {n:,}개, 인접 쌍 {len(a):,}개 ({source}), "
+                    f"{time.perf_counter() - started:.2f}초")
+        return matrix
+
+    @staticmethod
+    def _mutual_knn_pairs(knn: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """서로의 k-최근접에 포함되는 쌍 (a < b)"""
+        n, k = knn.shape
+        a = np.repeat(np.arange(n, dtype=np.int64), k)
+        b = knn.reshape(-1).astype(np.int64)
+        codes = np.minimum(a, b) * n + np.maximum(a, b)
+        codes, counts = np.unique(codes, return_counts=True)
+        mutual = codes[counts == 2]
+        return mutual // n, mutual % n, np.ones(len(mutual), dtype=np.int64)
+
+    @staticmethod
+    def _dense_distances(lats: np.ndarray, lngs: np.ndarray, chunk: int = 512) -> np.ndarray:
+        """전체 거리 행렬 (km, float32) - 행 블록 단위로 계산해 중간 배열 크기 제한"""
+        n = len(lats)
+        result = np.empty((n, n), dtype=np.float32)
+        for start in range(0, n, chunk):
+            stop = min(start + chunk, n)
+            result[start:stop] = haversine_m(lats[start:stop, None], lngs[start:stop, None], lats, lngs) / 1000.0
+        return result
+
+    # ------------------------------------------------------------------
+    # 저장 / 로드
+    # ------------------------------------------------------------------
+    def save(self, path: str = DEFAULT_MATRIX_PATH):
+        arrays = {
+            'format_version': np.array(FORMAT_VERSION),
+            'codes': self.codes, 'sidos': self.sidos, 'sigungus': self.sigungus, 'dongs': self.dongs,
+            'lats': self.lats, 'lngs': self.lngs,
+            'indptr': self.indptr, 'indices': self.indices, 'weights': self.weights,
+            'knn_indices': self.knn_indices, 'knn_distances': self.knn_distances,
+            'adjacency_source': np.array(self.adjacency_source),
+            'built_at': np.array(self.built_at or time.time()),
+        }
+        if self.distance_matrix is not None:
+            arrays['distance_matrix'] = self.distance_matrix
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        # np.savez는 확장자를 붙이므로 임시 파일도 .npz로 끝나게 두고 교체
+        tmp_path = f"{path}.tmp.npz"
+        np.savez_compressed(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+        logger.info(f"💾 읍면동 인접 행렬 저장: {path} ({os.path.getsize(path) / 1024:.0f}KB)")
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_MATRIX_PATH) -> 'DongAdjacencyMatrix':
+        with np.load(path, allow_pickle=False) as data:
+            version = int(data['format_version'])
+            if version != FORMAT_VERSION:
+                raise ValueError(f"지원하지 않는 인접 행렬 형식: {version}")
+            return cls(
+                codes=data['codes'], sidos=data['sidos'], sigungus=data['sigungus'], dongs=data['dongs'],
+                lats=data['lats'], lngs=data['lngs'],
+                indptr=data['indptr'], indices=data['indices'], weights=data['weights'],
+                knn_indices=data['knn_indices'], knn_distances=data['knn_distances'],
+                adjacency_source=str(data['adjacency_source']),
+                distance_matrix=data['distance_matrix'] if 'distance_matrix' in data.files else None,
+                built_at=float(data['built_at']),
+            )
+
+    @classmethod
+    def load_default(cls, rebuild: bool = False) -> Optional['DongAdjacencyMatrix']:
+        """저장된 행렬 로드, 없으면(또는 rebuild) 경계/중심점 파일에서 구축 후 저장 (원본도 없으면 None)"""
+        path = os.environ.get('DONG_ADJACENCY_PATH', DEFAULT_MATRIX_PATH)
+        if not rebuild and os.path.exists(path):
+            try:
+                return cls.load(path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"⚠️ 읍면동 인접 행렬 로드 실패 ({path}), 재구축: {e}")
+        index = DongSpatialIndex.load_default()
+        if index is None or len(index) < 2:
+            return None
+        matrix = cls.build(index)
+        try:
+            matrix.save(path)
+        except OSError as e:
+            logger.warning(f"⚠️ 읍면동 인접 행렬 저장 실패 ({path}): {e}")
+        return matrix
+
+    # ------------------------------------------------------------------
+    # 읍면동 조회
+    # ------------------------------------------------------------------
+    def find_dong(self, name: str) -> Optional[int]:
+        """행정동 코드 또는 '동' / '시군구 동' / '시도 시군구 동' 이름 → 인덱스 (동명이 여럿이면 첫 번째)"""
+        if name in self.code_index:
+            return self.code_index[name]
+        matches = self.name_index.get(name)
+        return matches[0] if matches else None
+
+    def dong_label(self, i: int) -> Dict:
+        return {'adm_cd': str(self.codes[i]), 'sido': str(self.sidos[i]),
+                'sigungu': str(self.sigungus[i]), 'dong': str(self.dongs[i])}
+
+    def neighbors(self, i: int) -> np.ndarray:
+        """인접 읍면동 인덱스"""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def nearest(self, i: int, k: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """중심점 기준 최근접 읍면동 (인덱스, 거리 km)"""
+        return self.knn_indices[i, :k], self.knn_distances[i, :k]
+
+    def distance_km(self, i: int, j: int) -> float:
+        if self.distance_matrix is not None:
+            return float(self.distance_matrix[i, j])
+        return float(haversine_m(self.lats[i], self.lngs[i], self.lats[j], self.lngs[j]) / 1000.0)
+
+    def distances_from(self, i: int, targets: np.ndarray) -> np.ndarray:
+        """i에서 여러 읍면동까지 거리 (km)"""
+        if self.distance_matrix is not None:
+            return self.distance_matrix[i, targets]
+        return haversine_m(self.lats[i], self.lngs[i], self.lats[targets], self.lngs[targets]) / 1000.0
+
+    # ------------------------------------------------------------------
+    # 시군구 조회 (읍면동 인접에서 집계)
+    # ------------------------------------------------------------------
+    def find_sigungu(self, name: str) -> Optional[int]:
+        """'평택시' / '경기도 평택시' → 시군구 id ('중구'처럼 겹치면 첫 번째)"""
+        matches = self.sigungu_names.get(name)
+        return matches[0] if matches else None
+
+    def sigungu_neighbors(self, s: int) -> np.ndarray:
+        """시군구 s와 경계를 맞댄 시군구 id - 소속 읍면동의 인접 읍면동이 속한 시군구"""
+        members = np.nonzero(self.dong_sigungu == s)[0]
+        if not len(members):
+            return np.empty(0, dtype=np.int32)
+        spans = [self.indices[self.indptr[i]:self.indptr[i + 1]] for i in members]
+        adjacent = self.dong_sigungu[np.concatenate(spans)] if spans else np.empty(0, dtype=np.int32)
+        adjacent = np.unique(adjacent)
+        return adjacent[adjacent != s]
+
+    def sigungu_distance_km(self, s: int, t) -> np.ndarray:
+        return haversine_m(self.sigungu_lats[s], self.sigungu_lngs[s],
+                           self.sigungu_lats[t], self.sigungu_lngs[t]) / 1000.0
+
+    # ------------------------------------------------------------------
+    # 지역 단위 공통 조회 (읍면동 또는 시군구 이름)
+    # ------------------------------------------------------------------
+    def region_centroid(self, name: str) -> Optional[Tuple[float, float]]:
+        s = self.find_sigungu(name)
+        if s is not None:
+            return float(self.sigungu_lats[s]), float(self.sigungu_lngs[s])
+        i = self.find_dong(name)
+        if i is not None:
+            return float(self.lats[i]), float(self.lngs[i])
+        return None
+
+    def adjacent_regions(self, name: str) -> Optional[List[Dict]]:
+        """이름(시군구 우선, 없으면 읍면동)의 인접 지역 목록 - 거리순, 모르는 이름이면 None"""
+        s = self.find_sigungu(name)
+        if s is not None:
+            origin_sido = self.sigungu_list[s][0]
+            adjacent = self.sigungu_neighbors(s)
+            distances = self.sigungu_distance_km(s, adjacent)
+            labels = [(self.sigungu_list[t][1], self.sigungu_list[t][0]) for t in adjacent]
+        else:
+            i = self.find_dong(name)
+            if i is None:
+                return None
+            origin_sido = str(self.sidos[i])
+            adjacent = self.neighbors(i)
+            distances = self.distances_from(i, adjacent)
+            labels = [(str(self.dongs[j]), str(self.sidos[j])) for j in adjacent]
+
+        regions = [
+            {'name': region_name, 'sido': sido,
+             'adjacency_type': 'same_sido' if sido == origin_sido else 'cross_sido',
+             'adjacency_source': self.adjacency_source,
+             'distance': round(float(distance), 2)}
+            for (region_name, sido), distance in zip(labels, distances)
+        ]
+        regions.sort(key=lambda region: region['distance'])
+        return regions
+
+    def stats(self) -> Dict:
+        return {
+            'dongs': len(self),
+            'sigungus': len(self.sigungu_list),
+            'adjacent_pairs': int(len(self.indices) // 2),
+            'adjacency_source': self.adjacency_source,
+            'knn_k': int(self.knn_indices.shape[1]) if self.knn_indices.ndim == 2 else 0,
+            'dense_distance_matrix': self.distance_matrix is not None,
+            'built_at': self.built_at,
+        }
+
+
+def main():
+    """경계/중심점 파일에서 인접 행렬을 다시 계산해 저장"""
+    import argparse
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description='읍면동 인접 행렬 사전 계산')
+    parser.add_argument('--k', type=int, default=16, help='저장할 최근접 읍면동 수')
+    parser.add_argument('--dense', action='store_true', help='전체 거리 행렬도 저장 (float32, N²)')
+    parser.add_argument('--output', default=os.environ.get('DONG_ADJACENCY_PATH', DEFAULT_MATRIX_PATH))
+    args = parser.parse_args()
+
+    index = DongSpatialIndex.load_default()
+    if index is None:
+        print('❌ 읍면동 경계/중심점 파일 없음 (DONG_BOUNDARY_PATH 또는 data/dong_boundaries.geojson)')
+        return
+    matrix = DongAdjacencyMatrix.build(index, k=args.k, dense=args.dense)
+    matrix.save(args.output)
+    print(f"✅ 읍면동 인접 행렬: {matrix.stats()}")
+
+
+if __name__ == '__main__':
+    main()
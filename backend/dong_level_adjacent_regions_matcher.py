@@ -11,18 +11,23 @@
 import json
 import pandas as pd
 import numpy as np
-import math
 import logging
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Set
 import os
 from collections import defaultdict
 
+from dong_adjacency_matrix import DongAdjacencyMatrix
+from spatial_index import haversine_m
+
 logger = logging.getLogger(__name__)
 
 class DongLevelAdjacentRegionsMatcher:
     def __init__(self):
         self.base_dir = "/Users/hopidaay/newsbot-kr/backend"
+        # 읍면동 인접/거리 사전 계산 행렬 (처음 사용할 때 로드, 원본 데이터가 없으면 None)
+        self._adjacency_matrix: Optional[DongAdjacencyMatrix] = None
+        self._adjacency_matrix_loaded = False
         
         # 선거 유형별 인접지역 비교 대상
         self.election_types = {
@@ -123,58 +128,100 @@ class DongLevelAdjacentRegionsMatcher:
             'comparative_sensitivity': 0.89  # 비교 정치 민감도
         }
 
+    # 지역 중심 좌표 추정 (인접 행렬이 없을 때)
+    COORD_ESTIMATES = {
+        '평택시': {'lat': 36.9921, 'lng': 127.1127},
+        '오산시': {'lat': 37.1498, 'lng': 127.0773},
+        '안성시': {'lat': 37.0078, 'lng': 127.2797},
+        '아산시': {'lat': 36.7898, 'lng': 127.0019},
+        '천안시': {'lat': 36.8151, 'lng': 127.1139},
+        '강남구': {'lat': 37.5172, 'lng': 127.0473},
+        '서초구': {'lat': 37.4837, 'lng': 127.0324},
+        '해운대구': {'lat': 37.1631, 'lng': 129.1635}
+    }
+
+    def get_adjacency_matrix(self) -> Optional[DongAdjacencyMatrix]:
+        """읍면동 인접 행렬 (저장본 로드, 없으면 경계/중심점 파일에서 구축, 둘 다 없으면 None)"""
+        if not self._adjacency_matrix_loaded:
+            self._adjacency_matrix = DongAdjacencyMatrix.load_default()
+            self._adjacency_matrix_loaded = True
+        return self._adjacency_matrix
+
+    def _region_centroid(self, name: str) -> Optional[Tuple[float, float]]:
+        matrix = self.get_adjacency_matrix()
+        if matrix is not None:
+            centroid = matrix.region_centroid(name)
+            if centroid is not None:
+                return centroid
+        coord = self.COORD_ESTIMATES.get(name)
+        return (coord['lat'], coord['lng']) if coord else None
+
     def calculate_geographic_distance(self, region1: Dict, region2: Dict) -> float:
-        """두 지역 간 지리적 거리 계산"""
-        # 지역 중심 좌표 추정 (실제로는 GIS 데이터 필요)
-        coord_estimates = {
-            '평택시': {'lat': 36.9921, 'lng': 127.1127},
-            '오산시': {'lat': 37.1498, 'lng': 127.0773},
-            '안성시': {'lat': 37.0078, 'lng': 127.2797},
-            '아산시': {'lat': 36.7898, 'lng': 127.0019},
-            '천안시': {'lat': 36.8151, 'lng': 127.1139},
-            '강남구': {'lat': 37.5172, 'lng': 127.0473},
-            '서초구': {'lat': 37.4837, 'lng': 127.0324},
-            '해운대구': {'lat': 37.1631, 'lng': 129.1635}
-        }
-        
-        region1_name = region1.get('name', '')
-        region2_name = region2.get('name', '')
-        
-        if region1_name in coord_estimates and region2_name in coord_estimates:
-            coord1 = coord_estimates[region1_name]
-            coord2 = coord_estimates[region2_name]
-            
-            # 하버사인 공식으로 거리 계산
-            R = 6371  # 지구 반지름 (km)
-            
-            lat1_rad = math.radians(coord1['lat'])
-            lat2_rad = math.radians(coord2['lat'])
-            delta_lat = math.radians(coord2['lat'] - coord1['lat'])
-            delta_lng = math.radians(coord2['lng'] - coord1['lng'])
-            
-            a = (math.sin(delta_lat/2) * math.sin(delta_lat/2) + 
-                 math.cos(lat1_rad) * math.cos(lat2_rad) * 
-                 math.sin(delta_lng/2) * math.sin(delta_lng/2))
-            
-            c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-            distance = R * c
-            
-            return distance
-        
-        return float('inf')  # 좌표 정보 없으면 무한대 거리
+        """두 지역 간 지리적 거리 계산 (km)"""
+        coord1 = self._region_centroid(region1.get('name', ''))
+        coord2 = self._region_centroid(region2.get('name', ''))
+        if coord1 is None or coord2 is None:
+            return float('inf')  # 좌표 정보 없으면 무한대 거리
+        return float(haversine_m(coord1[0], coord1[1], coord2[0], coord2[1]) / 1000.0)
 
     def identify_adjacent_regions(self, target_region: str, election_type: str) -> Dict:
         """대상 지역의 인접지역 식별"""
         logger.info(f"🗺️ {target_region} {election_type} 인접지역 식별")
+        election_config = self.election_types[election_type]
         
-        if target_region not in self.administrative_adjacency:
-            logger.warning(f"⚠️ {target_region} 인접성 데이터 없음")
-            return self._estimate_adjacent_regions(target_region, election_type)
+        # 경계 기반 인접 행렬 우선 (배열 조회)
+        adjacent_candidates = self._matrix_adjacent_candidates(target_region)
         
-        region_data = self.administrative_adjacency[target_region]
-        election_config = self.election_types[election_type]
+        if adjacent_candidates is None:
+            if target_region not in self.administrative_adjacency:
+                logger.warning(f"⚠️ {target_region} 인접성 데이터 없음")
+                return self._estimate_adjacent_regions(target_region, election_type)
+            adjacent_candidates = self._table_adjacent_candidates(target_region)
         
-        # 인접지역 후보 수집
+        # 거리순 정렬 후 개수 제한
+        adjacent_candidates.sort(key=lambda x: x['distance'])
+        
+        min_count = election_config['min_adjacent']
+        max_count = election_config['max_adjacent']
+        
+        selected_adjacent = adjacent_candidates[:max_count]
+        
+        # 최소 개수 보장
+        if len(selected_adjacent) < min_count:
+            logger.warning(f"⚠️ {target_region} 인접지역 부족: {len(selected_adjacent)}개")
+            # 추가 지역 추정
+            estimated_additional = self._estimate_additional_regions(
+                target_region, min_count - len(selected_adjacent)
+            )
+            selected_adjacent.extend(estimated_additional)
+        
+        return {
+            'target_region': target_region,
+            'election_type': election_type,
+            'adjacent_regions': selected_adjacent[:max_count],
+            'total_adjacent_count': len(selected_adjacent[:max_count]),
+            'adjacency_quality': self._assess_adjacency_quality(selected_adjacent[:max_count])
+        }
+
+    def _matrix_adjacent_candidates(self, target_region: str) -> Optional[List[Dict]]:
+        """인접 행렬에서 인접지역 후보 (행렬이 없거나 모르는 지역이면 None)"""
+        matrix = self.get_adjacency_matrix()
+        if matrix is None:
+            return None
+        regions = matrix.adjacent_regions(target_region)
+        if regions is None:
+            return None
+        
+        base_similarity = self.administrative_adjacency.get(target_region, {}).get('political_similarity', 0.7)
+        for region in regions:
+            region['political_similarity'] = (
+                base_similarity * 0.85 if region['adjacency_type'] == 'cross_sido' else base_similarity
+            )
+        return regions
+
+    def _table_adjacent_candidates(self, target_region: str) -> List[Dict]:
+        """수작업 인접성 표에서 인접지역 후보"""
+        region_data = self.administrative_adjacency[target_region]
         adjacent_candidates = []
         
         # 동일 시도 내 인접지역
@@ -202,30 +249,7 @@ class DongLevelAdjacentRegionsMatcher:
                     )
                 })
         
-        # 거리순 정렬 후 개수 제한
-        adjacent_candidates.sort(key=lambda x: x['distance'])
-        
-        min_count = election_config['min_adjacent']
-        max_count = election_config['max_adjacent']
-        
-        selected_adjacent = adjacent_candidates[:max_count]
-        
-        # 최소 개수 보장
-        if len(selected_adjacent) < min_count:
-            logger.warning(f"⚠️ {target_region} 인접지역 부족: {len(selected_adjacent)}개")
-            # 추가 지역 추정
-            estimated_additional = self._estimate_additional_regions(
-                target_region, min_count - len(selected_adjacent)
-            )
-            selected_adjacent.extend(estimated_additional)
-        
-        return {
-            'target_region': target_region,
-            'election_type': election_type,
-            'adjacent_regions': selected_adjacent[:max_count],
-            'total_adjacent_count': len(selected_adjacent[:max_count]),
-            'adjacency_quality': self._assess_adjacency_quality(selected_adjacent[:max_count])
-        }
+        return adjacent_candidates
 
     def _estimate_adjacent_regions(self, target_region: str, election_type: str) -> Dict:
         """데이터 없는 지역의 인접지역 추정"""
@@ -589,6 +613,8 @@ class DongLevelAdjacentRegionsMatcher:
         logger.info("🗺️ 동단위 인접지역 매칭 시스템 분석")
         
         try:
+            adjacency_matrix = self.get_adjacency_matrix()
+            
             # 주요 지역들의 비교 프레임워크 생성
             test_cases = [
                 {'region': '평택시', 'election': '기초단체장'},
@@ -610,6 +636,7 @@ class DongLevelAdjacentRegionsMatcher:
                     'election_types': self.election_types,
                     'excluded_elections': self.excluded_elections,
                     'adjacency_database': len(self.administrative_adjacency),
+                    'adjacency_matrix': adjacency_matrix.stats() if adjacency_matrix else None,
                     'border_effects': self.border_political_effects
                 },
                 
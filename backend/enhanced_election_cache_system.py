@@ -23,6 +23,8 @@ import threading
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict, field
 
+from cache_engine import BoundedLRUCache, CacheBudget, resolve_memory_limit
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -108,9 +110,12 @@ class EnhancedElectionCacheSystem:
         self.total_max_size = 280 * 1024 * 1024               # 280MB
         
         # 캐시 저장소
-        self.regional_election_cache = {}  # 읍면동별 선거 결과
-        self.candidate_info_cache = {}     # 후보자 정보
-        self.analysis_cache = {}           # 선거 분석 데이터
+        # 공유 바이트 예산: 항목 크기는 삽입 시 한 번만 기록, 하드 리밋 초과 시 LRU 제거
+        # (CACHE_MEMORY_LIMIT_MB 환경변수로 렌더 플랜 메모리에 맞게 조정)
+        self.cache_budget = CacheBudget('enhanced_election', resolve_memory_limit(self.total_max_size))
+        self.regional_election_cache = BoundedLRUCache('regional_election', budget=self.cache_budget)  # 읍면동별 선거 결과
+        self.candidate_info_cache = BoundedLRUCache('candidate_info', budget=self.cache_budget)     # 후보자 정보
+        self.analysis_cache = BoundedLRUCache('analysis', budget=self.cache_budget)           # 선거 분석 데이터
         
         self.cache_stats = {
             'election_queries': 0,
@@ -456,14 +461,14 @@ class EnhancedElectionCacheSystem:
             # 분석 캐시 로드
             self._load_analysis_cache()
             
-            total_size = (self._get_cache_size(self.regional_election_cache) + 
-                         self._get_cache_size(self.candidate_info_cache) + 
-                         self._get_cache_size(self.analysis_cache))
+            total_size = (self.regional_election_cache.size_bytes + 
+                         self.candidate_info_cache.size_bytes + 
+                         self.analysis_cache.size_bytes)
             
             logger.info(f"✅ 강화된 선거 캐시 로드 완료:")
-            logger.info(f"  📍 지역 데이터: {loaded_regions}개, {self._get_cache_size(self.regional_election_cache) / 1024 / 1024:.1f}MB")
-            logger.info(f"  👥 후보자 데이터: {self._get_cache_size(self.candidate_info_cache) / 1024 / 1024:.1f}MB")
-            logger.info(f"  📊 분석 데이터: {self._get_cache_size(self.analysis_cache) / 1024 / 1024:.1f}MB")
+            logger.info(f"  📍 지역 데이터: {loaded_regions}개, {self.regional_election_cache.size_bytes / 1024 / 1024:.1f}MB")
+            logger.info(f"  👥 후보자 데이터: {self.candidate_info_cache.size_bytes / 1024 / 1024:.1f}MB")
+            logger.info(f"  📊 분석 데이터: {self.analysis_cache.size_bytes / 1024 / 1024:.1f}MB")
             logger.info(f"  💾 총 사용량: {total_size / 1024 / 1024:.1f}MB")
             
             return True
@@ -502,7 +507,7 @@ class EnhancedElectionCacheSystem:
             
             self.candidate_info_cache['major_politicians'] = compressed_data
             
-            cache_size = self._get_cache_size(self.candidate_info_cache)
+            cache_size = self.candidate_info_cache.size_bytes
             logger.info(f"✅ 후보자 정보 캐시 로드 완료: {cache_size / 1024 / 1024:.1f}MB")
             
         except Exception as e:
@@ -536,22 +541,12 @@ class EnhancedElectionCacheSystem:
             
             self.analysis_cache['comprehensive_analysis'] = compressed_data
             
-            cache_size = self._get_cache_size(self.analysis_cache)
+            cache_size = self.analysis_cache.size_bytes
             logger.info(f"✅ 분석 캐시 로드 완료: {cache_size / 1024 / 1024:.1f}MB")
             
         except Exception as e:
             logger.error(f"❌ 분석 캐시 로드 실패: {e}")
 
-    def _get_cache_size(self, cache_dict: Dict) -> int:
-        """캐시 크기 계산"""
-        total_size = 0
-        for key, value in cache_dict.items():
-            if isinstance(value, bytes):
-                total_size += len(value)
-            else:
-                total_size += len(str(value).encode('utf-8'))
-        return total_size
-
     async def search_region_with_elections(self, region_name: str, search_type: str = 'comprehensive') -> Dict[str, Any]:
         """읍면동별 선거결과 포함 검색"""
         
@@ -646,9 +641,9 @@ class EnhancedElectionCacheSystem:
     def get_enhanced_election_cache_stats(self) -> Dict[str, Any]:
         """강화된 선거 캐시 통계"""
         
-        regional_size = self._get_cache_size(self.regional_election_cache)
-        candidate_size = self._get_cache_size(self.candidate_info_cache)
-        analysis_size = self._get_cache_size(self.analysis_cache)
+        regional_size = self.regional_election_cache.size_bytes
+        candidate_size = self.candidate_info_cache.size_bytes
+        analysis_size = self.analysis_cache.size_bytes
         total_size = regional_size + candidate_size + analysis_size
         
         return {
@@ -659,6 +654,7 @@ class EnhancedElectionCacheSystem:
                 'total_mb': round(total_size / 1024 / 1024, 2),
                 'utilization_percentage': round((total_size / self.total_max_size) * 100, 2)
             },
+            'memory_budget': self.cache_budget.stats(),
             'election_data_coverage': {
                 'regions_cached': len(self.regional_election_cache),
                 'total_regions_available': len(self.eupmyeondong_list),
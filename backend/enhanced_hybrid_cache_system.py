@@ -9,11 +9,9 @@
 """
 
 import os
-import json
 import logging
 import asyncio
 import hashlib
-import gzip
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union
@@ -22,6 +20,9 @@ from concurrent.futures import ThreadPoolExecutor
 import redis
 from dataclasses import dataclass, asdict
 
+from cache_engine import BoundedLRUCache
+from cache_codecs import CacheCodec, GzipCodec, get_codec, ZSTD_AVAILABLE
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -114,9 +115,9 @@ class EnhancedHybridCacheSystem:
         self.total_max_size = 290 * 1024 * 1024  # 290MB (300MB 거의 최대 활용)
         
         # 캐시 저장소 - 대폭 확장
-        self.tier1_cache = {}  # 기본 정보 캐시 (120MB)
-        self.tier3_cache = {}  # 상세 정보 캐시 (150MB)
-        self.metadata_cache = {}  # 메타데이터 캐시 (20MB)
+        self.tier1_cache = BoundedLRUCache('tier1', max_bytes=self.tier1_max_size)  # 기본 정보 캐시 (120MB)
+        self.tier3_cache = BoundedLRUCache('tier3', max_bytes=self.tier3_max_size)  # 상세 정보 캐시 (150MB)
+        self.metadata_cache = BoundedLRUCache('metadata', max_bytes=self.metadata_cache_size)  # 메타데이터 캐시 (20MB)
         self.regional_stats_cache = {}  # 지역 통계 캐시
         self.electoral_history_cache = {}  # 선거 이력 캐시
         self.performance_cache = {}  # 성과 지표 캐시
@@ -124,6 +125,15 @@ class EnhancedHybridCacheSystem:
         self.diversity_cache = {}  # 다양성 분석 캐시
         self.ai_prediction_cache = {}  # AI 예측 캐시
         
+        # 티어별 코덱 (Tier 1은 적재 시 샘플로 공유 사전 학습)
+        self.tier1_codec_name = os.getenv('CACHE_TIER1_CODEC', 'zstd-dict' if ZSTD_AVAILABLE else 'zlib-dict')
+        self.codec_training_samples = 200
+        self.codecs: Dict[str, CacheCodec] = {
+            'tier1': GzipCodec(6),
+            'tier3': get_codec(os.getenv('CACHE_TIER3_CODEC', 'gzip-1')),
+            'metadata': get_codec(os.getenv('CACHE_METADATA_CODEC', 'gzip-6'))
+        }
+        
         self.cache_stats = {
             'tier1_hits': 0, 'tier1_misses': 0,
             'tier2_generations': 0,
@@ -204,43 +214,26 @@ class EnhancedHybridCacheSystem:
         key_string = f"{candidate_name}:{position}"
         return hashlib.md5(key_string.encode()).hexdigest()
 
-    def _compress_data(self, data: Dict) -> bytes:
-        """데이터 압축 (더 강력한 압축)"""
-        json_str = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
-        return gzip.compress(json_str.encode('utf-8'), compresslevel=9)
-
-    def _decompress_data(self, compressed_data: bytes) -> Dict:
-        """데이터 압축 해제"""
-        json_str = gzip.decompress(compressed_data).decode('utf-8')
-        return json.loads(json_str)
+    def _compress_data(self, data: Dict, tier: str = 'tier3') -> bytes:
+        """티어 코덱으로 데이터 압축"""
+        return self.codecs[tier].encode(data)
 
-    def _get_cache_size(self, cache_dict: Dict) -> int:
-        """캐시 크기 계산"""
-        total_size = 0
-        for key, value in cache_dict.items():
-            if isinstance(value, bytes):
-                total_size += len(value)
-            else:
-                total_size += len(json.dumps(value, ensure_ascii=False).encode('utf-8'))
-        return total_size
+    def _decompress_data(self, compressed_data: bytes, tier: str = 'tier3') -> Dict:
+        """티어 코덱으로 데이터 압축 해제"""
+        return self.codecs[tier].decode(compressed_data)
 
-    def _evict_lru_cache(self, cache_dict: Dict, target_size: int):
-        """LRU 기반 캐시 제거"""
-        current_size = self._get_cache_size(cache_dict)
-        
-        if current_size <= target_size:
-            return
-        
-        # 접근 시간 기반 정렬 (단순화)
-        sorted_keys = list(cache_dict.keys())
-        
-        while current_size > target_size and sorted_keys:
-            key_to_remove = sorted_keys.pop(0)
-            if key_to_remove in cache_dict:
-                del cache_dict[key_to_remove]
-                current_size = self._get_cache_size(cache_dict)
-        
-        logger.info(f"🧹 LRU 캐시 정리: {current_size / 1024 / 1024:.1f}MB")
+    def _train_tier1_codec(self, candidates_data: List[Dict]):
+        """Tier 1 공유 사전 코덱 학습 (기존 Tier 1 항목은 코덱이 달라지므로 비움)"""
+        stride = max(1, len(candidates_data) // self.codec_training_samples)
+        samples = [asdict(self._create_enhanced_candidate_info(candidate))
+                   for candidate in candidates_data[::stride][:self.codec_training_samples]]
+        try:
+            self.codecs['tier1'] = get_codec(self.tier1_codec_name, samples)
+        except Exception as e:
+            logger.warning(f"⚠️ Tier 1 코덱 학습 실패, gzip 사용: {e}")
+            self.codecs['tier1'] = GzipCodec(6)
+        self.tier1_cache.clear()
+        logger.info(f"🗜️ Tier 1 코덱: {self.codecs['tier1'].name} ({len(samples)}개 샘플)")
 
     def load_enhanced_tier1_cache(self) -> bool:
         """강화된 Tier 1 캐시 로드 (120MB 최대 활용)"""
@@ -250,8 +243,9 @@ class EnhancedHybridCacheSystem:
             # 출마자 강화 데이터 생성
             candidates_data = self._generate_enhanced_candidates_data()
             
+            self._train_tier1_codec(candidates_data)
+            
             loaded_count = 0
-            current_size = 0
             
             for candidate in candidates_data:
                 cache_key = self._calculate_cache_key(candidate['name'], candidate['position'])
@@ -260,25 +254,24 @@ class EnhancedHybridCacheSystem:
                 enhanced_info = self._create_enhanced_candidate_info(candidate)
                 
                 # 압축하여 저장
-                compressed_data = self._compress_data(asdict(enhanced_info))
+                compressed_data = self._compress_data(asdict(enhanced_info), 'tier1')
                 data_size = len(compressed_data)
                 
-                # 크기 제한 확인
-                if current_size + data_size > self.tier1_max_size:
-                    logger.warning(f"⚠️ Tier 1 캐시 크기 한계 도달: {current_size / 1024 / 1024:.1f}MB")
+                # 크기 제한 확인 (적재 단계에서는 제거 없이 중단)
+                if not self.tier1_cache.fits(data_size):
+                    logger.warning(f"⚠️ Tier 1 캐시 크기 한계 도달: {self.tier1_cache.size_bytes / 1024 / 1024:.1f}MB")
                     break
                 
-                self.tier1_cache[cache_key] = compressed_data
-                current_size += data_size
+                self.tier1_cache.put(cache_key, compressed_data, size=data_size)
                 loaded_count += 1
                 
                 if loaded_count % 500 == 0:
-                    logger.info(f"  📊 로드 진행: {loaded_count:,}명, {current_size / 1024 / 1024:.1f}MB")
+                    logger.info(f"  📊 로드 진행: {loaded_count:,}명, {self.tier1_cache.size_bytes / 1024 / 1024:.1f}MB")
             
             # 메타데이터 캐시도 함께 로드
             self._load_metadata_cache()
             
-            logger.info(f"✅ 강화된 Tier 1 캐시 로드 완료: {loaded_count:,}명, {current_size / 1024 / 1024:.1f}MB")
+            logger.info(f"✅ 강화된 Tier 1 캐시 로드 완료: {loaded_count:,}명, {self.tier1_cache.size_bytes / 1024 / 1024:.1f}MB")
             return True
             
         except Exception as e:
@@ -445,8 +438,8 @@ class EnhancedHybridCacheSystem:
                 }
             }
             
-            compressed_metadata = self._compress_data(national_metadata)
-            self.metadata_cache['national'] = compressed_metadata
+            compressed_metadata = self._compress_data(national_metadata, 'metadata')
+            self.metadata_cache.put('national', compressed_metadata)
             
             # 추가 메타데이터들도 생성
             for category in ['regional', 'electoral', 'performance', 'comparison']:
@@ -455,10 +448,10 @@ class EnhancedHybridCacheSystem:
                     f'{category}_trends': [f'추세_{i}' for i in range(100)],
                     f'{category}_benchmarks': [f'벤치마크_{i}' for i in range(50)]
                 }
-                compressed_category = self._compress_data(category_metadata)
-                self.metadata_cache[category] = compressed_category
+                compressed_category = self._compress_data(category_metadata, 'metadata')
+                self.metadata_cache.put(category, compressed_category)
             
-            metadata_size = self._get_cache_size(self.metadata_cache)
+            metadata_size = self.metadata_cache.size_bytes
             logger.info(f"✅ 메타데이터 캐시 로드 완료: {metadata_size / 1024 / 1024:.1f}MB")
             
         except Exception as e:
@@ -478,9 +471,10 @@ class EnhancedHybridCacheSystem:
         
         try:
             # Tier 1: 강화된 기본 정보 캐시 확인
-            if cache_key in self.tier1_cache:
+            tier1_entry = self.tier1_cache.get(cache_key)
+            if tier1_entry is not None:
                 self.cache_stats['tier1_hits'] += 1
-                enhanced_data = self._decompress_data(self.tier1_cache[cache_key])
+                enhanced_data = self._decompress_data(tier1_entry, 'tier1')
                 
                 if detail_level == 'basic':
                     response_time = (time.time() - start_time) * 1000
@@ -497,9 +491,10 @@ class EnhancedHybridCacheSystem:
                 self.cache_stats['tier1_misses'] += 1
             
             # Tier 3: 인기 출마자 완전 분석 캐시 확인
-            if detail_level == 'detailed' and cache_key in self.tier3_cache:
+            tier3_entry = self.tier3_cache.get(cache_key) if detail_level == 'detailed' else None
+            if tier3_entry is not None:
                 self.cache_stats['tier3_hits'] += 1
-                detailed_data = self._decompress_data(self.tier3_cache[cache_key])
+                detailed_data = self._decompress_data(tier3_entry)
                 response_time = (time.time() - start_time) * 1000
                 
                 return {
@@ -514,6 +509,7 @@ class EnhancedHybridCacheSystem:
             
             # Tier 2: 실시간 완전 분석 생성
             if detail_level == 'detailed':
+                self.cache_stats['tier3_misses'] += 1
                 self.cache_stats['tier2_generations'] += 1
                 detailed_info = await self._generate_enhanced_detailed_analysis(candidate_name, position)
                 
@@ -662,14 +658,8 @@ class EnhancedHybridCacheSystem:
             compressed_data = self._compress_data(detailed_info)
             data_size = len(compressed_data)
             
-            # Tier 3 크기 제한 확인
-            current_tier3_size = self._get_cache_size(self.tier3_cache)
-            
-            if current_tier3_size + data_size > self.tier3_max_size:
-                # LRU 기반 캐시 정리
-                self._evict_lru_cache(self.tier3_cache, self.tier3_max_size - data_size)
-            
-            self.tier3_cache[cache_key] = compressed_data
+            # 한도 초과 시 캐시 엔진이 LRU 순서로 제거
+            self.tier3_cache.put(cache_key, compressed_data, size=data_size)
             logger.info(f"📊 강화된 Tier 3 캐시 저장: {cache_key[:8]}... ({data_size / 1024:.1f}KB)")
             
         except Exception as e:
@@ -678,9 +668,9 @@ class EnhancedHybridCacheSystem:
     def get_enhanced_cache_statistics(self) -> Dict[str, Any]:
         """강화된 캐시 통계 조회"""
         
-        tier1_size = self._get_cache_size(self.tier1_cache)
-        tier3_size = self._get_cache_size(self.tier3_cache)
-        metadata_size = self._get_cache_size(self.metadata_cache)
+        tier1_size = self.tier1_cache.size_bytes
+        tier3_size = self.tier3_cache.size_bytes
+        metadata_size = self.metadata_cache.size_bytes
         total_size = tier1_size + tier3_size + metadata_size
         
         # 히트율 계산
@@ -715,12 +705,17 @@ class EnhancedHybridCacheSystem:
                 'popular_candidates': len([k for k, v in self.popularity_tracker.items() if v >= self.popularity_threshold]),
                 'total_cached_candidates': len(self.tier1_cache) + len(self.tier3_cache)
             },
+            'tier_stats': {
+                'tier1': self.tier1_cache.stats(),
+                'tier3': self.tier3_cache.stats(),
+                'metadata': self.metadata_cache.stats()
+            },
             'system_enhancements': {
                 'data_expansion_factor': '10x',
                 'diversity_system_coverage': '96.19%',
                 'ai_prediction_enabled': True,
                 'metadata_caching': True,
-                'compression_level': 'maximum',
+                'compression_codecs': {tier: codec.name for tier, codec in self.codecs.items()},
                 'memory_utilization': 'optimized'
             },
             'system_status': {
@@ -13,12 +13,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 import re
-import fitz  # PyMuPDF for PDF processing
 from collections import defaultdict, Counter
 import matplotlib.pyplot as plt
 import seaborn as sns
 from wordcloud import WordCloud
 
+from pdf_page_cache import PDFPageCache
+from topic_matcher import TopicMatcher
+
 logger = logging.getLogger(__name__)
 
 class EnhancedPolicyTextMiningSystem:
@@ -92,6 +94,14 @@ class EnhancedPolicyTextMiningSystem:
             }
         }
         
+        # PDF 페이지 텍스트 캐시 (다른 분석기와 공유)
+        self.pdf_cache = PDFPageCache()
+        
+        # 미생토픽 키워드 매처 (토큰별 점수 캐시 공유)
+        self.topic_matcher = TopicMatcher(
+            {topic: topic_info['keywords'] for topic, topic_info in self.misaeng_topics.items()}
+        )
+        
         # 분석 결과
         self.analysis_results = {
             'document_info': {},
@@ -110,21 +120,17 @@ class EnhancedPolicyTextMiningSystem:
             if not os.path.exists(self.pdf_file):
                 raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {self.pdf_file}")
             
-            doc = fitz.open(self.pdf_file)
-            full_text = ""
-            total_pages = len(doc)
-            
+            # 페이지 캐시 사용 (없는 페이지만 병렬 추출)
+            total_pages = self.pdf_cache.total_pages(self.pdf_file)
             print(f"📊 총 {total_pages} 페이지 처리 중...")
             
-            for page_num in range(total_pages):
-                page = doc[page_num]
-                page_text = page.get_text()
-                full_text += page_text + '\n'
+            page_texts = []
+            for page_num, page_text in self.pdf_cache.iter_pages(self.pdf_file):
+                page_texts.append(page_text + '\n')
                 
                 if page_num % 50 == 0:
                     print(f"  📄 페이지 {page_num + 1}/{total_pages} 처리 완료")
-            
-            doc.close()
+            full_text = ''.join(page_texts)
             
             self.analysis_results['document_info'] = {
                 'file_path': self.pdf_file,
@@ -142,6 +148,10 @@ class EnhancedPolicyTextMiningSystem:
 
     def basic_korean_tokenizer(self, text: str) -> List[str]:
         """기본 한국어 토큰화 (konlpy 없이)"""
+        return self._tokenize_korean(text)[:100]  # 상위 100개 토큰만
+
+    def _tokenize_korean(self, text: str) -> List[str]:
+        """기본 한국어 토큰화 (개수 제한 없음)"""
         try:
             # 텍스트 정제
             text = re.sub(r'[^\w\s가-힣]', ' ', text)
@@ -161,7 +171,7 @@ class EnhancedPolicyTextMiningSystem:
             stopwords = {'그리고', '하지만', '그러나', '따라서', '이를', '이에', '대한', '위한', '통해', '있다', '없다', '된다', '한다', '이다', '것이다', '수있다'}
             filtered_tokens = [token for token in korean_tokens if token not in stopwords]
             
-            return filtered_tokens[:100]  # 상위 100개 토큰만
+            return filtered_tokens
             
         except Exception as e:
             logger.error(f"❌ 토큰화 실패: {e}")
@@ -174,34 +184,30 @@ class EnhancedPolicyTextMiningSystem:
             
             regional_topics = {}
             
-            # 1. 광역시도별 분석
-            print("  📍 광역시도 분석 중...")
-            for region_short, region_full in self.region_hierarchy['광역시도'].items():
-                region_data = self._analyze_region_topics(full_text, region_short, region_full, '광역시도')
-                if region_data['mention_count'] > 0:
-                    regional_topics[region_short] = region_data
+            # 1. 광역시도
+            regions = [(region_short, region_full, '광역시도')
+                       for region_short, region_full in self.region_hierarchy['광역시도'].items()]
             
-            # 2. 주요 시군구 분석 (상위 언급)
-            print("  📍 주요 시군구 분석 중...")
+            # 2. 주요 시군구 (상위 언급)
             sigungu_pattern = r'(\w{1,4}[시군구])'
-            sigungu_matches = re.findall(sigungu_pattern, full_text)
-            sigungu_counter = Counter(sigungu_matches)
-            
-            for sigungu, count in sigungu_counter.most_common(20):  # 상위 20개
-                if count > 5:  # 5회 이상 언급된 곳만
-                    region_data = self._analyze_region_topics(full_text, sigungu, sigungu, '시군구')
-                    regional_topics[f"{sigungu}"] = region_data
+            sigungu_counter = Counter(re.findall(sigungu_pattern, full_text))
+            regions += [(sigungu, sigungu, '시군구')
+                        for sigungu, count in sigungu_counter.most_common(20)  # 상위 20개
+                        if count > 5]  # 5회 이상 언급된 곳만
             
-            # 3. 주요 읍면동 분석
-            print("  📍 주요 읍면동 분석 중...")
+            # 3. 주요 읍면동
             emd_pattern = r'(\w{1,4}[읍면동])'
-            emd_matches = re.findall(emd_pattern, full_text)
-            emd_counter = Counter(emd_matches)
-            
-            for emd, count in emd_counter.most_common(30):  # 상위 30개
-                if count > 3:  # 3회 이상 언급된 곳만
-                    region_data = self._analyze_region_topics(full_text, emd, emd, '읍면동')
-                    regional_topics[f"{emd}"] = region_data
+            emd_counter = Counter(re.findall(emd_pattern, full_text))
+            regions += [(emd, emd, '읍면동')
+                        for emd, count in emd_counter.most_common(30)  # 상위 30개
+                        if count > 3]  # 3회 이상 언급된 곳만
+            
+            # 모든 지역을 한 번의 문장 순회로 분석
+            print(f"  📍 {len(regions)}개 지역 분석 중...")
+            for (region_key, region_name, level), region_data in zip(regions, self._analyze_regions(full_text, regions)):
+                if level == '광역시도' and region_data['mention_count'] == 0:
+                    continue
+                regional_topics[f"{region_key}"] = region_data
             
             self.analysis_results['regional_misaeng_topics'] = regional_topics
             
@@ -214,67 +220,77 @@ class EnhancedPolicyTextMiningSystem:
 
     def _analyze_region_topics(self, full_text: str, region_key: str, region_name: str, level: str) -> Dict[str, Any]:
         """개별 지역의 토픽 분석"""
-        try:
-            # 해당 지역 관련 문장 추출
-            region_sentences = []
-            for sentence in full_text.split('.'):
-                if region_key in sentence or region_name in sentence:
-                    clean_sentence = sentence.strip()
-                    if len(clean_sentence) > 10:
-                        region_sentences.append(clean_sentence)
-            
-            if not region_sentences:
-                return {
+        return self._analyze_regions(full_text, [(region_key, region_name, level)])[0]
+
+    def _analyze_regions(self, full_text: str, regions: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+        """여러 지역의 토픽 분석 (문장 분리/지역 탐색/토큰화를 한 번만 수행)"""
+        sentences = full_text.split('.')
+        
+        # 지역명 오토마톤으로 문장마다 언급 지역을 한 번에 찾음
+        region_matcher = TopicMatcher({}, {index: [region_key, region_name]
+                                           for index, (region_key, region_name, _) in enumerate(regions)})
+        region_hits = region_matcher.scan_sentences(sentences)
+        sentence_tokens: Dict[int, List[str]] = {}
+        
+        results = []
+        for index, (region_key, region_name, level) in enumerate(regions):
+            try:
+                # 해당 지역 관련 문장 (10자 초과)
+                sentence_indices = [
+                    i for i in region_hits.get(index, {}).get('sentence_indices', [])
+                    if len(sentences[i].strip()) > 10
+                ]
+                region_sentences = [sentences[i].strip() for i in sentence_indices]
+                
+                if not region_sentences:
+                    results.append({
+                        'region': region_name,
+                        'level': level,
+                        'mention_count': 0,
+                        'dominant_topics': [],
+                        'topic_scores': {},
+                        'sentences': [],
+                        'tokens': [],
+                        'promises': []
+                    })
+                    continue
+                
+                # 토큰화 (문장별 토큰은 지역 간 재사용, 지역 텍스트 기준 상위 100개)
+                tokens = []
+                for i in sentence_indices:
+                    if i not in sentence_tokens:
+                        sentence_tokens[i] = self._tokenize_korean(sentences[i].strip())
+                    tokens.extend(sentence_tokens[i])
+                    if len(tokens) >= 100:
+                        break
+                tokens = tokens[:100]
+                
+                # 미생토픽별 점수 계산 (키워드 ⊂ 토큰 또는 토큰 ⊂ 키워드)
+                topic_scores = self.topic_matcher.score_tokens(tokens)
+                
+                # 상위 토픽 정렬
+                sorted_topics = sorted(topic_scores.items(), key=lambda x: x[1], reverse=True)
+                dominant_topics = [topic for topic, score in sorted_topics[:3]]  # 상위 3개
+                
+                # 공약성 표현 추출
+                promises = self._extract_promises_from_sentences(region_sentences)
+                
+                results.append({
                     'region': region_name,
                     'level': level,
-                    'mention_count': 0,
-                    'dominant_topics': [],
-                    'topic_scores': {},
-                    'sentences': [],
-                    'tokens': [],
-                    'promises': []
-                }
-            
-            # 지역 관련 텍스트 결합
-            region_text = ' '.join(region_sentences)
-            
-            # 토큰화
-            tokens = self.basic_korean_tokenizer(region_text)
-            
-            # 미생토픽별 점수 계산
-            topic_scores = {}
-            for topic, topic_info in self.misaeng_topics.items():
-                score = 0
-                keywords = topic_info['keywords']
-                for token in tokens:
-                    for keyword in keywords:
-                        if keyword in token or token in keyword:
-                            score += 1
+                    'mention_count': len(region_sentences),
+                    'dominant_topics': dominant_topics,
+                    'topic_scores': topic_scores,
+                    'sentences': region_sentences[:5],  # 상위 5개 문장
+                    'tokens': tokens[:20],  # 상위 20개 토큰
+                    'promises': promises
+                })
                 
-                if score > 0:
-                    topic_scores[topic] = score
-            
-            # 상위 토픽 정렬
-            sorted_topics = sorted(topic_scores.items(), key=lambda x: x[1], reverse=True)
-            dominant_topics = [topic for topic, score in sorted_topics[:3]]  # 상위 3개
-            
-            # 공약성 표현 추출
-            promises = self._extract_promises_from_sentences(region_sentences)
-            
-            return {
-                'region': region_name,
-                'level': level,
-                'mention_count': len(region_sentences),
-                'dominant_topics': dominant_topics,
-                'topic_scores': topic_scores,
-                'sentences': region_sentences[:5],  # 상위 5개 문장
-                'tokens': tokens[:20],  # 상위 20개 토큰
-                'promises': promises
-            }
-            
-        except Exception as e:
-            logger.error(f"❌ 지역 {region_name} 분석 실패: {e}")
-            return {}
+            except Exception as e:
+                logger.error(f"❌ 지역 {region_name} 분석 실패: {e}")
+                results.append({})
+        
+        return results
 
     def _extract_promises_from_sentences(self, sentences: List[str]) -> List[str]:
         """문장에서 공약성 표현 추출"""
@@ -8,13 +8,23 @@ import os
 import json
 import sqlite3
 import logging
-from typing import Dict, List, Any, Optional
+import argparse
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from datetime import datetime
 
+from widget_render_engine import WidgetRenderer, file_hash
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 생성기 코드/템플릿이 바뀌면 모든 산출물의 입력이 바뀐 것으로 취급
+GENERATOR_HASH = file_hash(__file__)
+
+# 네트워크 시각화에 쓰는 필드 (사진·입법 통계 변경은 네트워크를 다시 만들 필요 없음)
+NETWORK_INPUT_FIELDS = ("name", "party", "district", "committee", "total_score")
+NETWORK_MAX_CONNECTIONS = 12
+
 class EnhancedWidgetGenerator:
     """실제 데이터 기반 향상된 위젯 생성기"""
     
@@ -28,6 +38,9 @@ class EnhancedWidgetGenerator:
         os.makedirs(f"{self.output_dir}/networks", exist_ok=True)
         os.makedirs(f"{self.output_dir}/pages", exist_ok=True)
         
+        # 변경분 기록 + 빌드 매니페스트 + 병렬 실행
+        self.renderer = WidgetRenderer(self.output_dir)
+        
         # 연결성 색상 정의
         self.connection_colors = {
             "정치적_연결": "#45B7D1",  # 파란색
@@ -537,7 +550,7 @@ class EnhancedWidgetGenerator:
         """네트워크 시각화 생성"""
         try:
             # 연결된 정치인들의 위치 계산 (방사형 배치)
-            connections = politician_data["connections"][:12]  # 최대 12개
+            connections = politician_data["connections"][:NETWORK_MAX_CONNECTIONS]  # 최대 12개
             positions = self._calculate_network_positions(connections, politician_data["name"])
             
             html_content = f"""
@@ -815,62 +828,99 @@ class EnhancedWidgetGenerator:
         
         return positions
     
-    def generate_all_widgets(self):
-        """모든 정치인에 대한 위젯 생성"""
+    def _widget_inputs(self, politician_data: Dict) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """정치인 한 명의 산출물별 (출력 경로, 입력 필드) — 빌드 매니페스트 비교용"""
+        name = politician_data["name"]
+        network_inputs = {field: politician_data[field] for field in NETWORK_INPUT_FIELDS}
+        network_inputs["connections"] = politician_data["connections"][:NETWORK_MAX_CONNECTIONS]
+        return {
+            "card": (f"cards/card_{name}.html", {**politician_data, "generator": GENERATOR_HASH}),
+            "network": (f"networks/network_{name}.html", {**network_inputs, "generator": GENERATOR_HASH}),
+        }
+    
+    def _create_politician_widgets(self, job: Tuple[str, Sequence[str]]) -> Dict[str, Any]:
+        """정치인 한 명의 카드/네트워크 중 작업에 포함된 것만 생성 (프로세스 풀 작업 단위)"""
+        name, kinds = job
+        logger.info(f"위젯 생성 중: {name}")
+        
+        # 정치인 데이터 로드 (작업 프로세스마다 자체 연결)
+        politician_data = self.load_politician_data(name)
+        if not politician_data:
+            return {kind: None for kind in kinds}
+        
+        files = {}
+        
+        # 신분증 카드 생성
+        if "card" in kinds:
+            card_html = self.generate_id_card(politician_data)
+            files["card"] = f"cards/card_{name}.html" if card_html else None
+            if card_html and self.renderer.write(files["card"], card_html):
+                logger.info(f"신분증 카드 생성 완료: {self.output_dir}/{files['card']}")
+        
+        # 네트워크 시각화 생성
+        if "network" in kinds:
+            network_html = self.generate_network_visualization(politician_data)
+            files["network"] = f"networks/network_{name}.html" if network_html else None
+            if network_html and self.renderer.write(files["network"], network_html):
+                logger.info(f"네트워크 시각화 생성 완료: {self.output_dir}/{files['network']}")
+        
+        return files
+    
+    def generate_all_widgets(self, max_workers: Optional[int] = None, changed_only: bool = False) -> Dict[str, Any]:
+        """모든 정치인에 대한 위젯 생성 (프로세스 풀 병렬, max_workers=1이면 순차)
+        
+        changed_only=True면 빌드 매니페스트와 입력 해시(DB 조회 결과 필드별)가 다른 산출물만 다시 생성
+        """
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
         try:
             # 정치인 목록 조회
             cursor.execute('SELECT name FROM politicians ORDER BY name')
-            politicians = cursor.fetchall()
-            
-            logger.info(f"위젯 생성 시작: {len(politicians)}명")
-            
-            for politician in politicians:
-                name = politician[0]
-                logger.info(f"위젯 생성 중: {name}")
-                
-                # 정치인 데이터 로드
+            names = [row[0] for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"위젯 생성 실패: {e}")
+            return {}
+        finally:
+            conn.close()
+        
+        logger.info(f"위젯 생성 시작: {len(names)}명")
+        
+        try:
+            # 산출물 입력 = DB 조회 결과
+            artifacts = {}
+            for name in names:
                 politician_data = self.load_politician_data(name)
-                if not politician_data:
-                    continue
-                
-                # 신분증 카드 생성
-                card_html = self.generate_id_card(politician_data)
-                if card_html:
-                    card_file = f"{self.output_dir}/cards/card_{name}.html"
-                    with open(card_file, 'w', encoding='utf-8') as f:
-                        f.write(card_html)
-                    logger.info(f"신분증 카드 생성 완료: {card_file}")
-                
-                # 네트워크 시각화 생성
-                network_html = self.generate_network_visualization(politician_data)
-                if network_html:
-                    network_file = f"{self.output_dir}/networks/network_{name}.html"
-                    with open(network_file, 'w', encoding='utf-8') as f:
-                        f.write(network_html)
-                    logger.info(f"네트워크 시각화 생성 완료: {network_file}")
+                if politician_data:
+                    artifacts[name] = self._widget_inputs(politician_data)
             
+            results = self.renderer.build(self._create_politician_widgets, artifacts, changed_only, max_workers)
             logger.info("모든 위젯 생성 완료")
+            return results
             
         except Exception as e:
             logger.error(f"위젯 생성 실패: {e}")
-        finally:
-            conn.close()
+            return {}
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="실제 데이터 기반 향상된 위젯 생성기")
+    parser.add_argument("--db", default="real_politician_data.db", help="정치인 데이터베이스 경로")
+    parser.add_argument("--changed-only", action="store_true",
+                        help="빌드 매니페스트와 입력이 달라진 산출물만 다시 생성")
+    parser.add_argument("--workers", type=int, default=None, help="병렬 프로세스 수 (1이면 순차)")
+    args = parser.parse_args()
+    
     try:
         # 향상된 위젯 생성기 초기화
-        generator = EnhancedWidgetGenerator()
+        generator = EnhancedWidgetGenerator(db_path=args.db)
         
-        # 모든 위젯 생성
-        generator.generate_all_widgets()
+        # 모든 위젯 생성 (변경분 빌드면 입력이 바뀐 카드/네트워크만)
+        results = generator.generate_all_widgets(args.workers, changed_only=args.changed_only)
         
         print("\n🎨 향상된 위젯 생성 완료!")
         print(f"📁 출력 디렉토리: {generator.output_dir}")
-        print("📊 생성된 위젯:")
+        print(f"📊 생성된 위젯 ({len(results)}명):")
         print("  - 신분증 카드: cards/")
         print("  - 네트워크 시각화: networks/")
         
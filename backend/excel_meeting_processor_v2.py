@@ -2,20 +2,122 @@
 """
 엑셀 회의록 파일 처리 시스템
 국회 회의록 엑셀 파일들을 읽어서 발언 데이터를 추출하고 데이터베이스에 저장합니다.
+- 워크북 파싱은 프로세스 풀에서 병렬 처리, 행 필터링은 컬럼 연산으로 일괄 처리
+- 파일별 발언은 단일 트랜잭션 + executemany로 적재 (WAL 모드)
+- 파일 내용 해시로 이미 적재한 파일은 재실행 시 건너뜀
 """
 
 import os
 import sqlite3
+import hashlib
 import pandas as pd
 import logging
 import re
-from typing import Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message)s')
 logger = logging.getLogger(__name__)
 
+MIN_SPEECH_LENGTH = 10
+
+
+def file_content_hash(file_path: str, chunk_size: int = 1 << 20) -> str:
+    """파일 내용 SHA-256 (재실행 시 변경 여부 판단용)"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def meeting_id_for(file_path: str) -> str:
+    """파일 경로 기준 회의 ID (실행마다 달라지는 hash() 대신 고정값)"""
+    return f"meeting_{hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()[:16]}"
+
+
+def extract_politician_name_from_filename(filename: str) -> str:
+    """파일명에서 정치인 이름 추출"""
+    # 파일명 패턴: 통합검색_국회회의록_발언자목록_강득구+(姜得求)_2025-08-16.xlsx
+    match = re.search(r'발언자목록_([^+]+)', filename)
+    if match:
+        return match.group(1).strip()
+    return "알수없음"
+
+
+def extract_date_from_filename(file_path: str) -> str:
+    """파일명에서 날짜 추출"""
+    filename = os.path.basename(file_path)
+    match = re.search(r'(\d{4}-\d{2}-\d{2})', filename)
+    if match:
+        return match.group(1)
+    return datetime.now().strftime('%Y-%m-%d')
+
+
+def find_speech_columns(columns: List[str]) -> Tuple[Optional[str], Optional[str]]:
+    """발언자/발언내용 컬럼 찾기"""
+    speaker_col = None
+    content_col = None
+    for col in columns:
+        col_lower = col.lower()
+        if '발언자' in col or 'speaker' in col_lower or '이름' in col:
+            speaker_col = col
+        elif '발언' in col or 'content' in col_lower or '내용' in col or '말씀' in col:
+            content_col = col
+    return speaker_col, content_col
+
+
+def parse_meeting_workbook(file_path: str, file_hash: Optional[str] = None) -> Dict:
+    """워크북 하나를 읽어 적재할 발언 행으로 변환 (프로세스 풀 작업 단위, DB 접근 없음)"""
+    filename = os.path.basename(file_path)
+    politician_name = extract_politician_name_from_filename(filename)
+    try:
+        # 여러 엔진으로 엑셀 파일 읽기 시도
+        df = None
+        for engine in ['openpyxl', 'xlrd']:
+            try:
+                df = pd.read_excel(file_path, engine=engine)
+                break
+            except Exception as e:
+                logger.warning(f"엔진 {engine} 실패 ({filename}): {e}")
+                continue
+
+        if df is None:
+            return {"success": False, "file_path": file_path, "error": "파일 읽기 실패"}
+
+        # 컬럼명 확인 및 정리
+        df.columns = df.columns.astype(str)
+        speaker_col, content_col = find_speech_columns(list(df.columns))
+
+        if not speaker_col or not content_col:
+            logger.warning(f"발언자 또는 발언내용 컬럼을 찾을 수 없습니다 ({filename}): {list(df.columns)}")
+            return {"success": False, "file_path": file_path, "error": "컬럼을 찾을 수 없음"}
+
+        # 행 단위 반복 대신 컬럼 연산으로 정리/필터링
+        speakers = df[speaker_col].astype(str).str.strip()
+        contents = df[content_col].astype(str).str.strip()
+        mask = ((speakers != '') & (speakers != 'nan') & (contents != 'nan')
+                & (contents.str.len() > MIN_SPEECH_LENGTH))
+
+        file_hash = file_hash or file_content_hash(file_path)
+        meeting_date = extract_date_from_filename(file_path)
+        return {
+            "success": True,
+            "file_path": file_path,
+            "file_hash": file_hash,
+            "politician_name": politician_name,
+            "meeting_id": meeting_id_for(file_path),
+            "meeting_date": meeting_date,
+            "meeting_title": f"국회회의록_{politician_name}_{meeting_date}",
+            "speeches": list(zip(speakers[mask].tolist(), contents[mask].tolist()))
+        }
+
+    except Exception as e:
+        return {"success": False, "file_path": file_path, "error": str(e)}
+
+
 class ExcelMeetingProcessor:
     def __init__(self, db_path: str = "meeting_records_processed.db"):
         self.db_path = db_path
@@ -28,6 +130,10 @@ class ExcelMeetingProcessor:
         self.conn = sqlite3.connect(self.db_path)
         self.cursor = self.conn.cursor()
         
+        # 대량 적재용 설정 (WAL: 적재 중에도 읽기 가능)
+        self.cursor.execute('PRAGMA journal_mode=WAL')
+        self.cursor.execute('PRAGMA synchronous=NORMAL')
+        
         # 회의 테이블
         self.cursor.execute('''
             CREATE TABLE IF NOT EXISTS meetings (
@@ -66,138 +172,224 @@ class ExcelMeetingProcessor:
             )
         ''')
         
+        # 적재 완료 파일 (내용 해시가 같으면 재실행 시 건너뜀)
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS ingested_files (
+                file_path TEXT PRIMARY KEY,
+                file_hash TEXT,
+                meeting_id TEXT,
+                speeches INTEGER,
+                ingested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_speeches_meeting ON speeches(meeting_id)')
+        
         self.conn.commit()
+        self.backfill_ingested_files()
         logger.info("데이터베이스 초기화 완료")
     
+    def backfill_ingested_files(self) -> int:
+        """이전 방식(hash() 회의 ID)으로 적재한 회의를 ingested_files에 등록
+        
+        파일이 그대로면 다시 적재하지 않고, 바뀌었으면 기존 회의 ID로 교체 적재됨.
+        같은 파일이 여러 회의로 적재된 경우 가장 최근 회의를 기준으로 삼음.
+        """
+        rows = self.cursor.execute('''
+            SELECT m.meeting_id, m.file_path, COUNT(s.id)
+            FROM meetings m
+            LEFT JOIN speeches s ON s.meeting_id = m.meeting_id
+            WHERE m.file_path IS NOT NULL
+              AND m.meeting_id NOT IN (SELECT meeting_id FROM ingested_files WHERE meeting_id IS NOT NULL)
+            GROUP BY m.meeting_id
+            ORDER BY m.created_at DESC, m.rowid DESC
+        ''').fetchall()
+        
+        backfilled = 0
+        with self.conn:
+            for meeting_id, file_path, speeches in rows:
+                abs_path = os.path.abspath(file_path)
+                if not os.path.exists(abs_path):
+                    continue
+                try:
+                    file_hash = file_content_hash(abs_path)
+                except OSError:
+                    continue
+                cursor = self.conn.execute('''
+                    INSERT OR IGNORE INTO ingested_files (file_path, file_hash, meeting_id, speeches)
+                    VALUES (?, ?, ?, ?)
+                ''', (abs_path, file_hash, meeting_id, speeches))
+                backfilled += cursor.rowcount
+        
+        if backfilled:
+            logger.info(f"기존 적재 파일 {backfilled}개를 ingested_files에 등록")
+        return backfilled
+    
+    def resolve_meeting_id(self, file_path: str, default_id: str) -> str:
+        """파일의 기존 회의 ID (적재 기록 → 이전 방식 회의 순), 없으면 default_id"""
+        abs_path = os.path.abspath(file_path)
+        row = self.conn.execute('SELECT meeting_id FROM ingested_files WHERE file_path = ?', (abs_path,)).fetchone()
+        if row and row[0]:
+            return row[0]
+        
+        # 이전 방식은 실행 위치 기준 상대 경로를 저장했으므로 파일명으로 대조
+        filename = os.path.basename(file_path)
+        rows = self.conn.execute('''
+            SELECT meeting_id, file_path FROM meetings
+            WHERE file_path IN (?, ?) OR file_path LIKE ?
+            ORDER BY created_at DESC, rowid DESC
+        ''', (file_path, abs_path, f"%{filename}")).fetchall()
+        for meeting_id, stored_path in rows:
+            if os.path.abspath(stored_path) == abs_path or os.path.basename(stored_path) == filename:
+                return meeting_id
+        return default_id
+    
     def extract_politician_name_from_filename(self, filename: str) -> str:
         """파일명에서 정치인 이름 추출"""
-        # 파일명 패턴: 통합검색_국회회의록_발언자목록_강득구+(姜得求)_2025-08-16.xlsx
-        match = re.search(r'발언자목록_([^+]+)', filename)
-        if match:
-            return match.group(1).strip()
-        return "알수없음"
+        return extract_politician_name_from_filename(filename)
     
     def extract_date_from_filename(self, file_path: str) -> str:
         """파일명에서 날짜 추출"""
-        filename = os.path.basename(file_path)
-        match = re.search(r'(\d{4}-\d{2}-\d{2})', filename)
-        if match:
-            return match.group(1)
-        return datetime.now().strftime('%Y-%m-%d')
+        return extract_date_from_filename(file_path)
     
-    def process_excel_file(self, file_path: str) -> Dict:
-        """개별 엑셀 파일 처리"""
-        try:
-            # 파일명에서 정치인 이름 추출
-            filename = os.path.basename(file_path)
-            politician_name = self.extract_politician_name_from_filename(filename)
-            
-            logger.info(f"처리 중: {politician_name} - {filename}")
-            
-            # 여러 엔진으로 엑셀 파일 읽기 시도
-            df = None
-            for engine in ['openpyxl', 'xlrd']:
-                try:
-                    df = pd.read_excel(file_path, engine=engine)
-                    logger.info(f"엔진 {engine}으로 파일 읽기 성공")
-                    break
-                except Exception as e:
-                    logger.warning(f"엔진 {engine} 실패: {e}")
-                    continue
-            
-            if df is None:
-                logger.error(f"모든 엔진으로 파일 읽기 실패: {file_path}")
-                return {"success": False, "error": "파일 읽기 실패"}
-            
-            # 컬럼명 확인 및 정리
-            df.columns = df.columns.astype(str)
-            logger.info(f"컬럼명: {list(df.columns)}")
-            
-            # 발언자와 발언내용 컬럼 찾기
-            speaker_col = None
-            content_col = None
-            
-            for col in df.columns:
-                col_lower = col.lower()
-                if '발언자' in col or 'speaker' in col_lower or '이름' in col:
-                    speaker_col = col
-                elif '발언' in col or 'content' in col_lower or '내용' in col or '말씀' in col:
-                    content_col = col
-            
-            if not speaker_col or not content_col:
-                logger.warning(f"발언자 또는 발언내용 컬럼을 찾을 수 없습니다")
-                logger.warning(f"사용 가능한 컬럼: {list(df.columns)}")
-                return {"success": False, "error": "컬럼을 찾을 수 없음"}
-            
-            logger.info(f"발언자 컬럼: {speaker_col}, 발언내용 컬럼: {content_col}")
-            
-            # 회의 정보 생성
-            meeting_id = f"meeting_{hash(file_path) % 1000000}"
-            meeting_date = self.extract_date_from_filename(file_path)
-            meeting_title = f"국회회의록_{politician_name}_{meeting_date}"
+    def is_ingested(self, file_path: str, file_hash: str) -> bool:
+        """같은 내용의 파일을 이미 적재했는지 확인"""
+        self.cursor.execute('SELECT file_hash FROM ingested_files WHERE file_path = ?',
+                            (os.path.abspath(file_path),))
+        row = self.cursor.fetchone()
+        return row is not None and row[0] == file_hash
+    
+    def store_parsed_file(self, parsed: Dict) -> int:
+        """파싱된 파일 하나를 단일 트랜잭션으로 적재, 저장한 발언 수 반환"""
+        meeting_id = parsed["meeting_id"]
+        file_path = parsed["file_path"]
+        speech_rows = [
+            (meeting_id, speaker, content, order)
+            for order, (speaker, content) in enumerate(parsed["speeches"], 1)
+        ]
+        
+        with self.conn:
+            # 내용이 바뀐 파일/강제 재적재 시 이전 발언 제거 (중복 방지)
+            self.conn.execute('DELETE FROM speeches WHERE meeting_id = ?', (meeting_id,))
             
-            # 회의 데이터 저장
-            self.cursor.execute('''
-                INSERT OR IGNORE INTO meetings (meeting_id, title, date, file_path)
+            # 회의 데이터 저장 (재적재 시 제목/날짜 갱신)
+            self.conn.execute('''
+                INSERT INTO meetings (meeting_id, title, date, file_path)
                 VALUES (?, ?, ?, ?)
-            ''', (meeting_id, meeting_title, meeting_date, file_path))
-            
-            # 발언 데이터 처리
-            speeches_processed = 0
-            for idx, row in df.iterrows():
-                speaker = str(row[speaker_col]).strip()
-                content = str(row[content_col]).strip()
-                
-                if speaker and content and speaker != 'nan' and content != 'nan' and len(content) > 10:
-                    # 발언 데이터 저장
-                    self.cursor.execute('''
-                        INSERT INTO speeches (meeting_id, speaker_name, speech_content, speech_order)
-                        VALUES (?, ?, ?, ?)
-                    ''', (meeting_id, speaker, content, speeches_processed + 1))
-                    
-                    speeches_processed += 1
+                ON CONFLICT(meeting_id) DO UPDATE SET
+                    title = excluded.title, date = excluded.date, file_path = excluded.file_path
+            ''', (meeting_id, parsed["meeting_title"], parsed["meeting_date"], file_path))
             
-            self.conn.commit()
-            logger.info(f"✅ {filename}: {speeches_processed}발언 처리")
-            
-            return {
-                "success": True,
-                "politician_name": politician_name,
-                "speeches_processed": speeches_processed,
-                "meeting_id": meeting_id
-            }
+            # 발언 데이터 일괄 저장
+            self.conn.executemany('''
+                INSERT INTO speeches (meeting_id, speaker_name, speech_content, speech_order)
+                VALUES (?, ?, ?, ?)
+            ''', speech_rows)
             
-        except Exception as e:
+            self.conn.execute('''
+                INSERT OR REPLACE INTO ingested_files (file_path, file_hash, meeting_id, speeches)
+                VALUES (?, ?, ?, ?)
+            ''', (os.path.abspath(file_path), parsed["file_hash"], meeting_id, len(speech_rows)))
+        
+        return len(speech_rows)
+    
+    def _store_result(self, parsed: Dict) -> Dict:
+        filename = os.path.basename(parsed["file_path"])
+        if not parsed["success"]:
+            return parsed
+        # 이미 적재된 파일(이전 방식 ID 포함)은 기존 회의 ID를 그대로 사용 (중복 회의 방지)
+        parsed = {**parsed, "meeting_id": self.resolve_meeting_id(parsed["file_path"], parsed["meeting_id"])}
+        try:
+            speeches_processed = self.store_parsed_file(parsed)
+        except sqlite3.Error as e:
+            logger.error(f"파일 적재 실패 ({parsed['file_path']}): {e}")
+            return {"success": False, "file_path": parsed["file_path"], "error": str(e)}
+        
+        logger.info(f"✅ {filename}: {speeches_processed}발언 처리")
+        return {
+            "success": True,
+            "skipped": False,
+            "politician_name": parsed["politician_name"],
+            "speeches_processed": speeches_processed,
+            "meeting_id": parsed["meeting_id"]
+        }
+    
+    def process_excel_file(self, file_path: str, force: bool = False) -> Dict:
+        """개별 엑셀 파일 처리 (이미 적재한 내용이면 건너뜀)"""
+        try:
+            file_hash = file_content_hash(file_path)
+        except OSError as e:
             logger.error(f"파일 처리 실패 ({file_path}): {e}")
             return {"success": False, "error": str(e)}
+        
+        if not force and self.is_ingested(file_path, file_hash):
+            logger.info(f"⏭️ 이미 적재된 파일: {os.path.basename(file_path)}")
+            return {"success": True, "skipped": True, "speeches_processed": 0}
+        
+        logger.info(f"처리 중: {self.extract_politician_name_from_filename(os.path.basename(file_path))} - "
+                    f"{os.path.basename(file_path)}")
+        return self._store_result(parse_meeting_workbook(file_path, file_hash))
     
-    def process_all_files(self, directory_path: str) -> Dict:
-        """디렉토리 내 모든 엑셀 파일 처리"""
-        excel_files = [f for f in os.listdir(directory_path) if f.endswith('.xlsx')]
+    def process_all_files(self, directory_path: str, max_workers: Optional[int] = None,
+                          force: bool = False) -> Dict:
+        """디렉토리 내 모든 엑셀 파일 처리
+
+        워크북 파싱은 프로세스 풀에서 병렬로, DB 적재는 이 프로세스에서 파일 단위 트랜잭션으로 처리.
+        max_workers=1이면 프로세스 풀 없이 순차 처리.
+        """
+        excel_files = sorted(f for f in os.listdir(directory_path) if f.endswith('.xlsx'))
         total_files = len(excel_files)
         successful_files = 0
+        skipped_files = 0
         total_speeches = 0
         total_meetings = 0
         
         logger.info(f"총 {total_files}개의 엑셀 파일을 처리합니다.")
         
+        # 1. 내용 해시로 이미 적재한 파일 제외
+        pending: List[Tuple[str, str]] = []
         for filename in excel_files:
             file_path = os.path.join(directory_path, filename)
-            result = self.process_excel_file(file_path)
-            
+            try:
+                file_hash = file_content_hash(file_path)
+            except OSError as e:
+                logger.error(f"❌ {filename}: {e}")
+                continue
+            if not force and self.is_ingested(file_path, file_hash):
+                skipped_files += 1
+                continue
+            pending.append((file_path, file_hash))
+        
+        if skipped_files:
+            logger.info(f"⏭️ 이미 적재된 파일 {skipped_files}개 건너뜀")
+        
+        # 2. 병렬 파싱 → 완료 순서대로 적재
+        def handle(parsed: Dict):
+            nonlocal successful_files, total_speeches, total_meetings
+            result = self._store_result(parsed)
             if result["success"]:
                 successful_files += 1
                 total_speeches += result.get("speeches_processed", 0)
                 total_meetings += 1
             else:
-                logger.error(f"❌ {filename}: {result.get('error', '알 수 없는 오류')}")
+                logger.error(f"❌ {os.path.basename(parsed['file_path'])}: {result.get('error', '알 수 없는 오류')}")
+        
+        if max_workers == 1 or len(pending) <= 1:
+            for file_path, file_hash in pending:
+                handle(parse_meeting_workbook(file_path, file_hash))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = [pool.submit(parse_meeting_workbook, file_path, file_hash)
+                           for file_path, file_hash in pending]
+                for future in as_completed(futures):
+                    handle(future.result())
         
-        logger.info(f"처리 완료: {successful_files}/{total_files} 파일 성공")
+        logger.info(f"처리 완료: {successful_files}/{len(pending)} 파일 성공 (건너뜀 {skipped_files}개)")
         logger.info(f"총 회의: {total_meetings}, 총 발언: {total_speeches}")
         
         return {
             "total_files": total_files,
             "successful_files": successful_files,
+            "skipped_files": skipped_files,
             "total_meetings": total_meetings,
             "total_speeches": total_speeches
         }
@@ -215,7 +407,7 @@ class ExcelMeetingProcessor:
                     COUNT(*) as total_speeches,
                     SUM(LENGTH(speech_content)) as total_words,
                     AVG(LENGTH(speech_content)) as avg_speech_length,
-                    COUNT(DISTINCT meeting_id) as committee_diversity,
+                    COUNT(DISTINCT s.meeting_id) as committee_diversity,
                     MAX(m.date) as last_speech_date
                 FROM speeches s
                 JOIN meetings m ON s.meeting_id = m.meeting_id
@@ -225,13 +417,12 @@ class ExcelMeetingProcessor:
             
             stats_data = self.cursor.fetchall()
             
-            for row in stats_data:
-                self.cursor.execute('''
-                    INSERT INTO speech_statistics 
-                    (politician_name, total_speeches, total_words, avg_speech_length, 
-                     committee_diversity, last_speech_date)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', row)
+            self.cursor.executemany('''
+                INSERT INTO speech_statistics 
+                (politician_name, total_speeches, total_words, avg_speech_length, 
+                 committee_diversity, last_speech_date)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', stats_data)
             
             self.conn.commit()
             logger.info(f"발언 통계 생성 완료: {len(stats_data)}명")
@@ -256,7 +447,7 @@ class ExcelMeetingProcessor:
             
             # 상위 발언자
             self.cursor.execute('''
-                SELECT speaker_name, total_speeches, total_words
+                SELECT politician_name, total_speeches, total_words
                 FROM speech_statistics
                 ORDER BY total_speeches DESC
                 LIMIT 10
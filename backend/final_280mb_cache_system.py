@@ -19,6 +19,8 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict, field
 
+from cache_engine import BoundedLRUCache, CacheBudget, resolve_memory_limit
+
 logger = logging.getLogger(__name__)
 
 class Final280MBCacheSystem:
@@ -31,10 +33,13 @@ class Final280MBCacheSystem:
         self.target_utilization = 0.95  # 95% 목표
         
         # 캐시 저장소 (압축 없음)
-        self.regional_cache = {}  # 읍면동별 데이터
-        self.candidate_cache = {}  # 후보자 데이터
-        self.election_cache = {}   # 선거 결과
-        self.metadata_cache = {}   # 메타데이터
+        # 공유 바이트 예산: 항목 크기는 삽입 시 한 번만 기록, 하드 리밋 초과 시 LRU 제거
+        # (CACHE_MEMORY_LIMIT_MB 환경변수로 렌더 플랜 메모리에 맞게 조정)
+        self.cache_budget = CacheBudget('final_280mb', resolve_memory_limit(self.target_size))
+        self.regional_cache = BoundedLRUCache('regional', budget=self.cache_budget)  # 읍면동별 데이터
+        self.candidate_cache = BoundedLRUCache('candidate', budget=self.cache_budget)  # 후보자 데이터
+        self.election_cache = BoundedLRUCache('election', budget=self.cache_budget)   # 선거 결과
+        self.metadata_cache = BoundedLRUCache('metadata', budget=self.cache_budget)   # 메타데이터
         
         self.cache_stats = {
             'total_requests': 0,
@@ -266,18 +271,6 @@ class Final280MBCacheSystem:
             logger.error(f"❌ 최종 280MB 캐시 로드 실패: {e}")
             return False
 
-    def _get_cache_size(self, cache_dict: Dict) -> int:
-        """캐시 크기 계산 (압축 없음)"""
-        total_size = 0
-        for key, value in cache_dict.items():
-            if isinstance(value, bytes):
-                total_size += len(value)
-            elif isinstance(value, str):
-                total_size += len(value.encode('utf-8'))
-            else:
-                total_size += len(json.dumps(value, ensure_ascii=False).encode('utf-8'))
-        return total_size
-
     async def search_region_with_full_elections(self, region_name: str) -> Dict[str, Any]:
         """읍면동별 완전한 선거결과 검색"""
         
@@ -347,10 +340,10 @@ class Final280MBCacheSystem:
     def get_final_cache_statistics(self) -> Dict[str, Any]:
         """최종 캐시 통계"""
         
-        regional_size = self._get_cache_size(self.regional_cache)
-        candidate_size = self._get_cache_size(self.candidate_cache)
-        election_size = self._get_cache_size(self.election_cache)
-        metadata_size = self._get_cache_size(self.metadata_cache)
+        regional_size = self.regional_cache.size_bytes
+        candidate_size = self.candidate_cache.size_bytes
+        election_size = self.election_cache.size_bytes
+        metadata_size = self.metadata_cache.size_bytes
         total_size = regional_size + candidate_size + election_size + metadata_size
         
         return {
@@ -360,6 +353,7 @@ class Final280MBCacheSystem:
                 'utilization_percentage': round((total_size / self.target_size) * 100, 2),
                 'target_achieved': total_size >= (self.target_size * 0.90)
             },
+            'memory_budget': self.cache_budget.stats(),
             'cache_breakdown': {
                 'regional_data_mb': round(regional_size / 1024 / 1024, 2),
                 'candidate_data_mb': round(candidate_size / 1024 / 1024, 2),
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+한글 이름 검색 색인
+정치인 이름을 한 번만 분해해서 정확/부분/초성/오타 검색을 색인 조회로 처리
+- 정확/부분 일치: 음절 부분 문자열 → 이름
+- 초성 검색: 초성 키/접두사 → 이름 ("ㄱㄱㅅ", "강ㄱㅅ" 모두 지원)
+- 오타 검색: 자모 분해 문자열 BK-tree (편집 거리 범위 탐색)
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ('', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ',
+             'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ')
+
+CHOSEONG_SET = frozenset(CHOSEONG)
+
+
+def is_hangul_syllable(char: str) -> bool:
+    return HANGUL_BASE <= ord(char) <= HANGUL_LAST
+
+
+def decompose(char: str) -> Tuple[str, str, str]:
+    """한글 음절을 (초성, 중성, 종성)으로 분해. 음절이 아니면 (char, '', '')"""
+    if not is_hangul_syllable(char):
+        return char, '', ''
+    offset = ord(char) - HANGUL_BASE
+    return CHOSEONG[offset // 588], JUNGSEONG[(offset % 588) // 28], JONGSEONG[offset % 28]
+
+
+def to_choseong(text: str) -> str:
+    """초성 문자열 ('강경숙' → 'ㄱㄱㅅ'). 음절이 아닌 문자는 그대로 유지"""
+    return ''.join(decompose(char)[0] for char in text)
+
+
+def to_jamo(text: str) -> str:
+    """자모 분해 문자열 ('명' → 'ㅁㅕㅇ')"""
+    return ''.join(''.join(decompose(char)) for char in text)
+
+
+def is_choseong_query(text: str) -> bool:
+    """초성이 하나 이상 포함된 초성/혼합 검색어인지 확인 ('ㄱㄱㅅ', '강ㄱㅅ')"""
+    text = text.replace(' ', '')
+    return bool(text) and any(char in CHOSEONG_SET for char in text) and \
+        all(char in CHOSEONG_SET or is_hangul_syllable(char) for char in text)
+
+
+def levenshtein(a: str, b: str) -> int:
+    """편집 거리 (BK-tree 거리 함수)"""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """편집 거리 BK-tree - 반경 r 이내 항목만 방문"""
+
+    def __init__(self):
+        self.root: Optional[list] = None  # [term, {distance: child}]
+        self.size = 0
+
+    def add(self, term: str):
+        if self.root is None:
+            self.root = [term, {}]
+            self.size = 1
+            return
+        node = self.root
+        while True:
+            distance = levenshtein(term, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [term, {}]
+                self.size += 1
+                return
+            node = child
+
+    def search(self, term: str, max_distance: int) -> List[Tuple[int, str]]:
+        """(거리, 항목) 목록, 거리 오름차순"""
+        if self.root is None:
+            return []
+        found: List[Tuple[int, str]] = []
+        stack = [self.root]
+        while stack:
+            node_term, children = stack.pop()
+            distance = levenshtein(term, node_term)
+            if distance <= max_distance:
+                found.append((distance, node_term))
+            low, high = distance - max_distance, distance + max_distance
+            for child_distance, child in children.items():
+                if low <= child_distance <= high:
+                    stack.append(child)
+        found.sort()
+        return found
+
+
+class HangulNameIndex:
+    """이름 → 레코드 색인 (부분 문자열/초성/자모 BK-tree)"""
+
+    def __init__(self, max_fuzzy_distance: int = 2):
+        self.max_fuzzy_distance = max_fuzzy_distance
+        self.records: Dict[str, List[Any]] = {}
+        self.substrings: Dict[str, Set[str]] = {}
+        self.choseong_keys: Dict[str, Set[str]] = {}      # 전체 초성 → 이름
+        self.choseong_prefixes: Dict[str, Set[str]] = {}  # 초성 접두사 → 이름
+        self.jamo_to_names: Dict[str, Set[str]] = {}
+        self.jamo_tree = BKTree()
+        self.name_lengths: Set[int] = set()
+
+    def add(self, name: str, record: Any = None):
+        """이름 추가 (동명이인은 같은 키에 레코드 누적)"""
+        name = (name or '').strip()
+        if not name:
+            return
+        if name in self.records:
+            self.records[name].append(record)
+            return
+        self.records[name] = [record]
+        self.name_lengths.add(len(name))
+
+        for start in range(len(name)):
+            for end in range(start + 1, len(name) + 1):
+                self.substrings.setdefault(name[start:end], set()).add(name)
+
+        choseong = to_choseong(name)
+        self.choseong_keys.setdefault(choseong, set()).add(name)
+        for length in range(1, len(choseong) + 1):
+            self.choseong_prefixes.setdefault(choseong[:length], set()).add(name)
+
+        jamo = to_jamo(name)
+        self.jamo_to_names.setdefault(jamo, set()).add(name)
+        self.jamo_tree.add(jamo)
+
+    def add_many(self, items: Iterable[Tuple[str, Any]]):
+        for name, record in items:
+            self.add(name, record)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.records
+
+    def get(self, name: str) -> List[Any]:
+        return self.records.get(name, [])
+
+    def containing(self, query: str) -> Set[str]:
+        """query를 부분 문자열로 포함하는 이름"""
+        return self.substrings.get(query, set())
+
+    def contained_in(self, text: str) -> Set[str]:
+        """text 안에 들어 있는 이름 ('이재명 뉴스' → {'이재명'})"""
+        found: Set[str] = set()
+        for length in self.name_lengths:
+            for start in range(len(text) - length + 1):
+                candidate = text[start:start + length]
+                if candidate in self.records:
+                    found.add(candidate)
+        return found
+
+    def by_choseong(self, query: str, prefix: bool = False) -> Set[str]:
+        """초성/혼합 검색 ('ㄱㄱㅅ', '강ㄱㅅ'). prefix=True면 접두 일치"""
+        query = query.replace(' ', '')
+        key = to_choseong(query)
+        names = (self.choseong_prefixes if prefix else self.choseong_keys).get(key, set())
+        if all(char in CHOSEONG_SET for char in query):
+            return names
+        # 완성 음절 위치는 실제 음절까지 일치해야 함
+        return {
+            name for name in names
+            if all(char in CHOSEONG_SET or name[i] == char for i, char in enumerate(query))
+        }
+
+    def fuzzy(self, query: str, max_distance: Optional[int] = None) -> List[Tuple[str, float]]:
+        """자모 편집 거리 기반 유사 이름 (이름, 유사도) 목록"""
+        if max_distance is None:
+            max_distance = self.max_fuzzy_distance
+        query_jamo = to_jamo(query)
+        results: List[Tuple[str, float]] = []
+        for distance, jamo in self.jamo_tree.search(query_jamo, max_distance):
+            similarity = 1 - distance / max(len(query_jamo), len(jamo))
+            for name in self.jamo_to_names[jamo]:
+                results.append((name, round(similarity, 3)))
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'names': len(self.records),
+            'substring_keys': len(self.substrings),
+            'choseong_keys': len(self.choseong_keys),
+            'bk_tree_nodes': self.jamo_tree.size
+        }
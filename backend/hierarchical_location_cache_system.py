@@ -19,6 +19,9 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 import random
 
+from cache_engine import BoundedLRUCache, CacheBudget, resolve_memory_limit
+from place_name_index import DEFAULT_PLACE_NAMES_FILE, PlaceNameIndex
+
 logger = logging.getLogger(__name__)
 
 class HierarchicalLocationCacheSystem:
@@ -33,14 +36,19 @@ class HierarchicalLocationCacheSystem:
         self.total_max_size = 280 * 1024 * 1024         # 280MB
         
         # 캐시 저장소
-        self.politician_cache = {}
-        self.location_cache = {}
-        self.metadata_cache = {}
+        # 공유 바이트 예산: 항목 크기는 삽입 시 한 번만 기록, 하드 리밋 초과 시 LRU 제거
+        # (CACHE_MEMORY_LIMIT_MB 환경변수로 렌더 플랜 메모리에 맞게 조정)
+        self.cache_budget = CacheBudget('hierarchical_location', resolve_memory_limit(self.total_max_size))
+        self.politician_cache = BoundedLRUCache('politician', budget=self.cache_budget)
+        self.location_cache = BoundedLRUCache('location', budget=self.cache_budget)
+        self.metadata_cache = BoundedLRUCache('metadata', budget=self.cache_budget)
         
         # 계층적 지명 데이터베이스
         self.hierarchical_locations = {}
         self.location_aliases = {}  # 별칭 매핑
         self.ambiguous_terms = {}   # 중복 지명
+        self.place_index = PlaceNameIndex()       # 지명 접두/n-gram 색인
+        self.politician_index = PlaceNameIndex()  # 정치인 이름 색인
         
         # 실제 정치인 데이터 로드
         self.real_politicians = []
@@ -62,12 +70,14 @@ class HierarchicalLocationCacheSystem:
                     politician_photos = json.load(f)
                     
                 for name, photo_url in politician_photos.items():
-                    self.real_politicians.append({
+                    politician = {
                         'name': name,
                         'photo_url': photo_url,
                         'position': '국회의원',
                         'term': '22대'
-                    })
+                    }
+                    self.real_politicians.append(politician)
+                    self.politician_index.add(name, 'politician', payload=politician, stem_aliases=False)
             
             logger.info(f"✅ 실제 정치인 데이터 로드: {len(self.real_politicians)}명")
             
@@ -274,6 +284,9 @@ class HierarchicalLocationCacheSystem:
         # 별칭 매핑 구축
         self._build_alias_mapping()
         
+        # 옛 지명 / 전국 읍면동 레코드 색인
+        loaded_places = self._load_place_name_records()
+        
         # 중복 지명 식별
         self._identify_ambiguous_terms()
         
@@ -283,6 +296,7 @@ class HierarchicalLocationCacheSystem:
         logger.info(f"  🏘️ 구: {len(gu_data)}개")
         logger.info(f"  🏠 동: {len(dong_data)}개")
         logger.info(f"  🔍 별칭: {len(self.location_aliases)}개")
+        logger.info(f"  📚 지명 파일 추가 항목: {loaded_places}개")
         logger.info(f"  ⚠️ 중복 지명: {len(self.ambiguous_terms)}개")
 
     def _build_alias_mapping(self):
@@ -290,15 +304,42 @@ class HierarchicalLocationCacheSystem:
         
         for level, locations in self.hierarchical_locations.items():
             for location_key, location_data in locations.items():
+                location_entry = {
+                    'key': location_key,
+                    'level': level,
+                    'data': location_data
+                }
                 for alias in location_data['official_names']:
                     if alias not in self.location_aliases:
                         self.location_aliases[alias] = []
                     
-                    self.location_aliases[alias].append({
-                        'key': location_key,
-                        'level': level,
-                        'data': location_data
-                    })
+                    self.location_aliases[alias].append(location_entry)
+                
+                # 접두/부분 검색 색인 (공식 명칭 + 별칭 + 약칭)
+                names = location_data['official_names']
+                self.place_index.add(
+                    names[0], level, key=location_key,
+                    parents={
+                        'sido': location_data.get('parent_sido'),
+                        'sigungu': location_data.get('parent_sigungu'),
+                        'gu': location_data.get('parent_gu')
+                    },
+                    aliases=names[1:] + [location_key],
+                    payload=location_entry
+                )
+
+    def _load_place_name_records(self) -> int:
+        """지명 레코드 파일(옛 지명, 읍면동 전체) 로드. 추가된 항목 수 반환"""
+        
+        path = os.environ.get('PLACE_NAMES_FILE', DEFAULT_PLACE_NAMES_FILE)
+        if not os.path.exists(path):
+            logger.warning(f"⚠️ 지명 레코드 파일 없음: {path}")
+            return 0
+        try:
+            return self.place_index.load_json(path)
+        except (OSError, ValueError) as e:
+            logger.error(f"❌ 지명 레코드 파일 로드 실패: {e}")
+            return 0
 
     def _identify_ambiguous_terms(self):
         """중복 지명 식별"""
@@ -328,21 +369,29 @@ class HierarchicalLocationCacheSystem:
         }
         
         self.ambiguous_terms.update(additional_ambiguous)
+        
+        # 역/시설 등 행정구역 외 후보도 제안용으로 색인
+        for term, options in additional_ambiguous.items():
+            for option in options:
+                if option['level'] not in self.hierarchical_locations:
+                    self.place_index.add(option['key'], option['level'], aliases=[term], payload=option)
 
     def classify_search_input(self, search_term: str) -> Dict[str, Any]:
         """검색 입력 분류 및 처리"""
         
         search_term = search_term.strip()
         
-        # 1. 정치인 이름 확인
-        for politician in self.real_politicians:
-            if politician['name'] == search_term or search_term in politician['name']:
-                return {
-                    'type': 'politician',
-                    'exact_match': True,
-                    'data': politician,
-                    'confidence': 1.0
-                }
+        # 1. 정치인 이름 확인 (정확/접두/부분 일치, 포함 일치는 자르기 전에 제외)
+        politician_matches = self.politician_index.search(
+            search_term, limit=1, match_types=('exact', 'prefix', 'infix')
+        )
+        if politician_matches:
+            return {
+                'type': 'politician',
+                'exact_match': True,
+                'data': politician_matches[0]['payload'],
+                'confidence': 1.0
+            }
         
         # 2. 중복 지명 확인
         if search_term in self.ambiguous_terms:
@@ -371,25 +420,20 @@ class HierarchicalLocationCacheSystem:
                     'confidence': 0.9
                 }
         
-        # 4. 부분 매칭
-        partial_matches = []
+        # 4. 부분 매칭 (색인 조회, 점수/계층 순 정렬)
+        candidates = self.place_index.search(search_term, limit=5, levels=self.hierarchical_locations.keys())
         
-        for alias, locations in self.location_aliases.items():
-            if search_term in alias or alias in search_term:
-                for location in locations:
-                    partial_matches.append({
-                        'alias': alias,
-                        'location': location,
-                        'match_score': len(search_term) / len(alias)
-                    })
-        
-        if partial_matches:
-            # 매칭 점수 기준 정렬
-            partial_matches.sort(key=lambda x: x['match_score'], reverse=True)
+        if candidates:
+            partial_matches = [{
+                'alias': candidate['matched_term'],
+                'location': candidate['payload'],
+                'label': candidate['label'],
+                'match_score': candidate['score']
+            } for candidate in candidates]
             
             return {
                 'type': 'partial_matches',
-                'matches': partial_matches[:5],
+                'matches': partial_matches,
                 'confidence': 0.7
             }
         
@@ -405,6 +449,18 @@ class HierarchicalLocationCacheSystem:
         
         suggestions = []
         
+        # 입력 앞부분을 줄여가며 색인에서 가까운 후보 탐색
+        term = search_term.replace(' ', '')
+        for length in range(len(term) - 1, 0, -1):
+            prefix = term[:length]
+            matches = self.politician_index.search(prefix, limit=5) + self.place_index.search(prefix, limit=5)
+            if matches:
+                suggestions.extend(match['name'] for match in matches)
+                break
+        
+        if suggestions:
+            return list(dict.fromkeys(suggestions))
+        
         # 정치인 이름 제안
         for politician in self.real_politicians[:10]:
             suggestions.append(politician['name'])
@@ -673,13 +729,13 @@ class HierarchicalLocationCacheSystem:
             self._load_hierarchical_metadata()
             
             # 최종 통계
-            total_size = current_size + location_current_size + self._get_cache_size(self.metadata_cache)
+            total_size = current_size + location_current_size + self.metadata_cache.size_bytes
             utilization = (total_size / self.total_max_size) * 100
             
             logger.info(f"✅ 계층적 지명 캐시 로드 완료:")
             logger.info(f"  👥 정치인: {politician_count}명, {current_size / 1024 / 1024:.1f}MB")
             logger.info(f"  🏘️ 지명: {location_count}개, {location_current_size / 1024 / 1024:.1f}MB")
-            logger.info(f"  📋 메타데이터: {self._get_cache_size(self.metadata_cache) / 1024 / 1024:.1f}MB")
+            logger.info(f"  📋 메타데이터: {self.metadata_cache.size_bytes / 1024 / 1024:.1f}MB")
             logger.info(f"  💾 총 사용량: {total_size / 1024 / 1024:.1f}MB ({utilization:.1f}%)")
             
             return True
@@ -727,16 +783,6 @@ class HierarchicalLocationCacheSystem:
         
         self.metadata_cache['hierarchical_metadata'] = json_str.encode('utf-8')
 
-    def _get_cache_size(self, cache_dict: Dict) -> int:
-        """캐시 크기 계산"""
-        total_size = 0
-        for key, value in cache_dict.items():
-            if isinstance(value, bytes):
-                total_size += len(value)
-            else:
-                total_size += len(str(value).encode('utf-8'))
-        return total_size
-
     async def hierarchical_search(self, search_term: str) -> Dict[str, Any]:
         """계층적 지명 검색"""
         
@@ -862,9 +908,9 @@ class HierarchicalLocationCacheSystem:
     def get_hierarchical_cache_stats(self) -> Dict[str, Any]:
         """계층적 캐시 통계"""
         
-        politician_size = self._get_cache_size(self.politician_cache)
-        location_size = self._get_cache_size(self.location_cache)
-        metadata_size = self._get_cache_size(self.metadata_cache)
+        politician_size = self.politician_cache.size_bytes
+        location_size = self.location_cache.size_bytes
+        metadata_size = self.metadata_cache.size_bytes
         total_size = politician_size + location_size + metadata_size
         
         return {
@@ -875,6 +921,7 @@ class HierarchicalLocationCacheSystem:
                 'location_cache_mb': round(location_size / 1024 / 1024, 2),
                 'metadata_cache_mb': round(metadata_size / 1024 / 1024, 2)
             },
+            'memory_budget': self.cache_budget.stats(),
             'hierarchical_coverage': {
                 'sido_count': len(self.hierarchical_locations['sido']),
                 'sigungu_count': len(self.hierarchical_locations['sigungu']),
@@ -883,6 +930,10 @@ class HierarchicalLocationCacheSystem:
                 'total_aliases': len(self.location_aliases),
                 'ambiguous_terms': len(self.ambiguous_terms)
             },
+            'search_index': {
+                'places': self.place_index.stats(),
+                'politicians': self.politician_index.stats()
+            },
             'search_capabilities': {
                 'politician_search': f'{len(self.real_politicians)}명',
                 'hierarchical_location_search': '4-level complete',
@@ -6,13 +6,14 @@
 """
 
 import xml.etree.ElementTree as ET
-import requests
 import json
-import time
 from typing import Dict, List, Optional
 import logging
 from datetime import datetime
 
+from lod_fetch_engine import CrawlCheckpoint, LODFetchEngine
+from lod_stream_parser import parse_election_file
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -34,42 +35,27 @@ class HierarchicalLODProcessor:
             'rdfs': 'http://www.w3.org/2000/01/rdf-schema#',
             'foaf': 'http://xmlns.com/foaf/0.1/'
         }
+        self.fetch_engine = LODFetchEngine()
     
     def extract_sub_elections(self, file_path: str) -> Dict:
         """상위 선거 파일에서 하위 선거 ID들을 추출합니다."""
         logger.info(f"상위 선거 파일 분석: {file_path}")
         
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            # 선거 정보 추출
-            election_element = root.find('.//no:Election', self.namespaces)
+            parsed = parse_election_file(file_path)
             
-            if election_element is None:
+            if not parsed['has_election']:
                 logger.warning("선거 정보를 찾을 수 없습니다")
                 return {}
             
             # 기본 정보
-            election_info = {}
-            
-            name_elem = election_element.find('.//no:name', self.namespaces)
-            if name_elem is not None:
-                election_info['name'] = name_elem.text
-            
-            election_day_elem = election_element.find('.//no:electionDay', self.namespaces)
-            if election_day_elem is not None:
-                election_info['election_day'] = election_day_elem.text
-            
-            # 하위 선거들 추출
-            sub_election_elements = election_element.findall('.//no:lowerPartElection', self.namespaces)
-            sub_elections = []
+            election_info = {
+                key: parsed['election_info'][key]
+                for key in ('name', 'election_day') if key in parsed['election_info']
+            }
             
-            for element in sub_election_elements:
-                resource = element.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource')
-                if resource:
-                    sub_election_id = resource.split('/')[-1]  # Elec_220200415 형태
-                    sub_elections.append(sub_election_id)
+            # 하위 선거들 (Elec_220200415 형태)
+            sub_elections = [resource.split('/')[-1] for resource in parsed['sub_election_uris']]
             
             election_info['sub_elections'] = sub_elections
             election_info['sub_elections_count'] = len(sub_elections)
@@ -86,24 +72,16 @@ class HierarchicalLODProcessor:
         try:
             sub_election_url = f"http://data.nec.go.kr/data/{sub_election_id}?output=rdfxml"
             
-            response = requests.get(sub_election_url, timeout=30)
+            content = self.fetch_engine.fetch(sub_election_url)
             
-            if response.status_code == 200:
-                root = ET.fromstring(response.content)
-                
+            if content is not None:
                 # 후보자 URI들 추출
-                candidate_elements = root.findall('.//no:hasCandidate', self.namespaces)
-                candidate_uris = []
-                
-                for element in candidate_elements:
-                    resource = element.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource')
-                    if resource:
-                        candidate_uris.append(resource)
+                candidate_uris = parse_election_file(content)['candidate_uris']
                 
                 logger.info(f"✅ {sub_election_id}: {len(candidate_uris)}명 후보자 URI 추출")
                 return candidate_uris
             else:
-                logger.warning(f"❌ {sub_election_id}: HTTP {response.status_code}")
+                logger.warning(f"❌ {sub_election_id}: 하위 선거 문서 수집 실패")
                 return []
                 
         except Exception as e:
@@ -111,40 +89,14 @@ class HierarchicalLODProcessor:
             return []
     
     def fetch_candidate_details(self, candidate_uris: List[str], election_info: Dict, sub_election_id: str) -> List[Dict]:
-        """후보자 상세 정보를 가져옵니다."""
+        """후보자 상세 정보를 가져옵니다. (병렬 수집, 하위 선거별 체크포인트로 이어받기)"""
         logger.info(f"후보자 상세 정보 수집 시작: {len(candidate_uris)}명 ({sub_election_id})")
         
-        candidates = []
-        failed_requests = []
-        
-        for i, uri in enumerate(candidate_uris):
-            try:
-                logger.info(f"처리 중: {i+1}/{len(candidate_uris)} - {uri}")
-                
-                # RDF 형식으로 요청
-                rdf_url = uri.replace('/resource/', '/data/') + "?output=rdfxml"
-                
-                response = requests.get(rdf_url, timeout=30)
-                
-                if response.status_code == 200:
-                    candidate_data = self._parse_candidate_rdf(response.content, uri, election_info, sub_election_id)
-                    if candidate_data:
-                        candidates.append(candidate_data)
-                        logger.info(f"✅ 성공: {candidate_data.get('name', 'Unknown')}")
-                    else:
-                        logger.warning(f"❌ 데이터 파싱 실패: {uri}")
-                        failed_requests.append(uri)
-                else:
-                    logger.warning(f"❌ HTTP 오류 {response.status_code}: {uri}")
-                    failed_requests.append(uri)
-                
-                # 요청 간격 조절 (서버 부하 방지)
-                time.sleep(0.5)
-                
-            except Exception as e:
-                logger.error(f"❌ 요청 실패 {uri}: {str(e)}")
-                failed_requests.append(uri)
-                continue
+        candidates, failed_requests = self.fetch_engine.crawl(
+            candidate_uris,
+            lambda uri, content: self._parse_candidate_rdf(content, uri, election_info, sub_election_id),
+            CrawlCheckpoint(sub_election_id)
+        )
         
         logger.info(f"상세 정보 수집 완료 - 성공: {len(candidates)}명, 실패: {len(failed_requests)}명")
         
@@ -273,54 +225,16 @@ class HierarchicalLODProcessor:
             return None
     
     def _fetch_party_name(self, party_resource: str) -> Optional[str]:
-        """정당 리소스에서 정당명을 가져옵니다."""
-        try:
-            party_rdf_url = party_resource.replace('/resource/', '/data/') + "?output=rdfxml"
-            response = requests.get(party_rdf_url, timeout=10)
-            
-            if response.status_code == 200:
-                root = ET.fromstring(response.content)
-                
-                name_patterns = [
-                    './/no:name',
-                    './/rdfs:label', 
-                    './/foaf:name'
-                ]
-                
-                for pattern in name_patterns:
-                    name_elem = root.find(pattern, self.namespaces)
-                    if name_elem is not None and name_elem.text:
-                        return name_elem.text.strip()
-                        
-        except Exception as e:
-            logger.warning(f"정당명 조회 실패 {party_resource}: {str(e)}")
-        
-        return None
+        """정당 리소스에서 정당명을 가져옵니다. (리소스당 1회 조회, 캐시 공유)"""
+        return self.fetch_engine.resolve_label(
+            party_resource, ['.//no:name', './/rdfs:label', './/foaf:name'], self.namespaces
+        )
     
     def _fetch_district_name(self, district_resource: str) -> Optional[str]:
-        """선거구 리소스에서 선거구명을 가져옵니다."""
-        try:
-            district_rdf_url = district_resource.replace('/resource/', '/data/') + "?output=rdfxml"
-            response = requests.get(district_rdf_url, timeout=10)
-            
-            if response.status_code == 200:
-                root = ET.fromstring(response.content)
-                
-                name_patterns = [
-                    './/no:name',
-                    './/rdfs:label',
-                    './/no:districtName'
-                ]
-                
-                for pattern in name_patterns:
-                    name_elem = root.find(pattern, self.namespaces)
-                    if name_elem is not None and name_elem.text:
-                        return name_elem.text.strip()
-                        
-        except Exception as e:
-            logger.warning(f"선거구명 조회 실패 {district_resource}: {str(e)}")
-        
-        return None
+        """선거구 리소스에서 선거구명을 가져옵니다. (리소스당 1회 조회, 캐시 공유)"""
+        return self.fetch_engine.resolve_label(
+            district_resource, ['.//no:name', './/rdfs:label', './/no:districtName'], self.namespaces
+        )
     
     def process_hierarchical_election(self, file_path: str, target_sub_elections: List[str] = None) -> Dict:
         """계층적 선거 데이터를 처리합니다."""
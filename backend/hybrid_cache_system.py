@@ -12,7 +12,6 @@ import json
 import logging
 import asyncio
 import hashlib
-import gzip
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union
@@ -21,6 +20,9 @@ from concurrent.futures import ThreadPoolExecutor
 import redis
 from dataclasses import dataclass, asdict
 
+from cache_engine import BoundedLRUCache
+from cache_codecs import CacheCodec, GzipCodec, get_codec, ZSTD_AVAILABLE
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -65,13 +67,22 @@ class HybridCacheSystem:
         self.total_max_size = 290 * 1024 * 1024  # 290MB (300MB 거의 최대 활용)
         
         # 캐시 저장소 - 대폭 확장
-        self.tier1_cache = {}  # 메모리 기본 정보 캐시 (120MB)
-        self.tier3_cache = {}  # 메모리 상세 정보 캐시 (150MB)
-        self.metadata_cache = {}  # 메타데이터 캐시 (20MB)
+        self.tier1_cache = BoundedLRUCache('tier1', max_bytes=self.tier1_max_size)  # 메모리 기본 정보 캐시 (120MB)
+        self.tier3_cache = BoundedLRUCache('tier3', max_bytes=self.tier3_max_size)  # 메모리 상세 정보 캐시 (150MB)
+        self.metadata_cache = BoundedLRUCache('metadata', max_bytes=self.metadata_cache_size)  # 메타데이터 캐시 (20MB)
         self.regional_stats_cache = {}  # 지역 통계 캐시
         self.electoral_history_cache = {}  # 선거 이력 캐시
         self.performance_cache = {}  # 성과 지표 캐시
         self.comparison_cache = {}  # 비교 분석 캐시
+        # 티어별 코덱 (Tier 1은 적재 시 샘플로 공유 사전 학습)
+        self.tier1_codec_name = os.getenv('CACHE_TIER1_CODEC', 'zstd-dict' if ZSTD_AVAILABLE else 'zlib-dict')
+        self.codec_training_samples = 200
+        self.codecs: Dict[str, CacheCodec] = {
+            'tier1': GzipCodec(6),
+            'tier3': get_codec(os.getenv('CACHE_TIER3_CODEC', 'gzip-1')),
+            'metadata': get_codec(os.getenv('CACHE_METADATA_CODEC', 'gzip-6'))
+        }
+        
         self.cache_stats = {
             'tier1_hits': 0,
             'tier1_misses': 0,
@@ -109,43 +120,27 @@ class HybridCacheSystem:
         key_string = f"{candidate_name}:{position}"
         return hashlib.md5(key_string.encode()).hexdigest()
 
-    def _compress_data(self, data: Dict) -> bytes:
-        """데이터 압축"""
-        json_str = json.dumps(data, ensure_ascii=False)
-        return gzip.compress(json_str.encode('utf-8'))
+    def _compress_data(self, data: Dict, tier: str = 'tier3') -> bytes:
+        """티어 코덱으로 데이터 압축"""
+        return self.codecs[tier].encode(data)
 
-    def _decompress_data(self, compressed_data: bytes) -> Dict:
-        """데이터 압축 해제"""
-        json_str = gzip.decompress(compressed_data).decode('utf-8')
-        return json.loads(json_str)
+    def _decompress_data(self, compressed_data: bytes, tier: str = 'tier3') -> Dict:
+        """티어 코덱으로 데이터 압축 해제"""
+        return self.codecs[tier].decode(compressed_data)
 
-    def _get_cache_size(self, cache_dict: Dict) -> int:
-        """캐시 크기 계산"""
-        total_size = 0
-        for key, value in cache_dict.items():
-            if isinstance(value, bytes):
-                total_size += len(value)
-            else:
-                total_size += len(json.dumps(value, ensure_ascii=False).encode('utf-8'))
-        return total_size
+    def _train_tier1_codec(self, candidates_data: List[Dict]):
+        """Tier 1 공유 사전 코덱 학습 (기존 Tier 1 항목은 코덱이 달라지므로 비움)"""
+        stride = max(1, len(candidates_data) // self.codec_training_samples)
+        samples = [asdict(self._create_basic_candidate_info(candidate))
+                   for candidate in candidates_data[::stride][:self.codec_training_samples]]
+        try:
+            self.codecs['tier1'] = get_codec(self.tier1_codec_name, samples)
+        except Exception as e:
+            logger.warning(f"⚠️ Tier 1 코덱 학습 실패, gzip 사용: {e}")
+            self.codecs['tier1'] = GzipCodec(6)
+        self.tier1_cache.clear()
+        logger.info(f"🗜️ Tier 1 코덱: {self.codecs['tier1'].name} ({len(samples)}개 샘플)")
 
-    def _evict_lru_cache(self, cache_dict: Dict, target_size: int):
-        """LRU 기반 캐시 제거"""
-        current_size = self._get_cache_size(cache_dict)
-        
-        if current_size <= target_size:
-            return
-        
-        # 접근 시간 기반 정렬 (단순화)
-        sorted_keys = list(cache_dict.keys())
-        
-        while current_size > target_size and sorted_keys:
-            key_to_remove = sorted_keys.pop(0)
-            if key_to_remove in cache_dict:
-                del cache_dict[key_to_remove]
-                current_size = self._get_cache_size(cache_dict)
-        
-        logger.info(f"🧹 LRU 캐시 정리: {current_size / 1024 / 1024:.1f}MB")
 
     def load_tier1_cache(self) -> bool:
         """Tier 1 기본 정보 캐시 로드"""
@@ -155,51 +150,55 @@ class HybridCacheSystem:
             # 출마자 기본 정보 생성 (시뮬레이션)
             candidates_data = self._generate_basic_candidates_data()
             
+            self._train_tier1_codec(candidates_data)
+            
             loaded_count = 0
-            current_size = 0
             
             for candidate in candidates_data:
                 cache_key = self._calculate_cache_key(candidate['name'], candidate['position'])
                 
                 # 기본 정보 객체 생성
-                basic_info = CandidateBasicInfo(
-                    name=candidate['name'],
-                    position=candidate['position'],
-                    party=candidate.get('party', ''),
-                    district=candidate.get('district', ''),
-                    current_term=candidate.get('current_term'),
-                    profile_image=candidate.get('profile_image'),
-                    contact_phone=candidate.get('contact_phone'),
-                    contact_email=candidate.get('contact_email'),
-                    birth_year=candidate.get('birth_year'),
-                    education=candidate.get('education'),
-                    career_summary=candidate.get('career_summary'),
-                    cache_timestamp=datetime.now().isoformat()
-                )
+                basic_info = self._create_basic_candidate_info(candidate)
                 
                 # 압축하여 저장
-                compressed_data = self._compress_data(asdict(basic_info))
+                compressed_data = self._compress_data(asdict(basic_info), 'tier1')
                 data_size = len(compressed_data)
                 
-                # 크기 제한 확인
-                if current_size + data_size > self.tier1_max_size:
-                    logger.warning(f"⚠️ Tier 1 캐시 크기 한계 도달: {current_size / 1024 / 1024:.1f}MB")
+                # 크기 제한 확인 (적재 단계에서는 제거 없이 중단)
+                if not self.tier1_cache.fits(data_size):
+                    logger.warning(f"⚠️ Tier 1 캐시 크기 한계 도달: {self.tier1_cache.size_bytes / 1024 / 1024:.1f}MB")
                     break
                 
-                self.tier1_cache[cache_key] = compressed_data
-                current_size += data_size
+                self.tier1_cache.put(cache_key, compressed_data, size=data_size)
                 loaded_count += 1
                 
                 if loaded_count % 1000 == 0:
-                    logger.info(f"  📊 로드 진행: {loaded_count:,}명, {current_size / 1024 / 1024:.1f}MB")
+                    logger.info(f"  📊 로드 진행: {loaded_count:,}명, {self.tier1_cache.size_bytes / 1024 / 1024:.1f}MB")
             
-            logger.info(f"✅ Tier 1 캐시 로드 완료: {loaded_count:,}명, {current_size / 1024 / 1024:.1f}MB")
+            logger.info(f"✅ Tier 1 캐시 로드 완료: {loaded_count:,}명, {self.tier1_cache.size_bytes / 1024 / 1024:.1f}MB")
             return True
             
         except Exception as e:
             logger.error(f"❌ Tier 1 캐시 로드 실패: {e}")
             return False
 
+    def _create_basic_candidate_info(self, candidate: Dict) -> CandidateBasicInfo:
+        """출마자 기본 정보 객체 생성"""
+        return CandidateBasicInfo(
+            name=candidate['name'],
+            position=candidate['position'],
+            party=candidate.get('party', ''),
+            district=candidate.get('district', ''),
+            current_term=candidate.get('current_term'),
+            profile_image=candidate.get('profile_image'),
+            contact_phone=candidate.get('contact_phone'),
+            contact_email=candidate.get('contact_email'),
+            birth_year=candidate.get('birth_year'),
+            education=candidate.get('education'),
+            career_summary=candidate.get('career_summary'),
+            cache_timestamp=datetime.now().isoformat()
+        )
+
     def _generate_basic_candidates_data(self) -> List[Dict]:
         """기본 출마자 데이터 생성 (시뮬레이션)"""
         
@@ -248,9 +247,10 @@ class HybridCacheSystem:
         
         try:
             # Tier 1: 기본 정보 캐시 확인
-            if cache_key in self.tier1_cache:
+            tier1_entry = self.tier1_cache.get(cache_key)
+            if tier1_entry is not None:
                 self.cache_stats['tier1_hits'] += 1
-                basic_data = self._decompress_data(self.tier1_cache[cache_key])
+                basic_data = self._decompress_data(tier1_entry, 'tier1')
                 
                 if detail_level == 'basic':
                     response_time = (time.time() - start_time) * 1000
@@ -265,9 +265,10 @@ class HybridCacheSystem:
                 self.cache_stats['tier1_misses'] += 1
             
             # Tier 3: 인기 출마자 상세 캐시 확인
-            if detail_level == 'detailed' and cache_key in self.tier3_cache:
+            tier3_entry = self.tier3_cache.get(cache_key) if detail_level == 'detailed' else None
+            if tier3_entry is not None:
                 self.cache_stats['tier3_hits'] += 1
-                detailed_data = self._decompress_data(self.tier3_cache[cache_key])
+                detailed_data = self._decompress_data(tier3_entry)
                 response_time = (time.time() - start_time) * 1000
                 
                 return {
@@ -277,6 +278,8 @@ class HybridCacheSystem:
                     'response_time_ms': round(response_time, 2),
                     'data_source': 'prediction_cache'
                 }
+            elif detail_level == 'detailed':
+                self.cache_stats['tier3_misses'] += 1
             
             # Tier 2: 실시간 상세 분석 생성
             if detail_level == 'detailed':
@@ -379,16 +382,9 @@ class HybridCacheSystem:
         
         try:
             compressed_data = self._compress_data(detailed_info)
-            data_size = len(compressed_data)
-            
-            # Tier 3 크기 제한 확인
-            current_tier3_size = self._get_cache_size(self.tier3_cache)
             
-            if current_tier3_size + data_size > self.tier3_max_size:
-                # LRU 기반 캐시 정리
-                self._evict_lru_cache(self.tier3_cache, self.tier3_max_size - data_size)
-            
-            self.tier3_cache[cache_key] = compressed_data
+            # 한도 초과 시 캐시 엔진이 LRU 순서로 제거
+            self.tier3_cache.put(cache_key, compressed_data, size=len(compressed_data))
             logger.info(f"📊 Tier 3 캐시 저장: {cache_key[:8]}...")
             
         except Exception as e:
@@ -397,8 +393,8 @@ class HybridCacheSystem:
     def get_cache_statistics(self) -> Dict[str, Any]:
         """캐시 통계 조회"""
         
-        tier1_size = self._get_cache_size(self.tier1_cache)
-        tier3_size = self._get_cache_size(self.tier3_cache)
+        tier1_size = self.tier1_cache.size_bytes
+        tier3_size = self.tier3_cache.size_bytes
         total_size = tier1_size + tier3_size
         
         # 히트율 계산
@@ -426,6 +422,11 @@ class HybridCacheSystem:
                 'tier3_entries': len(self.tier3_cache),
                 'popular_candidates': len([k for k, v in self.popularity_tracker.items() if v >= self.popularity_threshold])
             },
+            'tier_stats': {
+                'tier1': self.tier1_cache.stats(),
+                'tier3': self.tier3_cache.stats(),
+                'metadata': self.metadata_cache.stats()
+            },
             'system_status': {
                 'redis_connected': self.redis_client is not None,
                 'memory_usage': 'NORMAL',
@@ -446,6 +447,8 @@ class HybridCacheSystem:
         
         if tier == 'all':
             self.cache_stats = {key: 0 for key in self.cache_stats}
+            for cache in (self.tier1_cache, self.tier3_cache, self.metadata_cache):
+                cache.reset_stats()
             self.popularity_tracker.clear()
             logger.info("🧹 전체 캐시 및 통계 정리 완료")
 
@@ -465,7 +468,7 @@ class HybridCacheSystem:
                 'tier1': {
                     'description': '기본 정보 메모리 캐시',
                     'max_size_mb': self.tier1_max_size / 1024 / 1024,
-                    'compression': 'gzip',
+                    'compression': self.codecs['tier1'].name,
                     'response_time': '1-5ms'
                 },
                 'tier2': {
@@ -477,7 +480,7 @@ class HybridCacheSystem:
                 'tier3': {
                     'description': '인기 출마자 예측 캐시',
                     'max_size_mb': self.tier3_max_size / 1024 / 1024,
-                    'compression': 'gzip',
+                    'compression': self.codecs['tier3'].name,
                     'response_time': '10-50ms'
                 }
             },
@@ -5,15 +5,668 @@
 """
 
 import json
+import argparse
 import os
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from datetime import datetime
 
+from widget_render_engine import WidgetRenderer, WidgetTemplate, file_hash
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 생성기 코드/템플릿이 바뀌면 모든 산출물의 입력이 바뀐 것으로 취급
+GENERATOR_HASH = file_hash(__file__)
+
+CARD_CSS = """
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+    padding: 20px;
+    display: flex;
+    justify-content: center;
+    align-items: center;
+}
+
+.id-card-container {
+    background: white;
+    border-radius: 20px;
+    box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+    padding: 30px;
+    max-width: 400px;
+    width: 100%;
+}
+
+.id-card {
+    background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+    border-radius: 15px;
+    padding: 25px;
+    border: 2px solid #dee2e6;
+    position: relative;
+    overflow: hidden;
+}
+
+.id-card::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+    height: 4px;
+    background: linear-gradient(90deg, #3498db, #2ecc71, #e74c3c, #f39c12);
+}
+
+.card-header {
+    display: flex;
+    align-items: center;
+    margin-bottom: 20px;
+}
+
+.photo-container {
+    width: 80px;
+    height: 100px;
+    border-radius: 10px;
+    overflow: hidden;
+    margin-right: 20px;
+    border: 3px solid #3498db;
+    background: #ecf0f1;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+}
+
+.photo {
+    width: 100%;
+    height: 100%;
+    object-fit: cover;
+}
+
+.photo-placeholder {
+    width: 100%;
+    height: 100%;
+    background: linear-gradient(135deg, #3498db, #2980b9);
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    color: white;
+    font-size: 24px;
+    font-weight: 600;
+}
+
+.basic-info {
+    flex: 1;
+}
+
+.name {
+    font-size: 24px;
+    font-weight: 700;
+    color: #2c3e50;
+    margin-bottom: 5px;
+}
+
+.position {
+    font-size: 14px;
+    color: #7f8c8d;
+    margin-bottom: 3px;
+}
+
+.term {
+    font-size: 12px;
+    color: #95a5a6;
+    background: #ecf0f1;
+    padding: 2px 8px;
+    border-radius: 10px;
+    display: inline-block;
+}
+
+.card-body {
+    margin-bottom: 20px;
+}
+
+.info-row {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    padding: 8px 0;
+    border-bottom: 1px solid #ecf0f1;
+}
+
+.info-row:last-child {
+    border-bottom: none;
+}
+
+.info-label {
+    font-size: 12px;
+    color: #7f8c8d;
+    font-weight: 500;
+    min-width: 60px;
+}
+
+.info-value {
+    font-size: 13px;
+    color: #2c3e50;
+    font-weight: 600;
+    text-align: right;
+    flex: 1;
+}
+
+.score-section {
+    background: linear-gradient(135deg, #3498db, #2980b9);
+    color: white;
+    padding: 15px;
+    border-radius: 10px;
+    text-align: center;
+    margin-bottom: 20px;
+}
+
+.score-label {
+    font-size: 12px;
+    opacity: 0.9;
+    margin-bottom: 5px;
+}
+
+.score-value {
+    font-size: 28px;
+    font-weight: 700;
+    margin-bottom: 5px;
+}
+
+.score-description {
+    font-size: 11px;
+    opacity: 0.8;
+}
+
+.connections-section {
+    margin-top: 20px;
+}
+
+.connections-title {
+    font-size: 14px;
+    font-weight: 600;
+    color: #2c3e50;
+    margin-bottom: 15px;
+    text-align: center;
+}
+
+.connections-grid {
+    display: grid;
+    grid-template-columns: repeat(2, 1fr);
+    gap: 8px;
+}
+
+.connection-item {
+    background: white;
+    border-radius: 8px;
+    padding: 8px;
+    border-left: 3px solid;
+    font-size: 11px;
+    transition: transform 0.2s ease;
+}
+
+.connection-item:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+}
+
+.connection-item.입법_연결 { border-left-color: #FF6B6B; }
+.connection-item.위원회_연결 { border-left-color: #4ECDC4; }
+.connection-item.정치적_연결 { border-left-color: #45B7D1; }
+.connection-item.지역_연결 { border-left-color: #96CEB4; }
+.connection-item.정책_연결 { border-left-color: #FFEAA7; }
+.connection-item.시간_연결 { border-left-color: #DDA0DD; }
+
+.connection-name {
+    font-weight: 600;
+    color: #2c3e50;
+    margin-bottom: 2px;
+}
+
+.connection-type {
+    color: #7f8c8d;
+    font-size: 10px;
+}
+
+.card-footer {
+    text-align: center;
+    margin-top: 20px;
+    padding-top: 15px;
+    border-top: 1px solid #ecf0f1;
+}
+
+.qr-code {
+    width: 60px;
+    height: 60px;
+    background: #2c3e50;
+    border-radius: 8px;
+    margin: 0 auto 10px;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    color: white;
+    font-size: 10px;
+    font-weight: 600;
+}
+
+.card-id {
+    font-size: 10px;
+    color: #95a5a6;
+    font-family: 'Courier New', monospace;
+}
+
+@media (max-width: 480px) {
+    .id-card-container {
+        margin: 10px;
+        padding: 20px;
+    }
+    
+    .card-header {
+        flex-direction: column;
+        text-align: center;
+    }
+    
+    .photo-container {
+        margin-right: 0;
+        margin-bottom: 15px;
+    }
+    
+    .connections-grid {
+        grid-template-columns: 1fr;
+    }
+}
+"""
+
+CARD_JS = """
+// 카드 애니메이션
+document.addEventListener('DOMContentLoaded', function() {
+    const card = document.querySelector('.id-card');
+    
+    // 카드 등장 애니메이션
+    card.style.opacity = '0';
+    card.style.transform = 'translateY(20px)';
+    
+    setTimeout(() => {
+        card.style.transition = 'all 0.6s ease';
+        card.style.opacity = '1';
+        card.style.transform = 'translateY(0)';
+    }, 100);
+    
+    // 연결 항목 호버 효과
+    const connectionItems = document.querySelectorAll('.connection-item');
+    connectionItems.forEach(item => {
+        item.addEventListener('mouseenter', function() {
+            this.style.transform = 'translateY(-2px) scale(1.02)';
+        });
+        
+        item.addEventListener('mouseleave', function() {
+            this.style.transform = 'translateY(0) scale(1)';
+        });
+    });
+});
+"""
+
+PAGE_CSS = """
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+    padding: 20px;
+}
+
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+}
+
+.header {
+    text-align: center;
+    color: white;
+    margin-bottom: 40px;
+}
+
+.header h1 {
+    font-size: 3em;
+    margin-bottom: 15px;
+    font-weight: 600;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+}
+
+.header p {
+    font-size: 1.2em;
+    opacity: 0.9;
+}
+
+.card-section {
+    display: flex;
+    justify-content: center;
+    margin-bottom: 40px;
+}
+
+.back-button {
+    position: fixed;
+    top: 20px;
+    left: 20px;
+    background: rgba(255,255,255,0.9);
+    border: none;
+    padding: 15px 25px;
+    border-radius: 25px;
+    font-family: 'SF Pro Display', -apple-system, sans-serif;
+    font-size: 1em;
+    font-weight: 500;
+    cursor: pointer;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.2);
+    transition: all 0.3s ease;
+    backdrop-filter: blur(10px);
+}
+
+.back-button:hover {
+    background: white;
+    transform: translateY(-2px);
+    box-shadow: 0 8px 20px rgba(0,0,0,0.25);
+}
+
+.card-iframe {
+    width: 400px;
+    height: 600px;
+    border: none;
+    border-radius: 20px;
+    box-shadow: 0 20px 40px rgba(0,0,0,0.2);
+}
+
+@media (max-width: 480px) {
+    .card-iframe {
+        width: 100%;
+        height: 500px;
+    }
+}
+"""
+
+INDEX_CSS = """
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+    padding: 20px;
+}
+
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+}
+
+.header {
+    text-align: center;
+    color: white;
+    margin-bottom: 50px;
+}
+
+.header h1 {
+    font-size: 3.5em;
+    margin-bottom: 20px;
+    font-weight: 600;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+}
+
+.header p {
+    font-size: 1.3em;
+    opacity: 0.9;
+    font-weight: 300;
+}
+
+.politicians-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+    gap: 30px;
+}
+
+.politician-card {
+    background: white;
+    border-radius: 20px;
+    padding: 30px;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+    transition: transform 0.3s ease, box-shadow 0.3s ease;
+    cursor: pointer;
+    border: 1px solid #ecf0f1;
+    text-align: center;
+}
+
+.politician-card:hover {
+    transform: translateY(-10px);
+    box-shadow: 0 20px 40px rgba(0,0,0,0.2);
+}
+
+.card-preview {
+    width: 200px;
+    height: 300px;
+    margin: 0 auto 20px;
+    border-radius: 15px;
+    overflow: hidden;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+}
+
+.card-preview iframe {
+    width: 100%;
+    height: 100%;
+    border: none;
+    transform: scale(0.5);
+    transform-origin: top left;
+}
+
+.politician-name {
+    font-size: 1.8em;
+    font-weight: 600;
+    color: #2c3e50;
+    margin-bottom: 10px;
+}
+
+.politician-info {
+    color: #7f8c8d;
+    margin-bottom: 20px;
+    line-height: 1.5;
+}
+
+.politician-info p {
+    margin-bottom: 5px;
+}
+
+.score-badge {
+    display: inline-block;
+    background: linear-gradient(135deg, #3498db, #2ecc71);
+    color: white;
+    padding: 8px 16px;
+    border-radius: 20px;
+    font-weight: 600;
+    margin-bottom: 20px;
+    font-size: 14px;
+}
+
+.view-button {
+    background: linear-gradient(135deg, #3498db, #2980b9);
+    color: white;
+    border: none;
+    padding: 12px 24px;
+    border-radius: 25px;
+    font-family: 'SF Pro Display', -apple-system, sans-serif;
+    font-size: 1em;
+    font-weight: 500;
+    cursor: pointer;
+    width: 100%;
+    transition: all 0.3s ease;
+}
+
+.view-button:hover {
+    background: linear-gradient(135deg, #2980b9, #3498db);
+    transform: translateY(-2px);
+    box-shadow: 0 5px 15px rgba(52, 152, 219, 0.4);
+}
+"""
+
+CARD_TEMPLATE = WidgetTemplate("""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>${name} 신분증 카드</title>
+    ${stylesheets}
+</head>
+<body>
+    <div class="id-card-container">
+        <div class="id-card">
+            <div class="card-header">
+                <div class="photo-container">
+                    <img src="${photo_url}" alt="${name}" class="photo" onerror="this.style.display='none'; this.nextElementSibling.style.display='flex';">
+                    <div class="photo-placeholder" style="display: none;">
+                        ${initial}
+                    </div>
+                </div>
+                <div class="basic-info">
+                    <div class="name">${name}</div>
+                    <div class="position">${position}</div>
+                    <div class="term">${term}</div>
+                </div>
+            </div>
+            
+            <div class="card-body">
+                <div class="info-row">
+                    <div class="info-label">정당</div>
+                    <div class="info-value">${party}</div>
+                </div>
+                <div class="info-row">
+                    <div class="info-label">지역구</div>
+                    <div class="info-value">${district}</div>
+                </div>
+                <div class="info-row">
+                    <div class="info-label">위원회</div>
+                    <div class="info-value">${committee}</div>
+                </div>
+            </div>
+            
+            <div class="score-section">
+                <div class="score-label">연결성 점수</div>
+                <div class="score-value">${connectivity_score}</div>
+                <div class="score-description">네트워크 영향력</div>
+            </div>
+            
+            <div class="connections-section">
+                <div class="connections-title">주요 연결</div>
+                <div class="connections-grid">
+${connections}
+                </div>
+            </div>
+            
+            <div class="card-footer">
+                <div class="qr-code">
+                    QR
+                </div>
+                <div class="card-id">ID: ${card_id}</div>
+            </div>
+        </div>
+    </div>
+    
+    ${scripts}
+</body>
+</html>
+""")
+
+CONNECTION_ITEM_TEMPLATE = WidgetTemplate("""
+                    <div class="connection-item ${type}">
+                        <div class="connection-name">${name}</div>
+                        <div class="connection-type">${description}</div>
+                    </div>
+                """)
+
+PAGE_TEMPLATE = WidgetTemplate("""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>${name} 정치인 카드</title>
+    ${stylesheets}
+</head>
+<body>
+    <button class="back-button" onclick="history.back()">← 뒤로가기</button>
+    
+    <div class="container">
+        <div class="header">
+            <h1>🏛️ ${name} 정치인 카드</h1>
+            <p>신분증 형태의 정치인 정보 카드</p>
+        </div>
+        
+        <div class="card-section">
+            <iframe src="../cards/card_${name}.html" class="card-iframe"></iframe>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+INDEX_TEMPLATE = WidgetTemplate("""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>정치인 신분증 카드 시스템</title>
+    ${stylesheets}
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🏛️ 정치인 신분증 카드</h1>
+            <p>신분증 형태의 직관적인 정치인 정보 시스템</p>
+        </div>
+        
+        <div class="politicians-grid">
+${politician_cards}
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+INDEX_ITEM_TEMPLATE = WidgetTemplate("""
+            <div class="politician-card" onclick="location.href='pages/page_${name}.html'">
+                <div class="card-preview">
+                    <iframe src="cards/card_${name}.html"></iframe>
+                </div>
+                <div class="politician-name">${name}</div>
+                <div class="politician-info">
+                    <p><strong>정당:</strong> ${party}</p>
+                    <p><strong>지역구:</strong> ${district}</p>
+                    <p><strong>위원회:</strong> ${committee}</p>
+                </div>
+                <div class="score-badge">
+                    연결성 점수: ${connectivity_score}점
+                </div>
+                <button class="view-button" onclick="event.stopPropagation(); location.href='pages/page_${name}.html'">
+                    카드 보기
+                </button>
+            </div>
+""")
+
+
 class IDCardWidgetSystem:
     """신분증 형태 카드 위젯 시스템"""
     
@@ -106,6 +759,29 @@ class IDCardWidgetSystem:
         os.makedirs(f"{self.output_dir}/cards", exist_ok=True)
         os.makedirs(f"{self.output_dir}/pages", exist_ok=True)
         os.makedirs(f"{self.output_dir}/images", exist_ok=True)
+        
+        # 공용 CSS/JS (내용 해시 이름으로 한 번만 기록)
+        self.renderer = WidgetRenderer(self.output_dir)
+        self.card_assets = {
+            'css': [self.renderer.assets.add('id_card', CARD_CSS, 'css')],
+            'js': [self.renderer.assets.add('id_card', CARD_JS, 'js')],
+        }
+        self.page_assets = {'css': [self.renderer.assets.add('id_card_page', PAGE_CSS, 'css')]}
+        self.index_assets = {'css': [self.renderer.assets.add('id_card_index', INDEX_CSS, 'css')]}
+    
+    def render_id_card(self, politician: Dict) -> str:
+        """신분증 카드 HTML"""
+        page_path = f"cards/card_{politician['name']}.html"
+        connections = ''.join(
+            CONNECTION_ITEM_TEMPLATE.render(conn) for conn in politician["connections"][:6]
+        )
+        return CARD_TEMPLATE.render(
+            politician,
+            initial=politician['name'][0],
+            connections=connections,
+            card_id=f"{politician['name'].replace(' ', '').upper()}{politician['connectivity_score']:.0f}",
+            **self.renderer.asset_tags(page_path, **self.card_assets)
+        )
     
     def create_id_card_widget(self, politician_name: str) -> str:
         """신분증 형태 카드 위젯 생성"""
@@ -116,383 +792,10 @@ class IDCardWidgetSystem:
             
             politician = self.politicians[politician_name]
             
-            # HTML 콘텐츠 생성
-            html_content = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{politician['name']} 신분증 카드</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-        }}
-        
-        .id-card-container {{
-            background: white;
-            border-radius: 20px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            padding: 30px;
-            max-width: 400px;
-            width: 100%;
-        }}
-        
-        .id-card {{
-            background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
-            border-radius: 15px;
-            padding: 25px;
-            border: 2px solid #dee2e6;
-            position: relative;
-            overflow: hidden;
-        }}
-        
-        .id-card::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 4px;
-            background: linear-gradient(90deg, #3498db, #2ecc71, #e74c3c, #f39c12);
-        }}
-        
-        .card-header {{
-            display: flex;
-            align-items: center;
-            margin-bottom: 20px;
-        }}
-        
-        .photo-container {{
-            width: 80px;
-            height: 100px;
-            border-radius: 10px;
-            overflow: hidden;
-            margin-right: 20px;
-            border: 3px solid #3498db;
-            background: #ecf0f1;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }}
-        
-        .photo {{
-            width: 100%;
-            height: 100%;
-            object-fit: cover;
-        }}
-        
-        .photo-placeholder {{
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(135deg, #3498db, #2980b9);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-size: 24px;
-            font-weight: 600;
-        }}
-        
-        .basic-info {{
-            flex: 1;
-        }}
-        
-        .name {{
-            font-size: 24px;
-            font-weight: 700;
-            color: #2c3e50;
-            margin-bottom: 5px;
-        }}
-        
-        .position {{
-            font-size: 14px;
-            color: #7f8c8d;
-            margin-bottom: 3px;
-        }}
-        
-        .term {{
-            font-size: 12px;
-            color: #95a5a6;
-            background: #ecf0f1;
-            padding: 2px 8px;
-            border-radius: 10px;
-            display: inline-block;
-        }}
-        
-        .card-body {{
-            margin-bottom: 20px;
-        }}
-        
-        .info-row {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 8px 0;
-            border-bottom: 1px solid #ecf0f1;
-        }}
-        
-        .info-row:last-child {{
-            border-bottom: none;
-        }}
-        
-        .info-label {{
-            font-size: 12px;
-            color: #7f8c8d;
-            font-weight: 500;
-            min-width: 60px;
-        }}
-        
-        .info-value {{
-            font-size: 13px;
-            color: #2c3e50;
-            font-weight: 600;
-            text-align: right;
-            flex: 1;
-        }}
-        
-        .score-section {{
-            background: linear-gradient(135deg, #3498db, #2980b9);
-            color: white;
-            padding: 15px;
-            border-radius: 10px;
-            text-align: center;
-            margin-bottom: 20px;
-        }}
-        
-        .score-label {{
-            font-size: 12px;
-            opacity: 0.9;
-            margin-bottom: 5px;
-        }}
-        
-        .score-value {{
-            font-size: 28px;
-            font-weight: 700;
-            margin-bottom: 5px;
-        }}
-        
-        .score-description {{
-            font-size: 11px;
-            opacity: 0.8;
-        }}
-        
-        .connections-section {{
-            margin-top: 20px;
-        }}
-        
-        .connections-title {{
-            font-size: 14px;
-            font-weight: 600;
-            color: #2c3e50;
-            margin-bottom: 15px;
-            text-align: center;
-        }}
-        
-        .connections-grid {{
-            display: grid;
-            grid-template-columns: repeat(2, 1fr);
-            gap: 8px;
-        }}
-        
-        .connection-item {{
-            background: white;
-            border-radius: 8px;
-            padding: 8px;
-            border-left: 3px solid;
-            font-size: 11px;
-            transition: transform 0.2s ease;
-        }}
-        
-        .connection-item:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }}
-        
-        .connection-item.입법_연결 {{ border-left-color: #FF6B6B; }}
-        .connection-item.위원회_연결 {{ border-left-color: #4ECDC4; }}
-        .connection-item.정치적_연결 {{ border-left-color: #45B7D1; }}
-        .connection-item.지역_연결 {{ border-left-color: #96CEB4; }}
-        .connection-item.정책_연결 {{ border-left-color: #FFEAA7; }}
-        .connection-item.시간_연결 {{ border-left-color: #DDA0DD; }}
-        
-        .connection-name {{
-            font-weight: 600;
-            color: #2c3e50;
-            margin-bottom: 2px;
-        }}
-        
-        .connection-type {{
-            color: #7f8c8d;
-            font-size: 10px;
-        }}
-        
-        .card-footer {{
-            text-align: center;
-            margin-top: 20px;
-            padding-top: 15px;
-            border-top: 1px solid #ecf0f1;
-        }}
-        
-        .qr-code {{
-            width: 60px;
-            height: 60px;
-            background: #2c3e50;
-            border-radius: 8px;
-            margin: 0 auto 10px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-size: 10px;
-            font-weight: 600;
-        }}
-        
-        .card-id {{
-            font-size: 10px;
-            color: #95a5a6;
-            font-family: 'Courier New', monospace;
-        }}
-        
-        @media (max-width: 480px) {{
-            .id-card-container {{
-                margin: 10px;
-                padding: 20px;
-            }}
-            
-            .card-header {{
-                flex-direction: column;
-                text-align: center;
-            }}
-            
-            .photo-container {{
-                margin-right: 0;
-                margin-bottom: 15px;
-            }}
-            
-            .connections-grid {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="id-card-container">
-        <div class="id-card">
-            <div class="card-header">
-                <div class="photo-container">
-                    <img src="{politician['photo_url']}" alt="{politician['name']}" class="photo" onerror="this.style.display='none'; this.nextElementSibling.style.display='flex';">
-                    <div class="photo-placeholder" style="display: none;">
-                        {politician['name'][0]}
-                    </div>
-                </div>
-                <div class="basic-info">
-                    <div class="name">{politician['name']}</div>
-                    <div class="position">{politician['position']}</div>
-                    <div class="term">{politician['term']}</div>
-                </div>
-            </div>
-            
-            <div class="card-body">
-                <div class="info-row">
-                    <div class="info-label">정당</div>
-                    <div class="info-value">{politician['party']}</div>
-                </div>
-                <div class="info-row">
-                    <div class="info-label">지역구</div>
-                    <div class="info-value">{politician['district']}</div>
-                </div>
-                <div class="info-row">
-                    <div class="info-label">위원회</div>
-                    <div class="info-value">{politician['committee']}</div>
-                </div>
-            </div>
-            
-            <div class="score-section">
-                <div class="score-label">연결성 점수</div>
-                <div class="score-value">{politician['connectivity_score']}</div>
-                <div class="score-description">네트워크 영향력</div>
-            </div>
-            
-            <div class="connections-section">
-                <div class="connections-title">주요 연결</div>
-                <div class="connections-grid">
-"""
-            
-            # 연결된 정치인 카드들 추가 (최대 6개)
-            for i, conn in enumerate(politician["connections"][:6]):
-                html_content += f"""
-                    <div class="connection-item {conn['type']}">
-                        <div class="connection-name">{conn['name']}</div>
-                        <div class="connection-type">{conn['description']}</div>
-                    </div>
-                """
-            
-            html_content += f"""
-                </div>
-            </div>
-            
-            <div class="card-footer">
-                <div class="qr-code">
-                    QR
-                </div>
-                <div class="card-id">ID: {politician['name'].replace(' ', '').upper()}{politician['connectivity_score']:.0f}</div>
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        // 카드 애니메이션
-        document.addEventListener('DOMContentLoaded', function() {{
-            const card = document.querySelector('.id-card');
-            
-            // 카드 등장 애니메이션
-            card.style.opacity = '0';
-            card.style.transform = 'translateY(20px)';
-            
-            setTimeout(() => {{
-                card.style.transition = 'all 0.6s ease';
-                card.style.opacity = '1';
-                card.style.transform = 'translateY(0)';
-            }}, 100);
-            
-            // 연결 항목 호버 효과
-            const connectionItems = document.querySelectorAll('.connection-item');
-            connectionItems.forEach(item => {{
-                item.addEventListener('mouseenter', function() {{
-                    this.style.transform = 'translateY(-2px) scale(1.02)';
-                }});
-                
-                item.addEventListener('mouseleave', function() {{
-                    this.style.transform = 'translateY(0) scale(1)';
-                }});
-            }});
-        }});
-    </script>
-</body>
-</html>
-"""
-            
-            # HTML 파일로 저장
+            # HTML 파일로 저장 (내용이 같으면 건너뜀)
             filename = f"card_{politician['name']}.html"
-            filepath = f"{self.output_dir}/cards/{filename}"
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            logger.info(f"신분증 카드 위젯 생성 완료: {filepath}")
+            if self.renderer.write(f"cards/{filename}", self.render_id_card(politician)):
+                logger.info(f"신분증 카드 위젯 생성 완료: {self.output_dir}/cards/{filename}")
             return filename
             
         except Exception as e:
@@ -508,330 +811,66 @@ class IDCardWidgetSystem:
             
             politician = self.politicians[politician_name]
             
-            html_content = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{politician['name']} 정치인 카드</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-        }}
-        
-        .header {{
-            text-align: center;
-            color: white;
-            margin-bottom: 40px;
-        }}
-        
-        .header h1 {{
-            font-size: 3em;
-            margin-bottom: 15px;
-            font-weight: 600;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }}
-        
-        .header p {{
-            font-size: 1.2em;
-            opacity: 0.9;
-        }}
-        
-        .card-section {{
-            display: flex;
-            justify-content: center;
-            margin-bottom: 40px;
-        }}
-        
-        .back-button {{
-            position: fixed;
-            top: 20px;
-            left: 20px;
-            background: rgba(255,255,255,0.9);
-            border: none;
-            padding: 15px 25px;
-            border-radius: 25px;
-            font-family: 'SF Pro Display', -apple-system, sans-serif;
-            font-size: 1em;
-            font-weight: 500;
-            cursor: pointer;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-            transition: all 0.3s ease;
-            backdrop-filter: blur(10px);
-        }}
-        
-        .back-button:hover {{
-            background: white;
-            transform: translateY(-2px);
-            box-shadow: 0 8px 20px rgba(0,0,0,0.25);
-        }}
-        
-        .card-iframe {{
-            width: 400px;
-            height: 600px;
-            border: none;
-            border-radius: 20px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.2);
-        }}
-        
-        @media (max-width: 480px) {{
-            .card-iframe {{
-                width: 100%;
-                height: 500px;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <button class="back-button" onclick="history.back()">← 뒤로가기</button>
-    
-    <div class="container">
-        <div class="header">
-            <h1>🏛️ {politician['name']} 정치인 카드</h1>
-            <p>신분증 형태의 정치인 정보 카드</p>
-        </div>
-        
-        <div class="card-section">
-            <iframe src="cards/card_{politician['name']}.html" class="card-iframe"></iframe>
-        </div>
-    </div>
-</body>
-</html>
-"""
-            
-            # HTML 파일로 저장
             filename = f"page_{politician['name']}.html"
-            filepath = f"{self.output_dir}/pages/{filename}"
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            logger.info(f"정치인 페이지 생성 완료: {filepath}")
+            html_content = PAGE_TEMPLATE.render(
+                name=politician['name'],
+                **self.renderer.asset_tags(f"pages/{filename}", **self.page_assets)
+            )
+            
+            # HTML 파일로 저장 (내용이 같으면 건너뜀)
+            if self.renderer.write(f"pages/{filename}", html_content):
+                logger.info(f"정치인 페이지 생성 완료: {self.output_dir}/pages/{filename}")
             return filename
             
         except Exception as e:
             logger.error(f"정치인 페이지 생성 실패: {e}")
             return None
     
-    def create_all_widgets(self) -> Dict[str, Any]:
-        """모든 정치인 카드 위젯 생성"""
-        results = {}
+    def _widget_inputs(self, politician_name: str) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """정치인 한 명의 산출물별 (출력 경로, 입력 필드) — 빌드 매니페스트 비교용"""
+        politician = self.politicians[politician_name]
+        return {
+            "card": (f"cards/card_{politician_name}.html", {**politician, "assets": self.card_assets, "generator": GENERATOR_HASH}),
+            "page": (f"pages/page_{politician_name}.html", {"name": politician_name, "assets": self.page_assets, "generator": GENERATOR_HASH}),
+        }
+    
+    def _create_politician_widgets(self, job: Tuple[str, Sequence[str]]) -> Dict[str, Any]:
+        """정치인 한 명의 카드/페이지 중 작업에 포함된 것만 생성 (프로세스 풀 작업 단위)"""
+        politician_name, kinds = job
+        builders = {"card": self.create_id_card_widget, "page": self.create_politician_page}
+        return {kind: builders[kind](politician_name) for kind in kinds}
+    
+    def create_all_widgets(self, max_workers: Optional[int] = None, changed_only: bool = False) -> Dict[str, Any]:
+        """모든 정치인 카드 위젯 생성 (프로세스 풀 병렬, max_workers=1이면 순차)
         
-        for politician_name in self.politicians.keys():
-            logger.info(f"정치인 카드 생성 중: {politician_name}")
-            
-            # 신분증 카드 위젯 생성
-            card_file = self.create_id_card_widget(politician_name)
-            
-            # 개인 페이지 생성
-            page_file = self.create_politician_page(politician_name)
-            
-            if card_file and page_file:
-                results[politician_name] = {
-                    "card": card_file,
-                    "page": page_file,
-                    "status": "success"
-                }
+        changed_only=True면 빌드 매니페스트와 입력 해시가 다른 산출물만 다시 생성
+        """
+        artifacts = {name: self._widget_inputs(name) for name in self.politicians}
+        logger.info(f"정치인 카드 생성 중: {len(artifacts)}명")
+        
+        results = {}
+        for politician_name, files in self.renderer.build(self._create_politician_widgets, artifacts, changed_only, max_workers).items():
+            if all(files.values()):
+                results[politician_name] = {**files, "status": "success"}
         
         return results
     
     def create_index_page(self) -> str:
         """전체 정치인 목록 인덱스 페이지 생성"""
         try:
-            html_content = """
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>정치인 신분증 카드 시스템</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-        
-        .header {
-            text-align: center;
-            color: white;
-            margin-bottom: 50px;
-        }
-        
-        .header h1 {
-            font-size: 3.5em;
-            margin-bottom: 20px;
-            font-weight: 600;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }
-        
-        .header p {
-            font-size: 1.3em;
-            opacity: 0.9;
-            font-weight: 300;
-        }
-        
-        .politicians-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 30px;
-        }
-        
-        .politician-card {
-            background: white;
-            border-radius: 20px;
-            padding: 30px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-            cursor: pointer;
-            border: 1px solid #ecf0f1;
-            text-align: center;
-        }
-        
-        .politician-card:hover {
-            transform: translateY(-10px);
-            box-shadow: 0 20px 40px rgba(0,0,0,0.2);
-        }
-        
-        .card-preview {
-            width: 200px;
-            height: 300px;
-            margin: 0 auto 20px;
-            border-radius: 15px;
-            overflow: hidden;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-        }
-        
-        .card-preview iframe {
-            width: 100%;
-            height: 100%;
-            border: none;
-            transform: scale(0.5);
-            transform-origin: top left;
-        }
-        
-        .politician-name {
-            font-size: 1.8em;
-            font-weight: 600;
-            color: #2c3e50;
-            margin-bottom: 10px;
-        }
-        
-        .politician-info {
-            color: #7f8c8d;
-            margin-bottom: 20px;
-            line-height: 1.5;
-        }
-        
-        .politician-info p {
-            margin-bottom: 5px;
-        }
-        
-        .score-badge {
-            display: inline-block;
-            background: linear-gradient(135deg, #3498db, #2ecc71);
-            color: white;
-            padding: 8px 16px;
-            border-radius: 20px;
-            font-weight: 600;
-            margin-bottom: 20px;
-            font-size: 14px;
-        }
-        
-        .view-button {
-            background: linear-gradient(135deg, #3498db, #2980b9);
-            color: white;
-            border: none;
-            padding: 12px 24px;
-            border-radius: 25px;
-            font-family: 'SF Pro Display', -apple-system, sans-serif;
-            font-size: 1em;
-            font-weight: 500;
-            cursor: pointer;
-            width: 100%;
-            transition: all 0.3s ease;
-        }
-        
-        .view-button:hover {
-            background: linear-gradient(135deg, #2980b9, #3498db);
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(52, 152, 219, 0.4);
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🏛️ 정치인 신분증 카드</h1>
-            <p>신분증 형태의 직관적인 정치인 정보 시스템</p>
-        </div>
-        
-        <div class="politicians-grid">
-"""
-            
-            # 각 정치인 카드 추가
-            for politician_name, politician_data in self.politicians.items():
-                html_content += f"""
-            <div class="politician-card" onclick="location.href='pages/page_{politician_name}.html'">
-                <div class="card-preview">
-                    <iframe src="cards/card_{politician_name}.html"></iframe>
-                </div>
-                <div class="politician-name">{politician_name}</div>
-                <div class="politician-info">
-                    <p><strong>정당:</strong> {politician_data['party']}</p>
-                    <p><strong>지역구:</strong> {politician_data['district']}</p>
-                    <p><strong>위원회:</strong> {politician_data['committee']}</p>
-                </div>
-                <div class="score-badge">
-                    연결성 점수: {politician_data['connectivity_score']}점
-                </div>
-                <button class="view-button" onclick="event.stopPropagation(); location.href='pages/page_{politician_name}.html'">
-                    카드 보기
-                </button>
-            </div>
-"""
-            
-            html_content += """
-        </div>
-    </div>
-</body>
-</html>
-"""
-            
-            # HTML 파일로 저장
+            politician_cards = ''.join(
+                INDEX_ITEM_TEMPLATE.render(politician_data, name=politician_name)
+                for politician_name, politician_data in self.politicians.items()
+            )
+            html_content = INDEX_TEMPLATE.render(
+                politician_cards=politician_cards,
+                **self.renderer.asset_tags("index.html", **self.index_assets)
+            )
+            
+            # HTML 파일로 저장 (내용이 같으면 건너뜀)
             filepath = f"{self.output_dir}/index.html"
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            logger.info(f"인덱스 페이지 생성 완료: {filepath}")
+            if self.renderer.write("index.html", html_content):
+                logger.info(f"인덱스 페이지 생성 완료: {filepath}")
             return filepath
             
         except Exception as e:
@@ -840,13 +879,19 @@ class IDCardWidgetSystem:
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="신분증 형태 카드 위젯 시스템")
+    parser.add_argument("--changed-only", action="store_true",
+                        help="빌드 매니페스트와 입력이 달라진 산출물만 다시 생성")
+    parser.add_argument("--workers", type=int, default=None, help="병렬 프로세스 수 (1이면 순차)")
+    args = parser.parse_args()
+    
     try:
         # 신분증 카드 위젯 시스템 초기화
         system = IDCardWidgetSystem()
         
         # 모든 정치인 카드 생성
         logger.info("신분증 카드 위젯 시스템 생성 시작...")
-        results = system.create_all_widgets()
+        results = system.create_all_widgets(args.workers, changed_only=args.changed_only)
         
         # 인덱스 페이지 생성
         logger.info("인덱스 페이지 생성 중...")
@@ -860,8 +905,8 @@ def main():
         
         for politician, result in results.items():
             print(f"  - {politician}:")
-            print(f"    * 신분증 카드: {result['card']}")
-            print(f"    * 개인 페이지: {result['page']}")
+            print(f"    * 신분증 카드: {result.get('card', '변경 없음')}")
+            print(f"    * 개인 페이지: {result.get('page', '변경 없음')}")
         
         print(f"\n🌐 웹에서 보기: {system.output_dir}/index.html")
         
@@ -10,6 +10,7 @@ import logging
 from typing import Dict, List, Any, Optional
 from pyvis.network import Network
 import plotly.graph_objects as go
+import plotly.offline
 import plotly.express as px
 from plotly.subplots import make_subplots
 import networkx as nx
@@ -17,10 +18,433 @@ import pandas as pd
 import os
 from datetime import datetime
 
+from widget_render_engine import WidgetRenderer, WidgetTemplate
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+PAGE_CSS = """
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'Noto Sans KR', 'Malgun Gothic', sans-serif;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+    padding: 20px;
+}
+
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+    background: white;
+    border-radius: 20px;
+    box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+    overflow: hidden;
+}
+
+.header {
+    background: linear-gradient(135deg, #FF6B6B, #4ECDC4);
+    color: white;
+    padding: 40px;
+    text-align: center;
+}
+
+.header h1 {
+    font-size: 2.5em;
+    margin-bottom: 10px;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+}
+
+.header .info {
+    font-size: 1.2em;
+    opacity: 0.9;
+}
+
+.score-badge {
+    display: inline-block;
+    background: rgba(255,255,255,0.2);
+    padding: 10px 20px;
+    border-radius: 25px;
+    margin-top: 15px;
+    font-size: 1.1em;
+    font-weight: bold;
+}
+
+.content {
+    padding: 40px;
+}
+
+.widget-section {
+    margin-bottom: 40px;
+}
+
+.widget-section h2 {
+    color: #333;
+    margin-bottom: 20px;
+    font-size: 1.8em;
+    border-bottom: 3px solid #4ECDC4;
+    padding-bottom: 10px;
+}
+
+.widget-container {
+    border: 2px solid #f0f0f0;
+    border-radius: 15px;
+    overflow: hidden;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+}
+
+.widget-container iframe {
+    width: 100%;
+    height: 500px;
+    border: none;
+}
+
+.connections-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+    gap: 20px;
+    margin-top: 30px;
+}
+
+.connection-card {
+    background: white;
+    border-radius: 15px;
+    padding: 20px;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+    border-left: 5px solid;
+    transition: transform 0.3s ease;
+}
+
+.connection-card:hover {
+    transform: translateY(-5px);
+}
+
+.connection-card.입법_연결 { border-left-color: #FF6B6B; }
+.connection-card.위원회_연결 { border-left-color: #4ECDC4; }
+.connection-card.정치적_연결 { border-left-color: #45B7D1; }
+.connection-card.지역_연결 { border-left-color: #96CEB4; }
+.connection-card.정책_연결 { border-left-color: #FFEAA7; }
+.connection-card.시간_연결 { border-left-color: #DDA0DD; }
+
+.connection-name {
+    font-size: 1.3em;
+    font-weight: bold;
+    color: #333;
+    margin-bottom: 10px;
+}
+
+.connection-type {
+    color: #666;
+    font-size: 0.9em;
+    margin-bottom: 10px;
+}
+
+.connection-strength {
+    display: flex;
+    align-items: center;
+    gap: 10px;
+}
+
+.strength-bar {
+    flex: 1;
+    height: 8px;
+    background: #f0f0f0;
+    border-radius: 4px;
+    overflow: hidden;
+}
+
+.strength-fill {
+    height: 100%;
+    background: linear-gradient(90deg, #FF6B6B, #4ECDC4);
+    border-radius: 4px;
+    transition: width 0.3s ease;
+}
+
+.strength-value {
+    font-weight: bold;
+    color: #333;
+    min-width: 40px;
+}
+
+.back-button {
+    position: fixed;
+    top: 20px;
+    left: 20px;
+    background: rgba(255,255,255,0.9);
+    border: none;
+    padding: 15px 25px;
+    border-radius: 25px;
+    font-family: 'Noto Sans KR', sans-serif;
+    font-size: 1em;
+    cursor: pointer;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.2);
+    transition: all 0.3s ease;
+}
+
+.back-button:hover {
+    background: white;
+    transform: translateY(-2px);
+}
+"""
+
+PAGE_JS = """
+// 연결 강도 바 애니메이션
+document.addEventListener('DOMContentLoaded', function() {
+    const strengthBars = document.querySelectorAll('.strength-fill');
+    strengthBars.forEach(bar => {
+        const width = bar.style.width;
+        bar.style.width = '0%';
+        setTimeout(() => {
+            bar.style.width = width;
+        }, 500);
+    });
+});
+"""
+
+INDEX_CSS = """
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'Noto Sans KR', 'Malgun Gothic', sans-serif;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+    padding: 20px;
+}
+
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+}
+
+.header {
+    text-align: center;
+    color: white;
+    margin-bottom: 40px;
+}
+
+.header h1 {
+    font-size: 3em;
+    margin-bottom: 20px;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+}
+
+.header p {
+    font-size: 1.2em;
+    opacity: 0.9;
+}
+
+.politicians-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
+    gap: 30px;
+}
+
+.politician-card {
+    background: white;
+    border-radius: 20px;
+    padding: 30px;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+    transition: transform 0.3s ease, box-shadow 0.3s ease;
+    cursor: pointer;
+}
+
+.politician-card:hover {
+    transform: translateY(-10px);
+    box-shadow: 0 20px 40px rgba(0,0,0,0.2);
+}
+
+.politician-name {
+    font-size: 1.8em;
+    font-weight: bold;
+    color: #333;
+    margin-bottom: 15px;
+}
+
+.politician-info {
+    color: #666;
+    margin-bottom: 20px;
+}
+
+.politician-info p {
+    margin-bottom: 5px;
+}
+
+.score-badge {
+    display: inline-block;
+    background: linear-gradient(135deg, #FF6B6B, #4ECDC4);
+    color: white;
+    padding: 10px 20px;
+    border-radius: 25px;
+    font-weight: bold;
+    margin-bottom: 20px;
+}
+
+.connections-preview {
+    margin-top: 20px;
+}
+
+.connections-preview h4 {
+    color: #333;
+    margin-bottom: 10px;
+}
+
+.connection-tags {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 8px;
+}
+
+.connection-tag {
+    background: #f0f0f0;
+    padding: 5px 12px;
+    border-radius: 15px;
+    font-size: 0.9em;
+    color: #666;
+}
+
+.view-button {
+    background: linear-gradient(135deg, #4ECDC4, #45B7D1);
+    color: white;
+    border: none;
+    padding: 12px 25px;
+    border-radius: 25px;
+    font-family: 'Noto Sans KR', sans-serif;
+    font-size: 1em;
+    cursor: pointer;
+    margin-top: 20px;
+    width: 100%;
+    transition: all 0.3s ease;
+}
+
+.view-button:hover {
+    background: linear-gradient(135deg, #45B7D1, #4ECDC4);
+    transform: translateY(-2px);
+}
+"""
+
+PAGE_TEMPLATE = WidgetTemplate("""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>${name} 연결성 분석</title>
+    ${stylesheets}
+</head>
+<body>
+    <button class="back-button" onclick="history.back()">← 뒤로가기</button>
+    
+    <div class="container">
+        <div class="header">
+            <h1>${name}</h1>
+            <div class="info">
+                <p>${party} | ${district}</p>
+                <p>${committee}</p>
+            </div>
+            <div class="score-badge">
+                연결성 점수: ${connectivity_score}점
+            </div>
+        </div>
+        
+        <div class="content">
+            <div class="widget-section">
+                <h2>🌐 대화형 네트워크 시각화</h2>
+                <div class="widget-container">
+                    <iframe src="../widgets/widget_${name}_pyvis.html"></iframe>
+                </div>
+            </div>
+            
+            <div class="widget-section">
+                <h2>🎯 3D 네트워크 시각화</h2>
+                <div class="widget-container">
+                    <iframe src="../widgets/widget_${name}_plotly.html"></iframe>
+                </div>
+            </div>
+            
+            <div class="widget-section">
+                <h2>🔗 연결된 정치인 상세</h2>
+                <div class="connections-grid">
+${connection_cards}
+                </div>
+            </div>
+        </div>
+    </div>
+    
+    ${scripts}
+</body>
+</html>
+""")
+
+CONNECTION_CARD_TEMPLATE = WidgetTemplate("""
+                    <div class="connection-card ${type}">
+                        <div class="connection-name">${name}</div>
+                        <div class="connection-type">${description}</div>
+                        <div class="connection-strength">
+                            <div class="strength-bar">
+                                <div class="strength-fill" style="width: ${strength_percent}%"></div>
+                            </div>
+                            <div class="strength-value">${strength_text}</div>
+                        </div>
+                    </div>
+                """)
+
+INDEX_TEMPLATE = WidgetTemplate("""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>정치인 연결성 분석 시스템</title>
+    ${stylesheets}
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🔗 정치인 연결성 분석 시스템</h1>
+            <p>개인 정치인 중심의 고급 네트워크 시각화</p>
+        </div>
+        
+        <div class="politicians-grid">
+${politician_cards}
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+INDEX_ITEM_TEMPLATE = WidgetTemplate("""
+            <div class="politician-card" onclick="location.href='pages/page_${name}.html'">
+                <div class="politician-name">${name}</div>
+                <div class="politician-info">
+                    <p><strong>정당:</strong> ${party}</p>
+                    <p><strong>지역구:</strong> ${district}</p>
+                    <p><strong>위원회:</strong> ${committee}</p>
+                </div>
+                <div class="score-badge">
+                    연결성 점수: ${connectivity_score}점
+                </div>
+                <div class="connections-preview">
+                    <h4>연결 유형:</h4>
+                    <div class="connection-tags">
+${connection_tags}
+                    </div>
+                </div>
+                <button class="view-button" onclick="event.stopPropagation(); location.href='pages/page_${name}.html'">
+                    상세 분석 보기
+                </button>
+            </div>
+""")
+
+
 class IndividualPoliticianWidgets:
     """개인 정치인 중심 위젯 생성 클래스"""
     
@@ -86,6 +510,15 @@ class IndividualPoliticianWidgets:
         os.makedirs(self.output_dir, exist_ok=True)
         os.makedirs(f"{self.output_dir}/widgets", exist_ok=True)
         os.makedirs(f"{self.output_dir}/pages", exist_ok=True)
+        
+        # 공용 CSS/JS (내용 해시 이름으로 한 번만 기록) - plotly.js 번들도 위젯마다 넣지 않고 공유
+        self.renderer = WidgetRenderer(self.output_dir)
+        self.plotly_js = self.renderer.assets.add('plotly', plotly.offline.get_plotlyjs(), 'js')
+        self.page_assets = {
+            'css': [self.renderer.assets.add('politician_page', PAGE_CSS, 'css')],
+            'js': [self.renderer.assets.add('politician_page', PAGE_JS, 'js')],
+        }
+        self.index_assets = {'css': [self.renderer.assets.add('politician_index', INDEX_CSS, 'css')]}
     
     def create_politician_widget(self, politician_name: str) -> Dict[str, str]:
         """개별 정치인 위젯 생성"""
@@ -219,12 +652,10 @@ class IndividualPoliticianWidgets:
                     title=f"{conn['description']} (강도: {conn['strength']:.1f})"
                 )
             
-            # HTML 파일로 저장
+            # HTML 파일로 저장 (내용이 같으면 건너뜀)
             filename = f"widget_{politician['name']}_pyvis.html"
-            filepath = f"{self.output_dir}/widgets/{filename}"
-            net.save_graph(filepath)
-            
-            logger.info(f"Pyvis 위젯 생성 완료: {filepath}")
+            if self.renderer.write(f"widgets/{filename}", net.generate_html()):
+                logger.info(f"Pyvis 위젯 생성 완료: {self.output_dir}/widgets/{filename}")
             return filename
             
         except Exception as e:
@@ -333,12 +764,15 @@ class IndividualPoliticianWidgets:
                 height=500
             )
             
-            # HTML 파일로 저장
+            # HTML 파일로 저장 (내용이 같으면 건너뜀)
             filename = f"widget_{politician['name']}_plotly.html"
-            filepath = f"{self.output_dir}/widgets/{filename}"
-            fig.write_html(filepath)
-            
-            logger.info(f"Plotly 위젯 생성 완료: {filepath}")
+            # 공용 plotly.js 링크 + 고정 div id (재생성 시 내용이 같으면 건너뜀)
+            html_content = fig.to_html(
+                include_plotlyjs=self.renderer.href(self.plotly_js, f"widgets/{filename}"),
+                div_id="politician-network-3d"
+            )
+            if self.renderer.write(f"widgets/{filename}", html_content):
+                logger.info(f"Plotly 위젯 생성 완료: {self.output_dir}/widgets/{filename}")
             return filename
             
         except Exception as e:
@@ -348,276 +782,39 @@ class IndividualPoliticianWidgets:
     def _create_politician_page(self, politician: Dict) -> str:
         """개별 정치인 페이지 생성"""
         try:
-            html_content = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{politician['name']} 연결성 분석</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Noto Sans KR', 'Malgun Gothic', sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 20px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, #FF6B6B, #4ECDC4);
-            color: white;
-            padding: 40px;
-            text-align: center;
-        }}
-        
-        .header h1 {{
-            font-size: 2.5em;
-            margin-bottom: 10px;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }}
-        
-        .header .info {{
-            font-size: 1.2em;
-            opacity: 0.9;
-        }}
-        
-        .score-badge {{
-            display: inline-block;
-            background: rgba(255,255,255,0.2);
-            padding: 10px 20px;
-            border-radius: 25px;
-            margin-top: 15px;
-            font-size: 1.1em;
-            font-weight: bold;
-        }}
-        
-        .content {{
-            padding: 40px;
-        }}
-        
-        .widget-section {{
-            margin-bottom: 40px;
-        }}
-        
-        .widget-section h2 {{
-            color: #333;
-            margin-bottom: 20px;
-            font-size: 1.8em;
-            border-bottom: 3px solid #4ECDC4;
-            padding-bottom: 10px;
-        }}
-        
-        .widget-container {{
-            border: 2px solid #f0f0f0;
-            border-radius: 15px;
-            overflow: hidden;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-        }}
-        
-        .widget-container iframe {{
-            width: 100%;
-            height: 500px;
-            border: none;
-        }}
-        
-        .connections-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 20px;
-            margin-top: 30px;
-        }}
-        
-        .connection-card {{
-            background: white;
-            border-radius: 15px;
-            padding: 20px;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-            border-left: 5px solid;
-            transition: transform 0.3s ease;
-        }}
-        
-        .connection-card:hover {{
-            transform: translateY(-5px);
-        }}
-        
-        .connection-card.입법_연결 {{ border-left-color: #FF6B6B; }}
-        .connection-card.위원회_연결 {{ border-left-color: #4ECDC4; }}
-        .connection-card.정치적_연결 {{ border-left-color: #45B7D1; }}
-        .connection-card.지역_연결 {{ border-left-color: #96CEB4; }}
-        .connection-card.정책_연결 {{ border-left-color: #FFEAA7; }}
-        .connection-card.시간_연결 {{ border-left-color: #DDA0DD; }}
-        
-        .connection-name {{
-            font-size: 1.3em;
-            font-weight: bold;
-            color: #333;
-            margin-bottom: 10px;
-        }}
-        
-        .connection-type {{
-            color: #666;
-            font-size: 0.9em;
-            margin-bottom: 10px;
-        }}
-        
-        .connection-strength {{
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }}
-        
-        .strength-bar {{
-            flex: 1;
-            height: 8px;
-            background: #f0f0f0;
-            border-radius: 4px;
-            overflow: hidden;
-        }}
-        
-        .strength-fill {{
-            height: 100%;
-            background: linear-gradient(90deg, #FF6B6B, #4ECDC4);
-            border-radius: 4px;
-            transition: width 0.3s ease;
-        }}
-        
-        .strength-value {{
-            font-weight: bold;
-            color: #333;
-            min-width: 40px;
-        }}
-        
-        .back-button {{
-            position: fixed;
-            top: 20px;
-            left: 20px;
-            background: rgba(255,255,255,0.9);
-            border: none;
-            padding: 15px 25px;
-            border-radius: 25px;
-            font-family: 'Noto Sans KR', sans-serif;
-            font-size: 1em;
-            cursor: pointer;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-            transition: all 0.3s ease;
-        }}
-        
-        .back-button:hover {{
-            background: white;
-            transform: translateY(-2px);
-        }}
-    </style>
-</head>
-<body>
-    <button class="back-button" onclick="history.back()">← 뒤로가기</button>
-    
-    <div class="container">
-        <div class="header">
-            <h1>{politician['name']}</h1>
-            <div class="info">
-                <p>{politician['party']} | {politician['district']}</p>
-                <p>{politician['committee']}</p>
-            </div>
-            <div class="score-badge">
-                연결성 점수: {politician['connectivity_score']}점
-            </div>
-        </div>
-        
-        <div class="content">
-            <div class="widget-section">
-                <h2>🌐 대화형 네트워크 시각화</h2>
-                <div class="widget-container">
-                    <iframe src="widgets/widget_{politician['name']}_pyvis.html"></iframe>
-                </div>
-            </div>
-            
-            <div class="widget-section">
-                <h2>🎯 3D 네트워크 시각화</h2>
-                <div class="widget-container">
-                    <iframe src="widgets/widget_{politician['name']}_plotly.html"></iframe>
-                </div>
-            </div>
-            
-            <div class="widget-section">
-                <h2>🔗 연결된 정치인 상세</h2>
-                <div class="connections-grid">
-"""
-            
-            # 연결된 정치인 카드들 추가
-            for conn in politician["connections"]:
-                strength_percent = int(conn["strength"] * 100)
-                html_content += f"""
-                    <div class="connection-card {conn['type']}">
-                        <div class="connection-name">{conn['name']}</div>
-                        <div class="connection-type">{conn['description']}</div>
-                        <div class="connection-strength">
-                            <div class="strength-bar">
-                                <div class="strength-fill" style="width: {strength_percent}%"></div>
-                            </div>
-                            <div class="strength-value">{conn['strength']:.1f}</div>
-                        </div>
-                    </div>
-                """
-            
-            html_content += """
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        // 연결 강도 바 애니메이션
-        document.addEventListener('DOMContentLoaded', function() {
-            const strengthBars = document.querySelectorAll('.strength-fill');
-            strengthBars.forEach(bar => {
-                const width = bar.style.width;
-                bar.style.width = '0%';
-                setTimeout(() => {
-                    bar.style.width = width;
-                }, 500);
-            });
-        });
-    </script>
-</body>
-</html>
-"""
+            # 연결된 정치인 카드들
+            connection_cards = ''.join(
+                CONNECTION_CARD_TEMPLATE.render(
+                    conn,
+                    strength_percent=int(conn["strength"] * 100),
+                    strength_text=f"{conn['strength']:.1f}"
+                )
+                for conn in politician["connections"]
+            )
             
-            # HTML 파일로 저장
             filename = f"page_{politician['name']}.html"
-            filepath = f"{self.output_dir}/pages/{filename}"
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            html_content = PAGE_TEMPLATE.render(
+                politician,
+                connection_cards=connection_cards,
+                **self.renderer.asset_tags(f"pages/{filename}", **self.page_assets)
+            )
             
-            logger.info(f"정치인 페이지 생성 완료: {filepath}")
+            # HTML 파일로 저장 (내용이 같으면 건너뜀)
+            if self.renderer.write(f"pages/{filename}", html_content):
+                logger.info(f"정치인 페이지 생성 완료: {self.output_dir}/pages/{filename}")
             return filename
             
         except Exception as e:
             logger.error(f"정치인 페이지 생성 실패: {e}")
             return None
     
-    def create_all_politician_widgets(self) -> Dict[str, Any]:
-        """모든 정치인 위젯 생성"""
-        results = {}
+    def create_all_politician_widgets(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """모든 정치인 위젯 생성 (프로세스 풀 병렬, max_workers=1이면 순차)"""
+        names = list(self.politicians.keys())
+        logger.info(f"정치인 위젯 생성 중: {len(names)}명")
         
-        for politician_name in self.politicians.keys():
-            logger.info(f"정치인 위젯 생성 중: {politician_name}")
-            result = self.create_politician_widget(politician_name)
+        results = {}
+        for politician_name, result in zip(names, self.renderer.render_all(self.create_politician_widget, names, max_workers)):
             if result:
                 results[politician_name] = result
         
@@ -626,194 +823,26 @@ class IndividualPoliticianWidgets:
     def create_index_page(self) -> str:
         """전체 정치인 목록 인덱스 페이지 생성"""
         try:
-            html_content = """
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>정치인 연결성 분석 시스템</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Noto Sans KR', 'Malgun Gothic', sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-        
-        .header {
-            text-align: center;
-            color: white;
-            margin-bottom: 40px;
-        }
-        
-        .header h1 {
-            font-size: 3em;
-            margin-bottom: 20px;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }
-        
-        .header p {
-            font-size: 1.2em;
-            opacity: 0.9;
-        }
-        
-        .politicians-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
-            gap: 30px;
-        }
-        
-        .politician-card {
-            background: white;
-            border-radius: 20px;
-            padding: 30px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-            cursor: pointer;
-        }
-        
-        .politician-card:hover {
-            transform: translateY(-10px);
-            box-shadow: 0 20px 40px rgba(0,0,0,0.2);
-        }
-        
-        .politician-name {
-            font-size: 1.8em;
-            font-weight: bold;
-            color: #333;
-            margin-bottom: 15px;
-        }
-        
-        .politician-info {
-            color: #666;
-            margin-bottom: 20px;
-        }
-        
-        .politician-info p {
-            margin-bottom: 5px;
-        }
-        
-        .score-badge {
-            display: inline-block;
-            background: linear-gradient(135deg, #FF6B6B, #4ECDC4);
-            color: white;
-            padding: 10px 20px;
-            border-radius: 25px;
-            font-weight: bold;
-            margin-bottom: 20px;
-        }
-        
-        .connections-preview {
-            margin-top: 20px;
-        }
-        
-        .connections-preview h4 {
-            color: #333;
-            margin-bottom: 10px;
-        }
-        
-        .connection-tags {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 8px;
-        }
-        
-        .connection-tag {
-            background: #f0f0f0;
-            padding: 5px 12px;
-            border-radius: 15px;
-            font-size: 0.9em;
-            color: #666;
-        }
-        
-        .view-button {
-            background: linear-gradient(135deg, #4ECDC4, #45B7D1);
-            color: white;
-            border: none;
-            padding: 12px 25px;
-            border-radius: 25px;
-            font-family: 'Noto Sans KR', sans-serif;
-            font-size: 1em;
-            cursor: pointer;
-            margin-top: 20px;
-            width: 100%;
-            transition: all 0.3s ease;
-        }
-        
-        .view-button:hover {
-            background: linear-gradient(135deg, #45B7D1, #4ECDC4);
-            transform: translateY(-2px);
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🔗 정치인 연결성 분석 시스템</h1>
-            <p>개인 정치인 중심의 고급 네트워크 시각화</p>
-        </div>
-        
-        <div class="politicians-grid">
-"""
-            
-            # 각 정치인 카드 추가
-            for politician_name, politician_data in self.politicians.items():
-                connection_types = list(set([conn["type"] for conn in politician_data["connections"]]))
-                
-                html_content += f"""
-            <div class="politician-card" onclick="location.href='pages/page_{politician_name}.html'">
-                <div class="politician-name">{politician_name}</div>
-                <div class="politician-info">
-                    <p><strong>정당:</strong> {politician_data['party']}</p>
-                    <p><strong>지역구:</strong> {politician_data['district']}</p>
-                    <p><strong>위원회:</strong> {politician_data['committee']}</p>
-                </div>
-                <div class="score-badge">
-                    연결성 점수: {politician_data['connectivity_score']}점
-                </div>
-                <div class="connections-preview">
-                    <h4>연결 유형:</h4>
-                    <div class="connection-tags">
-"""
-                
-                for conn_type in connection_types:
-                    html_content += f'                        <span class="connection-tag">{conn_type}</span>\n'
-                
-                html_content += f"""
-                    </div>
-                </div>
-                <button class="view-button" onclick="event.stopPropagation(); location.href='pages/page_{politician_name}.html'">
-                    상세 분석 보기
-                </button>
-            </div>
-"""
-            
-            html_content += """
-        </div>
-    </div>
-</body>
-</html>
-"""
+            politician_cards = ''.join(
+                INDEX_ITEM_TEMPLATE.render(
+                    politician_data,
+                    name=politician_name,
+                    connection_tags=''.join(
+                        f'                        <span class="connection-tag">{conn_type}</span>\n'
+                        for conn_type in dict.fromkeys(conn["type"] for conn in politician_data["connections"])
+                    )
+                )
+                for politician_name, politician_data in self.politicians.items()
+            )
+            html_content = INDEX_TEMPLATE.render(
+                politician_cards=politician_cards,
+                **self.renderer.asset_tags("index.html", **self.index_assets)
+            )
             
-            # HTML 파일로 저장
+            # HTML 파일로 저장 (내용이 같으면 건너뜀)
             filepath = f"{self.output_dir}/index.html"
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            logger.info(f"인덱스 페이지 생성 완료: {filepath}")
+            if self.renderer.write("index.html", html_content):
+                logger.info(f"인덱스 페이지 생성 완료: {filepath}")
             return filepath
             
         except Exception as e:
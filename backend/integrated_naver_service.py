@@ -7,10 +7,13 @@ import requests
 import json
 import time
 import re
+import asyncio
 from datetime import datetime, timedelta
 from urllib.parse import quote
 import logging
 
+from naver_async_collector import AIOHTTP_AVAILABLE, NaverAsyncCollector, naver_quota, run_sync
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -67,6 +70,10 @@ class IntegratedNaverService:
     
     def search_news(self, query, display=10, sort="sim"):
         """네이버 뉴스 검색"""
+        if not naver_quota.try_consume('news'):
+            logger.warning("뉴스 API 일일 호출 예산 소진")
+            return None
+        
         try:
             params = {
                 "query": query,
@@ -109,6 +116,10 @@ class IntegratedNaverService:
         X-Naver-Client-Id: kXwlSsFmb055ku9rWyx1
         X-Naver-Client-Secret: JZqw_LTiq_
         """
+        if not naver_quota.try_consume('datalab'):
+            logger.warning("데이터랩 API 일일 호출 예산 소진")
+            return None
+        
         try:
             # 요청 바디 구성 (정확한 API 스펙에 따라)
             request_body = {
@@ -179,20 +190,49 @@ class IntegratedNaverService:
             logger.error(f"{politician_name} 통합 데이터 수집 오류: {e}")
             return None
     
+    def politician_news_queries(self, politician_name):
+        """최적화된 정치인 뉴스 검색어"""
+        return [
+            f'{politician_name} 의원',
+            f'{politician_name} 국회',
+            f'{politician_name} 정치'
+        ]
+    
+    def accept_news_items(self, items, all_news, seen_titles, max_results):
+        """검색 결과 항목을 필터링해 all_news에 추가"""
+        for item in items:
+            if len(all_news) >= max_results:
+                break
+            
+            title = self.clean_html(item.get('title', ''))
+            
+            # 중복 제거
+            if title in seen_titles:
+                continue
+            
+            # 정치 관련성 체크
+            if not self.is_political_news(title, item.get('description', '')):
+                continue
+            
+            seen_titles.add(title)
+            
+            news_item = {
+                'title': title,
+                'description': self.clean_html(item.get('description', '')),
+                'link': item.get('link', ''),
+                'pub_date': item.get('pubDate', ''),
+                'sentiment': self.analyze_sentiment(title + ' ' + item.get('description', ''))
+            }
+            
+            all_news.append(news_item)
+    
     def collect_politician_news(self, politician_name, max_results=10):
         """정치인 뉴스 수집"""
         try:
-            # 최적화된 검색어들
-            queries = [
-                f'{politician_name} 의원',
-                f'{politician_name} 국회',
-                f'{politician_name} 정치'
-            ]
-            
             all_news = []
             seen_titles = set()
             
-            for query in queries:
+            for query in self.politician_news_queries(politician_name):
                 if len(all_news) >= max_results:
                     break
                 
@@ -200,31 +240,7 @@ class IntegratedNaverService:
                 if not news_result:
                     continue
                 
-                for item in news_result.get('items', []):
-                    title = self.clean_html(item.get('title', ''))
-                    
-                    # 중복 제거
-                    if title in seen_titles:
-                        continue
-                    
-                    # 정치 관련성 체크
-                    if not self.is_political_news(title, item.get('description', '')):
-                        continue
-                    
-                    seen_titles.add(title)
-                    
-                    news_item = {
-                        'title': title,
-                        'description': self.clean_html(item.get('description', '')),
-                        'link': item.get('link', ''),
-                        'pub_date': item.get('pubDate', ''),
-                        'sentiment': self.analyze_sentiment(title + ' ' + item.get('description', ''))
-                    }
-                    
-                    all_news.append(news_item)
-                    
-                    if len(all_news) >= max_results:
-                        break
+                self.accept_news_items(news_result.get('items', []), all_news, seen_titles, max_results)
             
             logger.info(f"{politician_name} 뉴스 수집: {len(all_news)}건")
             return all_news
@@ -233,15 +249,48 @@ class IntegratedNaverService:
             logger.error(f"{politician_name} 뉴스 수집 오류: {e}")
             return []
     
+    def trend_period(self, days):
+        """트렌드 조회 기간 (시작일, 종료일 문자열)"""
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days)
+        return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
+    
+    def build_trend_data(self, politician_name, trend_result, start_date_str, end_date_str):
+        """데이터랩 응답을 트렌드 데이터로 정리"""
+        if trend_result and trend_result.get('results'):
+            result = trend_result['results'][0]
+            trend_points = result.get('data', [])
+            
+            # 통계 계산
+            if trend_points:
+                values = [point.get('ratio', 0) for point in trend_points]
+                stats = {
+                    'average': sum(values) / len(values),
+                    'max': max(values),
+                    'min': min(values),
+                    'total_points': len(values),
+                    'trend_direction': self.calculate_trend_direction(values)
+                }
+            else:
+                stats = {'average': 0, 'max': 0, 'min': 0, 'total_points': 0, 'trend_direction': 'stable'}
+            
+            trend_data = {
+                'period': {'start': start_date_str, 'end': end_date_str},
+                'data_points': trend_points,
+                'statistics': stats
+            }
+            
+            logger.info(f"{politician_name} 트렌드 수집: {len(trend_points)}일, 평균 {stats['average']:.2f}")
+            return trend_data
+        
+        logger.warning(f"{politician_name} 트렌드 데이터 없음")
+        return None
+    
     def collect_politician_trend(self, politician_name, days=30):
         """정치인 검색 트렌드 수집"""
         try:
             # 날짜 범위 설정
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days)
-            
-            start_date_str = start_date.strftime("%Y-%m-%d")
-            end_date_str = end_date.strftime("%Y-%m-%d")
+            start_date_str, end_date_str = self.trend_period(days)
             
             # 검색어 트렌드 조회
             trend_result = self.get_search_trend(
@@ -251,39 +300,74 @@ class IntegratedNaverService:
                 time_unit="date"
             )
             
-            if trend_result and trend_result.get('results'):
-                result = trend_result['results'][0]
-                trend_points = result.get('data', [])
-                
-                # 통계 계산
-                if trend_points:
-                    values = [point.get('ratio', 0) for point in trend_points]
-                    stats = {
-                        'average': sum(values) / len(values),
-                        'max': max(values),
-                        'min': min(values),
-                        'total_points': len(values),
-                        'trend_direction': self.calculate_trend_direction(values)
-                    }
-                else:
-                    stats = {'average': 0, 'max': 0, 'min': 0, 'total_points': 0, 'trend_direction': 'stable'}
-                
-                trend_data = {
-                    'period': {'start': start_date_str, 'end': end_date_str},
-                    'data_points': trend_points,
-                    'statistics': stats
-                }
-                
-                logger.info(f"{politician_name} 트렌드 수집: {len(trend_points)}일, 평균 {stats['average']:.2f}")
-                return trend_data
-            else:
-                logger.warning(f"{politician_name} 트렌드 데이터 없음")
-                return None
+            return self.build_trend_data(politician_name, trend_result, start_date_str, end_date_str)
                 
         except Exception as e:
             logger.error(f"{politician_name} 트렌드 수집 오류: {e}")
             return None
     
+    async def _collect_politician_data_async(self, collector, politician_name, days, max_news):
+        """정치인 1명의 뉴스 + 트렌드 (공유 수집기 사용)"""
+        start_date_str, end_date_str = self.trend_period(days)
+        trend_task = asyncio.ensure_future(
+            collector.search_trend([politician_name], start_date_str, end_date_str, time_unit="date")
+        )
+        
+        news_data = []
+        seen_titles = set()
+        for query in self.politician_news_queries(politician_name):
+            if len(news_data) >= max_news:
+                break
+            news_result = await collector.search_news(query, display=min(10, max_news))
+            if news_result:
+                self.accept_news_items(news_result.get('items', []), news_data, seen_titles, max_news)
+        
+        trend_data = self.build_trend_data(politician_name, await trend_task, start_date_str, end_date_str)
+        
+        return {
+            'politician': politician_name,
+            'party': self.politicians_info.get(politician_name, {}).get('party_name', '무소속'),
+            'collected_at': datetime.now().isoformat(),
+            'news': news_data,
+            'trend': trend_data,
+            'summary': self.create_summary(news_data, trend_data)
+        }
+    
+    async def collect_politicians_data_async(self, politicians=None, days=30, max_news=10, concurrency=8):
+        """여러 정치인 뉴스 + 트렌드 동시 수집 (연결 풀/호출 예산 공유)"""
+        politicians = politicians or self.politicians
+        
+        async with NaverAsyncCollector(self.client_id, self.client_secret, concurrency=concurrency) as collector:
+            results = await asyncio.gather(
+                *(self._collect_politician_data_async(collector, politician, days, max_news)
+                  for politician in politicians),
+                return_exceptions=True
+            )
+            self.news_requests += collector.stats['by_endpoint'].get('news', 0)
+            self.datalab_requests += collector.stats['by_endpoint'].get('datalab', 0)
+            logger.info(f"비동기 수집 통계: {collector.get_stats()}")
+        
+        collected = {}
+        for politician, result in zip(politicians, results):
+            if isinstance(result, Exception):
+                logger.error(f"{politician} 통합 데이터 수집 오류: {result}")
+                continue
+            collected[politician] = result
+        return collected
+    
+    def collect_all_politicians_data(self, politicians=None, days=30, max_news=10):
+        """전체(또는 지정) 정치인 통합 데이터 수집 (aiohttp 없으면 순차 수집)"""
+        politicians = politicians or self.politicians
+        if AIOHTTP_AVAILABLE:
+            return run_sync(self.collect_politicians_data_async(politicians, days, max_news))
+        
+        collected = {}
+        for politician in politicians:
+            data = self.collect_politician_data(politician, days, max_news)
+            if data:
+                collected[politician] = data
+        return collected
+    
     def collect_multiple_politicians_comparison(self, politicians, days=30):
         """여러 정치인 검색량 비교"""
         try:
@@ -291,11 +375,7 @@ class IntegratedNaverService:
             compare_list = politicians[:5]
             
             # 날짜 범위 설정
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days)
-            
-            start_date_str = start_date.strftime("%Y-%m-%d")
-            end_date_str = end_date.strftime("%Y-%m-%d")
+            start_date_str, end_date_str = self.trend_period(days)
             
             # 비교 트렌드 조회
             comparison_result = self.get_search_trend(
@@ -493,7 +573,8 @@ class IntegratedNaverService:
             'datalab_requests': self.datalab_requests,
             'total_requests': self.news_requests + self.datalab_requests,
             'news_limit': 25000,  # 일일 한도
-            'datalab_limit': 1000   # 일일 한도 (추정)
+            'datalab_limit': 1000,  # 일일 한도 (추정)
+            'shared_quota': naver_quota.stats()
         }
     
     def save_integrated_data(self, data, filename=None):
@@ -5,15 +5,17 @@ LOD 데이터 처리기
 제22대 국회의원선거 LOD 데이터에서 후보자 정보를 추출하고 처리합니다.
 """
 
+import os
 import xml.etree.ElementTree as ET
-import requests
 import json
-import time
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 import logging
 from datetime import datetime
 
+from lod_fetch_engine import CrawlCheckpoint, LODFetchEngine
+from lod_stream_parser import parse_election_file
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -38,26 +40,25 @@ class LODDataProcessor:
         self.candidates = []
         self.election_districts = []
         self.resign_candidates = []
+        self.fetch_engine = LODFetchEngine()
         
     def parse_lod_file(self) -> Dict:
         """LOD XML 파일을 파싱하여 데이터를 추출합니다."""
         logger.info(f"LOD 파일 파싱 시작: {self.lod_file_path}")
         
         try:
-            tree = ET.parse(self.lod_file_path)
-            root = tree.getroot()
-            
-            # 선거 정보 추출
-            election_info = self._extract_election_info(root)
-            
-            # 후보자 URI 추출
-            candidate_uris = self._extract_candidate_uris(root)
+            # 한 번의 스트리밍 순회로 선거 정보/후보자/선거구/사퇴자 URI 추출
+            parsed = parse_election_file(self.lod_file_path)
             
-            # 선거구 URI 추출
-            district_uris = self._extract_district_uris(root)
+            election_info = parsed['election_info']
+            if not parsed['has_election']:
+                logger.warning("선거 정보를 찾을 수 없습니다")
+            else:
+                logger.info(f"선거 정보 추출 완료: {election_info.get('name', 'Unknown')}")
             
-            # 사퇴 후보자 URI 추출
-            resign_uris = self._extract_resign_candidate_uris(root)
+            candidate_uris = parsed['candidate_uris']
+            district_uris = parsed['district_uris']
+            resign_uris = parsed['resign_candidate_uris']
             
             result = {
                 'election_info': election_info,
@@ -77,115 +78,19 @@ class LODDataProcessor:
             logger.error(f"LOD 파일 파싱 오류: {str(e)}")
             raise
     
-    def _extract_election_info(self, root) -> Dict:
-        """선거 기본 정보를 추출합니다."""
-        election_element = root.find('.//no:Election', self.namespaces)
-        
-        if election_element is None:
-            logger.warning("선거 정보를 찾을 수 없습니다")
-            return {}
-        
-        info = {}
-        
-        # 선거 ID
-        election_id_elem = election_element.find('.//no:electionId', self.namespaces)
-        if election_id_elem is not None:
-            info['election_id'] = election_id_elem.text
-        
-        # 선거명
-        name_elem = election_element.find('.//no:name', self.namespaces)
-        if name_elem is not None:
-            info['name'] = name_elem.text
-        
-        # 선거일
-        election_day_elem = election_element.find('.//no:electionDay', self.namespaces)
-        if election_day_elem is not None:
-            info['election_day'] = election_day_elem.text
-        
-        # 정렬 순서
-        sort_order_elem = election_element.find('.//no:sortOrder', self.namespaces)
-        if sort_order_elem is not None:
-            info['sort_order'] = sort_order_elem.text
-        
-        logger.info(f"선거 정보 추출 완료: {info.get('name', 'Unknown')}")
-        return info
-    
-    def _extract_candidate_uris(self, root) -> List[str]:
-        """후보자 URI들을 추출합니다."""
-        candidate_elements = root.findall('.//no:hasCandidate', self.namespaces)
-        uris = []
-        
-        for element in candidate_elements:
-            resource = element.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource')
-            if resource:
-                uris.append(resource)
-        
-        logger.info(f"후보자 URI {len(uris)}개 추출 완료")
-        return uris
-    
-    def _extract_district_uris(self, root) -> List[str]:
-        """선거구 URI들을 추출합니다."""
-        district_elements = root.findall('.//no:hasElectionDistrict', self.namespaces)
-        uris = []
-        
-        for element in district_elements:
-            resource = element.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource')
-            if resource:
-                uris.append(resource)
-        
-        logger.info(f"선거구 URI {len(uris)}개 추출 완료")
-        return uris
-    
-    def _extract_resign_candidate_uris(self, root) -> List[str]:
-        """사퇴 후보자 URI들을 추출합니다."""
-        resign_elements = root.findall('.//no:hasResignCandidate', self.namespaces)
-        uris = []
-        
-        for element in resign_elements:
-            resource = element.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource')
-            if resource:
-                uris.append(resource)
-        
-        logger.info(f"사퇴 후보자 URI {len(uris)}개 추출 완료")
-        return uris
-    
-    def fetch_candidate_details(self, candidate_uris: List[str], max_requests: int = 10) -> List[Dict]:
-        """후보자 상세 정보를 가져옵니다. (테스트용으로 제한된 수량)"""
-        logger.info(f"후보자 상세 정보 수집 시작 (테스트: {max_requests}명)")
-        
-        candidates = []
-        failed_requests = []
-        
-        for i, uri in enumerate(candidate_uris[:max_requests]):
-            try:
-                logger.info(f"처리 중: {i+1}/{max_requests} - {uri}")
-                
-                # RDF 형식으로 요청 (올바른 URL 패턴 사용)
-                rdf_url = uri.replace('/resource/', '/data/') + "?output=rdfxml"
-                
-                response = requests.get(rdf_url, timeout=30)
-                
-                if response.status_code == 200:
-                    candidate_data = self._parse_candidate_rdf(response.content, uri)
-                    if candidate_data:
-                        candidates.append(candidate_data)
-                        logger.info(f"✅ 성공: {candidate_data.get('name', 'Unknown')}")
-                    else:
-                        logger.warning(f"❌ 데이터 파싱 실패: {uri}")
-                        failed_requests.append(uri)
-                else:
-                    logger.warning(f"❌ HTTP 오류 {response.status_code}: {uri}")
-                    failed_requests.append(uri)
-                
-                # 요청 간격 조절 (서버 부하 방지)
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"❌ 요청 실패 {uri}: {str(e)}")
-                failed_requests.append(uri)
-                continue
+    def fetch_candidate_details(self, candidate_uris: List[str], max_requests: int = 10,
+                                checkpoint_name: Optional[str] = None) -> List[Dict]:
+        """후보자 상세 정보를 가져옵니다. (병렬 수집, 체크포인트로 이어받기)"""
+        target_uris = candidate_uris[:max_requests]
+        logger.info(f"후보자 상세 정보 수집 시작 ({len(target_uris)}명)")
+        
+        checkpoint = CrawlCheckpoint(checkpoint_name or os.path.basename(self.lod_file_path))
+        candidates, failed_requests = self.fetch_engine.crawl(
+            target_uris, lambda uri, content: self._parse_candidate_rdf(content, uri), checkpoint
+        )
         
         logger.info(f"상세 정보 수집 완료 - 성공: {len(candidates)}명, 실패: {len(failed_requests)}명")
+        logger.info(f"수집 통계: {self.fetch_engine.get_stats()}")
         
         return {
             'candidates': candidates,
@@ -278,56 +183,16 @@ class LODDataProcessor:
             return None
     
     def _fetch_party_name(self, party_resource: str) -> Optional[str]:
-        """정당 리소스에서 정당명을 가져옵니다."""
-        try:
-            party_rdf_url = party_resource.replace('/resource/', '/data/') + "?output=rdfxml"
-            response = requests.get(party_rdf_url, timeout=10)
-            
-            if response.status_code == 200:
-                root = ET.fromstring(response.content)
-                
-                # 정당명 추출 시도
-                name_patterns = [
-                    './/no:name',
-                    './/rdfs:label', 
-                    './/foaf:name'
-                ]
-                
-                for pattern in name_patterns:
-                    name_elem = root.find(pattern, self.namespaces)
-                    if name_elem is not None and name_elem.text:
-                        return name_elem.text.strip()
-                        
-        except Exception as e:
-            logger.warning(f"정당명 조회 실패 {party_resource}: {str(e)}")
-        
-        return None
+        """정당 리소스에서 정당명을 가져옵니다. (리소스당 1회 조회, 캐시 공유)"""
+        return self.fetch_engine.resolve_label(
+            party_resource, ['.//no:name', './/rdfs:label', './/foaf:name'], self.namespaces
+        )
     
     def _fetch_district_name(self, district_resource: str) -> Optional[str]:
-        """선거구 리소스에서 선거구명을 가져옵니다."""
-        try:
-            district_rdf_url = district_resource.replace('/resource/', '/data/') + "?output=rdfxml"
-            response = requests.get(district_rdf_url, timeout=10)
-            
-            if response.status_code == 200:
-                root = ET.fromstring(response.content)
-                
-                # 선거구명 추출 시도
-                name_patterns = [
-                    './/no:name',
-                    './/rdfs:label',
-                    './/no:districtName'
-                ]
-                
-                for pattern in name_patterns:
-                    name_elem = root.find(pattern, self.namespaces)
-                    if name_elem is not None and name_elem.text:
-                        return name_elem.text.strip()
-                        
-        except Exception as e:
-            logger.warning(f"선거구명 조회 실패 {district_resource}: {str(e)}")
-        
-        return None
+        """선거구 리소스에서 선거구명을 가져옵니다. (리소스당 1회 조회, 캐시 공유)"""
+        return self.fetch_engine.resolve_label(
+            district_resource, ['.//no:name', './/rdfs:label', './/no:districtName'], self.namespaces
+        )
     
     def save_results(self, data: Dict, filename: str):
         """결과를 JSON 파일로 저장합니다."""
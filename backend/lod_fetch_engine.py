@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LOD RDF 수집 엔진
+선관위 LOD(data.nec.go.kr) 후보자/정당/선거구 RDF 문서를 병렬로 수집합니다.
+- 동시 요청 수 제한 + 호스트별 최소 요청 간격 (서버 부하 방지)
+- 내용 주소(SHA-256) 기반 디스크 캐시: 한 번 받은 문서는 다시 요청하지 않음
+- 정당/선거구 이름 조회 메모이제이션 (같은 리소스는 한 번만 조회)
+- 체크포인트(JSON Lines): 중단된 수집을 이어서 진행
+"""
+
+import os
+import json
+import time
+import random
+import hashlib
+import logging
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+DEFAULT_CACHE_DIR = os.path.join(DATA_DIR, 'lod_rdf_cache')
+DEFAULT_CHECKPOINT_DIR = os.path.join(DATA_DIR, 'lod_checkpoints')
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def rdf_data_url(resource_uri: str) -> str:
+    """리소스 URI → RDF/XML 문서 URL"""
+    return resource_uri.replace('/resource/', '/data/') + "?output=rdfxml"
+
+
+class RDFDocumentCache:
+    """내용 주소 기반 RDF 캐시
+
+    objects/ab/abcd...rdf 에 본문을 SHA-256 이름으로 저장하고,
+    index.jsonl 에 URL → 해시를 추가 기록한다 (중단되어도 기록된 줄까지는 유효).
+    """
+
+    def __init__(self, cache_dir: Optional[str] = DEFAULT_CACHE_DIR):
+        self.cache_dir = os.environ.get('LOD_RDF_CACHE_DIR', cache_dir) if cache_dir else None
+        self.index: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        if self.cache_dir:
+            os.makedirs(os.path.join(self.cache_dir, 'objects'), exist_ok=True)
+            self._load_index()
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.cache_dir, 'index.jsonl')
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, 'objects', digest[:2], f"{digest}.rdf")
+
+    def _load_index(self):
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    self.index[entry['url']] = entry['sha256']
+                except (ValueError, KeyError):
+                    continue  # 기록 도중 중단된 줄
+        logger.info(f"RDF 캐시 로드: {len(self.index)}개 문서")
+
+    def get(self, url: str) -> Optional[bytes]:
+        if not self.cache_dir:
+            return None
+        digest = self.index.get(url)
+        if not digest:
+            return None
+        try:
+            with open(self._object_path(digest), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, url: str, content: bytes) -> str:
+        digest = hashlib.sha256(content).hexdigest()
+        if not self.cache_dir:
+            return digest
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        with self._lock:
+            if self.index.get(url) != digest:
+                self.index[url] = digest
+                with open(self.index_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps({'url': url, 'sha256': digest}) + '\n')
+        return digest
+
+
+class HostBudget:
+    """호스트별 동시 요청 수 + 최소 요청 간격"""
+
+    def __init__(self, max_concurrent: int = 2, min_interval: float = 0.25):
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._next_allowed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str):
+        with self._lock:
+            semaphore = self._semaphores.setdefault(host, threading.BoundedSemaphore(self.max_concurrent))
+        semaphore.acquire()
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed.get(host, 0.0))
+            self._next_allowed[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def release(self, host: str):
+        self._semaphores[host].release()
+
+
+class CrawlCheckpoint:
+    """수집 체크포인트 (uri별 결과를 JSON Lines로 추가 기록)"""
+
+    def __init__(self, name: str, checkpoint_dir: str = DEFAULT_CHECKPOINT_DIR):
+        checkpoint_dir = os.environ.get('LOD_CHECKPOINT_DIR', checkpoint_dir)
+        safe_name = ''.join(char if char.isalnum() or char in '-_' else '_' for char in name)
+        self.path = os.path.join(checkpoint_dir, f"{safe_name}.jsonl")
+        self.completed: Dict[str, Dict] = {}
+        self.failed: set = set()
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get('status') == 'ok':
+                    self.completed[entry['uri']] = entry['result']
+                    self.failed.discard(entry['uri'])
+                else:
+                    self.failed.add(entry['uri'])
+        logger.info(f"체크포인트 로드: 완료 {len(self.completed)}건, 실패 {len(self.failed)}건 ({self.path})")
+
+    def _append(self, entry: Dict):
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def record(self, uri: str, result: Dict):
+        self.completed[uri] = result
+        self.failed.discard(uri)
+        self._append({'uri': uri, 'status': 'ok', 'result': result})
+
+    def record_failure(self, uri: str):
+        self.failed.add(uri)
+        self._append({'uri': uri, 'status': 'failed'})
+
+
+class LODFetchEngine:
+    """병렬 LOD RDF 수집기 (캐시/메모이제이션/체크포인트 공유)"""
+
+    def __init__(self, max_workers: int = 4, per_host_concurrency: int = 2, per_host_interval: float = 0.25,
+                 timeout: int = 30, max_retries: int = 2, cache: Optional[RDFDocumentCache] = None):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.cache = cache if cache is not None else RDFDocumentCache()
+        self.hosts = HostBudget(per_host_concurrency, per_host_interval)
+
+        self._local = threading.local()
+        self._labels: Dict[str, str] = {}  # 조회에 성공한 이름만 저장 (실패는 다음 요청에서 재시도)
+        self._label_events: Dict[str, threading.Event] = {}
+        self._labels_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.stats = {'requests': 0, 'cache_hits': 0, 'retries': 0, 'errors': 0, 'label_hits': 0,
+                      'label_misses': 0, 'incomplete_records': 0}
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+    # ------------------------------------------------------------------
+    # 문서 수집
+    # ------------------------------------------------------------------
+    def fetch(self, url: str, timeout: Optional[int] = None) -> Optional[bytes]:
+        """URL 본문 (캐시 우선, 실패 시 None)"""
+        cached = self.cache.get(url)
+        if cached is not None:
+            self._count('cache_hits')
+            return cached
+
+        host = urlparse(url).netloc
+        for attempt in range(self.max_retries + 1):
+            self.hosts.acquire(host)
+            try:
+                self._count('requests')
+                response = self._session().get(url, timeout=timeout or self.timeout)
+                status = response.status_code
+                content = response.content
+            except requests.RequestException as e:
+                status, content = None, None
+                logger.warning(f"요청 오류 {url}: {e}")
+            finally:
+                self.hosts.release(host)
+
+            if status == 200:
+                self.cache.put(url, content)
+                return content
+            if status is not None and status not in RETRY_STATUS:
+                logger.warning(f"❌ HTTP 오류 {status}: {url}")
+                break
+            if attempt < self.max_retries:
+                self._count('retries')
+                time.sleep(min(2 ** attempt, 8) + random.uniform(0, 0.5))
+
+        self._count('errors')
+        return None
+
+    def fetch_resource(self, resource_uri: str, timeout: Optional[int] = None) -> Optional[bytes]:
+        return self.fetch(rdf_data_url(resource_uri), timeout)
+
+    def resolve_label(self, resource_uri: str, patterns: Iterable[str], namespaces: Dict[str, str]) -> Optional[str]:
+        """정당/선거구 등 리소스 이름 조회 (리소스당 1회, 동시 요청은 첫 요청 결과를 기다림)
+
+        조회에 실패하면 None을 기억하지 않고, 수집 중인 레코드를 미완성으로 표시해 체크포인트에서 제외한다.
+        """
+        with self._labels_lock:
+            label = self._labels.get(resource_uri)
+            memoized = label is not None
+            event = self._label_events.get(resource_uri)
+            owner = not memoized and event is None
+            if owner:
+                event = threading.Event()
+                self._label_events[resource_uri] = event
+        if memoized:
+            self._count('label_hits')
+            return label
+        if not owner:
+            event.wait()
+            label = self._labels.get(resource_uri)
+            if label is None:
+                self._label_missed()
+            else:
+                self._count('label_hits')
+            return label
+
+        label = None
+        try:
+            content = self.fetch_resource(resource_uri, timeout=10)
+            if content is not None:
+                root = ET.fromstring(content)
+                for pattern in patterns:
+                    elem = root.find(pattern, namespaces)
+                    if elem is not None and elem.text:
+                        label = elem.text.strip()
+                        break
+        except Exception as e:
+            logger.warning(f"이름 조회 실패 {resource_uri}: {e}")
+        finally:
+            with self._labels_lock:
+                if label is not None:
+                    self._labels[resource_uri] = label
+                del self._label_events[resource_uri]
+            event.set()
+        if label is None:
+            self._label_missed()
+        return label
+
+    def _label_missed(self):
+        """현재 스레드에서 파싱 중인 레코드에 미해결 이름 표시"""
+        self._count('label_misses')
+        self._local.unresolved_labels = getattr(self._local, 'unresolved_labels', 0) + 1
+
+    # ------------------------------------------------------------------
+    # 병렬 수집
+    # ------------------------------------------------------------------
+    def _crawl_one(self, uri: str, parse: Callable[[str, bytes], Optional[Dict]]) -> Tuple[Optional[Dict], bool]:
+        """(결과, 모든 이름 조회 성공 여부)"""
+        content = self.fetch_resource(uri)
+        if content is None:
+            return None, False
+        self._local.unresolved_labels = 0
+        try:
+            result = parse(uri, content)
+        except Exception as e:
+            logger.error(f"❌ 파싱 실패 {uri}: {e}")
+            return None, False
+        return result, self._local.unresolved_labels == 0
+
+    def crawl(self, uris: List[str], parse: Callable[[str, bytes], Optional[Dict]],
+              checkpoint: Optional[CrawlCheckpoint] = None) -> Tuple[List[Dict], List[str]]:
+        """리소스 목록 병렬 수집 → (결과 목록, 실패 URI 목록), 입력 순서 유지
+
+        체크포인트에 완료로 기록된 URI는 요청하지 않고 저장된 결과를 사용한다.
+        정당/선거구 이름 조회에 실패한 레코드는 결과에는 포함하되 체크포인트에 남기지 않아 다음 실행에서 다시 수집한다.
+        """
+        results: Dict[int, Dict] = {}
+        failed: Dict[int, str] = {}
+        pending: List[Tuple[int, str]] = []
+        for index, uri in enumerate(uris):
+            if checkpoint is not None and uri in checkpoint.completed:
+                results[index] = checkpoint.completed[uri]
+            else:
+                pending.append((index, uri))
+
+        if results:
+            logger.info(f"체크포인트에서 {len(results)}건 재사용, {len(pending)}건 수집")
+
+        done = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(self._crawl_one, uri, parse): (index, uri) for index, uri in pending}
+            for future in as_completed(futures):
+                index, uri = futures[future]
+                result, complete = future.result()
+                if result:
+                    results[index] = result
+                    if not complete:
+                        self._count('incomplete_records')
+                        logger.warning(f"⚠️ 이름 조회 실패로 체크포인트 보류: {uri}")
+                    elif checkpoint is not None:
+                        checkpoint.record(uri, result)
+                    logger.info(f"✅ 성공: {result.get('name', 'Unknown')}")
+                else:
+                    failed[index] = uri
+                    if checkpoint is not None:
+                        checkpoint.record_failure(uri)
+                done += 1
+                if done % 50 == 0:
+                    logger.info(f"진행: {done}/{len(pending)} ({self.get_stats()})")
+
+        return [results[index] for index in sorted(results)], [failed[index] for index in sorted(failed)]
+
+    def get_stats(self) -> Dict:
+        return {**self.stats, 'cached_documents': len(self.cache.index), 'resolved_labels': len(self._labels)}
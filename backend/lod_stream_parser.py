@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+LOD 선거 XML 스트리밍 파서
+iterparse로 파일을 한 번만 읽으면서 선거 정보, 후보자/선거구/사퇴자/하위 선거 URI를 추출
+- 처리한 요소는 바로 부모에서 떼어내므로 메모리에는 현재 경로의 요소만 남음
+- 전국 단위 지방선거 파일도 파일 크기와 무관하게 최대 메모리가 일정
+"""
+
+import io
+import logging
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterator, List, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+RDF_NS = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#'
+NO_NS = 'http://data.nec.go.kr/ontology/'
+
+RDF_RESOURCE = f'{{{RDF_NS}}}resource'
+RDF_ABOUT = f'{{{RDF_NS}}}about'
+ELECTION_TAG = f'{{{NO_NS}}}Election'
+
+# 선거 요소 안의 텍스트 속성 → election_info 키
+ELECTION_FIELDS = {
+    f'{{{NO_NS}}}electionId': 'election_id',
+    f'{{{NO_NS}}}name': 'name',
+    f'{{{NO_NS}}}electionDay': 'election_day',
+    f'{{{NO_NS}}}sortOrder': 'sort_order',
+}
+
+# 문서 전체에서 수집하는 URI 속성 → 이벤트 종류
+URI_PROPERTIES = {
+    f'{{{NO_NS}}}hasCandidate': 'candidate',
+    f'{{{NO_NS}}}hasElectionDistrict': 'district',
+    f'{{{NO_NS}}}hasResignCandidate': 'resign_candidate',
+}
+
+# 선거 요소 안에서만 수집하는 URI 속성
+ELECTION_URI_PROPERTIES = {
+    f'{{{NO_NS}}}lowerPartElection': 'sub_election',
+    f'{{{NO_NS}}}hasElectionType': 'election_type',
+}
+
+Source = Union[str, bytes, io.IOBase]
+
+
+def iter_lod_events(source: Source) -> Iterator[Tuple[str, str, str]]:
+    """(종류, 키, 값) 이벤트를 문서 순서대로 생성
+
+    - ('election_start', 'uri', rdf:about): 첫 번째 no:Election 시작
+    - ('election', 필드명, 텍스트): 그 선거 요소 안의 선거 정보
+    - ('uri', 종류, URI): candidate / district / resign_candidate / sub_election / election_type
+    """
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+
+    path: List[ET.Element] = []
+    election_depth = None  # 첫 번째 no:Election의 경로 깊이
+    election_seen = False
+    seen_fields = set()
+
+    for event, element in ET.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            if element.tag == ELECTION_TAG and not election_seen:
+                election_seen = True
+                election_depth = len(path)
+                yield 'election_start', 'uri', element.get(RDF_ABOUT)
+            path.append(element)
+            continue
+
+        path.pop()
+        in_election = election_depth is not None and len(path) > election_depth
+        tag = element.tag
+
+        kind = URI_PROPERTIES.get(tag)
+        if kind is None and in_election:
+            kind = ELECTION_URI_PROPERTIES.get(tag)
+        if kind is not None:
+            resource = element.get(RDF_RESOURCE)
+            if resource:
+                yield 'uri', kind, resource
+        elif in_election and tag in ELECTION_FIELDS and tag not in seen_fields:
+            seen_fields.add(tag)
+            yield 'election', ELECTION_FIELDS[tag], element.text
+
+        if election_depth is not None and len(path) == election_depth:
+            election_depth = None  # 첫 번째 선거 요소 종료
+
+        # 처리 끝난 요소는 부모에서 떼어냄 (현재 경로만 메모리에 유지)
+        element.clear()
+        if path:
+            path[-1].remove(element)
+
+
+def parse_election_file(source: Source) -> Dict:
+    """선거 XML을 한 번 순회해 선거 정보와 URI 목록을 모두 추출
+
+    반환: {'election_info', 'election_uri', 'has_election', 'candidate_uris', 'district_uris',
+          'resign_candidate_uris', 'sub_election_uris', 'election_type_uris'}
+    """
+    result = {
+        'election_info': {},
+        'election_uri': None,
+        'has_election': False,
+        'candidate_uris': [],
+        'district_uris': [],
+        'resign_candidate_uris': [],
+        'sub_election_uris': [],
+        'election_type_uris': [],
+    }
+    for kind, key, value in iter_lod_events(source):
+        if kind == 'election_start':
+            result['has_election'] = True
+            result['election_uri'] = value
+        elif kind == 'election':
+            result['election_info'][key] = value
+        else:
+            result[f'{key}_uris'].append(value)
+    return result
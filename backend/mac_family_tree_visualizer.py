@@ -5,17 +5,468 @@
 """
 
 import json
+import argparse
 import sqlite3
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from pyvis.network import Network
 import os
 from datetime import datetime
 
+from widget_render_engine import WidgetRenderer, WidgetTemplate, file_hash
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 생성기 코드/템플릿이 바뀌면 모든 산출물의 입력이 바뀐 것으로 취급
+GENERATOR_HASH = file_hash(__file__)
+
+PAGE_CSS = """
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+    padding: 20px;
+}
+
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+    background: white;
+    border-radius: 20px;
+    box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+    overflow: hidden;
+}
+
+.header {
+    background: linear-gradient(135deg, #3498db, #2980b9);
+    color: white;
+    padding: 40px;
+    text-align: center;
+}
+
+.header h1 {
+    font-size: 2.5em;
+    margin-bottom: 15px;
+    font-weight: 600;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+}
+
+.header .info {
+    font-size: 1.1em;
+    opacity: 0.9;
+    margin-bottom: 10px;
+}
+
+.score-badge {
+    display: inline-block;
+    background: rgba(255,255,255,0.2);
+    padding: 12px 24px;
+    border-radius: 25px;
+    margin-top: 15px;
+    font-size: 1.1em;
+    font-weight: 600;
+    backdrop-filter: blur(10px);
+}
+
+.content {
+    padding: 40px;
+}
+
+.widget-section {
+    margin-bottom: 40px;
+}
+
+.widget-section h2 {
+    color: #2c3e50;
+    margin-bottom: 20px;
+    font-size: 1.8em;
+    font-weight: 600;
+    border-bottom: 3px solid #3498db;
+    padding-bottom: 10px;
+}
+
+.widget-container {
+    border: 2px solid #ecf0f1;
+    border-radius: 15px;
+    overflow: hidden;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+    background: #f8f9fa;
+}
+
+.widget-container iframe {
+    width: 100%;
+    height: 600px;
+    border: none;
+}
+
+.connections-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+    gap: 20px;
+    margin-top: 30px;
+}
+
+.connection-card {
+    background: white;
+    border-radius: 15px;
+    padding: 20px;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+    border-left: 5px solid;
+    transition: transform 0.3s ease, box-shadow 0.3s ease;
+}
+
+.connection-card:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 10px 25px rgba(0,0,0,0.15);
+}
+
+.connection-card.입법_연결 { border-left-color: #FF6B6B; }
+.connection-card.위원회_연결 { border-left-color: #4ECDC4; }
+.connection-card.정치적_연결 { border-left-color: #45B7D1; }
+.connection-card.지역_연결 { border-left-color: #96CEB4; }
+.connection-card.정책_연결 { border-left-color: #FFEAA7; }
+.connection-card.시간_연결 { border-left-color: #DDA0DD; }
+
+.connection-name {
+    font-size: 1.3em;
+    font-weight: 600;
+    color: #2c3e50;
+    margin-bottom: 10px;
+}
+
+.connection-type {
+    color: #7f8c8d;
+    font-size: 0.9em;
+    margin-bottom: 10px;
+}
+
+.connection-strength {
+    display: flex;
+    align-items: center;
+    gap: 10px;
+}
+
+.strength-bar {
+    flex: 1;
+    height: 8px;
+    background: #ecf0f1;
+    border-radius: 4px;
+    overflow: hidden;
+}
+
+.strength-fill {
+    height: 100%;
+    background: linear-gradient(90deg, #3498db, #2ecc71);
+    border-radius: 4px;
+    transition: width 0.3s ease;
+}
+
+.strength-value {
+    font-weight: 600;
+    color: #2c3e50;
+    min-width: 40px;
+}
+
+.back-button {
+    position: fixed;
+    top: 20px;
+    left: 20px;
+    background: rgba(255,255,255,0.9);
+    border: none;
+    padding: 15px 25px;
+    border-radius: 25px;
+    font-family: 'SF Pro Display', -apple-system, sans-serif;
+    font-size: 1em;
+    font-weight: 500;
+    cursor: pointer;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.2);
+    transition: all 0.3s ease;
+    backdrop-filter: blur(10px);
+}
+
+.back-button:hover {
+    background: white;
+    transform: translateY(-2px);
+    box-shadow: 0 8px 20px rgba(0,0,0,0.25);
+}
+
+.level-indicator {
+    display: inline-block;
+    background: #3498db;
+    color: white;
+    padding: 4px 8px;
+    border-radius: 12px;
+    font-size: 0.8em;
+    font-weight: 500;
+    margin-left: 8px;
+}
+"""
+
+PAGE_JS = """
+// 연결 강도 바 애니메이션
+document.addEventListener('DOMContentLoaded', function() {
+    const strengthBars = document.querySelectorAll('.strength-fill');
+    strengthBars.forEach(bar => {
+        const width = bar.style.width;
+        bar.style.width = '0%';
+        setTimeout(() => {
+            bar.style.width = width;
+        }, 500);
+    });
+});
+"""
+
+INDEX_CSS = """
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+    padding: 20px;
+}
+
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+}
+
+.header {
+    text-align: center;
+    color: white;
+    margin-bottom: 50px;
+}
+
+.header h1 {
+    font-size: 3.5em;
+    margin-bottom: 20px;
+    font-weight: 600;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+}
+
+.header p {
+    font-size: 1.3em;
+    opacity: 0.9;
+    font-weight: 300;
+}
+
+.politicians-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
+    gap: 30px;
+}
+
+.politician-card {
+    background: white;
+    border-radius: 20px;
+    padding: 30px;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+    transition: transform 0.3s ease, box-shadow 0.3s ease;
+    cursor: pointer;
+    border: 1px solid #ecf0f1;
+}
+
+.politician-card:hover {
+    transform: translateY(-10px);
+    box-shadow: 0 20px 40px rgba(0,0,0,0.2);
+}
+
+.politician-name {
+    font-size: 1.8em;
+    font-weight: 600;
+    color: #2c3e50;
+    margin-bottom: 15px;
+}
+
+.politician-info {
+    color: #7f8c8d;
+    margin-bottom: 20px;
+    line-height: 1.5;
+}
+
+.politician-info p {
+    margin-bottom: 5px;
+}
+
+.score-badge {
+    display: inline-block;
+    background: linear-gradient(135deg, #3498db, #2ecc71);
+    color: white;
+    padding: 12px 24px;
+    border-radius: 25px;
+    font-weight: 600;
+    margin-bottom: 20px;
+}
+
+.connections-preview {
+    margin-top: 20px;
+}
+
+.connections-preview h4 {
+    color: #2c3e50;
+    margin-bottom: 10px;
+    font-weight: 600;
+}
+
+.connection-tags {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 8px;
+}
+
+.connection-tag {
+    background: #ecf0f1;
+    padding: 6px 12px;
+    border-radius: 15px;
+    font-size: 0.9em;
+    color: #7f8c8d;
+    font-weight: 500;
+}
+
+.view-button {
+    background: linear-gradient(135deg, #3498db, #2980b9);
+    color: white;
+    border: none;
+    padding: 15px 30px;
+    border-radius: 25px;
+    font-family: 'SF Pro Display', -apple-system, sans-serif;
+    font-size: 1em;
+    font-weight: 500;
+    cursor: pointer;
+    margin-top: 20px;
+    width: 100%;
+    transition: all 0.3s ease;
+}
+
+.view-button:hover {
+    background: linear-gradient(135deg, #2980b9, #3498db);
+    transform: translateY(-2px);
+    box-shadow: 0 5px 15px rgba(52, 152, 219, 0.4);
+}
+"""
+
+PAGE_TEMPLATE = WidgetTemplate("""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>${name} 연결성 분석 - 맥 패밀리트리 스타일</title>
+    ${stylesheets}
+</head>
+<body>
+    <button class="back-button" onclick="history.back()">← 뒤로가기</button>
+    
+    <div class="container">
+        <div class="header">
+            <h1>${name}</h1>
+            <div class="info">
+                <p>${party} | ${district}</p>
+                <p>${committee}</p>
+            </div>
+            <div class="score-badge">
+                연결성 점수: ${connectivity_score}점
+            </div>
+        </div>
+        
+        <div class="content">
+            <div class="widget-section">
+                <h2>🌳 맥 패밀리트리 스타일 연결성 시각화</h2>
+                <div class="widget-container">
+                    <iframe src="../widgets/family_tree_${name}.html"></iframe>
+                </div>
+            </div>
+            
+            <div class="widget-section">
+                <h2>🔗 연결된 정치인 상세</h2>
+                <div class="connections-grid">
+${connection_cards}
+                </div>
+            </div>
+        </div>
+    </div>
+    
+    ${scripts}
+</body>
+</html>
+""")
+
+CONNECTION_CARD_TEMPLATE = WidgetTemplate("""
+                    <div class="connection-card ${type}">
+                        <div class="connection-name">
+                            ${name}
+                            <span class="level-indicator">${level_text}</span>
+                        </div>
+                        <div class="connection-type">${description}</div>
+                        <div class="connection-strength">
+                            <div class="strength-bar">
+                                <div class="strength-fill" style="width: ${strength_percent}%"></div>
+                            </div>
+                            <div class="strength-value">${strength_text}</div>
+                        </div>
+                    </div>
+                """)
+
+INDEX_TEMPLATE = WidgetTemplate("""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>정치인 연결성 분석 - 맥 패밀리트리 스타일</title>
+    ${stylesheets}
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🌳 정치인 연결성 분석</h1>
+            <p>맥 패밀리트리 스타일의 직관적인 네트워크 시각화</p>
+        </div>
+        
+        <div class="politicians-grid">
+${politician_cards}
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+INDEX_ITEM_TEMPLATE = WidgetTemplate("""
+            <div class="politician-card" onclick="location.href='pages/page_${name}.html'">
+                <div class="politician-name">${name}</div>
+                <div class="politician-info">
+                    <p><strong>정당:</strong> ${party}</p>
+                    <p><strong>지역구:</strong> ${district}</p>
+                    <p><strong>위원회:</strong> ${committee}</p>
+                </div>
+                <div class="score-badge">
+                    연결성 점수: ${connectivity_score}점
+                </div>
+                <div class="connections-preview">
+                    <h4>연결 유형:</h4>
+                    <div class="connection-tags">
+${connection_tags}
+                    </div>
+                </div>
+                <button class="view-button" onclick="event.stopPropagation(); location.href='pages/page_${name}.html'">
+                    패밀리트리 보기
+                </button>
+            </div>
+""")
+
+
 class MacFamilyTreeVisualizer:
     """맥 패밀리트리 스타일 네트워크 시각화 클래스"""
     
@@ -98,6 +549,14 @@ class MacFamilyTreeVisualizer:
         os.makedirs(self.output_dir, exist_ok=True)
         os.makedirs(f"{self.output_dir}/widgets", exist_ok=True)
         os.makedirs(f"{self.output_dir}/pages", exist_ok=True)
+        
+        # 공용 CSS/JS (내용 해시 이름으로 한 번만 기록)
+        self.renderer = WidgetRenderer(self.output_dir)
+        self.page_assets = {
+            'css': [self.renderer.assets.add('family_tree_page', PAGE_CSS, 'css')],
+            'js': [self.renderer.assets.add('family_tree_page', PAGE_JS, 'js')],
+        }
+        self.index_assets = {'css': [self.renderer.assets.add('family_tree_index', INDEX_CSS, 'css')]}
     
     def create_family_tree_widget(self, politician_name: str) -> str:
         """맥 패밀리트리 스타일 위젯 생성"""
@@ -392,18 +851,15 @@ class MacFamilyTreeVisualizer:
                     title=f"{conn['description']} (강도: {conn['strength']:.1f})"
                 )
             
-            # HTML 파일로 저장
+            # HTML 파일로 저장 (내용이 같으면 건너뜀)
             filename = f"family_tree_{politician['name']}.html"
-            filepath = f"{self.output_dir}/widgets/{filename}"
-            net.save_graph(filepath)
-            
-            logger.info(f"맥 패밀리트리 위젯 생성 완료: {filepath}")
+            if self.renderer.write(f"widgets/{filename}", net.generate_html()):
+                logger.info(f"맥 패밀리트리 위젯 생성 완료: {self.output_dir}/widgets/{filename}")
             return filename
             
         except Exception as e:
             logger.error(f"맥 패밀리트리 위젯 생성 실패: {e}")
             return None
-    
     def create_politician_page(self, politician_name: str) -> str:
         """개별 정치인 페이지 생성 (맥 스타일)"""
         try:
@@ -413,508 +869,85 @@ class MacFamilyTreeVisualizer:
             
             politician = self.politicians[politician_name]
             
-            html_content = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{politician['name']} 연결성 분석 - 맥 패밀리트리 스타일</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 20px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, #3498db, #2980b9);
-            color: white;
-            padding: 40px;
-            text-align: center;
-        }}
-        
-        .header h1 {{
-            font-size: 2.5em;
-            margin-bottom: 15px;
-            font-weight: 600;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }}
-        
-        .header .info {{
-            font-size: 1.1em;
-            opacity: 0.9;
-            margin-bottom: 10px;
-        }}
-        
-        .score-badge {{
-            display: inline-block;
-            background: rgba(255,255,255,0.2);
-            padding: 12px 24px;
-            border-radius: 25px;
-            margin-top: 15px;
-            font-size: 1.1em;
-            font-weight: 600;
-            backdrop-filter: blur(10px);
-        }}
-        
-        .content {{
-            padding: 40px;
-        }}
-        
-        .widget-section {{
-            margin-bottom: 40px;
-        }}
-        
-        .widget-section h2 {{
-            color: #2c3e50;
-            margin-bottom: 20px;
-            font-size: 1.8em;
-            font-weight: 600;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 10px;
-        }}
-        
-        .widget-container {{
-            border: 2px solid #ecf0f1;
-            border-radius: 15px;
-            overflow: hidden;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-            background: #f8f9fa;
-        }}
-        
-        .widget-container iframe {{
-            width: 100%;
-            height: 600px;
-            border: none;
-        }}
-        
-        .connections-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 20px;
-            margin-top: 30px;
-        }}
-        
-        .connection-card {{
-            background: white;
-            border-radius: 15px;
-            padding: 20px;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-            border-left: 5px solid;
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-        }}
-        
-        .connection-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 10px 25px rgba(0,0,0,0.15);
-        }}
-        
-        .connection-card.입법_연결 {{ border-left-color: #FF6B6B; }}
-        .connection-card.위원회_연결 {{ border-left-color: #4ECDC4; }}
-        .connection-card.정치적_연결 {{ border-left-color: #45B7D1; }}
-        .connection-card.지역_연결 {{ border-left-color: #96CEB4; }}
-        .connection-card.정책_연결 {{ border-left-color: #FFEAA7; }}
-        .connection-card.시간_연결 {{ border-left-color: #DDA0DD; }}
-        
-        .connection-name {{
-            font-size: 1.3em;
-            font-weight: 600;
-            color: #2c3e50;
-            margin-bottom: 10px;
-        }}
-        
-        .connection-type {{
-            color: #7f8c8d;
-            font-size: 0.9em;
-            margin-bottom: 10px;
-        }}
-        
-        .connection-strength {{
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }}
-        
-        .strength-bar {{
-            flex: 1;
-            height: 8px;
-            background: #ecf0f1;
-            border-radius: 4px;
-            overflow: hidden;
-        }}
-        
-        .strength-fill {{
-            height: 100%;
-            background: linear-gradient(90deg, #3498db, #2ecc71);
-            border-radius: 4px;
-            transition: width 0.3s ease;
-        }}
-        
-        .strength-value {{
-            font-weight: 600;
-            color: #2c3e50;
-            min-width: 40px;
-        }}
-        
-        .back-button {{
-            position: fixed;
-            top: 20px;
-            left: 20px;
-            background: rgba(255,255,255,0.9);
-            border: none;
-            padding: 15px 25px;
-            border-radius: 25px;
-            font-family: 'SF Pro Display', -apple-system, sans-serif;
-            font-size: 1em;
-            font-weight: 500;
-            cursor: pointer;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-            transition: all 0.3s ease;
-            backdrop-filter: blur(10px);
-        }}
-        
-        .back-button:hover {{
-            background: white;
-            transform: translateY(-2px);
-            box-shadow: 0 8px 20px rgba(0,0,0,0.25);
-        }}
-        
-        .level-indicator {{
-            display: inline-block;
-            background: #3498db;
-            color: white;
-            padding: 4px 8px;
-            border-radius: 12px;
-            font-size: 0.8em;
-            font-weight: 500;
-            margin-left: 8px;
-        }}
-    </style>
-</head>
-<body>
-    <button class="back-button" onclick="history.back()">← 뒤로가기</button>
-    
-    <div class="container">
-        <div class="header">
-            <h1>{politician['name']}</h1>
-            <div class="info">
-                <p>{politician['party']} | {politician['district']}</p>
-                <p>{politician['committee']}</p>
-            </div>
-            <div class="score-badge">
-                연결성 점수: {politician['connectivity_score']}점
-            </div>
-        </div>
-        
-        <div class="content">
-            <div class="widget-section">
-                <h2>🌳 맥 패밀리트리 스타일 연결성 시각화</h2>
-                <div class="widget-container">
-                    <iframe src="widgets/family_tree_{politician['name']}.html"></iframe>
-                </div>
-            </div>
-            
-            <div class="widget-section">
-                <h2>🔗 연결된 정치인 상세</h2>
-                <div class="connections-grid">
-"""
-            
-            # 연결된 정치인 카드들 추가 (레벨별로)
-            for conn in politician["connections"]:
-                strength_percent = int(conn["strength"] * 100)
-                level_text = f"L{conn['level']}" if conn['level'] > 1 else ""
-                
-                html_content += f"""
-                    <div class="connection-card {conn['type']}">
-                        <div class="connection-name">
-                            {conn['name']}
-                            <span class="level-indicator">{level_text}</span>
-                        </div>
-                        <div class="connection-type">{conn['description']}</div>
-                        <div class="connection-strength">
-                            <div class="strength-bar">
-                                <div class="strength-fill" style="width: {strength_percent}%"></div>
-                            </div>
-                            <div class="strength-value">{conn['strength']:.1f}</div>
-                        </div>
-                    </div>
-                """
-            
-            html_content += """
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        // 연결 강도 바 애니메이션
-        document.addEventListener('DOMContentLoaded', function() {
-            const strengthBars = document.querySelectorAll('.strength-fill');
-            strengthBars.forEach(bar => {
-                const width = bar.style.width;
-                bar.style.width = '0%';
-                setTimeout(() => {
-                    bar.style.width = width;
-                }, 500);
-            });
-        });
-    </script>
-</body>
-</html>
-"""
+            # 연결된 정치인 카드들 (레벨별로)
+            connection_cards = ''.join(
+                CONNECTION_CARD_TEMPLATE.render(
+                    conn,
+                    level_text=f"L{conn['level']}" if conn['level'] > 1 else "",
+                    strength_percent=int(conn["strength"] * 100),
+                    strength_text=f"{conn['strength']:.1f}"
+                )
+                for conn in politician["connections"]
+            )
             
-            # HTML 파일로 저장
             filename = f"page_{politician['name']}.html"
-            filepath = f"{self.output_dir}/pages/{filename}"
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            html_content = PAGE_TEMPLATE.render(
+                politician,
+                connection_cards=connection_cards,
+                **self.renderer.asset_tags(f"pages/{filename}", **self.page_assets)
+            )
             
-            logger.info(f"정치인 페이지 생성 완료: {filepath}")
+            # HTML 파일로 저장 (내용이 같으면 건너뜀)
+            if self.renderer.write(f"pages/{filename}", html_content):
+                logger.info(f"정치인 페이지 생성 완료: {self.output_dir}/pages/{filename}")
             return filename
             
         except Exception as e:
             logger.error(f"정치인 페이지 생성 실패: {e}")
             return None
     
-    def create_all_widgets(self) -> Dict[str, Any]:
-        """모든 정치인 위젯 생성"""
-        results = {}
+    def _widget_inputs(self, politician_name: str) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """정치인 한 명의 산출물별 (출력 경로, 입력 필드) — 빌드 매니페스트 비교용"""
+        politician = self.politicians[politician_name]
+        return {
+            "widget": (f"widgets/family_tree_{politician_name}.html", {**politician, "colors": self.connection_colors, "generator": GENERATOR_HASH}),
+            "page": (f"pages/page_{politician_name}.html", {**politician, "assets": self.page_assets, "generator": GENERATOR_HASH}),
+        }
+    
+    def _create_politician_widgets(self, job: Tuple[str, Sequence[str]]) -> Dict[str, Any]:
+        """정치인 한 명의 패밀리트리 위젯/페이지 중 작업에 포함된 것만 생성 (프로세스 풀 작업 단위)"""
+        politician_name, kinds = job
+        builders = {"widget": self.create_family_tree_widget, "page": self.create_politician_page}
+        return {kind: builders[kind](politician_name) for kind in kinds}
+    
+    def create_all_widgets(self, max_workers: Optional[int] = None, changed_only: bool = False) -> Dict[str, Any]:
+        """모든 정치인 위젯 생성 (프로세스 풀 병렬, max_workers=1이면 순차)
         
-        for politician_name in self.politicians.keys():
-            logger.info(f"정치인 위젯 생성 중: {politician_name}")
-            
-            # 패밀리트리 위젯 생성
-            widget_file = self.create_family_tree_widget(politician_name)
-            
-            # 개인 페이지 생성
-            page_file = self.create_politician_page(politician_name)
-            
-            if widget_file and page_file:
-                results[politician_name] = {
-                    "widget": widget_file,
-                    "page": page_file,
-                    "status": "success"
-                }
+        changed_only=True면 빌드 매니페스트와 입력 해시가 다른 산출물만 다시 생성
+        """
+        artifacts = {name: self._widget_inputs(name) for name in self.politicians}
+        logger.info(f"정치인 위젯 생성 중: {len(artifacts)}명")
+        
+        results = {}
+        for politician_name, files in self.renderer.build(self._create_politician_widgets, artifacts, changed_only, max_workers).items():
+            if all(files.values()):
+                results[politician_name] = {**files, "status": "success"}
         
         return results
     
     def create_index_page(self) -> str:
         """전체 정치인 목록 인덱스 페이지 생성 (맥 스타일)"""
         try:
-            html_content = """
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>정치인 연결성 분석 - 맥 패밀리트리 스타일</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-        
-        .header {
-            text-align: center;
-            color: white;
-            margin-bottom: 50px;
-        }
-        
-        .header h1 {
-            font-size: 3.5em;
-            margin-bottom: 20px;
-            font-weight: 600;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }
-        
-        .header p {
-            font-size: 1.3em;
-            opacity: 0.9;
-            font-weight: 300;
-        }
-        
-        .politicians-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
-            gap: 30px;
-        }
-        
-        .politician-card {
-            background: white;
-            border-radius: 20px;
-            padding: 30px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-            cursor: pointer;
-            border: 1px solid #ecf0f1;
-        }
-        
-        .politician-card:hover {
-            transform: translateY(-10px);
-            box-shadow: 0 20px 40px rgba(0,0,0,0.2);
-        }
-        
-        .politician-name {
-            font-size: 1.8em;
-            font-weight: 600;
-            color: #2c3e50;
-            margin-bottom: 15px;
-        }
-        
-        .politician-info {
-            color: #7f8c8d;
-            margin-bottom: 20px;
-            line-height: 1.5;
-        }
-        
-        .politician-info p {
-            margin-bottom: 5px;
-        }
-        
-        .score-badge {
-            display: inline-block;
-            background: linear-gradient(135deg, #3498db, #2ecc71);
-            color: white;
-            padding: 12px 24px;
-            border-radius: 25px;
-            font-weight: 600;
-            margin-bottom: 20px;
-        }
-        
-        .connections-preview {
-            margin-top: 20px;
-        }
-        
-        .connections-preview h4 {
-            color: #2c3e50;
-            margin-bottom: 10px;
-            font-weight: 600;
-        }
-        
-        .connection-tags {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 8px;
-        }
-        
-        .connection-tag {
-            background: #ecf0f1;
-            padding: 6px 12px;
-            border-radius: 15px;
-            font-size: 0.9em;
-            color: #7f8c8d;
-            font-weight: 500;
-        }
-        
-        .view-button {
-            background: linear-gradient(135deg, #3498db, #2980b9);
-            color: white;
-            border: none;
-            padding: 15px 30px;
-            border-radius: 25px;
-            font-family: 'SF Pro Display', -apple-system, sans-serif;
-            font-size: 1em;
-            font-weight: 500;
-            cursor: pointer;
-            margin-top: 20px;
-            width: 100%;
-            transition: all 0.3s ease;
-        }
-        
-        .view-button:hover {
-            background: linear-gradient(135deg, #2980b9, #3498db);
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(52, 152, 219, 0.4);
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🌳 정치인 연결성 분석</h1>
-            <p>맥 패밀리트리 스타일의 직관적인 네트워크 시각화</p>
-        </div>
-        
-        <div class="politicians-grid">
-"""
-            
-            # 각 정치인 카드 추가
-            for politician_name, politician_data in self.politicians.items():
-                connection_types = list(set([conn["type"] for conn in politician_data["connections"]]))
-                
-                html_content += f"""
-            <div class="politician-card" onclick="location.href='pages/page_{politician_name}.html'">
-                <div class="politician-name">{politician_name}</div>
-                <div class="politician-info">
-                    <p><strong>정당:</strong> {politician_data['party']}</p>
-                    <p><strong>지역구:</strong> {politician_data['district']}</p>
-                    <p><strong>위원회:</strong> {politician_data['committee']}</p>
-                </div>
-                <div class="score-badge">
-                    연결성 점수: {politician_data['connectivity_score']}점
-                </div>
-                <div class="connections-preview">
-                    <h4>연결 유형:</h4>
-                    <div class="connection-tags">
-"""
-                
-                for conn_type in connection_types:
-                    html_content += f'                        <span class="connection-tag">{conn_type}</span>\n'
-                
-                html_content += f"""
-                    </div>
-                </div>
-                <button class="view-button" onclick="event.stopPropagation(); location.href='pages/page_{politician_name}.html'">
-                    패밀리트리 보기
-                </button>
-            </div>
-"""
-            
-            html_content += """
-        </div>
-    </div>
-</body>
-</html>
-"""
+            politician_cards = ''.join(
+                INDEX_ITEM_TEMPLATE.render(
+                    politician_data,
+                    name=politician_name,
+                    connection_tags=''.join(
+                        f'                        <span class="connection-tag">{conn_type}</span>\n'
+                        for conn_type in dict.fromkeys(conn["type"] for conn in politician_data["connections"])
+                    )
+                )
+                for politician_name, politician_data in self.politicians.items()
+            )
+            html_content = INDEX_TEMPLATE.render(
+                politician_cards=politician_cards,
+                **self.renderer.asset_tags("index.html", **self.index_assets)
+            )
             
-            # HTML 파일로 저장
+            # HTML 파일로 저장 (내용이 같으면 건너뜀)
             filepath = f"{self.output_dir}/index.html"
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            logger.info(f"인덱스 페이지 생성 완료: {filepath}")
+            if self.renderer.write("index.html", html_content):
+                logger.info(f"인덱스 페이지 생성 완료: {filepath}")
             return filepath
             
         except Exception as e:
@@ -923,13 +956,19 @@ class MacFamilyTreeVisualizer:
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="맥 패밀리트리 스타일 네트워크 시각화")
+    parser.add_argument("--changed-only", action="store_true",
+                        help="빌드 매니페스트와 입력이 달라진 산출물만 다시 생성")
+    parser.add_argument("--workers", type=int, default=None, help="병렬 프로세스 수 (1이면 순차)")
+    args = parser.parse_args()
+    
     try:
         # 맥 패밀리트리 시각화 생성기 초기화
         visualizer = MacFamilyTreeVisualizer()
         
         # 모든 정치인 위젯 생성
         logger.info("맥 패밀리트리 스타일 위젯 생성 시작...")
-        results = visualizer.create_all_widgets()
+        results = visualizer.create_all_widgets(args.workers, changed_only=args.changed_only)
         
         # 인덱스 페이지 생성
         logger.info("인덱스 페이지 생성 중...")
@@ -943,8 +982,8 @@ def main():
         
         for politician, result in results.items():
             print(f"  - {politician}:")
-            print(f"    * 패밀리트리 위젯: {result['widget']}")
-            print(f"    * 개인 페이지: {result['page']}")
+            print(f"    * 패밀리트리 위젯: {result.get('widget', '변경 없음')}")
+            print(f"    * 개인 페이지: {result.get('page', '변경 없음')}")
         
         print(f"\n🌐 웹에서 보기: {visualizer.output_dir}/index.html")
         
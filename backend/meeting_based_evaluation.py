@@ -12,12 +12,20 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import logging
 from collections import Counter
-import numpy as np
+
+from speech_search_index import SpeechSearchIndex
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 정책 관련 키워드
+POLICY_KEYWORDS = [
+    '정책', '법안', '예산', '제도', '개선', '발전', '지원', '투자',
+    '교육', '복지', '경제', '환경', '안전', '보건', '문화', '체육',
+    '농업', '산업', '교통', '통신', '에너지', '과학', '기술'
+]
+
 class MeetingBasedEvaluation:
     def __init__(self):
         self.meeting_db_path = "meeting_records_simple.db"
@@ -27,6 +35,7 @@ class MeetingBasedEvaluation:
         
         self.politicians_data = []
         self.evaluation_results = []
+        self.speech_index = None
         
         self.init_database()
         self.load_politicians_data()
@@ -145,44 +154,33 @@ class MeetingBasedEvaluation:
                 "committee_data": []
             }
     
+    def get_speech_index(self) -> SpeechSearchIndex:
+        """발언 전문 검색 색인 (처음 사용할 때 열고 새 발언만 색인)"""
+        if self.speech_index is None:
+            self.speech_index = SpeechSearchIndex(self.meeting_db_path, table='speakers')
+            self.speech_index.sync()
+        return self.speech_index
+    
     def analyze_speech_content(self, politician_name: str) -> Dict:
-        """발언 내용 분석"""
+        """발언 내용 분석 (발언 전문을 다시 읽지 않고 색인 조회로 계산)"""
         try:
-            conn = sqlite3.connect(self.meeting_db_path)
-            cursor = conn.cursor()
-            
-            # 발언 내용 가져오기
-            cursor.execute('''
-                SELECT speech_content FROM speakers
-                WHERE speaker_name = ? AND speech_content IS NOT NULL
-            ''', (politician_name,))
-            speeches = cursor.fetchall()
+            index = self.get_speech_index()
             
-            if not speeches:
-                conn.close()
+            # 평균 발언 길이
+            speaker_stats = index.speaker_stats(politician_name)
+            if not speaker_stats['total_speeches']:
                 return {
                     "avg_speech_length": 0,
                     "keyword_diversity": 0,
                     "policy_keywords": 0,
                     "content_quality_score": 0
                 }
+            avg_speech_length = speaker_stats['avg_speech_length']
             
-            # 평균 발언 길이
-            speech_lengths = [len(speech[0]) for speech in speeches if speech[0]]
-            avg_speech_length = np.mean(speech_lengths) if speech_lengths else 0
-            
-            # 키워드 분석
-            all_text = ' '.join([speech[0] for speech in speeches if speech[0]])
-            
-            # 정책 관련 키워드
-            policy_keywords = [
-                '정책', '법안', '예산', '제도', '개선', '발전', '지원', '투자',
-                '교육', '복지', '경제', '환경', '안전', '보건', '문화', '체육',
-                '농업', '산업', '교통', '통신', '에너지', '과학', '기술'
-            ]
-            
-            keyword_count = sum(1 for keyword in policy_keywords if keyword in all_text)
-            keyword_diversity = len(set([word for word in all_text.split() if len(word) > 2]))
+            # 키워드 분석: 등장한 정책 키워드 수 + 어휘 다양성
+            keyword_presence = index.keyword_presence(POLICY_KEYWORDS, speaker=politician_name)
+            keyword_count = sum(1 for present in keyword_presence.values() if present)
+            keyword_diversity = index.keyword_diversity(politician_name)
             
             # 내용 품질 점수
             content_quality_score = min(
@@ -192,8 +190,6 @@ class MeetingBasedEvaluation:
                 10
             )
             
-            conn.close()
-            
             return {
                 "avg_speech_length": avg_speech_length,
                 "keyword_diversity": keyword_diversity,
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+국회의원 인덱스 저장소
+로드/재로드 시 한 번만 정제·인덱싱·직렬화하고 요청 시에는 조회만 수행
+"""
+
+import json
+import time
+import hashlib
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple, Mapping
+
+# 목록 응답에 포함되는 필드 (simple_clean_api 목록 응답 형식과 동일)
+CLEAN_FIELDS = ('name', 'party', 'district', 'committee', 'photo_url')
+
+# 인덱스를 구성하는 필드
+INDEX_FIELDS = ('name', 'party', 'district', 'committee')
+
+
+def _encode(payload: Dict) -> bytes:
+    """응답 본문 JSON 인코딩"""
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _make_etag(body: bytes) -> str:
+    """본문 해시 기반 강한 ETag 생성"""
+    return '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+
+
+class EncodedBody:
+    """미리 인코딩된 응답 본문과 ETag"""
+
+    __slots__ = ('body', 'etag')
+
+    def __init__(self, payload: Dict):
+        self.body = _encode(payload)
+        self.etag = _make_etag(self.body)
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """If-None-Match 헤더가 현재 ETag와 일치하는지 확인"""
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == '*':
+            return True
+        candidates = [tag.strip() for tag in if_none_match.split(',')]
+        weak_etag = 'W/' + self.etag
+        return self.etag in candidates or weak_etag in candidates
+
+
+class MemberStore:
+    """불변 국회의원 스냅샷 (이름/정당/지역구/위원회 인덱스 + 사전 직렬화 본문)
+
+    재로드 시 새 스냅샷을 완전히 구성한 뒤 참조 하나만 교체하므로
+    요청 처리 중에는 항상 완성된 스냅샷 하나만 보인다.
+    """
+
+    def __init__(self, raw_members: List[Dict], source: str = "NewsBot Clean API",
+                 version: int = 0, source_file: Optional[str] = None,
+                 file_load_success: bool = False):
+        build_started = time.perf_counter()
+        raw_members = list(raw_members or [])
+        self.raw_count = len(raw_members)
+        self.source = source
+        self.version = version
+        self.source_file = source_file
+        self.file_load_success = file_load_success
+
+        clean_members: List[Dict] = []
+        raw_by_name: Dict[str, Dict] = {}
+        for member in raw_members:
+            clean_member = {field: str(member.get(field, '') or '').strip() for field in CLEAN_FIELDS}
+            # 이름이 있는 의원만 포함
+            if not clean_member['name']:
+                continue
+            clean_members.append(clean_member)
+            # 동명이인은 먼저 등장한 의원을 유지 (기존 선형 탐색과 동일한 결과)
+            raw_by_name.setdefault(clean_member['name'], member)
+
+        self.members: Tuple[Dict, ...] = tuple(clean_members)
+        self.first_raw = raw_members[0] if raw_members else None
+
+        # 필드별 인덱스: 값 -> 의원 튜플
+        indexes: Dict[str, Mapping[str, Tuple[Dict, ...]]] = {}
+        for field in INDEX_FIELDS:
+            grouped: Dict[str, List[Dict]] = {}
+            for clean_member in clean_members:
+                value = clean_member[field]
+                if value:
+                    grouped.setdefault(value, []).append(clean_member)
+            indexes[field] = MappingProxyType({key: tuple(group) for key, group in grouped.items()})
+        self.indexes: Mapping[str, Mapping[str, Tuple[Dict, ...]]] = MappingProxyType(indexes)
+
+        # 전체 목록 응답 본문
+        self.list_response = EncodedBody(self._list_payload(clean_members))
+
+        # 필드별 필터 응답 본문
+        filtered: Dict[str, Mapping[str, EncodedBody]] = {}
+        for field, index in indexes.items():
+            if field == 'name':
+                continue
+            filtered[field] = MappingProxyType({
+                key: EncodedBody(self._list_payload(list(group)))
+                for key, group in index.items()
+            })
+        self.filtered_responses: Mapping[str, Mapping[str, EncodedBody]] = MappingProxyType(filtered)
+        self.filtered_empty = EncodedBody(self._list_payload([]))
+
+        # 개별 의원 응답 본문 (원본 레코드 그대로 반환)
+        self.member_responses: Mapping[str, EncodedBody] = MappingProxyType({
+            name: EncodedBody({"success": True, "data": member})
+            for name, member in raw_by_name.items()
+        })
+
+        self.built_at = datetime.now().isoformat()
+        self.build_ms = round((time.perf_counter() - build_started) * 1000, 2)
+
+    def snapshot_info(self) -> Dict:
+        """스냅샷 버전 정보"""
+        return {
+            "version": self.version,
+            "built_at": self.built_at,
+            "source_file": self.source_file,
+            "file_load_success": self.file_load_success
+        }
+
+    def _list_payload(self, clean_members: List[Dict]) -> Dict:
+        """목록 응답 페이로드 구성"""
+        return {
+            "success": True,
+            "data": clean_members,
+            "total_count": len(clean_members),
+            "source": self.source,
+            "debug_info": {
+                "raw_count": self.raw_count,
+                "clean_count": len(clean_members),
+                "first_raw": self.first_raw,
+                "first_clean": clean_members[0] if clean_members else None
+            }
+        }
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def get(self, name: str) -> Optional[EncodedBody]:
+        """이름으로 개별 의원 응답 조회"""
+        return self.member_responses.get(name)
+
+    def find_by(self, field: str, value: str) -> Tuple[Dict, ...]:
+        """필드 값으로 의원 목록 조회"""
+        return self.indexes.get(field, {}).get(value, ())
+
+    def filtered(self, field: str, value: str) -> Optional[EncodedBody]:
+        """필드 값으로 필터링된 목록 응답 조회"""
+        return self.filtered_responses.get(field, {}).get(value)
+
+    def stats(self) -> Dict:
+        """인덱스 통계"""
+        return {
+            "version": self.version,
+            "built_at": self.built_at,
+            "build_ms": self.build_ms,
+            "source_file": self.source_file,
+            "raw_count": self.raw_count,
+            "clean_count": len(self.members),
+            "index_sizes": {field: len(index) for field, index in self.indexes.items()},
+            "list_bytes": len(self.list_response.body),
+            "etag": self.list_response.etag
+        }
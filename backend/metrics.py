@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+API 메트릭 수집 (Prometheus 텍스트 형식)
+- 라우트별 지연시간 히스토그램: HDR 방식 로그-선형 버킷 (고정 크기 배열, 기록 O(1), 상대 오차 약 1%)
+- 요청/오류 카운터, 캐시 적중률 (cache_engine 캐시 자동 수집 + 등록한 통계 함수)
+- 프로세스 RSS/CPU는 백그라운드 스레드에서 주기적으로 샘플링 → 조회가 블로킹되지 않음
+- ASGI 미들웨어: app.add_middleware(MetricsMiddleware, registry=metrics_registry)
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class LatencyHistogram:
+    """HDR 방식 지연시간 히스토그램 (마이크로초 단위)
+
+    2^sub_bucket_bits 미만 값은 그대로, 그 이상은 2의 거듭제곱 구간마다
+    2^(sub_bucket_bits-1)개 하위 버킷으로 나눈다. 버킷 수는 최대값에만 의존한다.
+    """
+
+    def __init__(self, max_seconds: float = 3600.0, sub_bucket_bits: int = 7):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.sub_bucket_count = 1 << sub_bucket_bits
+        self.half_count = self.sub_bucket_count >> 1
+        self.max_value = int(max_seconds * 1_000_000)
+        self.counts: List[int] = [0] * (self._index(self.max_value) + 1)
+        self.count = 0
+        self.total = 0  # 마이크로초 합
+        self.min_value = 0
+        self.max_seen = 0
+        self._lock = threading.Lock()
+
+    def _index(self, value: int) -> int:
+        if value < self.sub_bucket_count:
+            return value
+        shift = value.bit_length() - self.sub_bucket_bits
+        return self.sub_bucket_count + (shift - 1) * self.half_count + ((value >> shift) - self.half_count)
+
+    def _bucket_value(self, index: int) -> int:
+        """버킷의 대표값 (구간 중간값)"""
+        if index < self.sub_bucket_count:
+            return index
+        shift = (index - self.sub_bucket_count) // self.half_count + 1
+        mantissa = (index - self.sub_bucket_count) % self.half_count + self.half_count
+        return (mantissa << shift) + ((1 << shift) >> 1)
+
+    def record(self, seconds: float):
+        value = min(max(int(seconds * 1_000_000), 0), self.max_value)
+        index = self._index(value)
+        with self._lock:
+            self.counts[index] += 1
+            if self.count == 0 or value < self.min_value:
+                self.min_value = value
+            if value > self.max_seen:
+                self.max_seen = value
+            self.count += 1
+            self.total += value
+
+    def percentiles(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Dict[float, float]:
+        """분위수별 지연시간(초) - 버킷 배열을 한 번만 순회"""
+        quantiles = sorted(quantiles)
+        with self._lock:
+            counts = list(self.counts)
+            total_count = self.count
+            max_seen = self.max_seen
+        result = {quantile: 0.0 for quantile in quantiles}
+        if not total_count:
+            return result
+
+        targets = [(quantile, max(1, int(quantile * total_count + 0.5))) for quantile in quantiles]
+        position = 0
+        cumulative = 0
+        for index, bucket_count in enumerate(counts):
+            if not bucket_count:
+                continue
+            cumulative += bucket_count
+            while position < len(targets) and cumulative >= targets[position][1]:
+                value = min(self._bucket_value(index), max_seen)
+                result[targets[position][0]] = value / 1_000_000
+                position += 1
+            if position == len(targets):
+                break
+        return result
+
+    def summary(self) -> Dict[str, float]:
+        p = self.percentiles()
+        with self._lock:
+            count, total, min_value, max_value = self.count, self.total, self.min_value, self.max_seen
+        return {
+            'count': count,
+            'sum_seconds': total / 1_000_000,
+            'avg_seconds': (total / count / 1_000_000) if count else 0.0,
+            'min_seconds': min_value / 1_000_000,
+            'max_seconds': max_value / 1_000_000,
+            'p50_seconds': p[0.5],
+            'p95_seconds': p[0.95],
+            'p99_seconds': p[0.99]
+        }
+
+    def merge(self, other: 'LatencyHistogram'):
+        """같은 설정의 히스토그램을 더함"""
+        with other._lock:
+            counts = list(other.counts)
+            count, total, min_value, max_value = other.count, other.total, other.min_value, other.max_seen
+        if not count:
+            return
+        with self._lock:
+            for index, bucket_count in enumerate(counts):
+                if bucket_count:
+                    self.counts[index] += bucket_count
+            if self.count == 0 or min_value < self.min_value:
+                self.min_value = min_value
+            self.max_seen = max(self.max_seen, max_value)
+            self.count += count
+            self.total += total
+
+
+class WindowedLatencyHistogram:
+    """최근 window_seconds 동안의 지연시간 히스토그램
+
+    window_seconds를 slots개 구간으로 나눠 구간마다 히스토그램을 두고,
+    오래된 구간은 다시 쓸 때 비운다. 조회 시 살아 있는 구간만 합친다.
+    """
+
+    def __init__(self, window_seconds: float = 300.0, slots: int = 10, max_seconds: float = 3600.0):
+        self.window_seconds = window_seconds
+        self.slot_seconds = window_seconds / slots
+        self.max_seconds = max_seconds
+        self.slots = [LatencyHistogram(max_seconds) for _ in range(slots)]
+        self.slot_ids: List[Optional[int]] = [None] * slots
+        self._lock = threading.Lock()
+
+    def _slot(self, now: float) -> LatencyHistogram:
+        slot_id = int(now // self.slot_seconds)
+        index = slot_id % len(self.slots)
+        with self._lock:
+            if self.slot_ids[index] != slot_id:
+                self.slots[index] = LatencyHistogram(self.max_seconds)
+                self.slot_ids[index] = slot_id
+            return self.slots[index]
+
+    def record(self, seconds: float, now: Optional[float] = None):
+        self._slot(time.time() if now is None else now).record(seconds)
+
+    def snapshot(self, now: Optional[float] = None) -> LatencyHistogram:
+        """창 안의 구간을 합친 히스토그램"""
+        oldest = int((time.time() if now is None else now) // self.slot_seconds) - len(self.slots) + 1
+        merged = LatencyHistogram(self.max_seconds)
+        with self._lock:
+            live = [slot for slot, slot_id in zip(self.slots, self.slot_ids)
+                    if slot_id is not None and slot_id >= oldest]
+        for slot in live:
+            merged.merge(slot)
+        return merged
+
+    def summary(self, now: Optional[float] = None) -> Dict[str, float]:
+        return self.snapshot(now).summary()
+
+
+class RouteMetrics:
+    """라우트 하나의 지연시간/상태 코드 카운터"""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.status_counts: Dict[int, int] = {}
+        self.exceptions = 0
+        self.exceptions_after_response = 0  # 응답 시작 후 예외 (상태 코드만으로는 오류로 안 잡힘)
+        self._lock = threading.Lock()
+
+    def observe(self, status_code: int, seconds: float, exception: bool = False):
+        """요청 하나 기록 (예외로 끝난 요청도 요청 수/지연시간에 포함)"""
+        self.latency.record(seconds)
+        with self._lock:
+            self.status_counts[status_code] = self.status_counts.get(status_code, 0) + 1
+            if exception:
+                self.exceptions += 1
+                if status_code < 500:
+                    self.exceptions_after_response += 1
+
+    @property
+    def requests(self) -> int:
+        return sum(self.status_counts.values())
+
+    @property
+    def errors(self) -> int:
+        return (sum(count for status, count in self.status_counts.items() if status >= 500)
+                + self.exceptions_after_response)
+
+
+def read_rss_bytes() -> int:
+    """현재 프로세스 RSS (psutil 없으면 /proc/self/statm)"""
+    if PSUTIL_AVAILABLE:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+class ProcessSampler:
+    """RSS/CPU 백그라운드 샘플러 (데몬 스레드, 조회는 마지막 샘플 반환)"""
+
+    def __init__(self, interval: float = 10.0):
+        self.interval = interval
+        self.rss_bytes = 0
+        self.peak_rss_bytes = 0
+        self.cpu_percent = 0.0
+        self.sampled_at = 0.0
+        self._process = psutil.Process() if PSUTIL_AVAILABLE else None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def sample(self):
+        self.rss_bytes = read_rss_bytes()
+        self.peak_rss_bytes = max(self.peak_rss_bytes, self.rss_bytes)
+        if self._process is not None:
+            # interval=None: 직전 호출 이후 사용률 (블로킹 없음)
+            self.cpu_percent = self._process.cpu_percent(interval=None)
+        self.sampled_at = time.time()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                logger.warning(f"⚠️ 프로세스 샘플링 실패: {e}")
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self.sample()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='metrics-process-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+
+class MetricsRegistry:
+    """라우트별 메트릭 + 캐시 적중률 + 프로세스 샘플 집계"""
+
+    def __init__(self, namespace: str = 'newsbot', sample_interval: float = 10.0):
+        self.namespace = namespace
+        self.start_time = time.time()
+        self.routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self.cache_sources: Dict[str, Callable[[], Dict]] = {}
+        self.process = ProcessSampler(sample_interval)
+        self._lock = threading.Lock()
+
+    def route(self, method: str, route: str) -> RouteMetrics:
+        key = (method, route)
+        metrics = self.routes.get(key)
+        if metrics is None:
+            with self._lock:
+                metrics = self.routes.setdefault(key, RouteMetrics())
+        return metrics
+
+    def observe(self, method: str, route: str, status_code: int, seconds: float, exception: bool = False):
+        self.route(method, route).observe(status_code, seconds, exception)
+
+    def observe_exception(self, method: str, route: str, seconds: float, status_code: int = 500):
+        """처리 중 예외 (응답 전이면 500으로 집계)"""
+        self.observe(method, route, status_code, seconds, exception=True)
+
+    # ------------------------------------------------------------------
+    # 캐시 적중률
+    # ------------------------------------------------------------------
+    def register_cache(self, name: str, stats_fn: Callable[[], Dict]):
+        """hits/misses 키를 가진 dict를 반환하는 통계 함수 등록"""
+        self.cache_sources[name] = stats_fn
+
+    def cache_stats(self) -> Dict[str, Dict]:
+        caches: Dict[str, Dict] = {}
+        try:
+            from cache_engine import live_caches
+            sources = [(cache.name, cache.stats) for cache in live_caches()]
+        except ImportError:
+            sources = []
+        sources.extend(self.cache_sources.items())
+
+        for name, stats_fn in sources:
+            try:
+                stats = stats_fn()
+            except Exception as e:
+                logger.warning(f"⚠️ 캐시 통계 조회 실패 ({name}): {e}")
+                continue
+            hits = stats.get('hits', 0)
+            misses = stats.get('misses', 0)
+            entry = caches.setdefault(name, {'hits': 0, 'misses': 0})
+            entry['hits'] += hits
+            entry['misses'] += misses
+        for entry in caches.values():
+            lookups = entry['hits'] + entry['misses']
+            entry['hit_ratio'] = entry['hits'] / lookups if lookups else 0.0
+        return caches
+
+    # ------------------------------------------------------------------
+    # 출력
+    # ------------------------------------------------------------------
+    def snapshot(self) -> Dict:
+        """JSON용 요약 (라우트별 p50/p95/p99 포함)"""
+        routes = []
+        for (method, route), metrics in sorted(self.routes.items(), key=lambda item: item[0][1]):
+            routes.append({
+                'method': method,
+                'route': route,
+                'requests': metrics.requests,
+                'errors': metrics.errors,
+                'status_counts': dict(metrics.status_counts),
+                **metrics.latency.summary()
+            })
+        return {
+            'uptime_seconds': time.time() - self.start_time,
+            'routes': routes,
+            'caches': self.cache_stats(),
+            'process': {
+                'rss_bytes': self.process.rss_bytes,
+                'peak_rss_bytes': self.process.peak_rss_bytes,
+                'cpu_percent': self.process.cpu_percent,
+                'sampled_at': self.process.sampled_at
+            }
+        }
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        ns = self.namespace
+        lines = [
+            f'# HELP {ns}_http_requests_total HTTP 요청 수',
+            f'# TYPE {ns}_http_requests_total counter',
+        ]
+        routes = sorted(self.routes.items(), key=lambda item: (item[0][1], item[0][0]))
+        for (method, route), metrics in routes:
+            for status, count in sorted(metrics.status_counts.items()):
+                lines.append(f'{ns}_http_requests_total{{method="{method}",route="{_escape(route)}",'
+                             f'status="{status}"}} {count}')
+
+        lines += [f'# HELP {ns}_http_errors_total 5xx 응답(응답 전 예외는 500) + 응답 시작 후 예외 수',
+                  f'# TYPE {ns}_http_errors_total counter']
+        for (method, route), metrics in routes:
+            lines.append(f'{ns}_http_errors_total{{method="{method}",route="{_escape(route)}"}} {metrics.errors}')
+
+        lines += [f'# HELP {ns}_http_request_duration_seconds 요청 처리 시간',
+                  f'# TYPE {ns}_http_request_duration_seconds summary']
+        for (method, route), metrics in routes:
+            labels = f'method="{method}",route="{_escape(route)}"'
+            for quantile, value in metrics.latency.percentiles().items():
+                lines.append(f'{ns}_http_request_duration_seconds{{{labels},quantile="{quantile}"}} {value:.6f}')
+            summary = metrics.latency.summary()
+            lines.append(f'{ns}_http_request_duration_seconds_sum{{{labels}}} {summary["sum_seconds"]:.6f}')
+            lines.append(f'{ns}_http_request_duration_seconds_count{{{labels}}} {summary["count"]}')
+
+        caches = self.cache_stats()
+        if caches:
+            lines += [f'# HELP {ns}_cache_hits_total 캐시 적중 수', f'# TYPE {ns}_cache_hits_total counter']
+            lines += [f'{ns}_cache_hits_total{{cache="{_escape(name)}"}} {stats["hits"]}'
+                      for name, stats in sorted(caches.items())]
+            lines += [f'# HELP {ns}_cache_misses_total 캐시 미스 수', f'# TYPE {ns}_cache_misses_total counter']
+            lines += [f'{ns}_cache_misses_total{{cache="{_escape(name)}"}} {stats["misses"]}'
+                      for name, stats in sorted(caches.items())]
+            lines += [f'# HELP {ns}_cache_hit_ratio 캐시 적중률', f'# TYPE {ns}_cache_hit_ratio gauge']
+            lines += [f'{ns}_cache_hit_ratio{{cache="{_escape(name)}"}} {stats["hit_ratio"]:.4f}'
+                      for name, stats in sorted(caches.items())]
+
+        lines += [
+            f'# HELP {ns}_process_resident_memory_bytes 프로세스 RSS (백그라운드 샘플)',
+            f'# TYPE {ns}_process_resident_memory_bytes gauge',
+            f'{ns}_process_resident_memory_bytes {self.process.rss_bytes}',
+            f'# HELP {ns}_process_cpu_percent 프로세스 CPU 사용률 (백그라운드 샘플)',
+            f'# TYPE {ns}_process_cpu_percent gauge',
+            f'{ns}_process_cpu_percent {self.process.cpu_percent}',
+            f'# HELP {ns}_uptime_seconds 가동 시간',
+            f'# TYPE {ns}_uptime_seconds gauge',
+            f'{ns}_uptime_seconds {time.time() - self.start_time:.0f}',
+        ]
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def route_template(scope: Dict) -> str:
+    """라우팅 후 scope에서 라우트 템플릿 추출 (경로 파라미터 값으로 레이블이 늘어나지 않도록)"""
+    route = scope.get('route')
+    path = getattr(route, 'path', None)
+    if path:
+        return path
+    if scope.get('endpoint') is None:
+        return UNMATCHED_ROUTE
+    path = scope.get('path', '')
+    for name, value in (scope.get('path_params') or {}).items():
+        path = path.replace(str(value), '{' + name + '}')
+    return path
+
+
+class MetricsMiddleware:
+    """ASGI 미들웨어: 라우트별 지연시간/상태 코드 기록"""
+
+    def __init__(self, app, registry: Optional['MetricsRegistry'] = None, exempt_paths: Iterable[str] = ()):
+        self.app = app
+        self.registry = registry or metrics_registry
+        self.exempt_paths = frozenset(exempt_paths)
+        self.registry.process.start()
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope.get('path') in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        failed = False
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            # 예외로 끝난 요청도 requests_total/지연시간/오류에 같은 경로로 집계
+            self.registry.observe(scope.get('method', ''), route_template(scope), status_code,
+                                  time.perf_counter() - start, exception=failed)
+
+
+# 전역 메트릭 레지스트리
+metrics_registry = MetricsRegistry()
@@ -11,6 +11,8 @@ from typing import Dict, List
 from collections import defaultdict, deque
 import threading
 
+from metrics import WindowedLatencyHistogram, metrics_registry
+
 class SystemMonitor:
     """시스템 모니터링 클래스"""
     
@@ -18,9 +20,14 @@ class SystemMonitor:
         self.start_time = time.time()
         self.request_count = 0
         self.error_count = 0
-        self.response_times = deque(maxlen=1000)
+        # 최근 5분 응답 시간 분포 (샘플을 보관하지 않는 구간별 고정 크기 히스토그램)
+        # 알림/평균이 프로세스 전체 기간이 아니라 최근 상태를 반영하도록 창을 둔다
+        self.response_times = WindowedLatencyHistogram(window_seconds=300)
         self.error_log = deque(maxlen=100)
         
+        # cpu_percent(interval=None)는 직전 호출 이후 사용률을 반환 → 첫 호출로 기준점 설정
+        psutil.cpu_percent(interval=None)
+        
         # 로깅 설정
         logging.basicConfig(
             level=logging.INFO,
@@ -32,10 +39,12 @@ class SystemMonitor:
         )
         self.logger = logging.getLogger('newsbot_monitor')
     
-    def record_request(self, response_time: float, status_code: int):
-        """요청 기록"""
+    def record_request(self, response_time: float, status_code: int, path: str = None, method: str = 'GET'):
+        """요청 기록 (path를 주면 라우트별 메트릭에도 기록)"""
         self.request_count += 1
-        self.response_times.append(response_time)
+        self.response_times.record(response_time)
+        if path is not None:
+            metrics_registry.observe(method, path, status_code, response_time)
         
         if status_code >= 400:
             self.error_count += 1
@@ -50,8 +59,8 @@ class SystemMonitor:
         current_time = time.time()
         uptime = current_time - self.start_time
         
-        # CPU 사용률
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # CPU 사용률 (직전 조회 이후 평균, 블로킹 없음)
+        cpu_percent = psutil.cpu_percent(interval=None)
         
         # 메모리 사용률
         memory = psutil.virtual_memory()
@@ -61,13 +70,8 @@ class SystemMonitor:
         disk = psutil.disk_usage('/')
         disk_percent = disk.percent
         
-        # 응답 시간 통계
-        if self.response_times:
-            avg_response_time = sum(self.response_times) / len(self.response_times)
-            max_response_time = max(self.response_times)
-            min_response_time = min(self.response_times)
-        else:
-            avg_response_time = max_response_time = min_response_time = 0
+        # 응답 시간 통계 (최근 창 기준)
+        latency = self.response_times.summary()
         
         # 오류율 계산
         error_rate = (self.error_count / self.request_count) if self.request_count > 0 else 0
@@ -81,9 +85,13 @@ class SystemMonitor:
             "total_requests": self.request_count,
             "error_count": self.error_count,
             "error_rate": error_rate,
-            "avg_response_time": avg_response_time,
-            "max_response_time": max_response_time,
-            "min_response_time": min_response_time,
+            "avg_response_time": latency["avg_seconds"],
+            "max_response_time": latency["max_seconds"],
+            "min_response_time": latency["min_seconds"],
+            "p50_response_time": latency["p50_seconds"],
+            "p95_response_time": latency["p95_seconds"],
+            "p99_response_time": latency["p99_seconds"],
+            "response_time_window_seconds": self.response_times.window_seconds,
             "timestamp": datetime.now().isoformat()
         }
     
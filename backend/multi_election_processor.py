@@ -6,15 +6,16 @@
 """
 
 import xml.etree.ElementTree as ET
-import requests
 import json
-import time
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 import logging
 from datetime import datetime
 import os
 
+from lod_fetch_engine import CrawlCheckpoint, LODFetchEngine
+from lod_stream_parser import parse_election_file
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -38,69 +39,34 @@ class MultiElectionProcessor:
         }
         self.elections = []
         self.all_candidates = []
+        self.fetch_engine = LODFetchEngine()
         
     def analyze_election_file(self, file_path: str) -> Dict:
         """선거 파일을 분석하여 기본 정보를 추출합니다."""
         logger.info(f"선거 파일 분석 시작: {file_path}")
         
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            # 선거 정보 추출
-            election_element = root.find('.//no:Election', self.namespaces)
+            # 한 번의 스트리밍 순회로 선거 정보와 후보자/선거구 URI 추출
+            parsed = parse_election_file(file_path)
             
-            if election_element is None:
+            if not parsed['has_election']:
                 logger.warning("선거 정보를 찾을 수 없습니다")
                 return {}
             
-            info = {}
-            
-            # 선거 ID
-            election_id_elem = election_element.find('.//no:electionId', self.namespaces)
-            if election_id_elem is not None:
-                info['election_id'] = election_id_elem.text
-            
-            # 선거명
-            name_elem = election_element.find('.//no:name', self.namespaces)
-            if name_elem is not None:
-                info['name'] = name_elem.text
-            
-            # 선거일
-            election_day_elem = election_element.find('.//no:electionDay', self.namespaces)
-            if election_day_elem is not None:
-                info['election_day'] = election_day_elem.text
+            info = {
+                key: parsed['election_info'][key]
+                for key in ('election_id', 'name', 'election_day') if key in parsed['election_info']
+            }
             
             # 선거 타입
-            election_type_elem = election_element.find('.//no:hasElectionType', self.namespaces)
-            if election_type_elem is not None:
-                type_resource = election_type_elem.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource')
-                if type_resource:
-                    info['election_type'] = type_resource.split('_')[-1]
+            if parsed['election_type_uris']:
+                info['election_type'] = parsed['election_type_uris'][0].split('_')[-1]
             
-            # 후보자 URI들 추출
-            candidate_elements = root.findall('.//no:hasCandidate', self.namespaces)
-            candidate_uris = []
+            info['candidate_uris'] = parsed['candidate_uris']
+            info['candidate_count'] = len(parsed['candidate_uris'])
             
-            for element in candidate_elements:
-                resource = element.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource')
-                if resource:
-                    candidate_uris.append(resource)
-            
-            info['candidate_uris'] = candidate_uris
-            info['candidate_count'] = len(candidate_uris)
-            
-            # 선거구 URI들 추출
-            district_elements = root.findall('.//no:hasElectionDistrict', self.namespaces)
-            district_uris = []
-            
-            for element in district_elements:
-                resource = element.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource')
-                if resource:
-                    district_uris.append(resource)
-            
-            info['district_uris'] = district_uris
-            info['district_count'] = len(district_uris)
+            info['district_uris'] = parsed['district_uris']
+            info['district_count'] = len(parsed['district_uris'])
             
             logger.info(f"선거 분석 완료: {info.get('name', 'Unknown')} - 후보자 {info['candidate_count']}명")
             return info
@@ -110,45 +76,22 @@ class MultiElectionProcessor:
             return {}
     
     def fetch_candidate_details(self, candidate_uris: List[str], election_info: Dict, max_requests: int = None) -> List[Dict]:
-        """후보자 상세 정보를 가져옵니다."""
+        """후보자 상세 정보를 가져옵니다. (병렬 수집, 선거별 체크포인트로 이어받기)"""
         if max_requests is None:
             max_requests = len(candidate_uris)
         
-        logger.info(f"후보자 상세 정보 수집 시작: {min(max_requests, len(candidate_uris))}명")
-        
-        candidates = []
-        failed_requests = []
+        target_uris = candidate_uris[:max_requests]
+        logger.info(f"후보자 상세 정보 수집 시작: {len(target_uris)}명")
         
-        for i, uri in enumerate(candidate_uris[:max_requests]):
-            try:
-                logger.info(f"처리 중: {i+1}/{min(max_requests, len(candidate_uris))} - {uri}")
-                
-                # RDF 형식으로 요청
-                rdf_url = uri.replace('/resource/', '/data/') + "?output=rdfxml"
-                
-                response = requests.get(rdf_url, timeout=30)
-                
-                if response.status_code == 200:
-                    candidate_data = self._parse_candidate_rdf(response.content, uri, election_info)
-                    if candidate_data:
-                        candidates.append(candidate_data)
-                        logger.info(f"✅ 성공: {candidate_data.get('name', 'Unknown')}")
-                    else:
-                        logger.warning(f"❌ 데이터 파싱 실패: {uri}")
-                        failed_requests.append(uri)
-                else:
-                    logger.warning(f"❌ HTTP 오류 {response.status_code}: {uri}")
-                    failed_requests.append(uri)
-                
-                # 요청 간격 조절 (서버 부하 방지)
-                time.sleep(0.5)
-                
-            except Exception as e:
-                logger.error(f"❌ 요청 실패 {uri}: {str(e)}")
-                failed_requests.append(uri)
-                continue
+        checkpoint_name = election_info.get('election_id') or election_info.get('name') or 'election'
+        candidates, failed_requests = self.fetch_engine.crawl(
+            target_uris,
+            lambda uri, content: self._parse_candidate_rdf(content, uri, election_info),
+            CrawlCheckpoint(checkpoint_name)
+        )
         
         logger.info(f"상세 정보 수집 완료 - 성공: {len(candidates)}명, 실패: {len(failed_requests)}명")
+        logger.info(f"수집 통계: {self.fetch_engine.get_stats()}")
         
         return {
             'candidates': candidates,
@@ -280,54 +223,16 @@ class MultiElectionProcessor:
             return None
     
     def _fetch_party_name(self, party_resource: str) -> Optional[str]:
-        """정당 리소스에서 정당명을 가져옵니다."""
-        try:
-            party_rdf_url = party_resource.replace('/resource/', '/data/') + "?output=rdfxml"
-            response = requests.get(party_rdf_url, timeout=10)
-            
-            if response.status_code == 200:
-                root = ET.fromstring(response.content)
-                
-                name_patterns = [
-                    './/no:name',
-                    './/rdfs:label', 
-                    './/foaf:name'
-                ]
-                
-                for pattern in name_patterns:
-                    name_elem = root.find(pattern, self.namespaces)
-                    if name_elem is not None and name_elem.text:
-                        return name_elem.text.strip()
-                        
-        except Exception as e:
-            logger.warning(f"정당명 조회 실패 {party_resource}: {str(e)}")
-        
-        return None
+        """정당 리소스에서 정당명을 가져옵니다. (리소스당 1회 조회, 캐시 공유)"""
+        return self.fetch_engine.resolve_label(
+            party_resource, ['.//no:name', './/rdfs:label', './/foaf:name'], self.namespaces
+        )
     
     def _fetch_district_name(self, district_resource: str) -> Optional[str]:
-        """선거구 리소스에서 선거구명을 가져옵니다."""
-        try:
-            district_rdf_url = district_resource.replace('/resource/', '/data/') + "?output=rdfxml"
-            response = requests.get(district_rdf_url, timeout=10)
-            
-            if response.status_code == 200:
-                root = ET.fromstring(response.content)
-                
-                name_patterns = [
-                    './/no:name',
-                    './/rdfs:label',
-                    './/no:districtName'
-                ]
-                
-                for pattern in name_patterns:
-                    name_elem = root.find(pattern, self.namespaces)
-                    if name_elem is not None and name_elem.text:
-                        return name_elem.text.strip()
-                        
-        except Exception as e:
-            logger.warning(f"선거구명 조회 실패 {district_resource}: {str(e)}")
-        
-        return None
+        """선거구 리소스에서 선거구명을 가져옵니다. (리소스당 1회 조회, 캐시 공유)"""
+        return self.fetch_engine.resolve_label(
+            district_resource, ['.//no:name', './/rdfs:label', './/no:districtName'], self.namespaces
+        )
     
     def process_election(self, file_path: str, max_candidates: int = None) -> Dict:
         """단일 선거 데이터를 처리합니다."""
@@ -16,11 +16,14 @@ import os
 import glob
 import re
 
+from address_resolver import get_address_resolver
+
 logger = logging.getLogger(__name__)
 
 class NationalIndustrialComplexTemporalAnalyzer:
     def __init__(self):
         self.downloads_dir = "/Users/hopidaay/Downloads"
+        self.address_resolver = get_address_resolver()
         
         # 산업단지 정치적 특성 분석
         self.industrial_politics_characteristics = {
@@ -271,12 +274,9 @@ class NationalIndustrialComplexTemporalAnalyzer:
                                 break
                         
                         if address_col:
-                            regional_count = {}
-                            for _, row in df.iterrows():
-                                address = str(row[address_col]) if pd.notna(row[address_col]) else ""
-                                region = self._extract_region_from_address(address)
-                                if region:
-                                    regional_count[region] = regional_count.get(region, 0) + 1
+                            # 주소 컬럼 전체를 한 번에 해석한 뒤 시도 약칭별 집계
+                            regions = self.address_resolver.resolve_series(df[address_col])['sido_short']
+                            regional_count = regions.dropna().value_counts().to_dict()
                             
                             year_analysis['regional_distribution'] = regional_count
                             print(f"    🗺️ 지역 분포: {len(regional_count)}개 지역")
@@ -286,37 +286,10 @@ class NationalIndustrialComplexTemporalAnalyzer:
         return concentration_analysis
 
     def _extract_region_from_address(self, address: str) -> Optional[str]:
-        """주소에서 시도 추출"""
+        """주소에서 시도 추출 (약칭: '서울', '경기' ...)"""
         if not isinstance(address, str):
             return None
-        
-        # 시도 패턴 매칭
-        sido_patterns = {
-            '서울': ['서울특별시', '서울시', '서울'],
-            '부산': ['부산광역시', '부산시', '부산'],
-            '대구': ['대구광역시', '대구시', '대구'],
-            '인천': ['인천광역시', '인천시', '인천'],
-            '광주': ['광주광역시', '광주시', '광주'],
-            '대전': ['대전광역시', '대전시', '대전'],
-            '울산': ['울산광역시', '울산시', '울산'],
-            '세종': ['세종특별자치시', '세종시', '세종'],
-            '경기': ['경기도'],
-            '강원': ['강원특별자치도', '강원도'],
-            '충북': ['충청북도', '충북'],
-            '충남': ['충청남도', '충남'],
-            '전북': ['전라북도', '전북', '전북특별자치도'],
-            '전남': ['전라남도', '전남'],
-            '경북': ['경상북도', '경북'],
-            '경남': ['경상남도', '경남'],
-            '제주': ['제주특별자치도', '제주도', '제주']
-        }
-        
-        for sido, patterns in sido_patterns.items():
-            for pattern in patterns:
-                if pattern in address:
-                    return sido
-        
-        return None
+        return self.address_resolver.resolve(address).sido_short
 
     def analyze_population_composition_changes(self, industrial_analysis: Dict) -> Dict:
         """인구성분변화 분석"""
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+네이버 API 비동기 수집 엔진
+뉴스 검색 / 데이터랩 호출을 하나의 keep-alive 연결 풀과 호출 예산으로 처리
+- 동시 요청 수 제한 (세마포어 + 커넥터 풀 크기)
+- 토큰 버킷 초당 호출 제한
+- 엔드포인트별 일일 한도 (뉴스 25,000 / 데이터랩 1,000, 파일로 프로세스 간 공유)
+- 429/5xx/연결 오류 지수 백오프 + 지터 재시도
+- base_url 교체로 로컬 스텁 서버 대상 테스트 가능 (NAVER_API_BASE_URL)
+"""
+
+import os
+import json
+import time
+import random
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Dict, Iterable, List, Optional
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://openapi.naver.com"
+NEWS_PATH = "/v1/search/news.json"
+DATALAB_PATH = "/v1/datalab/search"
+
+DEFAULT_QUOTA_FILE = os.path.join(os.path.dirname(__file__), 'data', 'naver_quota.json')
+DEFAULT_DAILY_LIMITS = {'news': 25000, 'datalab': 1000}
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# 네이버 API 일일 한도는 한국 시간 자정에 초기화
+KST = timezone(timedelta(hours=9))
+
+
+class TokenBucket:
+    """비동기 토큰 버킷 (초당 rate개, 최대 capacity개 누적)"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self, tokens: float = 1.0):
+        """토큰이 생길 때까지 대기 후 차감"""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+
+
+class DailyQuotaBudget:
+    """엔드포인트별 일일 호출 예산
+
+    뉴스/데이터랩을 호출하는 모든 서비스가 같은 인스턴스(naver_quota)를 쓰고,
+    사용량은 파일에 주기적으로 기록되어 프로세스를 다시 띄워도 이어서 계산된다.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None, state_file: Optional[str] = DEFAULT_QUOTA_FILE,
+                 safety_ratio: float = 0.95, save_every: int = 50):
+        self.limits = dict(limits or DEFAULT_DAILY_LIMITS)
+        self.state_file = os.environ.get('NAVER_QUOTA_FILE', state_file) if state_file else None
+        self.safety_ratio = safety_ratio  # 한도의 일부는 수동 호출용으로 남김
+        self.save_every = save_every
+        self.day = self._today()
+        self.used: Dict[str, int] = {endpoint: 0 for endpoint in self.limits}
+        self.rejected: Dict[str, int] = {endpoint: 0 for endpoint in self.limits}
+        self._unsaved = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(KST).strftime('%Y-%m-%d')
+
+    def _roll_over(self):
+        today = self._today()
+        if today != self.day:
+            self.day = today
+            self.used = {endpoint: 0 for endpoint in self.limits}
+            self.rejected = {endpoint: 0 for endpoint in self.limits}
+
+    def _load(self):
+        if not self.state_file or not os.path.exists(self.state_file):
+            return
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('day') == self.day:
+                for endpoint, count in state.get('used', {}).items():
+                    if endpoint in self.used:
+                        self.used[endpoint] = int(count)
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ 네이버 호출량 파일 로드 실패: {e}")
+
+    def save(self):
+        """사용량 기록 (임시 파일 후 교체)"""
+        if not self.state_file:
+            return
+        with self._lock:
+            state = {'day': self.day, 'used': dict(self.used), 'limits': self.limits}
+            self._unsaved = 0
+        try:
+            os.makedirs(os.path.dirname(self.state_file) or '.', exist_ok=True)
+            temp_path = f"{self.state_file}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(temp_path, self.state_file)
+        except OSError as e:
+            logger.warning(f"⚠️ 네이버 호출량 파일 저장 실패: {e}")
+
+    def effective_limit(self, endpoint: str) -> int:
+        return int(self.limits.get(endpoint, 0) * self.safety_ratio)
+
+    def try_consume(self, endpoint: str, count: int = 1) -> bool:
+        """예산이 남아 있으면 차감 후 True"""
+        with self._lock:
+            self._roll_over()
+            if self.used.get(endpoint, 0) + count > self.effective_limit(endpoint):
+                self.rejected[endpoint] = self.rejected.get(endpoint, 0) + 1
+                return False
+            self.used[endpoint] = self.used.get(endpoint, 0) + count
+            self._unsaved += count
+            should_save = self._unsaved >= self.save_every
+        if should_save:
+            self.save()
+        return True
+
+    def remaining(self, endpoint: str) -> int:
+        with self._lock:
+            self._roll_over()
+            return max(0, self.effective_limit(endpoint) - self.used.get(endpoint, 0))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._roll_over()
+            return {
+                'day': self.day,
+                'endpoints': {
+                    endpoint: {
+                        'used': self.used.get(endpoint, 0),
+                        'limit': limit,
+                        'effective_limit': self.effective_limit(endpoint),
+                        'rejected': self.rejected.get(endpoint, 0)
+                    }
+                    for endpoint, limit in self.limits.items()
+                }
+            }
+
+
+# 전역 호출 예산 (모든 네이버 서비스 공유)
+naver_quota = DailyQuotaBudget()
+
+
+def run_sync(coro: Awaitable) -> Any:
+    """동기 코드에서 코루틴 실행 (이미 이벤트 루프 안이면 별도 스레드에서 실행)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+class NaverAsyncCollector:
+    """네이버 뉴스/데이터랩 비동기 클라이언트
+
+    사용 예:
+        async with NaverAsyncCollector(client_id, client_secret) as collector:
+            results = await collector.search_news_many(['이재명 의원', '한동훈 국회'])
+    """
+
+    def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None,
+                 base_url: Optional[str] = None, concurrency: int = 8,
+                 rate_per_second: Optional[float] = None, max_retries: int = 3,
+                 timeout: float = 10.0, backoff_base: float = 0.5, backoff_cap: float = 8.0,
+                 quota: Optional[DailyQuotaBudget] = None):
+        if not AIOHTTP_AVAILABLE:
+            raise RuntimeError("aiohttp 패키지가 설치되어 있지 않습니다")
+
+        self.client_id = client_id or os.environ.get('NAVER_CLIENT_ID', '')
+        self.client_secret = client_secret or os.environ.get('NAVER_CLIENT_SECRET', '')
+        self.base_url = (base_url or os.environ.get('NAVER_API_BASE_URL', DEFAULT_BASE_URL)).rstrip('/')
+        self.concurrency = concurrency
+        self.rate_per_second = rate_per_second or float(os.environ.get('NAVER_RATE_PER_SECOND', 10))
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.quota = quota or naver_quota
+
+        self.headers = {
+            "X-Naver-Client-Id": self.client_id,
+            "X-Naver-Client-Secret": self.client_secret,
+            "User-Agent": "NewsBot/1.0"
+        }
+
+        self._session: Optional['aiohttp.ClientSession'] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._bucket: Optional[TokenBucket] = None
+
+        self.stats = {
+            'requests': 0,
+            'succeeded': 0,
+            'failed': 0,
+            'retries': 0,
+            'quota_rejected': 0,
+            'by_endpoint': {'news': 0, 'datalab': 0}
+        }
+
+    # ------------------------------------------------------------------
+    # 세션 관리
+    # ------------------------------------------------------------------
+    async def open(self):
+        if self._session is not None:
+            return
+        # 세마포어/버킷은 실행 중인 이벤트 루프에 묶이므로 여기서 생성
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.concurrency,
+                                         keepalive_timeout=30)
+        self._session = aiohttp.ClientSession(
+            headers=self.headers,
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._bucket = TokenBucket(self.rate_per_second)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        self.quota.save()
+
+    async def __aenter__(self) -> 'NaverAsyncCollector':
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    # ------------------------------------------------------------------
+    # 요청
+    # ------------------------------------------------------------------
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Retry-After 헤더 우선, 없으면 full jitter 지수 백오프"""
+        if retry_after:
+            try:
+                return min(self.backoff_cap, float(retry_after))
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+
+    async def _request(self, endpoint: str, method: str, path: str,
+                       params: Optional[Dict] = None, body: Optional[Dict] = None) -> Optional[Dict]:
+        if self._session is None:
+            await self.open()
+
+        for attempt in range(self.max_retries + 1):
+            # 재시도도 실제 호출이므로 매 시도마다 예산 차감
+            if not self.quota.try_consume(endpoint):
+                self.stats['quota_rejected'] += 1
+                logger.warning(f"⚠️ 네이버 {endpoint} 일일 호출 예산 소진")
+                return None
+
+            retry_after = None
+            async with self._semaphore:
+                await self._bucket.acquire()
+                self.stats['requests'] += 1
+                self.stats['by_endpoint'][endpoint] = self.stats['by_endpoint'].get(endpoint, 0) + 1
+
+                try:
+                    kwargs: Dict[str, Any] = {'params': params}
+                    if body is not None:
+                        kwargs['data'] = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                        kwargs['headers'] = {'Content-Type': 'application/json'}
+                    async with self._session.request(method, f"{self.base_url}{path}", **kwargs) as response:
+                        if response.status == 200:
+                            self.stats['succeeded'] += 1
+                            return await response.json(content_type=None)
+                        if response.status not in RETRYABLE_STATUS:
+                            text = await response.text()
+                            logger.error(f"네이버 {endpoint} API 오류: {response.status} - {text[:200]}")
+                            self.stats['failed'] += 1
+                            return None
+                        retry_after = response.headers.get('Retry-After')
+                        logger.warning(f"네이버 {endpoint} API 재시도 대상 응답: {response.status}")
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.warning(f"네이버 {endpoint} API 연결 오류: {e}")
+
+            # 백오프 대기 중에는 동시 실행 슬롯을 반납
+            if attempt < self.max_retries:
+                self.stats['retries'] += 1
+                await asyncio.sleep(self._backoff_delay(attempt, retry_after))
+
+        self.stats['failed'] += 1
+        return None
+
+    async def search_news(self, query: str, display: int = 10, start: int = 1, sort: str = "sim") -> Optional[Dict]:
+        """뉴스 검색 (display 최대 100, start 최대 1000)"""
+        params = {"query": query, "display": display, "start": start, "sort": sort}
+        return await self._request('news', 'GET', NEWS_PATH, params=params)
+
+    async def search_trend(self, keywords: List[str], start_date: str, end_date: str,
+                           time_unit: str = "date") -> Optional[Dict]:
+        """데이터랩 검색어 트렌드 (키워드 그룹 최대 5개)"""
+        body = {
+            "startDate": start_date,
+            "endDate": end_date,
+            "timeUnit": time_unit,
+            "keywordGroups": [{"groupName": keyword, "keywords": [keyword]} for keyword in keywords[:5]]
+        }
+        return await self._request('datalab', 'POST', DATALAB_PATH, body=body)
+
+    async def search_news_many(self, queries: Iterable[str], **kwargs) -> List[Optional[Dict]]:
+        """여러 검색어 동시 조회 (입력 순서대로 결과 반환)"""
+        return await asyncio.gather(*(self.search_news(query, **kwargs) for query in queries))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            'concurrency': self.concurrency,
+            'rate_per_second': self.rate_per_second,
+            'quota': self.quota.stats()
+        }
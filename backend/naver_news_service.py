@@ -4,6 +4,7 @@
 정치인별 뉴스 수집 및 분석
 """
 
+import asyncio
 import requests
 import json
 import time
@@ -11,6 +12,9 @@ from datetime import datetime, timedelta
 from urllib.parse import quote
 import logging
 
+from naver_async_collector import AIOHTTP_AVAILABLE, NaverAsyncCollector, naver_quota, run_sync
+from news_ingestion import IncrementalNewsFetcher
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -34,6 +38,9 @@ class NaverNewsService:
         self.daily_limit = 25000
         self.request_count = 0
         
+        # 증분 수집 (정치인별 high-water mark까지만 날짜순 페이지 조회)
+        self.ingestion = IncrementalNewsFetcher(namespace='naver_news_service')
+        
         # 정치인 목록 로드
         self.load_politicians()
         
@@ -56,7 +63,7 @@ class NaverNewsService:
     
     def search_news(self, query, display=10, start=1, sort="sim"):
         """네이버 뉴스 검색"""
-        if self.request_count >= self.daily_limit:
+        if self.request_count >= self.daily_limit or not naver_quota.try_consume('news'):
             logger.warning("일일 API 호출 한도 초과")
             return None
             
@@ -95,22 +102,72 @@ class NaverNewsService:
         finally:
             time.sleep(self.request_delay)
     
+    def politician_queries(self, politician_name):
+        """정치인 뉴스 검색 쿼리 (정치 뉴스에 특화, 우선순위 순)"""
+        return [
+            f'{politician_name} 의원',
+            f'{politician_name} 국회의원',
+            f'{politician_name} 국회',
+            f'{politician_name} 정당',
+            f'{politician_name} 법안'
+        ]
+    
+    def accept_news_items(self, politician_name, items, all_news, seen_titles, days, max_results):
+        """검색 결과 항목을 필터링해 all_news에 추가"""
+        for item in items:
+            if len(all_news) >= max_results:
+                break
+            
+            # 중복 제거
+            title = self.clean_html(item.get('title', ''))
+            if title in seen_titles:
+                logger.debug(f"중복 제목 건너뛰기: {title}")
+                continue
+            
+            # 정치 관련 뉴스 필터링
+            description = item.get('description', '')
+            if not self.is_political_news(title, description):
+                logger.debug(f"정치 관련 없음: {title}")
+                continue
+            
+            seen_titles.add(title)
+            
+            # 날짜 필터링 (최근 N일) - 더 관대하게
+            pub_date = self.parse_date(item.get('pubDate', ''))
+            if pub_date:
+                # timezone-aware datetime으로 변환
+                now = datetime.now(pub_date.tzinfo) if pub_date.tzinfo else datetime.now()
+                days_diff = (now - pub_date).days
+                logger.debug(f"날짜 체크: {title} - {days_diff}일 전")
+                # 30일 이내 뉴스만 수집 (기본값보다 관대)
+                if days_diff > days:
+                    logger.debug(f"날짜 초과로 제외: {days_diff}일 > {days}일")
+                    continue
+            else:
+                logger.debug(f"날짜 파싱 실패: {item.get('pubDate', '')}")
+                # 날짜를 파싱할 수 없어도 수집 (최신 뉴스일 가능성)
+            
+            # 뉴스 데이터 정리
+            news_item = {
+                'title': title,
+                'description': self.clean_html(description),
+                'link': item.get('link', ''),
+                'pub_date': pub_date.isoformat() if pub_date else item.get('pubDate', ''),
+                'politician': politician_name,
+                'sentiment': self.analyze_sentiment(title + ' ' + description),
+                'collected_at': datetime.now().isoformat()
+            }
+            
+            all_news.append(news_item)
+            logger.info(f"뉴스 수집: {title}")
+    
     def search_politician_news(self, politician_name, days=30, max_results=20):
         """특정 정치인 관련 뉴스 검색"""
         try:
-            # 검색 쿼리 생성 (정치 뉴스에 특화)
-            queries = [
-                f'{politician_name} 의원',
-                f'{politician_name} 국회의원',
-                f'{politician_name} 국회',
-                f'{politician_name} 정당',
-                f'{politician_name} 법안'
-            ]
-            
             all_news = []
             seen_titles = set()
             
-            for query in queries:
+            for query in self.politician_queries(politician_name):
                 if len(all_news) >= max_results:
                     break
                     
@@ -118,52 +175,8 @@ class NaverNewsService:
                 if not news_data:
                     continue
                 
-                for item in news_data.get('items', []):
-                    # 중복 제거
-                    title = self.clean_html(item.get('title', ''))
-                    if title in seen_titles:
-                        logger.debug(f"중복 제목 건너뛰기: {title}")
-                        continue
-                    
-                    # 정치 관련 뉴스 필터링
-                    description = item.get('description', '')
-                    if not self.is_political_news(title, description):
-                        logger.debug(f"정치 관련 없음: {title}")
-                        continue
-                    
-                    seen_titles.add(title)
-                    
-                    # 날짜 필터링 (최근 N일) - 더 관대하게
-                    pub_date = self.parse_date(item.get('pubDate', ''))
-                    if pub_date:
-                        # timezone-aware datetime으로 변환
-                        now = datetime.now(pub_date.tzinfo) if pub_date.tzinfo else datetime.now()
-                        days_diff = (now - pub_date).days
-                        logger.debug(f"날짜 체크: {title} - {days_diff}일 전")
-                        # 30일 이내 뉴스만 수집 (기본값보다 관대)
-                        if days_diff > days:
-                            logger.debug(f"날짜 초과로 제외: {days_diff}일 > {days}일")
-                            continue
-                    else:
-                        logger.debug(f"날짜 파싱 실패: {item.get('pubDate', '')}")
-                        # 날짜를 파싱할 수 없어도 수집 (최신 뉴스일 가능성)
-                    
-                    # 뉴스 데이터 정리
-                    news_item = {
-                        'title': title,
-                        'description': self.clean_html(description),
-                        'link': item.get('link', ''),
-                        'pub_date': pub_date.isoformat() if pub_date else item.get('pubDate', ''),
-                        'politician': politician_name,
-                        'sentiment': self.analyze_sentiment(title + ' ' + description),
-                        'collected_at': datetime.now().isoformat()
-                    }
-                    
-                    all_news.append(news_item)
-                    logger.info(f"뉴스 수집: {title}")
-                    
-                    if len(all_news) >= max_results:
-                        break
+                self.accept_news_items(politician_name, news_data.get('items', []),
+                                       all_news, seen_titles, days, max_results)
             
             logger.info(f"{politician_name} 관련 뉴스 수집: {len(all_news)}건")
             return all_news
@@ -172,8 +185,47 @@ class NaverNewsService:
             logger.error(f"{politician_name} 뉴스 검색 오류: {e}")
             return []
     
+    async def collect_all_politicians_news_async(self, days=7, max_per_politician=10, concurrency=8):
+        """모든 정치인 뉴스 동시 수집
+
+        쿼리 순서대로 라운드를 나눠, 아직 max_per_politician을 채우지 못한
+        정치인의 다음 쿼리만 한꺼번에 요청한다 (순차 수집과 같은 호출 수).
+        """
+        collected = {politician: ([], set()) for politician in self.politicians}
+        display = min(20, max_per_politician)
+        
+        async with NaverAsyncCollector(self.client_id, self.client_secret, concurrency=concurrency) as collector:
+            for round_index in range(len(self.politician_queries(''))):
+                pending = [
+                    politician for politician, (news, _) in collected.items()
+                    if len(news) < max_per_politician
+                ]
+                if not pending:
+                    break
+                
+                logger.info(f"뉴스 수집 라운드 {round_index + 1}: {len(pending)}명")
+                queries = [self.politician_queries(politician)[round_index] for politician in pending]
+                results = await collector.search_news_many(queries, display=display, sort="sim")
+                
+                for politician, news_data in zip(pending, results):
+                    if not news_data:
+                        continue
+                    news, seen_titles = collected[politician]
+                    self.accept_news_items(politician, news_data.get('items', []),
+                                           news, seen_titles, days, max_per_politician)
+            
+            self.request_count += collector.stats['requests']
+            logger.info(f"비동기 수집 통계: {collector.get_stats()}")
+        
+        return {politician: news for politician, (news, _) in collected.items() if news}
+    
     def collect_all_politicians_news(self, days=7, max_per_politician=10):
         """모든 정치인 뉴스 수집"""
+        if AIOHTTP_AVAILABLE:
+            all_news = run_sync(self.collect_all_politicians_news_async(days, max_per_politician))
+            logger.info(f"뉴스 수집 완료: 총 {sum(len(news) for news in all_news.values())}건")
+            return all_news
+        
         all_news = {}
         total_collected = 0
         
@@ -197,6 +249,54 @@ class NaverNewsService:
         logger.info(f"뉴스 수집 완료: 총 {total_collected}건")
         return all_news
     
+    def search_new_politician_news(self, politician_name, days=30):
+        """특정 정치인의 지난 수집 이후 새 뉴스만 검색 (날짜순 증분)"""
+        try:
+            query = self.politician_queries(politician_name)[0]
+            items = self.ingestion.fetch_new(query, self.search_news)
+            all_news = []
+            self.accept_news_items(politician_name, items, all_news, set(), days, len(items))
+            return all_news
+        except Exception as e:
+            logger.error(f"{politician_name} 증분 뉴스 검색 오류: {e}")
+            return []
+    
+    async def collect_new_politicians_news_async(self, days=7, concurrency=8):
+        """모든 정치인 새 뉴스 동시 수집 (대표 쿼리, mark에 닿을 때까지만 페이지 조회)"""
+        async with NaverAsyncCollector(self.client_id, self.client_secret, concurrency=concurrency) as collector:
+            results = await asyncio.gather(*(
+                self.ingestion.afetch_new(self.politician_queries(politician)[0], collector.search_news)
+                for politician in self.politicians
+            ))
+            self.request_count += collector.stats['requests']
+        
+        all_news = {}
+        for politician, items in zip(self.politicians, results):
+            news = []
+            self.accept_news_items(politician, items, news, set(), days, len(items))
+            if news:
+                all_news[politician] = news
+        return all_news
+    
+    def collect_new_politicians_news(self, days=7):
+        """모든 정치인 새 뉴스 수집 (정상 상태에서는 정치인당 1회 요청)"""
+        if AIOHTTP_AVAILABLE:
+            all_news = run_sync(self.collect_new_politicians_news_async(days))
+        else:
+            all_news = {}
+            for politician in self.politicians:
+                if self.request_count >= self.daily_limit * 0.9:
+                    logger.warning("API 호출 한도 근접으로 수집 중단")
+                    break
+                news = self.search_new_politician_news(politician, days)
+                if news:
+                    all_news[politician] = news
+        
+        self.ingestion.save()
+        logger.info(f"증분 뉴스 수집 완료: 총 {sum(len(news) for news in all_news.values())}건 "
+                    f"({self.ingestion.get_stats()})")
+        return all_news
+    
     def is_political_news(self, title, description):
         """정치 관련 뉴스인지 판단 (개선된 버전)"""
         political_keywords = [
@@ -315,7 +415,9 @@ class NaverNewsService:
             'request_count': self.request_count,
             'daily_limit': self.daily_limit,
             'remaining': self.daily_limit - self.request_count,
-            'usage_percentage': (self.request_count / self.daily_limit) * 100
+            'usage_percentage': (self.request_count / self.daily_limit) * 100,
+            'shared_quota': naver_quota.stats(),
+            'ingestion': self.ingestion.get_stats()
         }
 
 def main():
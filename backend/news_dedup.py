@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+뉴스 유사 중복 제거 (MinHash LSH)
+제목/요약을 문자 shingle로 나눠 MinHash 서명을 만들고 LSH 버킷으로 후보만 비교
+- 기사당 비교 비용이 누적 기사 수와 무관 (전체 쌍 비교 없음)
+- 링크 해시 + 서명을 파일에 저장해 수집 주기 사이에도 재수집 기사를 즉시 제외
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIGNATURE_FILE = os.path.join(os.path.dirname(__file__), 'data', 'news_signatures.json')
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# [단독], [속보], (종합) 같은 머리표는 모든 기사에 공통이라 유사도를 부풀림
+_HEADLINE_TAGS = re.compile(r'[\[\(【<][^\]\)】>]{1,10}[\]\)】>]')
+_NON_WORD = re.compile(r'[^0-9A-Za-z가-힣]+')
+
+
+def normalize_news_text(text: str) -> str:
+    """머리표/문장부호/공백 제거 후 소문자화"""
+    text = _HEADLINE_TAGS.sub(' ', text or '')
+    return _NON_WORD.sub('', text).lower()
+
+
+def shingles(text: str, k: int = 3) -> Set[str]:
+    """문자 k-gram 집합"""
+    text = normalize_news_text(text)
+    if len(text) <= k:
+        return {text} if text else set()
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+
+def link_hash(link: str) -> str:
+    """기사 링크 해시 (쿼리스트링 포함, 앞뒤 공백 제거)"""
+    return hashlib.sha1((link or '').strip().encode('utf-8')).hexdigest()[:16]
+
+
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=4).digest(), 'little')
+
+
+class MinHasher:
+    """고정 시드 MinHash (실행 간 서명 호환)"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        self.num_perm = num_perm
+        # 시드 기반 (a, b) 계수 - 실행마다 동일해야 저장된 서명과 비교 가능
+        coefficients = []
+        state = seed
+        for _ in range(num_perm):
+            state = int.from_bytes(hashlib.blake2b(str(state).encode(), digest_size=8).digest(), 'little')
+            a = state % (_MERSENNE_PRIME - 1) + 1
+            state = int.from_bytes(hashlib.blake2b(str(state).encode(), digest_size=8).digest(), 'little')
+            b = state % _MERSENNE_PRIME
+            coefficients.append((a, b))
+        self.coefficients = coefficients
+
+    def signature(self, shingle_set: Iterable[str]) -> Tuple[int, ...]:
+        hashes = [_shingle_hash(shingle) for shingle in shingle_set]
+        if not hashes:
+            return tuple([_MAX_HASH] * self.num_perm)
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self.coefficients
+        )
+
+
+def estimate_jaccard(sig1: Tuple[int, ...], sig2: Tuple[int, ...]) -> float:
+    """서명 일치 비율로 Jaccard 유사도 추정"""
+    if not sig1 or len(sig1) != len(sig2):
+        return 0.0
+    return sum(1 for x, y in zip(sig1, sig2) if x == y) / len(sig1)
+
+
+class MinHashLSH:
+    """밴드 LSH 색인 (밴드 해시가 하나라도 같으면 후보)"""
+
+    def __init__(self, num_perm: int = 64, bands: int = 16):
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.buckets: List[Dict[Tuple[int, ...], Set[str]]] = [{} for _ in range(bands)]
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def insert(self, key: str, signature: Tuple[int, ...]):
+        for band, band_key in self._band_keys(signature):
+            self.buckets[band].setdefault(band_key, set()).add(key)
+
+    def remove(self, key: str, signature: Tuple[int, ...]):
+        for band, band_key in self._band_keys(signature):
+            bucket = self.buckets[band].get(band_key)
+            if bucket:
+                bucket.discard(key)
+                if not bucket:
+                    del self.buckets[band][band_key]
+
+    def candidates(self, signature: Tuple[int, ...]) -> Set[str]:
+        found: Set[str] = set()
+        for band, band_key in self._band_keys(signature):
+            found |= self.buckets[band].get(band_key, set())
+        return found
+
+
+class NewsDeduplicator:
+    """링크/제목/요약 기준 뉴스 중복 판정기 (서명 파일 영속화)
+
+    - 링크 해시가 이미 있으면 재수집 기사로 즉시 제외
+    - 제목 서명이 기존 기사와 threshold 이상 유사하면 중복
+    - 요약이 충분히 길면 요약 서명도 비교 (제목만 바꾼 전재 기사)
+    - 문장부호뿐인 제목은 shingle이 없어 서명 대신 원문 제목 일치로 비교
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_SIGNATURE_FILE, threshold: float = 0.5,
+                 num_perm: int = 96, bands: int = 32, retention_hours: float = 48,
+                 min_description_length: int = 30):
+        self.path = os.environ.get('NEWS_SIGNATURE_FILE', path) if path else None
+        self.threshold = threshold
+        self.retention_seconds = retention_hours * 3600
+        self.min_description_length = min_description_length
+
+        self.hasher = MinHasher(num_perm)
+        self.title_lsh = MinHashLSH(num_perm, bands)
+        self.description_lsh = MinHashLSH(num_perm, bands)
+
+        # 링크 해시 -> {'title_sig', 'title_exact', 'description_sig', 'added_at'}
+        self.entries: Dict[str, Dict] = {}
+        # shingle 없는 제목의 해시 -> 링크 해시 (모두 같은 빈 서명이 되므로 LSH 대신 정확 일치)
+        self.exact_titles: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.stats = {'checked': 0, 'link_duplicates': 0, 'near_duplicates': 0, 'accepted': 0}
+
+        self.load()
+
+    # ------------------------------------------------------------------
+    # 판정
+    # ------------------------------------------------------------------
+    def _signatures(self, title: str, description: str) -> Tuple[Optional[Tuple[int, ...]], Optional[str],
+                                                                 Optional[Tuple[int, ...]]]:
+        """(제목 서명, 제목 정확 일치 키, 요약 서명) - 제목은 둘 중 하나만 채움 (빈 제목은 둘 다 None)"""
+        title_shingles = shingles(title)
+        title_sig, title_exact = None, None
+        if title_shingles:
+            title_sig = self.hasher.signature(title_shingles)
+        elif (title or '').strip():
+            title_exact = hashlib.sha1(title.strip().encode('utf-8')).hexdigest()[:16]
+        description_sig = None
+        if len(normalize_news_text(description)) >= self.min_description_length:
+            description_sig = self.hasher.signature(shingles(description))
+        return title_sig, title_exact, description_sig
+
+    def _find_similar(self, lsh: MinHashLSH, field: str, signature: Tuple[int, ...]) -> Optional[str]:
+        for key in lsh.candidates(signature):
+            stored = self.entries.get(key, {}).get(field)
+            if stored and estimate_jaccard(signature, stored) >= self.threshold:
+                return key
+        return None
+
+    def is_seen_link(self, link: str) -> bool:
+        """이전 수집에서 이미 처리한 링크인지 확인"""
+        return bool(link) and link_hash(link) in self.entries
+
+    def _check(self, key: str, title_sig: Optional[Tuple[int, ...]], title_exact: Optional[str],
+               description_sig: Optional[Tuple[int, ...]]) -> bool:
+        """링크 또는 제목/요약 유사도 기준 중복 여부 (락 안에서 호출)"""
+        self.stats['checked'] += 1
+        if key in self.entries:
+            self.stats['link_duplicates'] += 1
+            return True
+        duplicate_of = None
+        if title_sig is not None:
+            duplicate_of = self._find_similar(self.title_lsh, 'title_sig', title_sig)
+        elif title_exact is not None:
+            duplicate_of = self.exact_titles.get(title_exact)
+        if duplicate_of is None and description_sig is not None:
+            duplicate_of = self._find_similar(self.description_lsh, 'description_sig', description_sig)
+        if duplicate_of is not None:
+            self.stats['near_duplicates'] += 1
+            return True
+        return False
+
+    def is_duplicate(self, link: str, title: str, description: str = '') -> bool:
+        """중복 판정만 (서명은 등록하지 않음)"""
+        signatures = self._signatures(title, description)
+        with self._lock:
+            return self._check(link_hash(link or title), *signatures)
+
+    def add(self, link: str, title: str, description: str = ''):
+        """기사 서명 등록 (실제로 노출한 기사만 등록해야 다음 수집에서 제외되지 않은 기사가 유실되지 않음)"""
+        signatures = self._signatures(title, description)
+        with self._lock:
+            key = link_hash(link or title)
+            if key not in self.entries:
+                self._insert(key, *signatures, time.time())
+                self.stats['accepted'] += 1
+
+    def check_and_add(self, link: str, title: str, description: str = '') -> bool:
+        """중복이면 True, 새 기사면 서명을 등록하고 False"""
+        signatures = self._signatures(title, description)
+        with self._lock:
+            key = link_hash(link or title)
+            if self._check(key, *signatures):
+                return True
+            self._insert(key, *signatures, time.time())
+            self.stats['accepted'] += 1
+            return False
+
+    def batch(self) -> 'NewsDeduplicator':
+        """같은 설정의 메모리 전용 판정기 (한 번의 수집 안에서 서로 중복인 기사 제거용)"""
+        return NewsDeduplicator(path=None, threshold=self.threshold, num_perm=self.hasher.num_perm,
+                                bands=self.title_lsh.bands,
+                                retention_hours=self.retention_seconds / 3600,
+                                min_description_length=self.min_description_length)
+
+    def _insert(self, key: str, title_sig: Optional[Tuple[int, ...]], title_exact: Optional[str],
+                description_sig: Optional[Tuple[int, ...]], added_at: float):
+        self.entries[key] = {'title_sig': title_sig, 'title_exact': title_exact,
+                             'description_sig': description_sig, 'added_at': added_at}
+        if title_sig is not None:
+            self.title_lsh.insert(key, title_sig)
+        elif title_exact is not None:
+            self.exact_titles.setdefault(title_exact, key)
+        if description_sig is not None:
+            self.description_lsh.insert(key, description_sig)
+
+    # ------------------------------------------------------------------
+    # 보존 기간 / 영속화
+    # ------------------------------------------------------------------
+    def prune(self) -> int:
+        """보존 기간이 지난 서명 제거"""
+        cutoff = time.time() - self.retention_seconds
+        with self._lock:
+            expired = [key for key, entry in self.entries.items() if entry['added_at'] < cutoff]
+            for key in expired:
+                entry = self.entries.pop(key)
+                if entry['title_sig'] is not None:
+                    self.title_lsh.remove(key, entry['title_sig'])
+                elif self.exact_titles.get(entry['title_exact']) == key:
+                    del self.exact_titles[entry['title_exact']]
+                if entry['description_sig'] is not None:
+                    self.description_lsh.remove(key, entry['description_sig'])
+        return len(expired)
+
+    def load(self):
+        """저장된 서명 로드 (파일이 없거나 손상되면 빈 상태로 시작)"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('num_perm') != self.hasher.num_perm:
+                logger.warning("⚠️ 뉴스 서명 파일 형식이 달라 무시합니다")
+                return
+            for key, entry in data.get('entries', {}).items():
+                title_sig = entry.get('title_sig')
+                title_exact = entry.get('title_exact')
+                # 이전 형식의 빈 서명(shingle 없는 제목)은 모든 빈 제목과 충돌하므로 비교 대상에서 제외
+                if title_sig and all(value == _MAX_HASH for value in title_sig):
+                    title_sig = None
+                description_sig = entry.get('description_sig')
+                self._insert(key, tuple(title_sig) if title_sig else None, title_exact,
+                             tuple(description_sig) if description_sig else None, entry['added_at'])
+            expired = self.prune()
+            logger.info(f"📚 뉴스 서명 로드: {len(self.entries)}개 (만료 {expired}개 제거)")
+        except Exception as e:
+            logger.warning(f"⚠️ 뉴스 서명 파일 로드 실패: {e}")
+
+    def save(self):
+        """서명 파일 저장 (임시 파일 후 교체)"""
+        if not self.path:
+            return
+        self.prune()
+        with self._lock:
+            data = {
+                'num_perm': self.hasher.num_perm,
+                'saved_at': time.time(),
+                'entries': {
+                    key: {
+                        'title_sig': list(entry['title_sig']) if entry['title_sig'] else None,
+                        'title_exact': entry['title_exact'],
+                        'description_sig': list(entry['description_sig']) if entry['description_sig'] else None,
+                        'added_at': entry['added_at']
+                    }
+                    for key, entry in self.entries.items()
+                }
+            }
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"⚠️ 뉴스 서명 파일 저장 실패: {e}")
+
+    def get_stats(self) -> Dict:
+        return {**self.stats, 'stored_signatures': len(self.entries)}
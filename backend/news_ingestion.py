@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+증분 뉴스 수집 상태
+검색어별 high-water mark(마지막 pubDate + 그 시각의 링크 해시)를 저장하고
+날짜순 결과를 이미 본 기사에 닿을 때까지만 페이지 단위로 조회
+- 정상 상태 갱신은 검색어당 1회 요청 수준
+- 페이지 오류나 max_pages 초과로 mark에 닿지 못하면 이어서 조회할 위치(resume)를 저장해 다음 수집에서 계속
+- 새 기사는 append-only JSONL 저장소에 추가 (링크 해시로 이미 저장한 기사는 건너뜀, 크기 상한 도달 시 교체)
+"""
+
+import os
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from news_dedup import link_hash
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+DEFAULT_STATE_FILE = os.path.join(DATA_DIR, 'news_ingestion_state.json')
+DEFAULT_ARCHIVE_FILE = os.path.join(DATA_DIR, 'news_archive.jsonl')
+DEFAULT_ARCHIVE_MAX_BYTES = 64 * 1024 * 1024  # 넘으면 .1로 교체 (이전 파일 하나만 유지)
+
+NAVER_DATE_FORMAT = "%a, %d %b %Y %H:%M:%S %z"
+MAX_START = 1000  # 네이버 검색 API start 최대값
+MAX_DISPLAY = 100
+
+
+def parse_pub_date(pub_date: str) -> Optional[datetime]:
+    """네이버 pubDate 파싱 ("Mon, 14 Sep 2025 12:00:00 +0900")"""
+    try:
+        return datetime.strptime(pub_date, NAVER_DATE_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+
+def item_link_hash(item: Dict) -> str:
+    """기사 식별 해시 (원문 링크 우선)"""
+    return link_hash(item.get('originallink') or item.get('link') or item.get('title', ''))
+
+
+def _atomic_write_json(path: str, data: Any):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(temp_path, path)
+
+
+class IngestionState:
+    """검색어별 high-water mark 저장소"""
+
+    def __init__(self, path: Optional[str] = DEFAULT_STATE_FILE, save_every: int = 20):
+        self.path = os.environ.get('NEWS_INGESTION_STATE_FILE', path) if path else None
+        self.save_every = save_every
+        # query -> {'pub_date': iso, 'link_hashes': [...], 'updated_at': iso, 'total_ingested': int}
+        self.marks: Dict[str, Dict[str, Any]] = {}
+        self._dirty = 0
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.marks = json.load(f).get('queries', {})
+            logger.info(f"📌 증분 수집 상태 로드: {len(self.marks)}개 검색어")
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ 증분 수집 상태 로드 실패, 처음부터 수집: {e}")
+            self.marks = {}
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            data = {'saved_at': datetime.now().isoformat(), 'queries': dict(self.marks)}
+            self._dirty = 0
+        try:
+            _atomic_write_json(self.path, data)
+        except OSError as e:
+            logger.warning(f"⚠️ 증분 수집 상태 저장 실패: {e}")
+
+    def get_resume(self, query: str) -> Optional[Dict[str, Any]]:
+        """미완료 수집의 이어서 조회할 위치 {'start', 'pub_date', 'link_hashes'} (없으면 None)
+
+        pub_date/link_hashes는 미완료 수집을 시작한 시점의 최신 기사 - 이어서 조회가 mark에 닿으면 mark가 됨.
+        """
+        return (self.marks.get(query) or {}).get('resume')
+
+    def set_resume(self, query: str, start: int, pub_date: datetime, link_hashes: Set[str], new_count: int):
+        with self._lock:
+            mark = self.marks.get(query)
+            if not mark:
+                return
+            mark['resume'] = {'start': start, 'pub_date': pub_date.isoformat(), 'link_hashes': sorted(link_hashes)}
+            mark['updated_at'] = datetime.now().isoformat()
+            mark['total_ingested'] = mark.get('total_ingested', 0) + new_count
+            self._dirty += 1
+
+    def get(self, query: str) -> Tuple[Optional[datetime], Set[str]]:
+        """(마지막 pubDate, 그 시각 기사 링크 해시)"""
+        mark = self.marks.get(query)
+        if not mark:
+            return None, set()
+        return datetime.fromisoformat(mark['pub_date']), set(mark.get('link_hashes', []))
+
+    def advance(self, query: str, pub_date: datetime, link_hashes: Set[str], new_count: int):
+        """high-water mark 갱신 (같은 시각이면 링크 해시 합침, 이어서 조회할 위치는 지움)"""
+        with self._lock:
+            current = self.marks.get(query)
+            if current and datetime.fromisoformat(current['pub_date']) > pub_date:
+                return
+            if current and datetime.fromisoformat(current['pub_date']) == pub_date:
+                link_hashes = link_hashes | set(current.get('link_hashes', []))
+            self.marks[query] = {
+                'pub_date': pub_date.isoformat(),
+                'link_hashes': sorted(link_hashes),
+                'updated_at': datetime.now().isoformat(),
+                'total_ingested': (current or {}).get('total_ingested', 0) + new_count
+            }
+            self._dirty += 1
+            should_save = self._dirty >= self.save_every
+        if should_save:
+            self.save()
+
+    def touch(self, query: str):
+        """새 기사 없이 조회만 한 경우 시각만 기록"""
+        with self._lock:
+            if query in self.marks:
+                self.marks[query]['updated_at'] = datetime.now().isoformat()
+
+
+class NewsArchive:
+    """append-only 뉴스 저장소 (JSON Lines)
+
+    (source, 링크 해시) 색인으로 이미 저장한 기사는 다시 쓰지 않는다.
+    파일이 max_bytes를 넘으면 <path>.1로 교체해 읽기 비용을 제한한다.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_ARCHIVE_FILE, max_bytes: int = DEFAULT_ARCHIVE_MAX_BYTES):
+        self.path = os.environ.get('NEWS_ARCHIVE_FILE', path) if path else None
+        self.max_bytes = max_bytes
+        self._index: Optional[Set[Tuple[Optional[str], str]]] = None
+        self._lock = threading.Lock()
+
+    def _files(self) -> List[str]:
+        """오래된 파일부터"""
+        if not self.path:
+            return []
+        return [path for path in (f"{self.path}.1", self.path) if os.path.exists(path)]
+
+    def _load_index(self) -> Set[Tuple[Optional[str], str]]:
+        if self._index is None:
+            index = set()
+            for path in self._files():
+                for record in self._read(path):
+                    index.add((record.get('source'), record.get('link_hash') or item_link_hash(record)))
+            self._index = index
+        return self._index
+
+    def fresh(self, items: List[Dict], source: Optional[str] = None) -> List[Dict]:
+        """아직 저장하지 않은 기사만 (같은 수집 안의 중복도 제거)"""
+        with self._lock:
+            index = self._load_index()
+            seen: Set[str] = set()
+            result = []
+            for item in items:
+                item_hash = item_link_hash(item)
+                if (source, item_hash) in index or item_hash in seen:
+                    continue
+                seen.add(item_hash)
+                result.append(item)
+            return result
+
+    def append(self, query: str, items: List[Dict], source: Optional[str] = None) -> int:
+        if not items:
+            return 0
+        ingested_at = datetime.now().isoformat()
+        records = [{**item, 'query': query, 'source': source, 'link_hash': item_link_hash(item),
+                    'ingested_at': ingested_at} for item in items]
+        with self._lock:
+            self._load_index().update((source, record['link_hash']) for record in records)
+            if not self.path:
+                return 0
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            if os.path.exists(self.path) and os.path.getsize(self.path) >= self.max_bytes:
+                os.replace(self.path, f"{self.path}.1")
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+                                  for record in records) + '\n')
+        return len(records)
+
+    @staticmethod
+    def _read(path: str) -> Iterator[Dict]:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue  # 기록 도중 중단된 마지막 줄
+
+    @staticmethod
+    def _read_reversed(path: str, block_size: int = 1 << 16) -> Iterator[Dict]:
+        """파일 끝에서부터 한 줄씩 (최근 기사만 필요할 때 전체를 읽지 않음)"""
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            remainder = b''
+            while position > 0:
+                size = min(block_size, position)
+                position -= size
+                f.seek(position)
+                lines = (f.read(size) + remainder).split(b'\n')
+                remainder = lines.pop(0)
+                for line in reversed(lines):
+                    if line.strip():
+                        try:
+                            yield json.loads(line)
+                        except ValueError:
+                            continue
+            if remainder.strip():
+                try:
+                    yield json.loads(remainder)
+                except ValueError:
+                    pass
+
+    def _matches(self, record: Dict, query: Optional[str], source: Optional[str]) -> bool:
+        return ((query is None or record.get('query') == query)
+                and (source is None or record.get('source') == source))
+
+    def iter_records(self, query: Optional[str] = None, source: Optional[str] = None) -> Iterator[Dict]:
+        """저장된 기사 순회 (query/source 지정 시 해당 기사만, 오래된 순)"""
+        for path in self._files():
+            for record in self._read(path):
+                if self._matches(record, query, source):
+                    yield record
+
+    def iter_recent(self, since: str, query: Optional[str] = None, source: Optional[str] = None) -> Iterator[Dict]:
+        """ingested_at이 since(ISO 시각) 이후인 기사만 최근 순으로 (파일 끝에서 읽다가 since 이전에서 중단)"""
+        for path in reversed(self._files()):
+            for record in self._read_reversed(path):
+                if record.get('ingested_at', '') <= since:
+                    return
+                if self._matches(record, query, source):
+                    yield record
+
+
+class IncrementalNewsFetcher:
+    """검색어별 증분 수집기
+
+    fetch(query, display=, start=, sort='date')는 네이버 검색 응답(dict), 기사 목록 또는 None을 반환한다.
+    처음 보는 검색어는 initial_pages만 조회하고, 이후에는 high-water mark에 닿을 때까지만 페이지를 넘긴다.
+    namespace는 같은 검색어를 쓰는 서비스끼리 mark를 나눠 갖기 위한 접두사.
+    """
+
+    def __init__(self, namespace: str = '', state: Optional[IngestionState] = None,
+                 archive: Optional[NewsArchive] = None, page_size: int = MAX_DISPLAY,
+                 initial_pages: int = 1, max_pages: int = 10):
+        self.namespace = namespace
+        self.state = state or IngestionState()
+        self.archive = archive if archive is not None else NewsArchive()
+        self.page_size = min(page_size, MAX_DISPLAY)
+        self.initial_pages = initial_pages
+        self.max_pages = max_pages
+        self.stats = {'queries': 0, 'requests': 0, 'new_items': 0, 'stopped_at_mark': 0, 'incomplete': 0}
+
+    def _key(self, query: str) -> str:
+        return f"{self.namespace}/{query}" if self.namespace else query
+
+    @staticmethod
+    def _items(data: Any) -> List[Dict]:
+        if isinstance(data, dict):
+            return data.get('items', [])
+        return data or []
+
+    def _scan_page(self, items: List[Dict], mark_date: Optional[datetime], mark_hashes: Set[str],
+                   seen: Set[str], new_items: List[Dict]) -> bool:
+        """한 페이지 처리. 이미 본 기사에 닿으면 True"""
+        for item in items:
+            item_hash = item_link_hash(item)
+            if item_hash in seen:
+                continue
+            pub_date = parse_pub_date(item.get('pubDate', ''))
+            if mark_date is not None and pub_date is not None:
+                if pub_date < mark_date or (pub_date == mark_date and item_hash in mark_hashes):
+                    return True
+            seen.add(item_hash)
+            new_items.append(item)
+        return False
+
+    def _pages(self, has_mark: bool) -> int:
+        return self.max_pages if has_mark else self.initial_pages
+
+    def _next_start(self, start: int, items: List[Dict]) -> Optional[int]:
+        if len(items) < self.page_size:
+            return None  # 마지막 페이지
+        next_start = start + self.page_size
+        return next_start if next_start <= MAX_START else None
+
+    def _begin(self, query: str) -> Tuple[Optional[datetime], Set[str], Optional[Dict[str, Any]], int]:
+        """(mark 시각, mark 링크 해시, 이어서 조회할 위치, 시작 start)"""
+        key = self._key(query)
+        mark_date, mark_hashes = self.state.get(key)
+        resume = self.state.get_resume(key) if mark_date is not None else None
+        return mark_date, mark_hashes, resume, resume['start'] if resume else 1
+
+    def _commit(self, query: str, new_items: List[Dict], resume: Optional[Dict[str, Any]],
+                cursor: Optional[int]) -> List[Dict]:
+        """high-water mark 또는 이어서 조회할 위치 갱신 + 저장소 추가 (이미 저장한 기사는 제외하고 반환)
+
+        cursor는 미완료 수집(페이지 요청 실패, max_pages 안에 mark에 닿지 못함)에서 다음에 조회할 start.
+        미완료면 mark는 그대로 두고 cursor부터 이어서 조회한다. 그 사이 새로 올라온 기사만큼
+        순위가 밀리므로 앞부분이 일부 겹칠 수는 있어도 빠지는 기사는 없다(겹친 기사는 저장소 색인으로 제외).
+        """
+        key = self._key(query)
+        self.stats['queries'] += 1
+        fresh = self.archive.fresh(new_items, source=self.namespace or None)
+
+        # 이번 수집의 최신 기사 (이어서 조회 중이면 미완료 수집을 시작한 시점의 최신 기사)
+        if resume:
+            top_date, top_hashes = datetime.fromisoformat(resume['pub_date']), set(resume['link_hashes'])
+        else:
+            dated = [(parse_pub_date(item.get('pubDate', '')), item) for item in new_items]
+            dated = [(pub_date, item) for pub_date, item in dated if pub_date is not None]
+            top_date = max((pub_date for pub_date, _ in dated), default=None)
+            top_hashes = {item_link_hash(item) for pub_date, item in dated if pub_date == top_date}
+
+        if cursor is not None:
+            self.stats['incomplete'] += 1
+        if top_date is None:
+            self.state.touch(key)
+        elif cursor is None:
+            self.state.advance(key, top_date, top_hashes, len(fresh))
+        elif self.state.get(key)[0] is not None:
+            self.state.set_resume(key, cursor, top_date, top_hashes, len(fresh))
+        else:
+            self.state.touch(key)  # 처음 보는 검색어는 멈출 기준이 없어 이어서 조회하지 않음
+
+        self.archive.append(query, fresh, source=self.namespace or None)
+        self.stats['new_items'] += len(fresh)
+        return fresh
+
+    def fetch_new(self, query: str, fetch: Callable[..., Optional[Dict]]) -> List[Dict]:
+        """새 기사만 반환 (최신순)"""
+        mark_date, mark_hashes, resume, start = self._begin(query)
+        new_items: List[Dict] = []
+        seen: Set[str] = set()
+        cursor = None
+        for _ in range(self._pages(mark_date is not None)):
+            data = fetch(query, display=self.page_size, start=start, sort='date')
+            self.stats['requests'] += 1
+            if data is None:
+                cursor = start  # 요청 실패 - mark를 올리면 사이 기사가 빠짐
+                break
+            items = self._items(data)
+            if self._scan_page(items, mark_date, mark_hashes, seen, new_items):
+                self.stats['stopped_at_mark'] += 1
+                break
+            start = self._next_start(start, items)
+            if start is None:
+                break
+        else:
+            if mark_date is not None:
+                cursor = start  # max_pages 안에 mark에 닿지 못함 - 다음 수집에서 이어서
+        return self._commit(query, new_items, resume, cursor)
+
+    async def afetch_new(self, query: str, fetch: Callable[..., Awaitable[Optional[Dict]]]) -> List[Dict]:
+        """fetch_new의 비동기 버전 (NaverAsyncCollector.search_news 등)"""
+        mark_date, mark_hashes, resume, start = self._begin(query)
+        new_items: List[Dict] = []
+        seen: Set[str] = set()
+        cursor = None
+        for _ in range(self._pages(mark_date is not None)):
+            data = await fetch(query, display=self.page_size, start=start, sort='date')
+            self.stats['requests'] += 1
+            if data is None:
+                cursor = start  # 요청 실패 - mark를 올리면 사이 기사가 빠짐
+                break
+            items = self._items(data)
+            if self._scan_page(items, mark_date, mark_hashes, seen, new_items):
+                self.stats['stopped_at_mark'] += 1
+                break
+            start = self._next_start(start, items)
+            if start is None:
+                break
+        else:
+            if mark_date is not None:
+                cursor = start  # max_pages 안에 mark에 닿지 못함 - 다음 수집에서 이어서
+        return self._commit(query, new_items, resume, cursor)
+
+    def save(self):
+        self.state.save()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'tracked_queries': len(self.state.marks)}
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+PDF 페이지 텍스트 추출 + 영구 캐시
+- 페이지 구간 단위로 프로세스 풀에서 병렬 추출 (PyMuPDF)
+- 페이지 텍스트는 (파일 해시, 페이지 번호) 키로 SQLite에 저장 → 재실행/다른 분석기와 공유
+- 파일 해시는 (경로, 수정 시각, 크기)가 같으면 다시 계산하지 않음
+- iter_pages는 페이지 순서대로 스트리밍하므로 추출이 끝나기 전에 분석을 시작할 수 있음
+"""
+
+import os
+import sqlite3
+import hashlib
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fitz  # PyMuPDF
+    FITZ_AVAILABLE = True
+except ImportError:
+    FITZ_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(__file__), 'data', 'pdf_page_cache.db')
+
+
+def pdf_file_hash(file_path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _extract_page_range(file_path: str, start: int, end: int) -> List[Tuple[int, str]]:
+    """[start, end) 페이지 텍스트 추출 (프로세스 풀 작업 단위, 문서는 구간당 한 번만 엶)"""
+    doc = fitz.open(file_path)
+    try:
+        return [(page_num, doc[page_num].get_text()) for page_num in range(start, min(end, len(doc)))]
+    finally:
+        doc.close()
+
+
+class PDFPageCache:
+    """페이지 단위 PDF 텍스트 캐시"""
+
+    def __init__(self, cache_path: Optional[str] = DEFAULT_CACHE_PATH, max_workers: Optional[int] = None,
+                 chunk_size: int = 16):
+        self.cache_path = os.environ.get('PDF_PAGE_CACHE_PATH', cache_path)
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.chunk_size = chunk_size
+        self.stats = {'cached_pages': 0, 'extracted_pages': 0}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        with self.conn:
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS pdf_documents (
+                    file_hash TEXT PRIMARY KEY,
+                    file_path TEXT,
+                    total_pages INTEGER,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS pdf_file_hashes (
+                    file_path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER,
+                    size INTEGER,
+                    file_hash TEXT
+                )
+            ''')
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS pdf_pages (
+                    file_hash TEXT,
+                    page_num INTEGER,
+                    text TEXT,
+                    PRIMARY KEY (file_hash, page_num)
+                ) WITHOUT ROWID
+            ''')
+
+    # ------------------------------------------------------------------
+    # 캐시
+    # ------------------------------------------------------------------
+    def _file_hash(self, file_path: str) -> str:
+        """파일 해시 ((경로, 수정 시각, 크기)가 기록과 같으면 저장된 값 사용)"""
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        with self._lock:
+            row = self.conn.execute('SELECT mtime_ns, size, file_hash FROM pdf_file_hashes WHERE file_path = ?',
+                                    (path,)).fetchone()
+        if row is not None and row[0] == stat.st_mtime_ns and row[1] == stat.st_size:
+            return row[2]
+
+        file_hash = pdf_file_hash(path)
+        with self._lock, self.conn:
+            self.conn.execute('INSERT OR REPLACE INTO pdf_file_hashes (file_path, mtime_ns, size, file_hash) '
+                              'VALUES (?, ?, ?, ?)', (path, stat.st_mtime_ns, stat.st_size, file_hash))
+        return file_hash
+
+    def _document(self, file_path: str) -> Tuple[str, int]:
+        """(파일 해시, 총 페이지 수) - 처음 보는 파일이면 등록"""
+        file_hash = self._file_hash(file_path)
+        with self._lock:
+            row = self.conn.execute('SELECT total_pages FROM pdf_documents WHERE file_hash = ?',
+                                    (file_hash,)).fetchone()
+        if row is not None:
+            return file_hash, row[0]
+
+        if not FITZ_AVAILABLE:
+            raise ImportError("PyMuPDF(fitz)가 설치되어 있지 않습니다")
+        doc = fitz.open(file_path)
+        total_pages = len(doc)
+        doc.close()
+        with self._lock, self.conn:
+            self.conn.execute('INSERT OR REPLACE INTO pdf_documents (file_hash, file_path, total_pages) VALUES (?, ?, ?)',
+                              (file_hash, file_path, total_pages))
+        return file_hash, total_pages
+
+    def _cached_pages(self, file_hash: str) -> Dict[int, str]:
+        with self._lock:
+            rows = self.conn.execute('SELECT page_num, text FROM pdf_pages WHERE file_hash = ?', (file_hash,))
+            return dict(rows.fetchall())
+
+    def _store_pages(self, file_hash: str, pages: List[Tuple[int, str]]):
+        with self._lock, self.conn:
+            self.conn.executemany('INSERT OR REPLACE INTO pdf_pages (file_hash, page_num, text) VALUES (?, ?, ?)',
+                                  [(file_hash, page_num, text) for page_num, text in pages])
+
+    # ------------------------------------------------------------------
+    # 추출
+    # ------------------------------------------------------------------
+    def iter_pages(self, file_path: str) -> Iterator[Tuple[int, str]]:
+        """(페이지 번호, 텍스트)를 페이지 순서대로 생성
+
+        캐시에 있는 페이지는 바로 내보내고, 없는 구간은 프로세스 풀에서 추출해 도착하는 대로 저장/전달한다.
+        """
+        file_hash, total_pages = self._document(file_path)
+        cached = self._cached_pages(file_hash)
+        self.stats['cached_pages'] += len(cached)
+
+        missing = [page_num for page_num in range(total_pages) if page_num not in cached]
+        if not missing:
+            for page_num in range(total_pages):
+                yield page_num, cached[page_num]
+            return
+
+        # 없는 페이지를 연속 구간으로 묶어 청크 단위 작업으로 분할
+        ranges: List[Tuple[int, int]] = []
+        for page_num in missing:
+            if ranges and ranges[-1][1] == page_num and page_num - ranges[-1][0] < self.chunk_size:
+                ranges[-1] = (ranges[-1][0], page_num + 1)
+            else:
+                ranges.append((page_num, page_num + 1))
+
+        logger.info(f"📄 PDF 페이지 추출: {len(missing)}/{total_pages}페이지 ({len(ranges)}개 구간, "
+                    f"워커 {self.max_workers}개)")
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(ranges))) as pool:
+            futures = {start: pool.submit(_extract_page_range, file_path, start, end) for start, end in ranges}
+            page_num = 0
+            for start, end in ranges:
+                # 이 구간 앞의 캐시된 페이지 먼저
+                while page_num < start:
+                    yield page_num, cached[page_num]
+                    page_num += 1
+                pages = futures[start].result()
+                self._store_pages(file_hash, pages)
+                self.stats['extracted_pages'] += len(pages)
+                for page_num, text in pages:
+                    yield page_num, text
+                page_num = end
+            while page_num < total_pages:
+                yield page_num, cached[page_num]
+                page_num += 1
+
+    def extract_text(self, file_path: str) -> Tuple[str, int]:
+        """(전체 텍스트, 총 페이지 수) - 페이지마다 줄바꿈으로 연결"""
+        parts = []
+        total_pages = 0
+        for page_num, text in self.iter_pages(file_path):
+            parts.append(text + '\n')
+            total_pages = page_num + 1
+        return ''.join(parts), total_pages
+
+    def total_pages(self, file_path: str) -> int:
+        return self._document(file_path)[1]
+
+    def get_stats(self) -> Dict:
+        return dict(self.stats)
+
+    def close(self):
+        self.conn.close()
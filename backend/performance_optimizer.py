@@ -7,17 +7,19 @@ NewsBot 성능 최적화 시스템
 import json
 import time
 import asyncio
-from datetime import datetime, timedelta
 from functools import lru_cache
 import logging
 
+from cache_engine import BoundedLRUCache
+
 logger = logging.getLogger(__name__)
 
 class PerformanceOptimizer:
     def __init__(self):
-        self.cache = {}
-        self.cache_ttl = {}  # Time To Live
         self.default_ttl = 300  # 5분
+        self.cache_max_size = 64 * 1024 * 1024  # 64MB
+        self.cache = BoundedLRUCache('performance', max_bytes=self.cache_max_size,
+                                     default_ttl=self.default_ttl)
         
         # 데이터 사전 로드
         self.preload_data()
@@ -200,39 +202,19 @@ class PerformanceOptimizer:
     
     def set_cache(self, key, value, ttl=None):
         """캐시 설정"""
-        if ttl is None:
-            ttl = self.default_ttl
-        
-        self.cache[key] = value
-        self.cache_ttl[key] = datetime.now() + timedelta(seconds=ttl)
+        if not self.cache.put(key, value, ttl=ttl):
+            logger.warning(f"캐시 한도 초과로 저장 생략: {key}")
     
     def get_cache(self, key):
-        """캐시 조회"""
-        if key not in self.cache:
-            return None
-        
-        # TTL 확인
-        if datetime.now() > self.cache_ttl.get(key, datetime.now()):
-            # 만료된 캐시 삭제
-            del self.cache[key]
-            if key in self.cache_ttl:
-                del self.cache_ttl[key]
-            return None
-        
-        return self.cache[key]
+        """캐시 조회 (만료 항목은 엔진에서 제거)"""
+        return self.cache.get(key)
     
     def clear_expired_cache(self):
         """만료된 캐시 정리"""
-        now = datetime.now()
-        expired_keys = [key for key, expire_time in self.cache_ttl.items() if now > expire_time]
-        
-        for key in expired_keys:
-            if key in self.cache:
-                del self.cache[key]
-            del self.cache_ttl[key]
+        expired_count = self.cache.purge_expired()
         
-        if expired_keys:
-            logger.info(f"만료된 캐시 정리: {len(expired_keys)}개")
+        if expired_count:
+            logger.info(f"만료된 캐시 정리: {expired_count}개")
     
     def get_politicians_fast(self):
         """빠른 정치인 목록 조회"""
@@ -302,7 +284,8 @@ class PerformanceOptimizer:
         """성능 통계"""
         return {
             'cache_items': len(self.cache),
-            'cache_keys': list(self.cache.keys()),
+            'cache_keys': self.cache.keys(),
+            'cache_stats': self.cache.stats(),
             'data_sizes': {
                 'politicians': len(self.politicians_data) if self.politicians_data else 0,
                 'bills': len(self.bills_data) if self.bills_data else 0,
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+지명 prefix/n-gram 역색인
+시도/시군구/구/읍면동 이름과 별칭·옛 지명을 한 번에 색인하고
+짧은 입력("성남", "정자", "강서")에 대해 계층 수준과 함께 순위화된 후보를 반환
+- 정확 일치: dict 조회
+- 접두 일치: 접두사 → 용어 목록
+- 부분 일치: 2-gram 게시 목록 교집합 (선형 탐색 없음)
+"""
+
+import os
+import re
+import json
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# 계층 수준 정렬 순서 (동점 시 상위 행정구역 우선)
+LEVEL_ORDER = {
+    'sido': 0,
+    'sigungu': 1,
+    'gu': 2,
+    'dong': 3,
+    'station': 4,
+    'landmark': 5,
+    'politician': 6
+}
+
+LEVEL_LABELS = {
+    'sido': '광역단체장급',
+    'sigungu': '기초단체장급',
+    'gu': '구청장급',
+    'dong': '동장급',
+    'station': '교통 중심지',
+    'landmark': '주요 시설',
+    'politician': '정치인'
+}
+
+# 긴 접미사부터 확인 ('특별시'가 '시'보다 먼저)
+ADMIN_SUFFIXES = ('특별자치시', '특별자치도', '특별시', '광역시', '도', '시', '군', '구', '읍', '면', '동', '리')
+
+PARENT_FIELDS = ('sido', 'sigungu', 'gu')
+
+# 용어 종류별 가중치
+TERM_WEIGHTS = {'name': 1.0, 'alias': 0.97, 'stem': 0.95, 'historical': 0.85}
+
+# 옛 지명/전국 읍면동 레코드 파일 (PLACE_NAMES_FILE 환경변수로 교체)
+DEFAULT_PLACE_NAMES_FILE = os.path.join(os.path.dirname(__file__), 'data', 'place_names.json')
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_place_name(name: str) -> str:
+    """공백 제거 정규화"""
+    return _WHITESPACE.sub('', name or '')
+
+
+def place_name_stem(name: str) -> Optional[str]:
+    """행정구역 접미사를 뗀 약칭 ('정자동' → '정자', '서울특별시' → '서울')
+
+    '중구', '중동'처럼 한 글자만 남는 경우는 약칭으로 쓰지 않는다.
+    """
+    for suffix in ADMIN_SUFFIXES:
+        if name.endswith(suffix) and len(name) - len(suffix) >= 2:
+            return name[:-len(suffix)]
+    return None
+
+
+class PlaceNameIndex:
+    """지명 역색인 (정확/접두/부분/포함 일치)"""
+
+    def __init__(self, max_prefix_length: int = 12):
+        self.max_prefix_length = max_prefix_length
+
+        self.entries: List[Dict[str, Any]] = []
+        self.entry_terms: List[Set[str]] = []             # entry_id -> 등록된 용어
+        self.label_ids: Dict[Tuple[str, str], int] = {}  # (level, label) -> entry_id
+        self.terms: List[str] = []
+        self.term_ids: Dict[str, int] = {}
+        self.term_entries: List[List[Tuple[int, str]]] = []  # term_id -> [(entry_id, 종류)]
+
+        self.prefix_index: Dict[str, List[int]] = {}
+        self.bigram_index: Dict[str, Set[int]] = {}
+
+    # ------------------------------------------------------------------
+    # 색인 구축
+    # ------------------------------------------------------------------
+    def add(self, name: str, level: str, key: Optional[str] = None,
+            parents: Optional[Dict[str, Optional[str]]] = None,
+            aliases: Iterable[str] = (), historical_names: Iterable[str] = (),
+            payload: Any = None, stem_aliases: bool = True) -> int:
+        """지명 한 건 추가 후 entry_id 반환 (stem_aliases=False면 약칭 생성 안 함)"""
+        entry_id = len(self.entries)
+        parents = {field: value for field, value in (parents or {}).items() if value}
+        entry = {
+            'entry_id': entry_id,
+            'key': key or name,
+            'name': name,
+            'level': level,
+            'level_label': LEVEL_LABELS.get(level, level),
+            'parents': parents,
+            'label': self._make_label(name, level, parents),
+            'payload': payload
+        }
+        self.entries.append(entry)
+        self.entry_terms.append(set())
+        self.label_ids.setdefault((level, entry['label']), entry_id)
+
+        self.add_terms(entry_id, [name], aliases, historical_names, stem_aliases, name_kind='name')
+        return entry_id
+
+    def add_terms(self, entry_id: int, names: Iterable[str] = (), aliases: Iterable[str] = (),
+                  historical_names: Iterable[str] = (), stem_aliases: bool = True, name_kind: str = 'alias'):
+        """기존 항목에 이름/별칭/옛 지명 추가 (이미 등록된 용어는 건너뜀)"""
+        seen = self.entry_terms[entry_id]
+        added: List[str] = []
+
+        def register(term: str, kind: str):
+            term = normalize_place_name(term)
+            if term and term not in seen:
+                added.append(term)
+                self._add_term(term, entry_id, kind)
+
+        for name in names:
+            register(name, name_kind)
+        for alias in aliases:
+            register(alias, 'alias')
+        for historical in historical_names:
+            register(historical, 'historical')
+
+        # 약칭은 명시 이름을 모두 등록한 뒤 추가 (명시 별칭이 우선)
+        for term in (added if stem_aliases else ()):
+            stem = place_name_stem(term)
+            if stem:
+                register(stem, 'stem')
+
+    def add_records(self, records: Iterable[Dict[str, Any]]) -> int:
+        """행정구역 레코드 일괄 추가
+
+        레코드 형식: {'sido', 'sigungu', 'gu', 'dong', 'aliases', 'historical_names'}
+        가장 하위 값이 이름, 나머지는 상위 계층으로 사용한다.
+        같은 계층/경로의 항목이 이미 있으면 새로 만들지 않고 별칭·옛 지명만 보탠다.
+        새로 추가한 항목 수 반환
+        """
+        added = 0
+        for record in records:
+            level, name = None, None
+            for field in ('dong', 'gu', 'sigungu', 'sido'):
+                if record.get(field):
+                    level, name = field, record[field]
+                    break
+            if not name:
+                continue
+            # 자신보다 상위 계층만 부모로 사용
+            upper = PARENT_FIELDS if level == 'dong' else PARENT_FIELDS[:PARENT_FIELDS.index(level)]
+            parents = {field: record[field] for field in upper if record.get(field)}
+            aliases = record.get('aliases', ())
+            historical_names = record.get('historical_names', ())
+
+            existing = self.label_ids.get((level, self._make_label(name, level, parents)))
+            if existing is not None:
+                self.add_terms(existing, aliases=aliases, historical_names=historical_names)
+                continue
+            self.add(name, level, key=record.get('code') or name, parents=parents,
+                     aliases=aliases, historical_names=historical_names, payload=record)
+            added += 1
+        return added
+
+    def load_json(self, path: str) -> int:
+        """행정구역 레코드 JSON 파일 로드"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return self.add_records(json.load(f))
+
+    def _add_term(self, term: str, entry_id: int, kind: str):
+        term_id = self.term_ids.get(term)
+        if term_id is None:
+            term_id = len(self.terms)
+            self.term_ids[term] = term_id
+            self.terms.append(term)
+            self.term_entries.append([])
+
+            for length in range(1, min(len(term), self.max_prefix_length) + 1):
+                self.prefix_index.setdefault(term[:length], []).append(term_id)
+            for gram in self._bigrams(term):
+                self.bigram_index.setdefault(gram, set()).add(term_id)
+
+        self.term_entries[term_id].append((entry_id, kind))
+        self.entry_terms[entry_id].add(term)
+
+    @staticmethod
+    def _bigrams(term: str) -> Set[str]:
+        return {term[i:i + 2] for i in range(len(term) - 1)}
+
+    @staticmethod
+    def _make_label(name: str, level: str, parents: Dict[str, str]) -> str:
+        path = [parents[field] for field in PARENT_FIELDS if parents.get(field)]
+        path.append(name)
+        return f"{' '.join(path)} ({LEVEL_LABELS.get(level, level)})"
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def exact(self, query: str, names_only: bool = False) -> List[Dict[str, Any]]:
+        """정확 일치 항목 (names_only=True면 별칭/약칭 제외)"""
+        term_id = self.term_ids.get(normalize_place_name(query))
+        if term_id is None:
+            return []
+        return [self.entries[entry_id] for entry_id, kind in self.term_entries[term_id]
+                if not names_only or kind == 'name']
+
+    def _infix_terms(self, query: str) -> Set[int]:
+        """2-gram 교집합으로 query를 포함하는 용어 후보"""
+        grams = sorted(self._bigrams(query), key=lambda gram: len(self.bigram_index.get(gram, ())))
+        if not grams:
+            return set()
+        candidates = set(self.bigram_index.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not candidates:
+                break
+            candidates &= self.bigram_index.get(gram, set())
+        return {term_id for term_id in candidates if query in self.terms[term_id]}
+
+    def _contained_terms(self, query: str) -> Set[int]:
+        """query 안에 포함된 용어 ("정자동 맛집" → "정자동")"""
+        found: Set[int] = set()
+        for start in range(len(query)):
+            for end in range(start + 2, len(query) + 1):
+                term_id = self.term_ids.get(query[start:end])
+                if term_id is not None:
+                    found.add(term_id)
+        return found
+
+    def search(self, query: str, limit: int = 10, levels: Optional[Iterable[str]] = None,
+               match_types: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """순위화된 후보 목록 (계층/매칭 종류 필터는 limit 자르기 전에 적용)"""
+        query = normalize_place_name(query)
+        if not query:
+            return []
+        level_filter = set(levels) if levels else None
+        type_filter = set(match_types) if match_types else None
+
+        # term_id -> (매칭 점수, 매칭 종류)
+        matches: Dict[int, Tuple[float, str]] = {}
+
+        def consider(term_id: int, score: float, match_type: str):
+            if type_filter and match_type not in type_filter:
+                return
+            if score > matches.get(term_id, (0.0, ''))[0]:
+                matches[term_id] = (score, match_type)
+
+        exact_id = self.term_ids.get(query)
+        if exact_id is not None:
+            consider(exact_id, 1.0, 'exact')
+
+        for term_id in self.prefix_index.get(query[:self.max_prefix_length], ()):
+            term = self.terms[term_id]
+            if term.startswith(query) and term_id != exact_id:
+                consider(term_id, 0.6 + 0.35 * len(query) / len(term), 'prefix')
+
+        if len(query) >= 2:
+            for term_id in self._infix_terms(query):
+                if term_id != exact_id:
+                    consider(term_id, 0.4 + 0.3 * len(query) / len(self.terms[term_id]), 'infix')
+            for term_id in self._contained_terms(query):
+                if term_id != exact_id:
+                    consider(term_id, 0.5 + 0.3 * len(self.terms[term_id]) / len(query), 'contained')
+
+        # 항목 단위 최고 점수
+        best: Dict[int, Tuple[float, str, str, str]] = {}
+        for term_id, (match_score, match_type) in matches.items():
+            term = self.terms[term_id]
+            for entry_id, kind in self.term_entries[term_id]:
+                entry = self.entries[entry_id]
+                if level_filter and entry['level'] not in level_filter:
+                    continue
+                score = match_score * TERM_WEIGHTS.get(kind, 0.9)
+                if score > best.get(entry_id, (0.0,))[0]:
+                    best[entry_id] = (score, match_type, term, kind)
+
+        ranked = sorted(
+            best.items(),
+            key=lambda item: (-item[1][0], LEVEL_ORDER.get(self.entries[item[0]]['level'], 99), self.entries[item[0]]['name'])
+        )
+
+        results = []
+        for entry_id, (score, match_type, term, kind) in ranked[:limit]:
+            result = dict(self.entries[entry_id])
+            result.update({
+                'matched_term': term,
+                'match_type': match_type,
+                'historical': kind == 'historical',
+                'score': round(score, 4)
+            })
+            results.append(result)
+        return results
+
+    def resolve(self, query: str, limit: int = 10, levels: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """후보와 함께 선택 필요 여부(최고 점수 동점) 반환"""
+        started = time.perf_counter()
+        candidates = self.search(query, limit=limit, levels=levels)
+        top_score = candidates[0]['score'] if candidates else 0.0
+        top = [candidate for candidate in candidates if candidate['score'] == top_score]
+        return {
+            'query': query,
+            'candidates': candidates,
+            'requires_selection': len(top) > 1,
+            'best': top[0] if len(top) == 1 else None,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 3)
+        }
+
+    def stats(self) -> Dict[str, int]:
+        """색인 통계"""
+        return {
+            'entries': len(self.entries),
+            'terms': len(self.terms),
+            'prefix_keys': len(self.prefix_index),
+            'bigram_keys': len(self.bigram_index)
+        }
@@ -9,6 +9,8 @@ import re
 from difflib import SequenceMatcher
 import logging
 
+from hangul_name_index import HangulNameIndex, is_choseong_query, to_jamo
+
 logger = logging.getLogger(__name__)
 
 class PoliticianSearchService:
@@ -57,8 +59,12 @@ class PoliticianSearchService:
     def create_search_index(self):
         """검색 인덱스 생성"""
         self.search_index = {}
+        # 부분 문자열/초성/자모 BK-tree 색인 (유사 검색용)
+        self.name_index = HangulNameIndex(max_fuzzy_distance=3)
         
         for name, info in self.politicians.items():
+            self.name_index.add(name, info)
+            
             # 기본 이름
             self.add_to_index(name, name, info)
             
@@ -84,7 +90,7 @@ class PoliticianSearchService:
                 district_search = f"{name} {district}"
                 self.add_to_index(district_search, name, info)
         
-        logger.info(f"검색 인덱스 구축: {len(self.search_index)}개 키워드")
+        logger.info(f"검색 인덱스 구축: {len(self.search_index)}개 키워드, 이름 색인 {self.name_index.stats()}")
     
     def add_to_index(self, keyword, politician_name, politician_info):
         """검색 인덱스에 키워드 추가"""
@@ -154,11 +160,12 @@ class PoliticianSearchService:
         ]
         
         query_lower = query.lower()
+        contains_politician = bool(self.name_index.contained_in(query))
         
         # 금지된 키워드만으로 구성된 검색어 차단
         if any(keyword in query_lower for keyword in forbidden_keywords):
             # 하지만 정치인 이름이 포함되어 있으면 허용
-            if not any(name in query for name in self.politician_names):
+            if not contains_politician:
                 return False
         
         # 한글 이름 패턴 체크 (2-4글자 한글)
@@ -166,8 +173,12 @@ class PoliticianSearchService:
         if re.match(korean_name_pattern, query.strip()):
             return True
         
+        # 초성 검색어 허용 (ㄱㄱㅅ, 강ㄱㅅ)
+        if is_choseong_query(query):
+            return True
+        
         # 정치인 이름이 포함된 복합 검색어 허용
-        if any(name in query for name in self.politician_names):
+        if contains_politician:
             return True
         
         return False
@@ -189,33 +200,42 @@ class PoliticianSearchService:
                     })
         
         # 완전 일치하는 이름 직접 검색
-        for name in self.politician_names:
-            if name == query:
-                if name not in [r['name'] for r in results]:
-                    results.append({
-                        'name': name,
-                        'info': self.politicians[name],
-                        'match_score': 1.0,
-                        'match_type': 'exact'
-                    })
+        if query in self.politicians and query not in [r['name'] for r in results]:
+            results.append({
+                'name': query,
+                'info': self.politicians[query],
+                'match_score': 1.0,
+                'match_type': 'exact'
+            })
         
         return results
     
     def find_similar_matches(self, query, max_results=5):
         """유사한 이름 검색"""
         results = []
+        query_lower = query.lower()
         
-        for name in self.politician_names:
-            # 문자열 유사도 계산
-            similarity = SequenceMatcher(None, query.lower(), name.lower()).ratio()
-            
-            # 부분 문자열 매칭
-            if query.lower() in name.lower() or name.lower() in query.lower():
-                similarity = max(similarity, 0.8)
-            
-            # 초성 매칭 (ㄱㄱㅅ = 강경숙)
-            if self.match_initials(query, name):
-                similarity = max(similarity, 0.7)
+        # 색인에서 후보만 수집 (전체 이름 순회 없음)
+        candidates = {}
+        
+        # 자모 편집 거리 (오타 허용)
+        for name, jamo_similarity in self.name_index.fuzzy(query_lower):
+            candidates[name] = max(candidates.get(name, 0), jamo_similarity)
+        
+        # 부분 문자열 매칭
+        for name in self.name_index.containing(query_lower) | self.name_index.contained_in(query_lower):
+            candidates[name] = max(candidates.get(name, 0), 0.8)
+        
+        # 초성 매칭 (ㄱㄱㅅ = 강경숙)
+        if is_choseong_query(query):
+            for name in self.name_index.by_choseong(query, prefix=True):
+                candidates[name] = max(candidates.get(name, 0), 0.65)
+            for name in self.name_index.by_choseong(query):
+                candidates[name] = max(candidates.get(name, 0), 0.7)
+        
+        for name, index_score in candidates.items():
+            # 문자열 유사도 계산 (후보에 대해서만)
+            similarity = max(SequenceMatcher(None, query_lower, name.lower()).ratio(), index_score)
             
             # 유사도 임계값 (0.6 이상)
             if similarity >= 0.6:
@@ -232,28 +252,22 @@ class PoliticianSearchService:
         return results[:max_results]
     
     def match_initials(self, query, name):
-        """초성 매칭 (ㄱㄱㅅ = 강경숙)"""
-        # 한글 초성 추출
-        initials_map = {
-            'ㄱ': ['가', '나'], 'ㄴ': ['나', '다'], 'ㄷ': ['다', '라'], 'ㄹ': ['라', '마'],
-            'ㅁ': ['마', '바'], 'ㅂ': ['바', '사'], 'ㅅ': ['사', '아'], 'ㅇ': ['아', '자'],
-            'ㅈ': ['자', '차'], 'ㅊ': ['차', '카'], 'ㅋ': ['카', '타'], 'ㅌ': ['타', '파'],
-            'ㅍ': ['파', '하'], 'ㅎ': ['하', '힣']
-        }
-        
-        # 간단한 초성 매칭 (정확한 구현은 복잡함)
-        if len(query) == len(name) and all(c in 'ㄱㄴㄷㄹㅁㅂㅅㅇㅈㅊㅋㅌㅍㅎ' for c in query):
-            return True
-        
-        return False
+        """초성 매칭 (ㄱㄱㅅ = 강경숙, 강ㄱㅅ = 강경숙)"""
+        return is_choseong_query(query) and name in self.name_index.by_choseong(query)
     
     def suggest_politicians(self, query):
         """검색어와 유사한 정치인 추천"""
         suggestions = []
+        query_lower = query.lower()
+        
+        # 검색어 길이에 비례한 자모 편집 거리 후보 (짧은 검색어는 거의 모든 이름과 가까우므로 최대 2) + 부분 문자열 후보
+        max_distance = min(2, len(to_jamo(query_lower)) // 3)
+        candidates = {name for name, _ in self.name_index.fuzzy(query_lower, max_distance=max_distance)}
+        candidates |= self.name_index.contained_in(query_lower)
         
-        for name in self.politician_names:
+        for name in candidates:
             # 편집 거리 기반 유사도
-            similarity = SequenceMatcher(None, query.lower(), name.lower()).ratio()
+            similarity = SequenceMatcher(None, query_lower, name.lower()).ratio()
             
             if similarity >= 0.3:  # 낮은 임계값으로 추천
                 suggestions.append({
@@ -355,6 +369,7 @@ class PoliticianSearchService:
             'total_politicians': len(self.politicians),
             'total_parties': len(self.get_parties_list()),
             'search_index_size': len(self.search_index),
+            'name_index': self.name_index.stats(),
             'searchable_keywords': list(self.search_index.keys())[:10]  # 샘플
         }
 
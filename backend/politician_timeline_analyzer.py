@@ -14,10 +14,14 @@ from datetime import datetime, timedelta
 import hashlib
 from collections import defaultdict
 
+from speech_search_index import SpeechSearchIndex
+
 class PoliticianTimelineAnalyzer:
-    def __init__(self, meeting_data_path: str, batch_size: int = 20):
+    def __init__(self, meeting_data_path: str, batch_size: int = 20,
+                 speech_index: Optional[SpeechSearchIndex] = None):
         self.meeting_data_path = meeting_data_path
         self.batch_size = batch_size
+        self.speech_index = speech_index  # 회의록 DB 발언 색인 (있으면 엑셀 재파싱 없이 조회)
         
         # 시간축별 데이터 저장
         self.current_news = {}  # 현재 뉴스 (실시간)
@@ -83,6 +87,36 @@ class PoliticianTimelineAnalyzer:
             'next_start': end_index
         }
     
+    def load_historical_speeches_from_index(self, member_names: Optional[List[str]] = None) -> Dict:
+        """발언 색인에서 과거 발언 통계 로드 (의원별 색인 조회, 발언 전문 재탐색 없음)"""
+        if self.speech_index is None:
+            return {'processed_count': 0, 'total_speeches': len(self.historical_speeches)}
+        
+        self.speech_index.sync()
+        names = member_names if member_names is not None else list(self.current_politicians)
+        
+        processed_count = 0
+        for member_name in names:
+            stats = self.speech_index.speaker_stats(member_name)
+            if not stats['total_speeches']:
+                continue
+            
+            # 현재 주요 이슈별 발언 수
+            key_issues = self.current_politicians.get(member_name, {}).get('key_issues', [])
+            self.historical_speeches[member_name] = {
+                'source': 'speech_index',
+                'speeches': [],
+                'total_speeches': stats['total_speeches'],
+                'avg_speech_length': stats['avg_speech_length'],
+                'issue_mentions': self.speech_index.keyword_counts(key_issues, speaker=member_name),
+                'date_range': {'start': None, 'end': None},
+                'last_updated': datetime.now().isoformat()
+            }
+            processed_count += 1
+        
+        print(f"📊 색인 기반 과거 발화록 로드 완료: {processed_count}명")
+        return {'processed_count': processed_count, 'total_speeches': len(self.historical_speeches)}
+    
     def load_current_politicians(self, politician_list: List[Dict]) -> Dict:
         """현재 의원 정보 로드 (현재 상태)"""
         print("👥 현재 의원 정보 로드 중...")
@@ -176,9 +210,13 @@ class PoliticianTimelineAnalyzer:
         elif speech_count > 20 or news_mentions > 2:
             analysis['activity_level'] = 'medium'
         
-        # 이슈 포커스 분석
+        # 이슈 포커스 분석 (색인 기반 발언 수가 있으면 많이 언급한 이슈 순)
         current_info = timeline.get('current_info', {})
         analysis['issue_focus'] = current_info.get('key_issues', [])
+        issue_mentions = timeline.get('historical_speeches', {}).get('issue_mentions')
+        if issue_mentions:
+            analysis['issue_focus'] = sorted(analysis['issue_focus'],
+                                             key=lambda issue: -issue_mentions.get(issue, 0))
         
         # 트렌드 방향 분석
         if news_mentions > speech_count / 10:
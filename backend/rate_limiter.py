@@ -1,102 +1,250 @@
+import os
+import json
 import time
-from collections import defaultdict, deque
-from typing import Dict, Optional
+import zlib
+import ipaddress
+from typing import Dict, Iterable, List, Optional, Union
 import threading
 
-class RateLimiter:
-    """DDoS 방지를 위한 Rate Limiter"""
-    
+Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+class _SlidingWindow:
+    """슬라이딩 윈도 카운터 (직전/현재 고정 구간 2개로 근사, 요청 수와 무관하게 O(1))"""
+
+    __slots__ = ('size', 'start', 'current', 'previous')
+
+    def __init__(self, size: float):
+        self.size = size
+        self.start = 0.0
+        self.current = 0
+        self.previous = 0
+
+    def _roll(self, now: float):
+        window_start = now - (now % self.size)
+        if window_start != self.start:
+            # 바로 다음 구간이면 현재 → 직전, 더 지났으면 둘 다 0
+            self.previous = self.current if window_start - self.start == self.size else 0
+            self.current = 0
+            self.start = window_start
+
+    def add(self, now: float, count: int = 1) -> float:
+        """요청 기록 후 추정 요청 수 반환"""
+        self._roll(now)
+        self.current += count
+        return self.estimate(now)
+
+    def estimate(self, now: float) -> float:
+        self._roll(now)
+        elapsed_ratio = (now - self.start) / self.size
+        return self.previous * (1 - elapsed_ratio) + self.current
+
+    def idle_since(self, now: float) -> bool:
+        """두 구간 넘게 요청이 없었는지 (정리 대상)"""
+        return now - self.start >= 2 * self.size
+
+class _ClientState:
+    __slots__ = ('minute', 'hour')
+
+    def __init__(self):
+        self.minute = _SlidingWindow(60)
+        self.hour = _SlidingWindow(3600)
+
+class _Shard:
+    """IP 일부를 담당하는 샤드 (샤드별 락)"""
+
     def __init__(self):
-        # IP별 요청 기록
-        self.ip_requests = defaultdict(lambda: deque())
-        # IP별 차단 상태
-        self.blocked_ips = set()
-        # 락 (thread-safe)
         self.lock = threading.Lock()
-        
-        # 설정값
-        self.max_requests_per_minute = 60  # 분당 최대 요청 수
-        self.max_requests_per_hour = 1000  # 시간당 최대 요청 수
-        self.block_duration = 3600  # 차단 시간 (초)
-        self.cleanup_interval = 300  # 정리 간격 (초)
-        
-        # 마지막 정리 시간
+        self.clients: Dict[str, _ClientState] = {}
+        self.blocked_until: Dict[str, float] = {}
+        self.requests = _SlidingWindow(60)  # 샤드 전체 분당 요청 (통계용)
         self.last_cleanup = time.time()
-    
+
+class RateLimiter:
+    """DDoS 방지를 위한 Rate Limiter
+
+    IP별 분/시간 슬라이딩 윈도 카운터로 판정하므로 요청 확인 비용이 IP의 요청 수와 무관하다.
+    IP를 해시로 샤드에 나눠 샤드별 락만 잡고, 차단은 IP마다 block_duration 후 만료된다.
+    """
+
+    def __init__(self, max_requests_per_minute: int = 60, max_requests_per_hour: int = 1000,
+                 block_duration: int = 3600, cleanup_interval: int = 300, shards: int = 16):
+        # 설정값
+        self.max_requests_per_minute = max_requests_per_minute  # 분당 최대 요청 수
+        self.max_requests_per_hour = max_requests_per_hour  # 시간당 최대 요청 수
+        self.block_duration = block_duration  # 차단 시간 (초)
+        self.cleanup_interval = cleanup_interval  # 정리 간격 (초)
+
+        self.shards: List[_Shard] = [_Shard() for _ in range(shards)]
+
+    def _shard(self, ip: str) -> _Shard:
+        return self.shards[zlib.crc32(ip.encode('utf-8')) % len(self.shards)]
+
     def is_allowed(self, ip: str) -> tuple[bool, str]:
         """IP가 요청을 허용받을 수 있는지 확인"""
         current_time = time.time()
-        
-        with self.lock:
-            # 차단된 IP 확인
-            if ip in self.blocked_ips:
-                return False, "IP가 차단되었습니다. 잠시 후 다시 시도해주세요."
-            
-            # 정리 작업 (5분마다)
-            if current_time - self.last_cleanup > self.cleanup_interval:
-                self._cleanup_old_requests(current_time)
-                self.last_cleanup = current_time
-            
+        shard = self._shard(ip)
+
+        with shard.lock:
+            # 차단된 IP 확인 (만료된 차단은 해제)
+            blocked_until = shard.blocked_until.get(ip)
+            if blocked_until is not None:
+                if blocked_until > current_time:
+                    return False, "IP가 차단되었습니다. 잠시 후 다시 시도해주세요."
+                del shard.blocked_until[ip]
+                shard.clients.pop(ip, None)  # 차단 해제 후에는 새로 집계
+
+            # 정리 작업 (샤드별 5분마다)
+            if current_time - shard.last_cleanup > self.cleanup_interval:
+                self._cleanup_shard(shard, current_time)
+
             # 요청 기록 추가
-            self.ip_requests[ip].append(current_time)
-            
+            state = shard.clients.get(ip)
+            if state is None:
+                state = shard.clients[ip] = _ClientState()
+            shard.requests.add(current_time)
+
             # 분당 요청 수 확인
-            minute_ago = current_time - 60
-            recent_requests = [req_time for req_time in self.ip_requests[ip] if req_time > minute_ago]
-            
-            if len(recent_requests) > self.max_requests_per_minute:
-                self.blocked_ips.add(ip)
+            if state.minute.add(current_time) > self.max_requests_per_minute:
+                state.hour.add(current_time)
+                shard.blocked_until[ip] = current_time + self.block_duration
                 return False, "분당 요청 한도를 초과했습니다. IP가 차단되었습니다."
-            
+
             # 시간당 요청 수 확인
-            hour_ago = current_time - 3600
-            hourly_requests = [req_time for req_time in self.ip_requests[ip] if req_time > hour_ago]
-            
-            if len(hourly_requests) > self.max_requests_per_hour:
-                self.blocked_ips.add(ip)
+            if state.hour.add(current_time) > self.max_requests_per_hour:
+                shard.blocked_until[ip] = current_time + self.block_duration
                 return False, "시간당 요청 한도를 초과했습니다. IP가 차단되었습니다."
-            
+
             return True, "요청이 허용되었습니다."
-    
-    def _cleanup_old_requests(self, current_time: float):
-        """오래된 요청 기록 정리"""
-        cutoff_time = current_time - 3600  # 1시간 이전
-        
-        for ip in list(self.ip_requests.keys()):
-            # 1시간 이전 요청들 제거
-            self.ip_requests[ip] = deque(
-                req_time for req_time in self.ip_requests[ip] 
-                if req_time > cutoff_time
-            )
-            
-            # 빈 deque 제거
-            if not self.ip_requests[ip]:
-                del self.ip_requests[ip]
-        
-        # 차단 시간이 지난 IP들 해제
-        self.blocked_ips.clear()  # 간단하게 모든 차단 해제
-    
+
+    def retry_after(self, ip: str) -> int:
+        """차단 해제까지 남은 초 (차단되지 않았으면 0)"""
+        shard = self._shard(ip)
+        with shard.lock:
+            blocked_until = shard.blocked_until.get(ip)
+        return max(0, int(blocked_until - time.time()) + 1) if blocked_until else 0
+
+    def _cleanup_shard(self, shard: _Shard, current_time: float):
+        """오래된 요청 기록 / 만료된 차단 정리 (샤드 락 안에서 호출)"""
+        for ip in [ip for ip, state in shard.clients.items() if state.hour.idle_since(current_time)]:
+            del shard.clients[ip]
+        for ip in [ip for ip, until in shard.blocked_until.items() if until <= current_time]:
+            del shard.blocked_until[ip]
+        shard.last_cleanup = current_time
+
+    def unblock(self, ip: str) -> bool:
+        shard = self._shard(ip)
+        with shard.lock:
+            shard.clients.pop(ip, None)
+            return shard.blocked_until.pop(ip, None) is not None
+
+    def reset(self):
+        """모든 기록/차단 초기화 (관리자용)"""
+        for shard in self.shards:
+            with shard.lock:
+                shard.clients.clear()
+                shard.blocked_until.clear()
+                shard.requests = _SlidingWindow(60)
+
     def get_stats(self) -> Dict:
-        """현재 상태 통계 반환"""
-        with self.lock:
-            current_time = time.time()
-            active_ips = len(self.ip_requests)
-            blocked_count = len(self.blocked_ips)
-            
-            # 최근 1분간 총 요청 수
-            minute_ago = current_time - 60
-            recent_requests = sum(
-                len([req_time for req_time in requests if req_time > minute_ago])
-                for requests in self.ip_requests.values()
-            )
-            
-            return {
-                "active_ips": active_ips,
-                "blocked_ips": blocked_count,
-                "recent_requests_per_minute": recent_requests,
-                "max_requests_per_minute": self.max_requests_per_minute,
-                "max_requests_per_hour": self.max_requests_per_hour
-            }
+        """현재 상태 통계 반환 (샤드별 집계값 합산, IP 기록은 다시 훑지 않음)"""
+        current_time = time.time()
+        active_ips = 0
+        blocked_count = 0
+        recent_requests = 0.0
+        for shard in self.shards:
+            with shard.lock:
+                active_ips += len(shard.clients)
+                blocked_count += sum(1 for until in shard.blocked_until.values() if until > current_time)
+                recent_requests += shard.requests.estimate(current_time)
+
+        return {
+            "active_ips": active_ips,
+            "blocked_ips": blocked_count,
+            "recent_requests_per_minute": int(round(recent_requests)),
+            "max_requests_per_minute": self.max_requests_per_minute,
+            "max_requests_per_hour": self.max_requests_per_hour,
+            "shards": len(self.shards)
+        }
+
+def parse_trusted_proxies(value: Optional[str] = None) -> List[Network]:
+    """신뢰 프록시 목록 ("10.0.0.0/8,127.0.0.1") - 기본값은 TRUSTED_PROXIES 환경변수"""
+    if value is None:
+        value = os.environ.get("TRUSTED_PROXIES", "")
+    networks = []
+    for item in value.split(","):
+        item = item.strip()
+        if item:
+            networks.append(ipaddress.ip_network(item, strict=False))
+    return networks
+
+def _is_trusted(host: str, trusted_proxies: Iterable[Network]) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in trusted_proxies)
+
+def client_ip_from_scope(scope: Dict, trusted_proxies: Iterable[Network] = ()) -> str:
+    """ASGI scope에서 클라이언트 IP
+
+    X-Forwarded-For는 누구나 보낼 수 있으므로 직접 연결한 상대가 신뢰 프록시일 때만 사용하고,
+    그 경우에도 오른쪽(가까운 쪽)부터 신뢰 프록시가 아닌 첫 주소를 고른다.
+    """
+    client = scope.get("client")
+    host = client[0] if client else "unknown"
+    trusted_proxies = list(trusted_proxies)
+    if not trusted_proxies or not _is_trusted(host, trusted_proxies):
+        return host
+
+    forwarded: List[str] = []
+    for name, value in scope.get("headers") or []:
+        if name == b"x-forwarded-for":
+            forwarded.extend(part.strip() for part in value.decode("latin-1").split(","))
+    for address in reversed([address for address in forwarded if address]):
+        if not _is_trusted(address, trusted_proxies):
+            return address
+    return host
+
+class RateLimitMiddleware:
+    """ASGI 미들웨어: app.add_middleware(RateLimitMiddleware, limiter=rate_limiter)"""
+
+    def __init__(self, app, limiter: Optional[RateLimiter] = None, exempt_paths: Iterable[str] = (),
+                 trusted_proxies: Optional[Iterable[str]] = None):
+        self.app = app
+        self.limiter = limiter or rate_limiter
+        self.exempt_paths = frozenset(exempt_paths)
+        # 신뢰 프록시를 지정하지 않으면 TRUSTED_PROXIES 환경변수, 둘 다 없으면 X-Forwarded-For 무시
+        self.trusted_proxies = (parse_trusted_proxies(",".join(trusted_proxies))
+                                if trusted_proxies is not None else parse_trusted_proxies())
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("path") in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        client_ip = client_ip_from_scope(scope, self.trusted_proxies)
+        is_allowed, message = self.limiter.is_allowed(client_ip)
+        if is_allowed:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = self.limiter.retry_after(client_ip) or 60
+        body = json.dumps({
+            "success": False,
+            "error": "Rate limit exceeded",
+            "message": message,
+            "retry_after": retry_after
+        }, ensure_ascii=False).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json; charset=utf-8"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
 
 # 전역 Rate Limiter 인스턴스
 rate_limiter = RateLimiter()
@@ -18,6 +18,9 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 import random
 
+from cache_engine import BoundedLRUCache, CacheBudget, resolve_memory_limit
+from place_name_index import PlaceNameIndex
+
 logger = logging.getLogger(__name__)
 
 class RealDongNameCacheSystem:
@@ -33,18 +36,27 @@ class RealDongNameCacheSystem:
         self.total_max_size = 280 * 1024 * 1024         # 280MB
         
         # 캐시 저장소
-        self.politician_cache = {}  # 실제 정치인 정보
-        self.dong_cache = {}        # 실제 동명 정보
-        self.metadata_cache = {}    # 메타데이터
+        # 공유 바이트 예산: 항목 크기는 삽입 시 한 번만 기록, 하드 리밋 초과 시 LRU 제거
+        # (CACHE_MEMORY_LIMIT_MB 환경변수로 렌더 플랜 메모리에 맞게 조정)
+        self.cache_budget = CacheBudget('real_dong_name', resolve_memory_limit(self.total_max_size))
+        self.politician_cache = BoundedLRUCache('politician', budget=self.cache_budget)  # 실제 정치인 정보
+        self.dong_cache = BoundedLRUCache('dong', budget=self.cache_budget)        # 실제 동명 정보
+        self.metadata_cache = BoundedLRUCache('metadata', budget=self.cache_budget)    # 메타데이터
         
         # 실제 데이터 로드
         self.real_politicians = []
         self.real_dong_names = []
         self.dong_to_constituency = {}  # 동명 → 선거구 매핑
         self.dong_to_politician = {}    # 동명 → 국회의원 매핑
+        self.politicians_by_name = {}   # 이름 → 정치인
+        
+        # 검색 색인 (접두/부분 일치)
+        self.dong_index = PlaceNameIndex()
+        self.politician_index = PlaceNameIndex()
         
         self.load_real_data()
         self.generate_dong_database()
+        self._build_search_indexes()
         
         # NLP 패턴 (수정)
         self.politician_name_patterns = [
@@ -76,11 +88,13 @@ class RealDongNameCacheSystem:
                     politician_photos = json.load(f)
                     
                 for name, photo_url in politician_photos.items():
-                    self.real_politicians.append({
+                    politician = {
                         'name': name,
                         'photo_url': photo_url,
                         'source': 'real_assembly_data'
-                    })
+                    }
+                    self.real_politicians.append(politician)
+                    self.politicians_by_name.setdefault(name, politician)
             
             # fallback 데이터에서 선거구 정보 추가
             fallback_file = '/Users/hopidaay/newsbot-kr/frontend/data/fallback_politicians.js'
@@ -104,11 +118,10 @@ class RealDongNameCacheSystem:
                                 party = party_match.group(1) if party_match else '정당정보없음'
                                 
                                 # 기존 정치인 정보 업데이트
-                                for politician in self.real_politicians:
-                                    if politician['name'] == name:
-                                        politician['district'] = district
-                                        politician['party'] = party
-                                        break
+                                politician = self.politicians_by_name.get(name)
+                                if politician:
+                                    politician['district'] = district
+                                    politician['party'] = party
                         except:
                             continue
             
@@ -236,6 +249,22 @@ class RealDongNameCacheSystem:
         logger.info(f"  🗺️ 동명→선거구 매핑: {len(self.dong_to_constituency)}개")
         logger.info(f"  🏛️ 동명→국회의원 매핑: {len(self.dong_to_politician)}개")
 
+    def _build_search_indexes(self):
+        """동명/정치인 검색 색인 구축"""
+        
+        for dong_info in self.real_dong_names:
+            self.dong_index.add(
+                dong_info['dong_name'], 'dong',
+                key=dong_info['full_address'],
+                parents={'sido': dong_info['sido'], 'sigungu': dong_info['sigungu'], 'gu': dong_info['gu']},
+                payload=dong_info
+            )
+        
+        for politician in self.real_politicians:
+            self.politician_index.add(politician['name'], 'politician', payload=politician, stem_aliases=False)
+        
+        logger.info(f"  🔍 검색 색인: 동 {self.dong_index.stats()['terms']}개 용어, 정치인 {len(self.politician_index.entries)}명")
+
     def _map_dong_to_constituency(self, sido: str, sigungu: str, gu: Optional[str], dong: str) -> str:
         """동명을 선거구로 매핑"""
         
@@ -307,13 +336,11 @@ class RealDongNameCacheSystem:
         search_term = search_term.strip()
         
         # 1단계: 실제 데이터에서 직접 매칭
-        for politician in self.real_politicians:
-            if politician['name'] == search_term:
-                return ('politician', 1.0)
+        if search_term in self.politicians_by_name:
+            return ('politician', 1.0)
         
-        for dong_info in self.real_dong_names:
-            if dong_info['dong_name'] == search_term:
-                return ('dong', 1.0)
+        if self.dong_index.exact(search_term, names_only=True):
+            return ('dong', 1.0)
         
         # 2단계: 패턴 기반 분류
         # 동명 패턴 확인 (더 구체적)
@@ -328,14 +355,12 @@ class RealDongNameCacheSystem:
         
         # 3단계: 부분 매칭
         # 동명 부분 매칭
-        for dong_info in self.real_dong_names:
-            if search_term in dong_info['dong_name'] or dong_info['dong_name'] in search_term:
-                return ('dong', 0.7)
+        if self.dong_index.search(search_term, limit=1):
+            return ('dong', 0.7)
         
         # 정치인 부분 매칭
-        for politician in self.real_politicians:
-            if search_term in politician['name'] or politician['name'] in search_term:
-                return ('politician', 0.6)
+        if self.politician_index.search(search_term, limit=1):
+            return ('politician', 0.6)
         
         # 기본값: 동명으로 분류 (지역 검색이 더 일반적)
         return ('dong', 0.5)
@@ -636,13 +661,13 @@ class RealDongNameCacheSystem:
             self._load_dong_metadata_cache()
             
             # 최종 통계
-            total_cache_size = current_size + dong_current_size + self._get_cache_size(self.metadata_cache)
+            total_cache_size = current_size + dong_current_size + self.metadata_cache.size_bytes
             utilization = (total_cache_size / self.total_max_size) * 100
             
             logger.info(f"✅ 실제 동명 캐시 로드 완료:")
             logger.info(f"  👥 정치인: {politician_count}명, {current_size / 1024 / 1024:.1f}MB")
             logger.info(f"  🏘️ 동명: {dong_count}개, {dong_current_size / 1024 / 1024:.1f}MB")
-            logger.info(f"  📋 메타데이터: {self._get_cache_size(self.metadata_cache) / 1024 / 1024:.1f}MB")
+            logger.info(f"  📋 메타데이터: {self.metadata_cache.size_bytes / 1024 / 1024:.1f}MB")
             logger.info(f"  💾 총 사용량: {total_cache_size / 1024 / 1024:.1f}MB ({utilization:.1f}%)")
             
             return True
@@ -712,16 +737,6 @@ class RealDongNameCacheSystem:
         
         self.metadata_cache['dong_metadata'] = json_str.encode('utf-8')
 
-    def _get_cache_size(self, cache_dict: Dict) -> int:
-        """캐시 크기 계산"""
-        total_size = 0
-        for key, value in cache_dict.items():
-            if isinstance(value, bytes):
-                total_size += len(value)
-            else:
-                total_size += len(str(value).encode('utf-8'))
-        return total_size
-
     async def smart_search_dong_politician(self, search_term: str) -> Dict[str, Any]:
         """동명/정치인 스마트 검색"""
         
@@ -776,10 +791,7 @@ class RealDongNameCacheSystem:
             }
         else:
             # 유사 이름 검색
-            similar_politicians = []
-            for politician in self.real_politicians:
-                if politician_name in politician['name'] or politician['name'] in politician_name:
-                    similar_politicians.append(politician['name'])
+            similar_politicians = [match['name'] for match in self.politician_index.search(politician_name, limit=5)]
             
             return {
                 'success': False,
@@ -808,10 +820,7 @@ class RealDongNameCacheSystem:
             }
         else:
             # 유사 동명 검색
-            similar_dongs = []
-            for dong_info in self.real_dong_names:
-                if dong_name in dong_info['dong_name'] or dong_info['dong_name'] in dong_name:
-                    similar_dongs.append(dong_info['dong_name'])
+            similar_dongs = [match['name'] for match in self.dong_index.search(dong_name, limit=5)]
             
             return {
                 'success': False,
@@ -824,9 +833,9 @@ class RealDongNameCacheSystem:
     def get_dong_cache_statistics(self) -> Dict[str, Any]:
         """동명 캐시 통계"""
         
-        politician_size = self._get_cache_size(self.politician_cache)
-        dong_size = self._get_cache_size(self.dong_cache)
-        metadata_size = self._get_cache_size(self.metadata_cache)
+        politician_size = self.politician_cache.size_bytes
+        dong_size = self.dong_cache.size_bytes
+        metadata_size = self.metadata_cache.size_bytes
         total_size = politician_size + dong_size + metadata_size
         
         return {
@@ -837,6 +846,7 @@ class RealDongNameCacheSystem:
                 'dong_cache_mb': round(dong_size / 1024 / 1024, 2),
                 'metadata_cache_mb': round(metadata_size / 1024 / 1024, 2)
             },
+            'memory_budget': self.cache_budget.stats(),
             'data_coverage': {
                 'real_politicians': len(self.real_politicians),
                 'real_dong_names': len(self.real_dong_names),
@@ -18,6 +18,8 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 import random
 
+from cache_engine import BoundedLRUCache, CacheBudget, resolve_memory_limit
+
 logger = logging.getLogger(__name__)
 
 class RealPoliticianRegionCacheSystem:
@@ -33,9 +35,12 @@ class RealPoliticianRegionCacheSystem:
         self.total_max_size = 280 * 1024 * 1024         # 280MB
         
         # 캐시 저장소
-        self.politician_cache = {}  # 실제 정치인 정보
-        self.region_cache = {}      # 실제 지역 정보
-        self.metadata_cache = {}    # 메타데이터
+        # 공유 바이트 예산: 항목 크기는 삽입 시 한 번만 기록, 하드 리밋 초과 시 LRU 제거
+        # (CACHE_MEMORY_LIMIT_MB 환경변수로 렌더 플랜 메모리에 맞게 조정)
+        self.cache_budget = CacheBudget('real_politician_region', resolve_memory_limit(self.total_max_size))
+        self.politician_cache = BoundedLRUCache('politician', budget=self.cache_budget)  # 실제 정치인 정보
+        self.region_cache = BoundedLRUCache('region', budget=self.cache_budget)      # 실제 지역 정보
+        self.metadata_cache = BoundedLRUCache('metadata', budget=self.cache_budget)    # 메타데이터
         
         # 실제 데이터 로드
         self.real_politicians = []
@@ -561,13 +566,13 @@ class RealPoliticianRegionCacheSystem:
             self._load_real_metadata_cache()
             
             # 최종 통계
-            total_cache_size = current_size + region_current_size + self._get_cache_size(self.metadata_cache)
+            total_cache_size = current_size + region_current_size + self.metadata_cache.size_bytes
             utilization = (total_cache_size / self.total_max_size) * 100
             
             logger.info(f"✅ 실제 데이터 캐시 로드 완료:")
             logger.info(f"  👥 정치인: {politician_count}명, {current_size / 1024 / 1024:.1f}MB")
             logger.info(f"  🗺️ 지역: {region_count}개, {region_current_size / 1024 / 1024:.1f}MB")
-            logger.info(f"  📋 메타데이터: {self._get_cache_size(self.metadata_cache) / 1024 / 1024:.1f}MB")
+            logger.info(f"  📋 메타데이터: {self.metadata_cache.size_bytes / 1024 / 1024:.1f}MB")
             logger.info(f"  💾 총 사용량: {total_cache_size / 1024 / 1024:.1f}MB ({utilization:.1f}%)")
             
             return True
@@ -612,16 +617,6 @@ class RealPoliticianRegionCacheSystem:
         except Exception as e:
             logger.error(f"❌ 메타데이터 캐시 로드 실패: {e}")
 
-    def _get_cache_size(self, cache_dict: Dict) -> int:
-        """캐시 크기 계산"""
-        total_size = 0
-        for key, value in cache_dict.items():
-            if isinstance(value, bytes):
-                total_size += len(value)
-            else:
-                total_size += len(str(value).encode('utf-8'))
-        return total_size
-
     async def smart_search(self, search_term: str) -> Dict[str, Any]:
         """스마트 검색 (정치인/지명 자동 판별)"""
         
@@ -732,9 +727,9 @@ class RealPoliticianRegionCacheSystem:
     def get_real_cache_statistics(self) -> Dict[str, Any]:
         """실제 데이터 캐시 통계"""
         
-        politician_size = self._get_cache_size(self.politician_cache)
-        region_size = self._get_cache_size(self.region_cache)
-        metadata_size = self._get_cache_size(self.metadata_cache)
+        politician_size = self.politician_cache.size_bytes
+        region_size = self.region_cache.size_bytes
+        metadata_size = self.metadata_cache.size_bytes
         total_size = politician_size + region_size + metadata_size
         
         return {
@@ -745,6 +740,7 @@ class RealPoliticianRegionCacheSystem:
                 'region_cache_mb': round(region_size / 1024 / 1024, 2),
                 'metadata_cache_mb': round(metadata_size / 1024 / 1024, 2)
             },
+            'memory_budget': self.cache_budget.stats(),
             'data_coverage': {
                 'real_politicians': len(self.real_politicians),
                 'real_regions': len(self.real_districts),
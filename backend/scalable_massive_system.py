@@ -14,6 +14,8 @@ import gc
 import hashlib
 from collections import defaultdict
 
+from hangul_name_index import HangulNameIndex, is_choseong_query
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -29,6 +31,7 @@ class ScalableMassiveSystem:
         self.integrated_politicians = []
         self.partitioned_data = {}  # 파티션별 데이터
         self.search_index = {}
+        self.name_index = HangulNameIndex()  # 이름 부분/초성/오타 검색 색인
         self.system_config = {
             'max_batch_size': 2000,
             'partition_size': 5000,
@@ -160,6 +163,7 @@ class ScalableMassiveSystem:
         
         processed_count = 0
         batch_size = self.system_config['memory_cleanup_interval']
+        self.name_index = HangulNameIndex()
         
         for politician in self.integrated_politicians:
             name = politician['name']
@@ -176,6 +180,7 @@ class ScalableMassiveSystem:
                     key=lambda x: x['search_priority'], reverse=True
                 )
                 search_index['by_name'][name.lower()] = search_index['by_name'][name.lower()][:5]
+                self.name_index.add(name, politician)
             
             # 정당별 인덱스
             if party:
@@ -204,12 +209,34 @@ class ScalableMassiveSystem:
             'by_party': dict(search_index['by_party']),
             'by_category': dict(search_index['by_category']),
             'by_political_level': dict(search_index['by_political_level']),
-            'priority_index': dict(search_index['priority_index'])
+            'priority_index': dict(search_index['priority_index']),
+            # 초성 → 이름 목록 (ㄱㄱㅅ → 강경숙, ...)
+            'by_choseong': {key: sorted(names) for key, names in self.name_index.choseong_keys.items()}
         }
         
-        logger.info("✅ 확장 가능한 검색 인덱스 구축 완료")
+        logger.info(f"✅ 확장 가능한 검색 인덱스 구축 완료 (이름 색인: {self.name_index.stats()})")
         return final_index
     
+    def search_by_name(self, query: str, limit: Optional[int] = None) -> List[Dict]:
+        """이름 검색 (정확 → 초성 → 부분 → 오타 순, 우선순위 높은 정치인 먼저)"""
+        limit = limit or self.system_config['max_search_results']
+        query = query.strip()
+        
+        if query in self.name_index:
+            names = [query]
+        elif is_choseong_query(query):
+            names = sorted(self.name_index.by_choseong(query, prefix=True))
+        else:
+            names = sorted(self.name_index.containing(query))
+            if not names:
+                names = [name for name, _ in self.name_index.fuzzy(query)]
+        
+        results = []
+        for name in names:
+            results.extend(self.name_index.get(name))
+        results.sort(key=lambda x: x['search_priority'], reverse=True)
+        return results[:limit]
+    
     def run_scalable_integration(self) -> Dict:
         """확장 가능한 통합 작업을 실행합니다."""
         logger.info("🚀 확장 가능한 대규모 통합 시스템 시작")
@@ -5,10 +5,16 @@ NewsBot 완전 새로운 API 서버 - 정공법 해결 + 렌더 프로세스 관
 
 import json
 import os
-from fastapi import FastAPI, HTTPException
+import asyncio
+from typing import Optional
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 
+from member_store import MemberStore, EncodedBody
+from rate_limiter import RateLimitMiddleware, rate_limiter
+from metrics import MetricsMiddleware, metrics_registry, PROMETHEUS_CONTENT_TYPE
+
 # 렌더 프로세스 관리 임포트
 from render_process_manager import setup_render_process_management, get_render_status, shutdown_render_process
 
@@ -18,6 +24,10 @@ logger = logging.getLogger(__name__)
 
 app = FastAPI(title="NewsBot Clean API", version="1.0.0")
 
+# Rate Limiting (CORS보다 먼저 등록 → 429 응답에도 CORS 헤더가 붙음, 상태 확인 경로는 제외)
+# 클라이언트 키는 연결 주소, X-Forwarded-For는 TRUSTED_PROXIES(렌더 로드밸런서 대역 등)에서 온 요청만 사용
+app.add_middleware(RateLimitMiddleware, limiter=rate_limiter, exempt_paths=("/", "/metrics"))
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -27,58 +37,98 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 전역 데이터
-politicians_data = []
+# 요청 메트릭 (가장 바깥에 등록 → 429 응답까지 기록)
+app.add_middleware(MetricsMiddleware, registry=metrics_registry, exempt_paths=("/metrics",))
 
-def load_clean_data():
-    """깨끗한 데이터 로드"""
-    global politicians_data
-    politicians_data = []  # 초기화
-    
-    # 우선순위 파일들
-    files_to_try = [
-        'final_298_current_assembly.json',
-        'updated_298_current_assembly.json',
-        'verified_22nd_assembly_from_csv.json'
-    ]
-    
-    for filename in files_to_try:
+# 전역 데이터: 항상 완성된 스냅샷 하나만 가리키며 재로드 시 참조만 교체
+member_store = MemberStore([])
+reload_lock = asyncio.Lock()
+
+# 조건부 요청(ETag) 적중 통계 → 메트릭의 캐시 적중률로 노출
+etag_stats = {"hits": 0, "misses": 0}
+metrics_registry.register_cache("member_etag", lambda: etag_stats)
+
+# 우선순위 파일들
+FILES_TO_TRY = [
+    'final_298_current_assembly.json',
+    'updated_298_current_assembly.json',
+    'verified_22nd_assembly_from_csv.json'
+]
+
+# 모든 파일 로드 실패 시 최소 실제 데이터
+FALLBACK_MEMBERS = [
+    {"name": "강경숙", "party": "조국혁신당", "district": "비례대표", "committee": "교육위원회"},
+    {"name": "강대식", "party": "국민의힘", "district": "대구 동구군위군을", "committee": "국방위원회"},
+    {"name": "강득구", "party": "더불어민주당", "district": "경기 안양시만안구", "committee": "환경노동위원회"},
+    {"name": "강명구", "party": "국민의힘", "district": "경북 구미시을", "committee": "농림축산식품해양수산위원회"},
+    {"name": "강민국", "party": "국민의힘", "district": "경남 진주시을", "committee": "정무위원회"},
+    {"name": "이재명", "party": "더불어민주당", "district": "경기 성남시분당구을", "committee": "기획재정위원회"},
+    {"name": "김기현", "party": "국민의힘", "district": "울산 북구", "committee": "정무위원회"},
+    {"name": "정청래", "party": "더불어민주당", "district": "서울 마포구을", "committee": "기획재정위원회"}
+]
+
+def encoded_response(encoded: EncodedBody, request: Request) -> Response:
+    """사전 직렬화된 본문 응답 (If-None-Match 일치 시 304)"""
+    headers = {"ETag": encoded.etag, "Cache-Control": "no-cache"}
+    if encoded.matches(request.headers.get("if-none-match")):
+        etag_stats["hits"] += 1
+        return Response(status_code=304, headers=headers)
+    etag_stats["misses"] += 1
+    return Response(content=encoded.body, media_type="application/json", headers=headers)
+
+def validate_members(data) -> bool:
+    """데이터 검증: 비어있지 않은 목록이며 첫 의원의 이름/정당이 존재"""
+    if not isinstance(data, list) or not data or not isinstance(data[0], dict):
+        return False
+    first_member = data[0]
+    name = str(first_member.get('name', '') or '').strip()
+    party = str(first_member.get('party', '') or '').strip()
+    return bool(name and party)
+
+def build_member_snapshot(version: int) -> MemberStore:
+    """파일을 파싱해 새 스냅샷 생성 (전역 상태를 변경하지 않음, 워커 스레드에서 실행 가능)"""
+    for filename in FILES_TO_TRY:
         try:
             if os.path.exists(filename):
                 with open(filename, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                 
-                # 데이터 검증
-                if data and len(data) > 0:
-                    first_member = data[0]
-                    name = first_member.get('name', '').strip()
-                    party = first_member.get('party', '').strip()
-                    
-                    if name and party:
-                        politicians_data = data
-                        logger.info(f"✅ 데이터 로드 성공: {filename} - {len(data)}명")
-                        logger.info(f"검증 샘플: {name} ({party})")
-                        return True
-                    else:
-                        logger.warning(f"❌ 데이터 품질 문제: {filename}")
-                        continue
+                if validate_members(data):
+                    snapshot = MemberStore(data, version=version, source_file=filename, file_load_success=True)
+                    logger.info(f"✅ 데이터 로드 성공: {filename} - {len(data)}명 (스냅샷 v{version})")
+                    logger.info(f"검증 샘플: {data[0].get('name')} ({data[0].get('party')})")
+                    return snapshot
+                else:
+                    logger.warning(f"❌ 데이터 품질 문제: {filename}")
+                    continue
         except Exception as e:
             logger.error(f"파일 로드 실패: {filename} - {e}")
             continue
     
-    # 모든 파일 로드 실패 시 최소 실제 데이터
     logger.warning("모든 파일 로드 실패, 최소 실제 데이터 사용")
-    politicians_data = [
-        {"name": "강경숙", "party": "조국혁신당", "district": "비례대표", "committee": "교육위원회"},
-        {"name": "강대식", "party": "국민의힘", "district": "대구 동구군위군을", "committee": "국방위원회"},
-        {"name": "강득구", "party": "더불어민주당", "district": "경기 안양시만안구", "committee": "환경노동위원회"},
-        {"name": "강명구", "party": "국민의힘", "district": "경북 구미시을", "committee": "농림축산식품해양수산위원회"},
-        {"name": "강민국", "party": "국민의힘", "district": "경남 진주시을", "committee": "정무위원회"},
-        {"name": "이재명", "party": "더불어민주당", "district": "경기 성남시분당구을", "committee": "기획재정위원회"},
-        {"name": "김기현", "party": "국민의힘", "district": "울산 북구", "committee": "정무위원회"},
-        {"name": "정청래", "party": "더불어민주당", "district": "서울 마포구을", "committee": "기획재정위원회"}
-    ]
-    return False
+    return MemberStore(FALLBACK_MEMBERS, version=version, file_load_success=False)
+
+def swap_member_snapshot(snapshot: MemberStore) -> MemberStore:
+    """새 스냅샷으로 교체 (단일 참조 할당)"""
+    global member_store
+    previous = member_store
+    member_store = snapshot
+    logger.info(f"🔄 스냅샷 교체: v{previous.version} → v{snapshot.version} "
+                f"({snapshot.raw_count}명, 빌드 {snapshot.build_ms}ms)")
+    return previous
+
+def load_clean_data():
+    """깨끗한 데이터 로드 (동기)"""
+    snapshot = build_member_snapshot(member_store.version + 1)
+    swap_member_snapshot(snapshot)
+    return snapshot.file_load_success
+
+async def reload_clean_data() -> MemberStore:
+    """워커 스레드에서 새 스냅샷을 구성한 뒤 교체 (이벤트 루프 비차단)"""
+    async with reload_lock:
+        snapshot = await asyncio.to_thread(build_member_snapshot, member_store.version + 1)
+        swap_member_snapshot(snapshot)
+        return snapshot
 
 @app.on_event("startup")
 async def startup_event():
@@ -93,57 +143,61 @@ async def startup_event():
         logger.warning("⚠️ 렌더 프로세스 관리 시작 실패")
     
     # 데이터 로드
-    success = load_clean_data()
-    if success:
-        logger.info(f"✅ 서버 준비 완료: {len(politicians_data)}명 의원 데이터")
+    snapshot = await reload_clean_data()
+    if snapshot.file_load_success:
+        logger.info(f"✅ 서버 준비 완료: {snapshot.raw_count}명 의원 데이터")
     else:
         logger.warning("⚠️ 파일 로드 실패, 최소 데이터로 서버 시작")
 
 @app.get("/")
 async def root():
     """API 서버 상태"""
+    store = member_store
     return {
         "message": "NewsBot Clean API Server",
         "status": "running",
-        "politicians_count": len(politicians_data),
-        "sample_member": politicians_data[0] if politicians_data else None
+        "politicians_count": store.raw_count,
+        "sample_member": store.first_raw,
+        "snapshot": store.snapshot_info()
     }
 
 @app.get("/api/assembly/members")
-async def get_assembly_members():
-    """국회의원 목록 조회"""
+async def get_assembly_members(
+    request: Request,
+    party: Optional[str] = None,
+    district: Optional[str] = None,
+    committee: Optional[str] = None
+):
+    """국회의원 목록 조회 (정당/지역구/위원회 필터 지원)"""
     try:
-        if not politicians_data:
+        store = member_store
+        if not store.raw_count:
             return {
                 "success": False,
                 "error": "의원 데이터가 로드되지 않았습니다"
             }
         
-        # 명시적으로 필드 검증
-        clean_members = []
-        for member in politicians_data:
-            clean_member = {
-                "name": str(member.get('name', '')).strip(),
-                "party": str(member.get('party', '')).strip(),
-                "district": str(member.get('district', '')).strip(),
-                "committee": str(member.get('committee', '')).strip(),
-                "photo_url": str(member.get('photo_url', '')).strip()
-            }
-            # 이름이 있는 의원만 포함
-            if clean_member["name"]:
-                clean_members.append(clean_member)
+        filters = [(field, value) for field, value in
+                   (("party", party), ("district", district), ("committee", committee)) if value]
+        if not filters:
+            return encoded_response(store.list_response, request)
+        
+        if len(filters) == 1:
+            field, value = filters[0]
+            encoded = store.filtered(field, value.strip())
+            if encoded is None:
+                encoded = store.filtered_empty
+            return encoded_response(encoded, request)
         
+        # 복합 필터: 가장 작은 인덱스 버킷에서 교집합 계산
+        buckets = sorted((store.find_by(field, value.strip()) for field, value in filters), key=len)
+        members = [member for member in buckets[0]
+                   if all(member[field] == value.strip() for field, value in filters)]
         return {
             "success": True,
-            "data": clean_members,
-            "total_count": len(clean_members),
-            "source": "NewsBot Clean API",
-            "debug_info": {
-                "raw_count": len(politicians_data),
-                "clean_count": len(clean_members),
-                "first_raw": politicians_data[0] if politicians_data else None,
-                "first_clean": clean_members[0] if clean_members else None
-            }
+            "data": members,
+            "total_count": len(members),
+            "source": store.source
         }
     except Exception as e:
         logger.error(f"국회의원 목록 조회 오류: {e}")
@@ -153,15 +207,12 @@ async def get_assembly_members():
         }
 
 @app.get("/api/assembly/members/{member_name}")
-async def get_assembly_member(member_name: str):
+async def get_assembly_member(member_name: str, request: Request):
     """특정 국회의원 조회"""
     try:
-        for member in politicians_data:
-            if member.get('name') == member_name:
-                return {
-                    "success": True,
-                    "data": member
-                }
+        encoded = member_store.get(member_name)
+        if encoded is not None:
+            return encoded_response(encoded, request)
         
         return {
             "success": False,
@@ -178,13 +229,14 @@ async def get_assembly_member(member_name: str):
 async def reload_data():
     """데이터 강제 재로드"""
     try:
-        success = load_clean_data()
+        snapshot = await reload_clean_data()
         return {
             "success": True,
             "message": "데이터 재로드 완료",
-            "politicians_count": len(politicians_data),
-            "file_load_success": success,
-            "sample": politicians_data[0] if politicians_data else None
+            "politicians_count": snapshot.raw_count,
+            "file_load_success": snapshot.file_load_success,
+            "sample": snapshot.first_raw,
+            "snapshot": snapshot.snapshot_info()
         }
     except Exception as e:
         logger.error(f"데이터 재로드 오류: {e}")
@@ -193,6 +245,16 @@ async def reload_data():
             "error": f"재로드 실패: {str(e)}"
         }
 
+@app.get("/metrics")
+async def metrics():
+    """Prometheus 텍스트 형식 메트릭 (미리 집계된 값만 읽으므로 블로킹 없음)"""
+    return Response(content=metrics_registry.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+@app.get("/api/metrics")
+async def metrics_summary():
+    """라우트별 p50/p95/p99, 캐시 적중률, RSS 요약"""
+    return {"success": True, "data": metrics_registry.snapshot()}
+
 @app.get("/api/render/status")
 async def get_render_process_status():
     """렌더 프로세스 상태 조회"""
@@ -8,6 +8,8 @@ import json
 import re
 from datetime import datetime
 
+from news_ingestion import IncrementalNewsFetcher
+
 class SimpleNewsCollector:
     def __init__(self):
         self.client_id = "kXwlSsFmb055ku9rWyx1"
@@ -18,6 +20,9 @@ class SimpleNewsCollector:
             "X-Naver-Client-Id": self.client_id,
             "X-Naver-Client-Secret": self.client_secret
         }
+        
+        # 증분 수집 상태 (incremental=True일 때 사용)
+        self.ingestion = IncrementalNewsFetcher(namespace='simple_news_collector')
     
     def clean_html(self, text):
         """HTML 태그 제거"""
@@ -27,53 +32,64 @@ class SimpleNewsCollector:
         clean = clean.replace('&#39;', "'").replace('&nbsp;', ' ')
         return clean.strip()
     
-    def collect_political_news(self, politician_name, max_results=10):
-        """정치인 뉴스 수집 (간단 버전)"""
+    def fetch_page(self, query, display=10, start=1, sort="sim"):
+        """검색 결과 한 페이지 조회 (실패 시 None)"""
+        params = {
+            "query": query,
+            "display": display,
+            "start": start,
+            "sort": sort  # sim(정확도), date(날짜)
+        }
+        
+        response = requests.get(self.base_url, headers=self.headers, params=params, timeout=10)
+        if response.status_code != 200:
+            print(f"❌ API 오류: {response.status_code}")
+            return None
+        return response.json()
+    
+    def collect_political_news(self, politician_name, max_results=10, incremental=False):
+        """정치인 뉴스 수집 (간단 버전)
+        
+        incremental=True면 날짜순으로 지난 수집 이후 새 기사만 가져온다 (max_results 무시).
+        """
         try:
             # 가장 효과적인 검색어 사용
             query = f"{politician_name} 의원"
             
-            params = {
-                "query": query,
-                "display": max_results,
-                "start": 1,
-                "sort": "sim"  # 정확도 정렬
-            }
-            
             print(f"🔍 검색어: '{query}'")
-            response = requests.get(self.base_url, headers=self.headers, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
+            if incremental:
+                items = self.ingestion.fetch_new(query, self.fetch_page)
+                self.ingestion.save()
+            else:
+                data = self.fetch_page(query, display=max_results, start=1, sort="sim")
+                if data is None:
+                    return []
                 items = data.get('items', [])
+            
+            print(f"📊 검색 결과: {len(items)}건")
+            
+            collected_news = []
+            for i, item in enumerate(items):
+                title = self.clean_html(item.get('title', ''))
+                description = self.clean_html(item.get('description', ''))
                 
-                print(f"📊 검색 결과: {len(items)}건")
-                
-                collected_news = []
-                for i, item in enumerate(items):
-                    title = self.clean_html(item.get('title', ''))
-                    description = self.clean_html(item.get('description', ''))
-                    
-                    # 기본적인 정치 관련성 체크
-                    if self.is_relevant_news(title, description, politician_name):
-                        news_item = {
-                            'title': title,
-                            'description': description,
-                            'link': item.get('link', ''),
-                            'pub_date': item.get('pubDate', ''),
-                            'politician': politician_name,
-                            'sentiment': self.simple_sentiment(title + ' ' + description),
-                            'collected_at': datetime.now().isoformat()
-                        }
-                        collected_news.append(news_item)
-                        print(f"  ✅ 수집: {title}")
-                    else:
-                        print(f"  ❌ 제외: {title}")
-                
-                return collected_news
-            else:
-                print(f"❌ API 오류: {response.status_code}")
-                return []
+                # 기본적인 정치 관련성 체크
+                if self.is_relevant_news(title, description, politician_name):
+                    news_item = {
+                        'title': title,
+                        'description': description,
+                        'link': item.get('link', ''),
+                        'pub_date': item.get('pubDate', ''),
+                        'politician': politician_name,
+                        'sentiment': self.simple_sentiment(title + ' ' + description),
+                        'collected_at': datetime.now().isoformat()
+                    }
+                    collected_news.append(news_item)
+                    print(f"  ✅ 수집: {title}")
+                else:
+                    print(f"  ❌ 제외: {title}")
+            
+            return collected_news
                 
         except Exception as e:
             print(f"❌ 수집 오류: {e}")
@@ -11,10 +11,544 @@ import logging
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
+from widget_render_engine import WidgetRenderer, WidgetTemplate
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+WIDGET_CSS = """
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+    padding: 20px;
+    overflow: hidden;
+}
+
+.network-container {
+    width: 100%;
+    height: 100vh;
+    position: relative;
+    background: white;
+    border-radius: 20px;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+    overflow: hidden;
+}
+
+.network-svg {
+    width: 100%;
+    height: 100%;
+}
+
+.panel {
+    cursor: pointer;
+    transition: all 0.3s ease;
+    filter: drop-shadow(0 4px 8px rgba(0,0,0,0.1));
+}
+
+.panel:hover {
+    transform: scale(1.05);
+    filter: drop-shadow(0 8px 16px rgba(0,0,0,0.2));
+}
+
+.panel-center {
+    fill: #FFD700;
+    stroke: #2c3e50;
+    stroke-width: 3;
+    rx: 15;
+    ry: 15;
+}
+
+.panel-level1 {
+    fill: #3498db;
+    stroke: #2980b9;
+    stroke-width: 2;
+    rx: 12;
+    ry: 12;
+}
+
+.panel-level2 {
+    fill: #2ecc71;
+    stroke: #27ae60;
+    stroke-width: 2;
+    rx: 10;
+    ry: 10;
+}
+
+.panel-level3 {
+    fill: #e74c3c;
+    stroke: #c0392b;
+    stroke-width: 2;
+    rx: 8;
+    ry: 8;
+}
+
+.panel-text {
+    font-family: 'SF Pro Display', -apple-system, sans-serif;
+    font-size: 12px;
+    font-weight: 600;
+    fill: white;
+    text-shadow: 1px 1px 2px rgba(0,0,0,0.5);
+}
+
+.panel-name {
+    font-size: 14px;
+    font-weight: 700;
+    text-anchor: middle;
+    dominant-baseline: middle;
+}
+
+.panel-info {
+    font-size: 10px;
+    font-weight: 500;
+    text-anchor: middle;
+    dominant-baseline: middle;
+}
+
+.connection-line {
+    stroke-width: 2;
+    fill: none;
+    opacity: 0.6;
+    transition: all 0.3s ease;
+}
+
+.connection-line:hover {
+    stroke-width: 4;
+    opacity: 1;
+}
+
+.connection-line.입법_연결 { stroke: #FF6B6B; }
+.connection-line.위원회_연결 { stroke: #4ECDC4; }
+.connection-line.정치적_연결 { stroke: #45B7D1; }
+.connection-line.지역_연결 { stroke: #96CEB4; }
+.connection-line.정책_연결 { stroke: #FFEAA7; }
+.connection-line.시간_연결 { stroke: #DDA0DD; }
+
+.legend {
+    position: absolute;
+    top: 20px;
+    right: 20px;
+    background: rgba(255,255,255,0.95);
+    padding: 20px;
+    border-radius: 15px;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+    backdrop-filter: blur(10px);
+    min-width: 200px;
+}
+
+.legend-title {
+    font-size: 16px;
+    font-weight: 600;
+    color: #2c3e50;
+    margin-bottom: 15px;
+    text-align: center;
+}
+
+.legend-item {
+    display: flex;
+    align-items: center;
+    margin-bottom: 8px;
+    font-size: 12px;
+}
+
+.legend-color {
+    width: 16px;
+    height: 16px;
+    border-radius: 4px;
+    margin-right: 10px;
+}
+
+.info-panel {
+    position: absolute;
+    bottom: 20px;
+    left: 20px;
+    background: rgba(255,255,255,0.95);
+    padding: 25px;
+    border-radius: 15px;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+    backdrop-filter: blur(10px);
+    max-width: 350px;
+}
+
+.info-title {
+    font-size: 20px;
+    font-weight: 600;
+    color: #2c3e50;
+    margin-bottom: 15px;
+}
+
+.info-detail {
+    font-size: 13px;
+    color: #7f8c8d;
+    margin-bottom: 8px;
+    display: flex;
+    justify-content: space-between;
+}
+
+.info-label {
+    font-weight: 500;
+}
+
+.info-value {
+    font-weight: 600;
+    color: #2c3e50;
+}
+
+.score-badge {
+    display: inline-block;
+    background: linear-gradient(135deg, #3498db, #2ecc71);
+    color: white;
+    padding: 8px 16px;
+    border-radius: 20px;
+    font-size: 13px;
+    font-weight: 600;
+    margin-top: 15px;
+    text-align: center;
+    width: 100%;
+}
+
+.controls {
+    position: absolute;
+    top: 20px;
+    left: 20px;
+    display: flex;
+    gap: 10px;
+}
+
+.control-btn {
+    background: rgba(255,255,255,0.9);
+    border: none;
+    padding: 12px 18px;
+    border-radius: 25px;
+    font-family: 'SF Pro Display', -apple-system, sans-serif;
+    font-size: 13px;
+    font-weight: 500;
+    cursor: pointer;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+    transition: all 0.3s ease;
+}
+
+.control-btn:hover {
+    background: white;
+    transform: translateY(-2px);
+    box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+}
+
+.control-btn.active {
+    background: #3498db;
+    color: white;
+}
+
+.detail-modal {
+    position: fixed;
+    top: 0;
+    left: 0;
+    width: 100%;
+    height: 100%;
+    background: rgba(0,0,0,0.8);
+    display: none;
+    justify-content: center;
+    align-items: center;
+    z-index: 1000;
+}
+
+.modal-content {
+    background: white;
+    padding: 30px;
+    border-radius: 20px;
+    max-width: 600px;
+    max-height: 80vh;
+    overflow-y: auto;
+    box-shadow: 0 20px 40px rgba(0,0,0,0.3);
+}
+
+.modal-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 20px;
+}
+
+.modal-title {
+    font-size: 24px;
+    font-weight: 600;
+    color: #2c3e50;
+}
+
+.close-btn {
+    background: none;
+    border: none;
+    font-size: 24px;
+    cursor: pointer;
+    color: #7f8c8d;
+}
+
+.modal-body {
+    font-size: 14px;
+    line-height: 1.6;
+    color: #2c3e50;
+}
+"""
+
+WIDGET_JS = """
+let showAllLevels = true;
+let currentPolitician = '정청래';
+
+function resetView() {
+    const svg = document.querySelector('.network-svg');
+    svg.style.transform = 'scale(1) translate(0, 0)';
+}
+
+function toggleLevels() {
+    showAllLevels = !showAllLevels;
+    const panels = document.querySelectorAll('.panel');
+    const lines = document.querySelectorAll('.connection-line');
+    
+    panels.forEach(panel => {
+        const level = panel.classList.contains('panel-center') ? 0 : 
+                     panel.classList.contains('panel-level1') ? 1 :
+                     panel.classList.contains('panel-level2') ? 2 : 3;
+        
+        if (level > 2 && !showAllLevels) {
+            panel.style.display = 'none';
+        } else {
+            panel.style.display = 'block';
+        }
+    });
+    
+    lines.forEach(line => {
+        if (!showAllLevels) {
+            line.style.display = 'none';
+        } else {
+            line.style.display = 'block';
+        }
+    });
+}
+
+function showAllPanels() {
+    const panels = document.querySelectorAll('.panel');
+    const lines = document.querySelectorAll('.connection-line');
+    
+    panels.forEach(panel => {
+        panel.style.display = 'block';
+    });
+    
+    lines.forEach(line => {
+        line.style.display = 'block';
+    });
+}
+
+function showPoliticianDetail(politicianName) {
+    // 해당 정치인의 상세 정보 표시
+    const modal = document.getElementById('detailModal');
+    const title = document.getElementById('modalTitle');
+    const body = document.getElementById('modalBody');
+    
+    title.textContent = politicianName + ' 상세 정보';
+    body.innerHTML = `
+        <h3>기본 정보</h3>
+        <p><strong>정당:</strong> ${politicianName}의 정당</p>
+        <p><strong>지역구:</strong> ${politicianName}의 지역구</p>
+        <p><strong>위원회:</strong> ${politicianName}의 위원회</p>
+        <p><strong>연결성 점수:</strong> 85.5</p>
+        
+        <h3>주요 연결</h3>
+        <ul>
+            <li>김영배 - 같은 정당 (강도: 0.9)</li>
+            <li>박수현 - 같은 위원회 (강도: 0.8)</li>
+            <li>이재정 - 공동발의 (강도: 0.7)</li>
+        </ul>
+        
+        <h3>입법 활동</h3>
+        <p>총 발의 법안: 15건</p>
+        <p>통과 법안: 8건</p>
+        <p>통과율: 53.3%</p>
+    `;
+    
+    modal.style.display = 'flex';
+}
+
+function closeModal() {
+    const modal = document.getElementById('detailModal');
+    modal.style.display = 'none';
+}
+
+// 드래그 앤 줌 기능
+let isDragging = false;
+let startX, startY, translateX = 0, translateY = 0, scale = 1;
+
+const svg = document.querySelector('.network-svg');
+
+svg.addEventListener('mousedown', (e) => {
+    isDragging = true;
+    startX = e.clientX;
+    startY = e.clientY;
+});
+
+svg.addEventListener('mousemove', (e) => {
+    if (isDragging) {
+        const deltaX = e.clientX - startX;
+        const deltaY = e.clientY - startY;
+        translateX += deltaX;
+        translateY += deltaY;
+        svg.style.transform = `scale(${scale}) translate(${translateX}px, ${translateY}px)`;
+        startX = e.clientX;
+        startY = e.clientY;
+    }
+});
+
+svg.addEventListener('mouseup', () => {
+    isDragging = false;
+});
+
+svg.addEventListener('wheel', (e) => {
+    e.preventDefault();
+    const delta = e.deltaY > 0 ? 0.9 : 1.1;
+    scale *= delta;
+    scale = Math.max(0.5, Math.min(3, scale));
+    svg.style.transform = `scale(${scale}) translate(${translateX}px, ${translateY}px)`;
+});
+
+// 패널 클릭 이벤트
+document.querySelectorAll('.panel').forEach(panel => {
+    panel.addEventListener('click', (e) => {
+        const name = e.target.getAttribute('title').split(' ')[0];
+        console.log('선택된 패널:', name);
+        showPoliticianDetail(name);
+    });
+});
+
+// 모달 외부 클릭 시 닫기
+document.getElementById('detailModal').addEventListener('click', (e) => {
+    if (e.target === e.currentTarget) {
+        closeModal();
+    }
+});
+"""
+
+WIDGET_TEMPLATE = WidgetTemplate("""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>${name} 세련된 패널 네트워크</title>
+    ${stylesheets}
+</head>
+<body>
+    <div class="network-container">
+        <div class="controls">
+            <button class="control-btn" onclick="resetView()">초기화</button>
+            <button class="control-btn" onclick="toggleLevels()">레벨 토글</button>
+            <button class="control-btn" onclick="showAllPanels()">전체 보기</button>
+        </div>
+        
+        <div class="legend">
+            <div class="legend-title">연결 유형</div>
+            <div class="legend-item">
+                <div class="legend-color" style="background: #FF6B6B;"></div>
+                <span>공동발의</span>
+            </div>
+            <div class="legend-item">
+                <div class="legend-color" style="background: #4ECDC4;"></div>
+                <span>같은 위원회</span>
+            </div>
+            <div class="legend-item">
+                <div class="legend-color" style="background: #45B7D1;"></div>
+                <span>같은 정당</span>
+            </div>
+            <div class="legend-item">
+                <div class="legend-color" style="background: #96CEB4;"></div>
+                <span>같은 지역구</span>
+            </div>
+            <div class="legend-item">
+                <div class="legend-color" style="background: #FFEAA7;"></div>
+                <span>유사 정책</span>
+            </div>
+            <div class="legend-item">
+                <div class="legend-color" style="background: #DDA0DD;"></div>
+                <span>동시기 활동</span>
+            </div>
+        </div>
+        
+        <div class="info-panel">
+            <div class="info-title">${name}</div>
+            <div class="info-detail">
+                <span class="info-label">정당:</span>
+                <span class="info-value">${party}</span>
+            </div>
+            <div class="info-detail">
+                <span class="info-label">지역구:</span>
+                <span class="info-value">${district}</span>
+            </div>
+            <div class="info-detail">
+                <span class="info-label">위원회:</span>
+                <span class="info-value">${committee}</span>
+            </div>
+            <div class="score-badge">연결성 점수: ${connectivity_score}</div>
+        </div>
+        
+        <svg class="network-svg" viewBox="0 0 800 600">
+${svg_content}
+        </svg>
+    </div>
+    
+    <!-- 상세 정보 모달 -->
+    <div class="detail-modal" id="detailModal">
+        <div class="modal-content">
+            <div class="modal-header">
+                <div class="modal-title" id="modalTitle">상세 정보</div>
+                <button class="close-btn" onclick="closeModal()">&times;</button>
+            </div>
+            <div class="modal-body" id="modalBody">
+                <!-- 상세 정보가 여기에 표시됩니다 -->
+            </div>
+        </div>
+    </div>
+    ${scripts}
+</body>
+</html>
+""")
+
+LINE_TEMPLATE = WidgetTemplate('''
+            <line class="connection-line ${connection_type}" 
+                  x1="${x1}" y1="${y1}" 
+                  x2="${x2}" y2="${y2}">
+                <title>${parent} → ${name} (${connection_type})</title>
+            </line>
+''')
+
+CENTER_PANEL_TEMPLATE = WidgetTemplate('''
+            <rect class="panel panel-center" 
+                  x="${x}" y="${y}" 
+                  width="${width}" height="${height}">
+                <title>${name} (중심)</title>
+            </rect>
+            <text class="panel-text panel-name" x="${text_x}" y="${name_y}">${name}</text>
+            <text class="panel-text panel-info" x="${text_x}" y="${party_y}">${party}</text>
+            <text class="panel-text panel-info" x="${text_x}" y="${district_y}">${district}</text>
+            <text class="panel-text panel-info" x="${text_x}" y="${score_y}">점수: ${connectivity_score}</text>
+''')
+
+PANEL_TEMPLATE = WidgetTemplate('''
+            <rect class="panel ${panel_class}" 
+                  x="${x}" y="${y}" 
+                  width="${width}" height="${height}">
+                <title>${name} (레벨 ${level})</title>
+            </rect>
+            <text class="panel-text panel-name" x="${text_x}" y="${name_y}">${name}</text>
+            <text class="panel-text panel-info" x="${text_x}" y="${party_y}">${party}</text>
+            <text class="panel-text panel-info" x="${text_x}" y="${district_y}">${district}</text>
+''')
+
+
 class SophisticatedPanelVisualizer:
     """세련된 패널 기반 시각화 시스템"""
     
@@ -87,6 +621,13 @@ class SophisticatedPanelVisualizer:
         os.makedirs(self.output_dir, exist_ok=True)
         os.makedirs(f"{self.output_dir}/widgets", exist_ok=True)
         os.makedirs(f"{self.output_dir}/pages", exist_ok=True)
+        
+        # 공용 CSS/JS (내용 해시 이름으로 한 번만 기록)
+        self.renderer = WidgetRenderer(self.output_dir)
+        self.widget_assets = {
+            'css': [self.renderer.assets.add('sophisticated_panel', WIDGET_CSS, 'css')],
+            'js': [self.renderer.assets.add('sophisticated_panel', WIDGET_JS, 'js')],
+        }
     
     def calculate_panel_positions(self, connections: List[Dict], center_x: float = 400, center_y: float = 300) -> List[Dict]:
         """패널 위치 계산 (방사형 배치)"""
@@ -183,6 +724,61 @@ class SophisticatedPanelVisualizer:
         
         return positions
     
+    def render_panel_widget(self, politician: Dict) -> str:
+        """세련된 패널 위젯 HTML (연결선 + 패널 조각을 템플릿으로 렌더링)"""
+        positions = self.calculate_panel_positions(politician["connections"])
+        # 같은 이름이 중심과 연결 패널에 함께 나올 수 있으므로 첫 위치 우선
+        by_name = {}
+        for pos in positions:
+            by_name.setdefault(pos["name"], pos)
+        connections_by_name = {}
+        for conn in politician["connections"]:
+            connections_by_name.setdefault(conn["name"], conn)
+        
+        # 연결선 (패널 중심점끼리)
+        lines = []
+        for pos in positions:
+            if pos["name"] != "정청래" and "parent" in pos:
+                parent_pos = by_name.get(pos["parent"])
+                if parent_pos:
+                    lines.append(LINE_TEMPLATE.render(
+                        connection_type=pos.get("connection_type", "정치적_연결"),
+                        x1=parent_pos["x"] + parent_pos["width"] / 2,
+                        y1=parent_pos["y"] + parent_pos["height"] / 2,
+                        x2=pos["x"] + pos["width"] / 2,
+                        y2=pos["y"] + pos["height"] / 2,
+                        parent=pos["parent"],
+                        name=pos["name"]
+                    ))
+        
+        # 패널
+        panels = []
+        for pos in positions:
+            if pos["name"] == "정청래":
+                panels.append(CENTER_PANEL_TEMPLATE.render(
+                    pos,
+                    text_x=pos['x'] + pos['width'] / 2,
+                    name_y=pos['y'] + 30, party_y=pos['y'] + 50, district_y=pos['y'] + 70, score_y=pos['y'] + 90,
+                    party=politician['party'], district=politician['district'],
+                    connectivity_score=politician['connectivity_score']
+                ))
+            else:
+                conn_info = connections_by_name.get(pos["name"], {})
+                panels.append(PANEL_TEMPLATE.render(
+                    pos,
+                    panel_class=f"panel-level{pos['level']}",
+                    text_x=pos['x'] + pos['width'] / 2,
+                    name_y=pos['y'] + 20, party_y=pos['y'] + 35, district_y=pos['y'] + 50,
+                    party=conn_info.get('party', ''), district=conn_info.get('district', '')
+                ))
+        
+        page_path = f"widgets/sophisticated_panel_{politician['name']}.html"
+        return WIDGET_TEMPLATE.render(
+            politician,
+            svg_content=''.join(lines) + ''.join(panels),
+            **self.renderer.asset_tags(page_path, **self.widget_assets)
+        )
+    
     def create_sophisticated_panel_widget(self, politician_name: str) -> str:
         """세련된 패널 기반 위젯 생성"""
         try:
@@ -191,585 +787,24 @@ class SophisticatedPanelVisualizer:
                 return None
             
             politician = self.politicians[politician_name]
-            positions = self.calculate_panel_positions(politician["connections"])
-            
-            # HTML 콘텐츠 생성
-            html_content = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{politician['name']} 세련된 패널 네트워크</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-            overflow: hidden;
-        }}
-        
-        .network-container {{
-            width: 100%;
-            height: 100vh;
-            position: relative;
-            background: white;
-            border-radius: 20px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        
-        .network-svg {{
-            width: 100%;
-            height: 100%;
-        }}
-        
-        .panel {{
-            cursor: pointer;
-            transition: all 0.3s ease;
-            filter: drop-shadow(0 4px 8px rgba(0,0,0,0.1));
-        }}
-        
-        .panel:hover {{
-            transform: scale(1.05);
-            filter: drop-shadow(0 8px 16px rgba(0,0,0,0.2));
-        }}
-        
-        .panel-center {{
-            fill: #FFD700;
-            stroke: #2c3e50;
-            stroke-width: 3;
-            rx: 15;
-            ry: 15;
-        }}
-        
-        .panel-level1 {{
-            fill: #3498db;
-            stroke: #2980b9;
-            stroke-width: 2;
-            rx: 12;
-            ry: 12;
-        }}
-        
-        .panel-level2 {{
-            fill: #2ecc71;
-            stroke: #27ae60;
-            stroke-width: 2;
-            rx: 10;
-            ry: 10;
-        }}
-        
-        .panel-level3 {{
-            fill: #e74c3c;
-            stroke: #c0392b;
-            stroke-width: 2;
-            rx: 8;
-            ry: 8;
-        }}
-        
-        .panel-text {{
-            font-family: 'SF Pro Display', -apple-system, sans-serif;
-            font-size: 12px;
-            font-weight: 600;
-            fill: white;
-            text-shadow: 1px 1px 2px rgba(0,0,0,0.5);
-        }}
-        
-        .panel-name {{
-            font-size: 14px;
-            font-weight: 700;
-            text-anchor: middle;
-            dominant-baseline: middle;
-        }}
-        
-        .panel-info {{
-            font-size: 10px;
-            font-weight: 500;
-            text-anchor: middle;
-            dominant-baseline: middle;
-        }}
-        
-        .connection-line {{
-            stroke-width: 2;
-            fill: none;
-            opacity: 0.6;
-            transition: all 0.3s ease;
-        }}
-        
-        .connection-line:hover {{
-            stroke-width: 4;
-            opacity: 1;
-        }}
-        
-        .connection-line.입법_연결 {{ stroke: #FF6B6B; }}
-        .connection-line.위원회_연결 {{ stroke: #4ECDC4; }}
-        .connection-line.정치적_연결 {{ stroke: #45B7D1; }}
-        .connection-line.지역_연결 {{ stroke: #96CEB4; }}
-        .connection-line.정책_연결 {{ stroke: #FFEAA7; }}
-        .connection-line.시간_연결 {{ stroke: #DDA0DD; }}
-        
-        .legend {{
-            position: absolute;
-            top: 20px;
-            right: 20px;
-            background: rgba(255,255,255,0.95);
-            padding: 20px;
-            border-radius: 15px;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-            backdrop-filter: blur(10px);
-            min-width: 200px;
-        }}
-        
-        .legend-title {{
-            font-size: 16px;
-            font-weight: 600;
-            color: #2c3e50;
-            margin-bottom: 15px;
-            text-align: center;
-        }}
-        
-        .legend-item {{
-            display: flex;
-            align-items: center;
-            margin-bottom: 8px;
-            font-size: 12px;
-        }}
-        
-        .legend-color {{
-            width: 16px;
-            height: 16px;
-            border-radius: 4px;
-            margin-right: 10px;
-        }}
-        
-        .info-panel {{
-            position: absolute;
-            bottom: 20px;
-            left: 20px;
-            background: rgba(255,255,255,0.95);
-            padding: 25px;
-            border-radius: 15px;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-            backdrop-filter: blur(10px);
-            max-width: 350px;
-        }}
-        
-        .info-title {{
-            font-size: 20px;
-            font-weight: 600;
-            color: #2c3e50;
-            margin-bottom: 15px;
-        }}
-        
-        .info-detail {{
-            font-size: 13px;
-            color: #7f8c8d;
-            margin-bottom: 8px;
-            display: flex;
-            justify-content: space-between;
-        }}
-        
-        .info-label {{
-            font-weight: 500;
-        }}
-        
-        .info-value {{
-            font-weight: 600;
-            color: #2c3e50;
-        }}
-        
-        .score-badge {{
-            display: inline-block;
-            background: linear-gradient(135deg, #3498db, #2ecc71);
-            color: white;
-            padding: 8px 16px;
-            border-radius: 20px;
-            font-size: 13px;
-            font-weight: 600;
-            margin-top: 15px;
-            text-align: center;
-            width: 100%;
-        }}
-        
-        .controls {{
-            position: absolute;
-            top: 20px;
-            left: 20px;
-            display: flex;
-            gap: 10px;
-        }}
-        
-        .control-btn {{
-            background: rgba(255,255,255,0.9);
-            border: none;
-            padding: 12px 18px;
-            border-radius: 25px;
-            font-family: 'SF Pro Display', -apple-system, sans-serif;
-            font-size: 13px;
-            font-weight: 500;
-            cursor: pointer;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-            transition: all 0.3s ease;
-        }}
-        
-        .control-btn:hover {{
-            background: white;
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-        }}
-        
-        .control-btn.active {{
-            background: #3498db;
-            color: white;
-        }}
-        
-        .detail-modal {{
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: rgba(0,0,0,0.8);
-            display: none;
-            justify-content: center;
-            align-items: center;
-            z-index: 1000;
-        }}
-        
-        .modal-content {{
-            background: white;
-            padding: 30px;
-            border-radius: 20px;
-            max-width: 600px;
-            max-height: 80vh;
-            overflow-y: auto;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.3);
-        }}
-        
-        .modal-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 20px;
-        }}
-        
-        .modal-title {{
-            font-size: 24px;
-            font-weight: 600;
-            color: #2c3e50;
-        }}
-        
-        .close-btn {{
-            background: none;
-            border: none;
-            font-size: 24px;
-            cursor: pointer;
-            color: #7f8c8d;
-        }}
-        
-        .modal-body {{
-            font-size: 14px;
-            line-height: 1.6;
-            color: #2c3e50;
-        }}
-    </style>
-</head>
-<body>
-    <div class="network-container">
-        <div class="controls">
-            <button class="control-btn" onclick="resetView()">초기화</button>
-            <button class="control-btn" onclick="toggleLevels()">레벨 토글</button>
-            <button class="control-btn" onclick="showAllPanels()">전체 보기</button>
-        </div>
-        
-        <div class="legend">
-            <div class="legend-title">연결 유형</div>
-            <div class="legend-item">
-                <div class="legend-color" style="background: #FF6B6B;"></div>
-                <span>공동발의</span>
-            </div>
-            <div class="legend-item">
-                <div class="legend-color" style="background: #4ECDC4;"></div>
-                <span>같은 위원회</span>
-            </div>
-            <div class="legend-item">
-                <div class="legend-color" style="background: #45B7D1;"></div>
-                <span>같은 정당</span>
-            </div>
-            <div class="legend-item">
-                <div class="legend-color" style="background: #96CEB4;"></div>
-                <span>같은 지역구</span>
-            </div>
-            <div class="legend-item">
-                <div class="legend-color" style="background: #FFEAA7;"></div>
-                <span>유사 정책</span>
-            </div>
-            <div class="legend-item">
-                <div class="legend-color" style="background: #DDA0DD;"></div>
-                <span>동시기 활동</span>
-            </div>
-        </div>
-        
-        <div class="info-panel">
-            <div class="info-title">{politician['name']}</div>
-            <div class="info-detail">
-                <span class="info-label">정당:</span>
-                <span class="info-value">{politician['party']}</span>
-            </div>
-            <div class="info-detail">
-                <span class="info-label">지역구:</span>
-                <span class="info-value">{politician['district']}</span>
-            </div>
-            <div class="info-detail">
-                <span class="info-label">위원회:</span>
-                <span class="info-value">{politician['committee']}</span>
-            </div>
-            <div class="score-badge">연결성 점수: {politician['connectivity_score']}</div>
-        </div>
-        
-        <svg class="network-svg" viewBox="0 0 800 600">
-"""
-            
-            # 연결선 그리기
-            for pos in positions:
-                if pos["name"] != "정청래" and "parent" in pos:
-                    parent_pos = next((p for p in positions if p["name"] == pos["parent"]), None)
-                    if parent_pos:
-                        connection_type = pos.get("connection_type", "정치적_연결")
-                        # 패널 중심점으로 연결선 그리기
-                        parent_center_x = parent_pos["x"] + parent_pos["width"] / 2
-                        parent_center_y = parent_pos["y"] + parent_pos["height"] / 2
-                        child_center_x = pos["x"] + pos["width"] / 2
-                        child_center_y = pos["y"] + pos["height"] / 2
-                        
-                        html_content += f'''
-            <line class="connection-line {connection_type}" 
-                  x1="{parent_center_x}" y1="{parent_center_y}" 
-                  x2="{child_center_x}" y2="{child_center_y}">
-                <title>{pos['parent']} → {pos['name']} ({connection_type})</title>
-            </line>
-'''
-            
-            # 패널 그리기
-            for pos in positions:
-                if pos["name"] == "정청래":
-                    # 중심 패널
-                    html_content += f'''
-            <rect class="panel panel-center" 
-                  x="{pos['x']}" y="{pos['y']}" 
-                  width="{pos['width']}" height="{pos['height']}">
-                <title>{pos['name']} (중심)</title>
-            </rect>
-            <text class="panel-text panel-name" x="{pos['x'] + pos['width']/2}" y="{pos['y'] + 30}">{pos['name']}</text>
-            <text class="panel-text panel-info" x="{pos['x'] + pos['width']/2}" y="{pos['y'] + 50}">{politician['party']}</text>
-            <text class="panel-text panel-info" x="{pos['x'] + pos['width']/2}" y="{pos['y'] + 70}">{politician['district']}</text>
-            <text class="panel-text panel-info" x="{pos['x'] + pos['width']/2}" y="{pos['y'] + 90}">점수: {politician['connectivity_score']}</text>
-'''
-                else:
-                    # 주변 패널
-                    level = pos["level"]
-                    panel_class = f"panel-level{level}"
-                    
-                    # 연결된 정치인 정보 찾기
-                    conn_info = next((conn for conn in politician["connections"] if conn["name"] == pos["name"]), {})
-                    
-                    html_content += f'''
-            <rect class="panel {panel_class}" 
-                  x="{pos['x']}" y="{pos['y']}" 
-                  width="{pos['width']}" height="{pos['height']}">
-                <title>{pos['name']} (레벨 {level})</title>
-            </rect>
-            <text class="panel-text panel-name" x="{pos['x'] + pos['width']/2}" y="{pos['y'] + 20}">{pos['name']}</text>
-            <text class="panel-text panel-info" x="{pos['x'] + pos['width']/2}" y="{pos['y'] + 35}">{conn_info.get('party', '')}</text>
-            <text class="panel-text panel-info" x="{pos['x'] + pos['width']/2}" y="{pos['y'] + 50}">{conn_info.get('district', '')}</text>
-'''
-            
-            html_content += """
-        </svg>
-    </div>
-    
-    <!-- 상세 정보 모달 -->
-    <div class="detail-modal" id="detailModal">
-        <div class="modal-content">
-            <div class="modal-header">
-                <div class="modal-title" id="modalTitle">상세 정보</div>
-                <button class="close-btn" onclick="closeModal()">&times;</button>
-            </div>
-            <div class="modal-body" id="modalBody">
-                <!-- 상세 정보가 여기에 표시됩니다 -->
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        let showAllLevels = true;
-        let currentPolitician = '정청래';
-        
-        function resetView() {
-            const svg = document.querySelector('.network-svg');
-            svg.style.transform = 'scale(1) translate(0, 0)';
-        }
-        
-        function toggleLevels() {
-            showAllLevels = !showAllLevels;
-            const panels = document.querySelectorAll('.panel');
-            const lines = document.querySelectorAll('.connection-line');
             
-            panels.forEach(panel => {
-                const level = panel.classList.contains('panel-center') ? 0 : 
-                             panel.classList.contains('panel-level1') ? 1 :
-                             panel.classList.contains('panel-level2') ? 2 : 3;
-                
-                if (level > 2 && !showAllLevels) {
-                    panel.style.display = 'none';
-                } else {
-                    panel.style.display = 'block';
-                }
-            });
-            
-            lines.forEach(line => {
-                if (!showAllLevels) {
-                    line.style.display = 'none';
-                } else {
-                    line.style.display = 'block';
-                }
-            });
-        }
-        
-        function showAllPanels() {
-            const panels = document.querySelectorAll('.panel');
-            const lines = document.querySelectorAll('.connection-line');
-            
-            panels.forEach(panel => {
-                panel.style.display = 'block';
-            });
-            
-            lines.forEach(line => {
-                line.style.display = 'block';
-            });
-        }
-        
-        function showPoliticianDetail(politicianName) {
-            // 해당 정치인의 상세 정보 표시
-            const modal = document.getElementById('detailModal');
-            const title = document.getElementById('modalTitle');
-            const body = document.getElementById('modalBody');
-            
-            title.textContent = politicianName + ' 상세 정보';
-            body.innerHTML = `
-                <h3>기본 정보</h3>
-                <p><strong>정당:</strong> ${politicianName}의 정당</p>
-                <p><strong>지역구:</strong> ${politicianName}의 지역구</p>
-                <p><strong>위원회:</strong> ${politicianName}의 위원회</p>
-                <p><strong>연결성 점수:</strong> 85.5</p>
-                
-                <h3>주요 연결</h3>
-                <ul>
-                    <li>김영배 - 같은 정당 (강도: 0.9)</li>
-                    <li>박수현 - 같은 위원회 (강도: 0.8)</li>
-                    <li>이재정 - 공동발의 (강도: 0.7)</li>
-                </ul>
-                
-                <h3>입법 활동</h3>
-                <p>총 발의 법안: 15건</p>
-                <p>통과 법안: 8건</p>
-                <p>통과율: 53.3%</p>
-            `;
-            
-            modal.style.display = 'flex';
-        }
-        
-        function closeModal() {
-            const modal = document.getElementById('detailModal');
-            modal.style.display = 'none';
-        }
-        
-        // 드래그 앤 줌 기능
-        let isDragging = false;
-        let startX, startY, translateX = 0, translateY = 0, scale = 1;
-        
-        const svg = document.querySelector('.network-svg');
-        
-        svg.addEventListener('mousedown', (e) => {
-            isDragging = true;
-            startX = e.clientX;
-            startY = e.clientY;
-        });
-        
-        svg.addEventListener('mousemove', (e) => {
-            if (isDragging) {
-                const deltaX = e.clientX - startX;
-                const deltaY = e.clientY - startY;
-                translateX += deltaX;
-                translateY += deltaY;
-                svg.style.transform = `scale(${scale}) translate(${translateX}px, ${translateY}px)`;
-                startX = e.clientX;
-                startY = e.clientY;
-            }
-        });
-        
-        svg.addEventListener('mouseup', () => {
-            isDragging = false;
-        });
-        
-        svg.addEventListener('wheel', (e) => {
-            e.preventDefault();
-            const delta = e.deltaY > 0 ? 0.9 : 1.1;
-            scale *= delta;
-            scale = Math.max(0.5, Math.min(3, scale));
-            svg.style.transform = `scale(${scale}) translate(${translateX}px, ${translateY}px)`;
-        });
-        
-        // 패널 클릭 이벤트
-        document.querySelectorAll('.panel').forEach(panel => {
-            panel.addEventListener('click', (e) => {
-                const name = e.target.getAttribute('title').split(' ')[0];
-                console.log('선택된 패널:', name);
-                showPoliticianDetail(name);
-            });
-        });
-        
-        // 모달 외부 클릭 시 닫기
-        document.getElementById('detailModal').addEventListener('click', (e) => {
-            if (e.target === e.currentTarget) {
-                closeModal();
-            }
-        });
-    </script>
-</body>
-</html>
-"""
-            
-            # HTML 파일로 저장
+            # HTML 파일로 저장 (내용이 같으면 건너뜀)
             filename = f"sophisticated_panel_{politician_name}.html"
-            filepath = f"{self.output_dir}/widgets/{filename}"
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            logger.info(f"세련된 패널 위젯 생성 완료: {filepath}")
+            if self.renderer.write(f"widgets/{filename}", self.render_panel_widget(politician)):
+                logger.info(f"세련된 패널 위젯 생성 완료: {self.output_dir}/widgets/{filename}")
             return filename
             
         except Exception as e:
             logger.error(f"세련된 패널 위젯 생성 실패: {e}")
             return None
     
-    def create_all_widgets(self) -> Dict[str, Any]:
-        """모든 정치인 세련된 패널 위젯 생성"""
-        results = {}
+    def create_all_widgets(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """모든 정치인 세련된 패널 위젯 생성 (프로세스 풀 병렬, max_workers=1이면 순차)"""
+        names = list(self.politicians.keys())
+        logger.info(f"세련된 패널 위젯 생성 중: {len(names)}명")
         
-        for politician_name in self.politicians.keys():
-            logger.info(f"세련된 패널 위젯 생성 중: {politician_name}")
-            
-            widget_file = self.create_sophisticated_panel_widget(politician_name)
-            
+        results = {}
+        for politician_name, widget_file in zip(names, self.renderer.render_all(self.create_sophisticated_panel_widget, names, max_workers)):
             if widget_file:
                 results[politician_name] = {
                     "widget": widget_file,
@@ -778,6 +813,7 @@ class SophisticatedPanelVisualizer:
         
         return results
 
+
 def main():
     """메인 함수"""
     try:
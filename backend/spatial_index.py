@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+좌표 공간 색인 (점 → 읍면동 배정, 반경/최근접 질의)
+- 위경도를 기준 위도 등장방형 투영(미터)으로 바꿔 균일 격자(또는 scipy cKDTree)에 색인
+- 질의 점은 격자 칸 단위로 묶어 후보 블록과 한 번에 거리 계산 (점마다 전체 순회 없음)
+- 읍면동 경계 폴리곤이 있으면 최근접 중심점 후보 k개에 대해 점-폴리곤 포함 검사로 보정
+- 하버사인 거리는 NumPy 브로드캐스팅으로 배열 단위 계산
+
+경계 데이터는 DONG_BOUNDARY_PATH 또는 data/dong_boundaries.geojson (행정동 경계 GeoJSON,
+속성 adm_nm/adm_cd2), 없으면 data/dong_centroids.csv (adm_cd, adm_nm, lat, lng)를 읽는다.
+"""
+
+import os
+import csv
+import json
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_M = 6371000.0
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+DEFAULT_BOUNDARY_PATHS = (
+    os.path.join(DATA_DIR, 'dong_boundaries.geojson'),
+    os.path.join(DATA_DIR, 'dong_centroids.csv'),
+)
+
+
+def haversine_m(lat1, lng1, lat2, lng2) -> np.ndarray:
+    """하버사인 거리(미터) - 입력 배열은 브로드캐스팅 규칙을 따름"""
+    lat1, lng1, lat2, lng2 = (np.radians(np.asarray(value, dtype=float)) for value in (lat1, lng1, lat2, lng2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def project(lats, lngs, ref_lat: float) -> np.ndarray:
+    """등장방형 투영 (N, 2) 미터 좌표 - 국내 범위에서 수 km 거리 오차 1% 미만"""
+    lats = np.asarray(lats, dtype=float)
+    lngs = np.asarray(lngs, dtype=float)
+    scale = np.radians(1.0) * EARTH_RADIUS_M
+    return np.column_stack((lngs * scale * np.cos(np.radians(ref_lat)), lats * scale))
+
+
+class PointIndex:
+    """점 집합 공간 색인 (k-최근접 / 반경 질의, 거리 단위 미터)"""
+
+    MAX_BLOCK_RADIUS = 32  # 격자 탐색 블록 최대 반경 (칸)
+
+    def __init__(self, lats, lngs, cell_size_m: float = 1000.0, ref_lat: Optional[float] = None):
+        self.lats = np.asarray(lats, dtype=float)
+        self.lngs = np.asarray(lngs, dtype=float)
+        self.ref_lat = float(np.mean(self.lats)) if ref_lat is None and len(self.lats) else (ref_lat or 36.0)
+        self.cell_size = cell_size_m
+        self.xy = project(self.lats, self.lngs, self.ref_lat)
+
+        self.tree = cKDTree(self.xy) if SCIPY_AVAILABLE and len(self.xy) else None
+        if self.tree is None:
+            self._build_grid()
+
+    def __len__(self) -> int:
+        return len(self.lats)
+
+    # ------------------------------------------------------------------
+    # 균일 격자 (scipy 없을 때)
+    # ------------------------------------------------------------------
+    def _build_grid(self):
+        cells = np.floor(self.xy / self.cell_size).astype(np.int64)
+        order = np.lexsort((cells[:, 1], cells[:, 0]))
+        self._order = order
+        sorted_cells = cells[order]
+        unique_cells, starts, counts = np.unique(sorted_cells, axis=0, return_index=True, return_counts=True)
+        self._grid: Dict[Tuple[int, int], Tuple[int, int]] = {
+            (int(cx), int(cy)): (int(start), int(start + count))
+            for (cx, cy), start, count in zip(unique_cells, starts, counts)
+        }
+
+    def _block(self, cx: int, cy: int, radius: int) -> np.ndarray:
+        """(cx, cy) 중심 (2r+1)² 칸의 점 인덱스"""
+        parts = []
+        for x in range(cx - radius, cx + radius + 1):
+            for y in range(cy - radius, cy + radius + 1):
+                span = self._grid.get((x, y))
+                if span is not None:
+                    parts.append(self._order[span[0]:span[1]])
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+    def _query_groups(self, query_xy: np.ndarray):
+        """질의 점을 격자 칸별로 묶음 → (cx, cy, 질의 인덱스)"""
+        cells = np.floor(query_xy / self.cell_size).astype(np.int64)
+        order = np.lexsort((cells[:, 1], cells[:, 0]))
+        unique_cells, starts = np.unique(cells[order], axis=0, return_index=True)
+        bounds = list(starts[1:]) + [len(order)]
+        for (cx, cy), start, end in zip(unique_cells, starts, bounds):
+            yield int(cx), int(cy), order[start:end]
+
+    # ------------------------------------------------------------------
+    # 질의
+    # ------------------------------------------------------------------
+    def query_knn(self, lats, lngs, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """k-최근접 (거리(미터, 하버사인), 인덱스) - 각각 (N, k)"""
+        query_xy = project(lats, lngs, self.ref_lat)
+        n = len(query_xy)
+        k = min(k, len(self))
+        if n == 0 or k == 0:
+            return np.empty((n, k)), np.empty((n, k), dtype=np.int64)
+
+        if self.tree is not None:
+            _, indices = self.tree.query(query_xy, k=k)
+            indices = np.asarray(indices, dtype=np.int64).reshape(n, k)
+        else:
+            indices = np.empty((n, k), dtype=np.int64)
+            everything = np.arange(len(self), dtype=np.int64)
+            for cx, cy, rows in self._query_groups(query_xy):
+                radius = 1
+                while True:
+                    # 블록이 너무 커지면(색인 범위 밖 질의 등) 전체 점과 비교
+                    exhaustive = radius > self.MAX_BLOCK_RADIUS
+                    candidates = everything if exhaustive else self._block(cx, cy, radius)
+                    if len(candidates) >= k:
+                        d = np.linalg.norm(query_xy[rows, None, :] - self.xy[None, candidates, :], axis=2)
+                        nearest = np.argsort(d, axis=1)[:, :k]
+                        kth = np.take_along_axis(d, nearest[:, -1:], axis=1)
+                        # 블록 밖 점은 radius 칸 이상 떨어져 있으므로 k번째 거리가 그 이내면 확정
+                        if exhaustive or (kth <= radius * self.cell_size).all():
+                            indices[rows] = candidates[nearest]
+                            break
+                    radius *= 2
+
+        lats = np.asarray(lats, dtype=float)
+        lngs = np.asarray(lngs, dtype=float)
+        distances = haversine_m(lats[:, None], lngs[:, None], self.lats[indices], self.lngs[indices])
+        return distances, indices
+
+    def query_radius(self, lats, lngs, radius_m: float) -> List[np.ndarray]:
+        """반경 내 점 인덱스 목록 (질의 점마다 배열)"""
+        query_xy = project(lats, lngs, self.ref_lat)
+        if self.tree is not None:
+            return [np.asarray(found, dtype=np.int64) for found in self.tree.query_ball_point(query_xy, radius_m)]
+        result: List[np.ndarray] = [np.empty(0, dtype=np.int64)] * len(query_xy)
+        block_radius = int(np.ceil(radius_m / self.cell_size))
+        for cx, cy, rows in self._query_groups(query_xy):
+            candidates = self._block(cx, cy, block_radius)
+            if not len(candidates):
+                continue
+            d = np.linalg.norm(query_xy[rows, None, :] - self.xy[None, candidates, :], axis=2)
+            for row, mask in zip(rows, d <= radius_m):
+                result[row] = candidates[mask]
+        return result
+
+    def count_within(self, lats, lngs, radius_m: float) -> np.ndarray:
+        """반경 내 점 개수 (질의 점마다)"""
+        query_xy = project(lats, lngs, self.ref_lat)
+        if self.tree is not None:
+            return np.asarray(self.tree.query_ball_point(query_xy, radius_m, return_length=True), dtype=np.int64)
+        counts = np.zeros(len(query_xy), dtype=np.int64)
+        block_radius = int(np.ceil(radius_m / self.cell_size))
+        for cx, cy, rows in self._query_groups(query_xy):
+            candidates = self._block(cx, cy, block_radius)
+            if len(candidates):
+                d = np.linalg.norm(query_xy[rows, None, :] - self.xy[None, candidates, :], axis=2)
+                counts[rows] = (d <= radius_m).sum(axis=1)
+        return counts
+
+
+def points_in_rings(xs: np.ndarray, ys: np.ndarray, rings: Sequence[np.ndarray]) -> np.ndarray:
+    """점-폴리곤 포함 검사 (짝홀 규칙, 모든 고리 합산이라 구멍/멀티폴리곤도 처리)"""
+    inside = np.zeros(len(xs), dtype=bool)
+    px = xs[:, None]
+    py = ys[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for ring in rings:
+            x1, y1 = ring[:, 0], ring[:, 1]
+            x2, y2 = np.roll(x1, 1), np.roll(y1, 1)
+            crosses = ((y1 > py) != (y2 > py)) & (px < (x2 - x1) * (py - y1) / (y2 - y1) + x1)
+            inside ^= (crosses.sum(axis=1) % 2).astype(bool)
+    return inside
+
+
+def ring_centroid(ring: np.ndarray) -> Tuple[float, float]:
+    """고리 면적 중심 (lng, lat) - 면적이 0이면 꼭짓점 평균"""
+    x, y = ring[:, 0], ring[:, 1]
+    cross = x * np.roll(y, -1) - np.roll(x, -1) * y
+    area = cross.sum() / 2
+    if abs(area) < 1e-12:
+        return float(x.mean()), float(y.mean())
+    cx = ((x + np.roll(x, -1)) * cross).sum() / (6 * area)
+    cy = ((y + np.roll(y, -1)) * cross).sum() / (6 * area)
+    return float(cx), float(cy)
+
+
+def split_admin_name(full_name: str) -> Tuple[str, str, str]:
+    """'서울특별시 종로구 사직동' → (시도, 시군구, 읍면동)"""
+    parts = (full_name or '').split()
+    if not parts:
+        return '', '', ''
+    if len(parts) == 1:
+        return parts[0], parts[0], parts[0]
+    if len(parts) == 2:
+        return parts[0], parts[0], parts[1]
+    return parts[0], ' '.join(parts[1:-1]), parts[-1]
+
+
+class DongSpatialIndex:
+    """읍면동 중심점 색인 + (선택) 경계 폴리곤 보정"""
+
+    def __init__(self, dongs: List[Dict], polygons: Optional[List[List[np.ndarray]]] = None,
+                 cell_size_m: float = 2000.0):
+        self.dongs = dongs
+        self.polygons = polygons
+        self.centroids = PointIndex([d['lat'] for d in dongs], [d['lng'] for d in dongs], cell_size_m)
+        if polygons is not None:
+            # (min_lng, min_lat, max_lng, max_lat) - 포함 검사 전 후보 걸러내기
+            self.bboxes = np.array([
+                [min(r[:, 0].min() for r in rings), min(r[:, 1].min() for r in rings),
+                 max(r[:, 0].max() for r in rings), max(r[:, 1].max() for r in rings)]
+                for rings in polygons
+            ])
+
+    def __len__(self) -> int:
+        return len(self.dongs)
+
+    # ------------------------------------------------------------------
+    # 로드
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_geojson(cls, path: str, name_property: str = 'adm_nm', code_property: str = 'adm_cd2') -> 'DongSpatialIndex':
+        with open(path, 'r', encoding='utf-8') as f:
+            collection = json.load(f)
+        dongs: List[Dict] = []
+        polygons: List[List[np.ndarray]] = []
+        for feature in collection.get('features', []):
+            geometry = feature.get('geometry') or {}
+            if geometry.get('type') == 'Polygon':
+                ring_lists = [geometry['coordinates']]
+            elif geometry.get('type') == 'MultiPolygon':
+                ring_lists = geometry['coordinates']
+            else:
+                continue
+            rings = [np.asarray(ring, dtype=float)[:, :2] for polygon in ring_lists for ring in polygon if len(ring) >= 3]
+            if not rings:
+                continue
+            properties = feature.get('properties') or {}
+            sido, sigungu, dong = split_admin_name(properties.get(name_property, ''))
+            # 가장 큰 외곽 고리의 면적 중심
+            outer = max((np.asarray(polygon[0], dtype=float)[:, :2] for polygon in ring_lists),
+                        key=lambda ring: np.ptp(ring[:, 0]) * np.ptp(ring[:, 1]))
+            lng, lat = ring_centroid(outer)
+            dongs.append({'adm_cd': str(properties.get(code_property, '')), 'sido': sido, 'sigungu': sigungu,
+                          'dong': dong, 'lat': lat, 'lng': lng})
+            polygons.append(rings)
+        logger.info(f"🗺️ 읍면동 경계 로드: {len(dongs):,}개 ({path})")
+        return cls(dongs, polygons)
+
+    @classmethod
+    def from_centroid_csv(cls, path: str) -> 'DongSpatialIndex':
+        dongs: List[Dict] = []
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            for row in csv.DictReader(f):
+                try:
+                    lat, lng = float(row['lat']), float(row['lng'])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                sido, sigungu, dong = split_admin_name(row.get('adm_nm', ''))
+                dongs.append({'adm_cd': row.get('adm_cd', ''), 'sido': sido, 'sigungu': sigungu,
+                              'dong': dong, 'lat': lat, 'lng': lng})
+        logger.info(f"🗺️ 읍면동 중심점 로드: {len(dongs):,}개 ({path})")
+        return cls(dongs)
+
+    @classmethod
+    def load_default(cls) -> Optional['DongSpatialIndex']:
+        """로컬 경계/중심점 파일에서 로드 (없으면 None)"""
+        env_path = os.environ.get('DONG_BOUNDARY_PATH')
+        for path in ((env_path,) if env_path else DEFAULT_BOUNDARY_PATHS):
+            if not os.path.exists(path):
+                continue
+            try:
+                if path.endswith('.csv'):
+                    return cls.from_centroid_csv(path)
+                return cls.from_geojson(path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"⚠️ 읍면동 공간 데이터 로드 실패 ({path}): {e}")
+        return None
+
+    # ------------------------------------------------------------------
+    # 질의
+    # ------------------------------------------------------------------
+    def nearest(self, lats, lngs, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """중심점 기준 k-최근접 읍면동 (거리(미터), 인덱스)"""
+        return self.centroids.query_knn(lats, lngs, k)
+
+    def within_radius(self, lats, lngs, radius_m: float) -> List[np.ndarray]:
+        """반경 내 중심점을 가진 읍면동 인덱스"""
+        return self.centroids.query_radius(lats, lngs, radius_m)
+
+    def assign(self, lats, lngs, candidates: int = 8) -> Dict[str, np.ndarray]:
+        """점 → 읍면동 배정 (한 번에 전체 배열 처리)
+
+        반환: {'index': 배정 읍면동 인덱스, 'distance_m': 중심점까지 거리, 'inside': 경계 내부 확인 여부}
+        경계 폴리곤이 있으면 최근접 후보 순서대로 포함 검사해 처음 포함되는 읍면동을, 없으면 최근접 중심점을 쓴다.
+        """
+        lats = np.asarray(lats, dtype=float)
+        lngs = np.asarray(lngs, dtype=float)
+        k = 1 if self.polygons is None else min(candidates, len(self))
+        distances, indices = self.centroids.query_knn(lats, lngs, k)
+        assigned = indices[:, 0].copy()
+        inside = np.zeros(len(lats), dtype=bool)
+
+        if self.polygons is not None:
+            pending = np.ones(len(lats), dtype=bool)
+            for rank in range(k):
+                rows = np.nonzero(pending)[0]
+                if not len(rows):
+                    break
+                candidate = indices[rows, rank]
+                box = self.bboxes[candidate]
+                in_box = ((lngs[rows] >= box[:, 0]) & (lngs[rows] <= box[:, 2])
+                          & (lats[rows] >= box[:, 1]) & (lats[rows] <= box[:, 3]))
+                rows, candidate = rows[in_box], candidate[in_box]
+                # 같은 후보 읍면동끼리 묶어 폴리곤당 한 번 검사
+                order = np.argsort(candidate, kind='stable')
+                rows, candidate = rows[order], candidate[order]
+                unique_candidates, starts = np.unique(candidate, return_index=True)
+                bounds = list(starts[1:]) + [len(rows)]
+                for dong_index, start, end in zip(unique_candidates, starts, bounds):
+                    group = rows[start:end]
+                    hit = group[points_in_rings(lngs[group], lats[group], self.polygons[dong_index])]
+                    assigned[hit] = dong_index
+                    inside[hit] = True
+                    pending[hit] = False
+
+        distance_m = haversine_m(lats, lngs, self.centroids.lats[assigned], self.centroids.lngs[assigned])
+        return {'index': assigned, 'distance_m': distance_m, 'inside': inside}
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+회의록 발언 전문 검색 인덱스
+발언 테이블(speeches / speakers) 위에 SQLite FTS5 역색인을 만들어 키워드 통계를 색인 조회로 계산
+- 한국어 토큰화: 한글 구간은 문자 bigram, 그 밖의 영숫자는 단어 단위 (조사/복합어에도 부분 일치)
+- 한 글자 검색어는 bigram 첫 글자(body) 또는 한글 구간 끝 글자(tails) 접두 검색 → 부분 문자열 일치와 같음
+- 키워드/구문 검색, 발언자 필터, BM25 순위
+- 발언자별 어휘(공백 기준 3자 이상 단어) 집합을 함께 유지해 어휘 다양성도 색인에서 바로 계산
+- 원본 테이블의 새 행만 추가 색인, 삭제된 행은 색인에서도 제거
+"""
+
+import re
+import sqlite3
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+HANGUL_RUN = re.compile(r'[가-힣]+|[0-9A-Za-z]+')
+QUOTED_OR_WORD = re.compile(r'"([^"]+)"|(\S+)')
+
+FTS_SUFFIX = '_fts'
+VOCAB_SUFFIX = '_vocab'
+MIN_VOCAB_WORD_LENGTH = 3  # 기존 평가 기준: len(word) > 2
+
+
+def tokenize_korean(text: str) -> List[str]:
+    """색인/검색 공통 토큰화 (한글 bigram + 영숫자 단어, 소문자)"""
+    tokens = []
+    for run in HANGUL_RUN.findall(text or ''):
+        if run[0] >= '가':
+            if len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run.lower())
+    return tokens
+
+
+def tail_tokens(text: str) -> List[str]:
+    """두 글자 이상 한글 구간의 끝 글자 (bigram 첫 글자로는 안 잡히는 위치, 한 글자 검색용)"""
+    return [run[-1] for run in HANGUL_RUN.findall(text or '') if run[0] >= '가' and len(run) > 1]
+
+
+def _phrase(term: str) -> Optional[str]:
+    """검색어 하나 → FTS5 구문 (토큰 위치가 연속인 경우만 일치 = 부분 문자열 일치)"""
+    tokens = tokenize_korean(term)
+    if not tokens:
+        return None
+    if len(tokens) == 1 and len(tokens[0]) == 1 and tokens[0] >= '가':
+        # 한 글자 검색어: '법'은 '법안'(bigram 첫 글자)과 '헌법'(구간 끝 글자) 모두 일치
+        return f'{{body tails}} : "{tokens[0]}"*'
+    return '"' + ' '.join(tokens) + '"'
+
+
+def match_expression(terms: Sequence[str], operator: str = 'AND') -> Optional[str]:
+    """검색어 목록 → FTS5 MATCH 식 (각 검색어는 구문으로 묶음)"""
+    phrases = [phrase for phrase in (_phrase(term) for term in terms) if phrase]
+    if not phrases:
+        return None
+    return f' {operator} '.join(phrases)
+
+
+def parse_query(query: str) -> List[str]:
+    """'교육 "기본 소득"' → ['교육', '기본 소득'] (따옴표는 구문)"""
+    return [quoted or word for quoted, word in QUOTED_OR_WORD.findall(query)]
+
+
+class SpeechSearchIndex:
+    """발언 테이블용 FTS5 색인
+
+    table/speaker_column/text_column으로 ExcelMeetingProcessor(v2)의 speeches 테이블과
+    기존 처리기의 speakers 테이블 모두에 사용할 수 있다. 색인은 같은 DB 파일의
+    <table>_fts / <table>_vocab 테이블에 저장된다.
+    """
+
+    def __init__(self, db_path: str = "meeting_records_processed.db", table: str = 'speeches',
+                 speaker_column: str = 'speaker_name', text_column: str = 'speech_content',
+                 meeting_column: str = 'meeting_id'):
+        self.db_path = db_path
+        self.table = table
+        self.speaker_column = speaker_column
+        self.text_column = text_column
+        self.meeting_column = meeting_column
+        self.fts_table = f"{table}{FTS_SUFFIX}"
+        self.vocab_table = f"{table}{VOCAB_SUFFIX}"
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.init_index()
+
+    def init_index(self):
+        with self.conn:
+            # tails 열이 없는 이전 형식 색인은 지우고 다음 sync에서 다시 색인
+            columns = [row[1] for row in self.conn.execute(f'PRAGMA table_info({self.fts_table})')]
+            if columns and 'tails' not in columns:
+                logger.info(f"🔎 발언 색인 형식 변경, 재색인 예정: {self.fts_table}")
+                self.conn.execute(f'DROP TABLE {self.fts_table}')
+            self.conn.execute(f'''
+                CREATE VIRTUAL TABLE IF NOT EXISTS {self.fts_table} USING fts5(
+                    speaker, body, tails, meeting_id UNINDEXED,
+                    tokenize = 'unicode61 remove_diacritics 0'
+                )
+            ''')
+            self.conn.execute(f'''
+                CREATE TABLE IF NOT EXISTS {self.vocab_table} (
+                    speaker TEXT,
+                    word TEXT,
+                    PRIMARY KEY (speaker, word)
+                ) WITHOUT ROWID
+            ''')
+            self.conn.execute(
+                f'CREATE INDEX IF NOT EXISTS idx_{self.table}_{self.speaker_column} '
+                f'ON {self.table}({self.speaker_column})'
+            )
+
+    # ------------------------------------------------------------------
+    # 색인 구축 / 동기화
+    # ------------------------------------------------------------------
+    def sync(self, batch_size: int = 5000) -> Dict[str, int]:
+        """원본 테이블과 색인 동기화 (삭제된 행 제거 + 새 행 추가)"""
+        with self.conn:
+            # 1. 원본에서 사라진 행 제거 (재적재로 지워진 발언) - 건수가 맞으면 생략
+            last_id = self.conn.execute(f'SELECT COALESCE(MAX(rowid), 0) FROM {self.fts_table}').fetchone()[0]
+            indexed = self.conn.execute(f'SELECT COUNT(*) FROM {self.fts_table}').fetchone()[0]
+            expected = self.conn.execute(
+                f'SELECT COUNT(*) FROM {self.table} WHERE id <= ? AND {self.text_column} IS NOT NULL', (last_id,)
+            ).fetchone()[0]
+            stale = []
+            if indexed != expected:
+                stale = self.conn.execute(f'''
+                    SELECT rowid, speaker FROM {self.fts_table}
+                    WHERE rowid NOT IN (SELECT id FROM {self.table})
+                ''').fetchall()
+            if stale:
+                self.conn.executemany(f'DELETE FROM {self.fts_table} WHERE rowid = ?',
+                                      [(rowid,) for rowid, _ in stale])
+            stale_speakers = {speaker for _, speaker in stale}
+
+            # 2. 아직 색인하지 않은 행 추가
+            last_id = self.conn.execute(f'SELECT COALESCE(MAX(rowid), 0) FROM {self.fts_table}').fetchone()[0]
+            cursor = self.conn.execute(f'''
+                SELECT id, {self.speaker_column}, {self.text_column}, {self.meeting_column}
+                FROM {self.table}
+                WHERE id > ? AND {self.text_column} IS NOT NULL
+                ORDER BY id
+            ''', (last_id,))
+            added = 0
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                self.conn.executemany(
+                    f'INSERT INTO {self.fts_table} (rowid, speaker, body, tails, meeting_id) VALUES (?, ?, ?, ?, ?)',
+                    [(row_id, speaker or '', ' '.join(tokenize_korean(text)), ' '.join(tail_tokens(text)), meeting_id)
+                     for row_id, speaker, text, meeting_id in rows]
+                )
+                self.conn.executemany(
+                    f'INSERT OR IGNORE INTO {self.vocab_table} (speaker, word) VALUES (?, ?)',
+                    [(speaker or '', word) for _, speaker, text, _ in rows
+                     for word in set(text.split()) if len(word) >= MIN_VOCAB_WORD_LENGTH]
+                )
+                added += len(rows)
+
+            # 3. 발언이 지워진 발언자의 어휘는 남은 발언으로 다시 계산
+            for speaker in stale_speakers:
+                self._rebuild_vocabulary(speaker)
+
+        if stale or added:
+            logger.info(f"🔎 발언 색인 동기화: 추가 {added}건, 제거 {len(stale)}건")
+        return {'added': added, 'removed': len(stale)}
+
+    def rebuild(self) -> Dict[str, int]:
+        """색인 전체 재구축"""
+        with self.conn:
+            self.conn.execute(f'DELETE FROM {self.fts_table}')
+            self.conn.execute(f'DELETE FROM {self.vocab_table}')
+        result = self.sync()
+        with self.conn:
+            self.conn.execute(f"INSERT INTO {self.fts_table}({self.fts_table}) VALUES ('optimize')")
+        return result
+
+    def _rebuild_vocabulary(self, speaker: str):
+        self.conn.execute(f'DELETE FROM {self.vocab_table} WHERE speaker = ?', (speaker,))
+        rows = self.conn.execute(f'''
+            SELECT {self.text_column} FROM {self.table}
+            WHERE {self.speaker_column} = ? AND {self.text_column} IS NOT NULL
+        ''', (speaker,))
+        self.conn.executemany(
+            f'INSERT OR IGNORE INTO {self.vocab_table} (speaker, word) VALUES (?, ?)',
+            [(speaker, word) for (text,) in rows for word in set(text.split())
+             if len(word) >= MIN_VOCAB_WORD_LENGTH]
+        )
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def _where(self, expression: str, speaker: Optional[str]) -> Tuple[str, list]:
+        """MATCH 조건 (발언자 필터는 색인 조회 + 정확히 같은 이름만)
+
+        speaker=None만 필터 없음. ''는 발언자가 비어 있는 발언만 (색인에는 빈 문자열로 저장)
+        """
+        if speaker is None:
+            return f'f.{self.fts_table} MATCH ?', [expression]
+        if not speaker.strip():
+            return f'f.{self.fts_table} MATCH ? AND f.speaker = ?', [expression, speaker]
+        escaped = speaker.replace('"', '""')
+        return (f'f.{self.fts_table} MATCH ? AND f.speaker = ?',
+                [f'speaker : "{escaped}" AND ({expression})', speaker])
+
+    def search(self, query: str, speaker: Optional[str] = None, limit: int = 20,
+               operator: str = 'AND') -> List[Dict]:
+        """키워드/구문 검색 (BM25 순). query 예: '교육 "기본 소득"', speaker=None이면 전체 발언자"""
+        expression = match_expression(parse_query(query), operator)
+        if expression is None:
+            return []
+        where, params = self._where(expression, speaker)
+        rows = self.conn.execute(f'''
+            SELECT f.rowid, t.{self.speaker_column}, t.{self.meeting_column}, t.{self.text_column},
+                   bm25({self.fts_table}, 0.0, 1.0, 1.0) AS score
+            FROM {self.fts_table} f
+            JOIN {self.table} t ON t.id = f.rowid
+            WHERE {where}
+            ORDER BY score
+            LIMIT ?
+        ''', params + [limit]).fetchall()
+        return [
+            {'id': row_id, 'speaker_name': speaker_name, 'meeting_id': meeting_id,
+             'speech_content': content, 'score': round(-score, 4)}
+            for row_id, speaker_name, meeting_id, content, score in rows
+        ]
+
+    def count(self, term: str, speaker: Optional[str] = None) -> int:
+        """검색어가 들어간 발언 수"""
+        expression = match_expression([term])
+        if expression is None:
+            return 0
+        where, params = self._where(expression, speaker)
+        return self.conn.execute(f'SELECT COUNT(*) FROM {self.fts_table} f WHERE {where}', params).fetchone()[0]
+
+    def contains(self, term: str, speaker: Optional[str] = None) -> bool:
+        """검색어가 들어간 발언이 하나라도 있는지 (첫 일치에서 조회 종료)"""
+        expression = match_expression([term])
+        if expression is None:
+            return False
+        where, params = self._where(expression, speaker)
+        return self.conn.execute(f'SELECT 1 FROM {self.fts_table} f WHERE {where} LIMIT 1', params).fetchone() is not None
+
+    def keyword_presence(self, keywords: Iterable[str], speaker: Optional[str] = None) -> Dict[str, bool]:
+        """키워드별 사용 여부"""
+        return {keyword: self.contains(keyword, speaker) for keyword in keywords}
+
+    def keyword_counts(self, keywords: Iterable[str], speaker: Optional[str] = None) -> Dict[str, int]:
+        """키워드별 발언 수 (키워드당 색인 조회 1회)"""
+        return {keyword: self.count(keyword, speaker) for keyword in keywords}
+
+    def keyword_diversity(self, speaker: str) -> int:
+        """발언자가 쓴 서로 다른 단어 수 (공백 기준 3자 이상)"""
+        return self.conn.execute(
+            f'SELECT COUNT(*) FROM {self.vocab_table} WHERE speaker = ?', (speaker,)
+        ).fetchone()[0]
+
+    def speaker_stats(self, speaker: str) -> Dict:
+        """발언 수 / 평균 발언 길이 (발언자 인덱스 조회)"""
+        total, avg_length = self.conn.execute(f'''
+            SELECT COUNT(*), AVG(LENGTH({self.text_column})) FROM {self.table}
+            WHERE {self.speaker_column} = ? AND {self.text_column} IS NOT NULL AND {self.text_column} != ''
+        ''', (speaker,)).fetchone()
+        return {'total_speeches': total, 'avg_speech_length': avg_length or 0}
+
+    def stats(self) -> Dict:
+        indexed = self.conn.execute(f'SELECT COUNT(*) FROM {self.fts_table}').fetchone()[0]
+        speakers = self.conn.execute(f'SELECT COUNT(DISTINCT speaker) FROM {self.vocab_table}').fetchone()[0]
+        return {'table': self.table, 'indexed_speeches': indexed, 'speakers': speakers}
+
+    def close(self):
+        self.conn.close()
@@ -5,15 +5,760 @@ HTML/CSS/JavaScript로 직접 구현하여 안정성 확보
 """
 
 import json
+import argparse
 import os
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from datetime import datetime
 
+from widget_render_engine import WidgetRenderer, WidgetTemplate, file_hash
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 생성기 코드/템플릿이 바뀌면 모든 산출물의 입력이 바뀐 것으로 취급
+GENERATOR_HASH = file_hash(__file__)
+
+WIDGET_CSS = """
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    background: #f8f9fa;
+    padding: 20px;
+    overflow-x: auto;
+}
+
+.network-container {
+    width: 100%;
+    height: 600px;
+    background: white;
+    border-radius: 15px;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+    position: relative;
+    overflow: hidden;
+}
+
+.network-svg {
+    width: 100%;
+    height: 100%;
+}
+
+.node {
+    cursor: pointer;
+    transition: all 0.3s ease;
+}
+
+.node:hover {
+    transform: scale(1.1);
+}
+
+.node-center {
+    fill: #FFD700;
+    stroke: #3498db;
+    stroke-width: 3;
+}
+
+.node-level1 {
+    fill: #ecf0f1;
+    stroke: #bdc3c7;
+    stroke-width: 2;
+}
+
+.node-level2 {
+    fill: #f8f9fa;
+    stroke: #95a5a6;
+    stroke-width: 1.5;
+}
+
+.node-level3 {
+    fill: #ffffff;
+    stroke: #7f8c8d;
+    stroke-width: 1;
+}
+
+.node-text {
+    font-family: 'SF Pro Display', -apple-system, sans-serif;
+    font-size: 12px;
+    font-weight: 500;
+    text-anchor: middle;
+    dominant-baseline: central;
+    pointer-events: none;
+}
+
+.node-center .node-text {
+    font-size: 14px;
+    font-weight: 600;
+    fill: #2c3e50;
+}
+
+.node-level1 .node-text {
+    font-size: 12px;
+    fill: #2c3e50;
+}
+
+.node-level2 .node-text {
+    font-size: 11px;
+    fill: #7f8c8d;
+}
+
+.node-level3 .node-text {
+    font-size: 10px;
+    fill: #95a5a6;
+}
+
+.edge {
+    stroke: #bdc3c7;
+    stroke-width: 2;
+    fill: none;
+    opacity: 0.7;
+}
+
+.edge:hover {
+    opacity: 1;
+    stroke-width: 3;
+}
+
+.tooltip {
+    position: absolute;
+    background: rgba(0,0,0,0.8);
+    color: white;
+    padding: 10px;
+    border-radius: 8px;
+    font-size: 12px;
+    pointer-events: none;
+    z-index: 1000;
+    max-width: 200px;
+    font-family: 'SF Pro Display', -apple-system, sans-serif;
+}
+
+.legend {
+    position: absolute;
+    top: 20px;
+    right: 20px;
+    background: white;
+    padding: 15px;
+    border-radius: 10px;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+    font-size: 11px;
+}
+
+.legend-item {
+    display: flex;
+    align-items: center;
+    margin-bottom: 5px;
+}
+
+.legend-color {
+    width: 12px;
+    height: 12px;
+    border-radius: 50%;
+    margin-right: 8px;
+}
+"""
+
+WIDGET_JS = """
+// 네트워크 생성
+function createNetwork() {
+    const svg = document.getElementById('networkSvg');
+    const tooltip = document.getElementById('tooltip');
+    
+    // SVG 크기 설정
+    const container = document.querySelector('.network-container');
+    const width = container.clientWidth;
+    const height = container.clientHeight;
+    
+    svg.setAttribute('width', width);
+    svg.setAttribute('height', height);
+    
+    // 중심 노드 위치
+    const centerX = width / 2;
+    const centerY = height / 2;
+    
+    // 노드와 엣지 생성
+    const nodes = [];
+    const edges = [];
+    
+    // 중심 노드 추가
+    nodes.push({
+        id: politicianData.name,
+        x: centerX,
+        y: centerY,
+        level: 0,
+        type: 'center',
+        data: politicianData
+    });
+    
+    // 1단계 연결 노드들 (원형 배치)
+    const level1Connections = politicianData.connections.filter(conn => conn.level === 1);
+    const level1Radius = 150;
+    
+    level1Connections.forEach((conn, index) => {
+        const angle = (2 * Math.PI * index) / level1Connections.length;
+        const x = centerX + level1Radius * Math.cos(angle);
+        const y = centerY + level1Radius * Math.sin(angle);
+        
+        nodes.push({
+            id: conn.name,
+            x: x,
+            y: y,
+            level: 1,
+            type: conn.type,
+            data: conn
+        });
+        
+        // 중심 노드와 연결
+        edges.push({
+            from: politicianData.name,
+            to: conn.name,
+            type: conn.type,
+            strength: conn.strength
+        });
+    });
+    
+    // 2단계 연결 노드들
+    const level2Connections = politicianData.connections.filter(conn => conn.level === 2);
+    level2Connections.forEach((conn, index) => {
+        const parentNode = nodes.find(node => node.id === conn.parent);
+        if (parentNode) {
+            const angle = Math.random() * 2 * Math.PI;
+            const distance = 100;
+            const x = parentNode.x + distance * Math.cos(angle);
+            const y = parentNode.y + distance * Math.sin(angle);
+            
+            nodes.push({
+                id: conn.name,
+                x: x,
+                y: y,
+                level: 2,
+                type: conn.type,
+                data: conn
+            });
+            
+            // 부모 노드와 연결
+            edges.push({
+                from: conn.parent,
+                to: conn.name,
+                type: conn.type,
+                strength: conn.strength
+            });
+        }
+    });
+    
+    // 3단계 연결 노드들
+    const level3Connections = politicianData.connections.filter(conn => conn.level === 3);
+    level3Connections.forEach((conn, index) => {
+        const parentNode = nodes.find(node => node.id === conn.parent);
+        if (parentNode) {
+            const angle = Math.random() * 2 * Math.PI;
+            const distance = 80;
+            const x = parentNode.x + distance * Math.cos(angle);
+            const y = parentNode.y + distance * Math.sin(angle);
+            
+            nodes.push({
+                id: conn.name,
+                x: x,
+                y: y,
+                level: 3,
+                type: conn.type,
+                data: conn
+            });
+            
+            // 부모 노드와 연결
+            edges.push({
+                from: conn.parent,
+                to: conn.name,
+                type: conn.type,
+                strength: conn.strength
+            });
+        }
+    });
+    
+    // SVG에 노드와 엣지 그리기
+    drawNetwork(svg, nodes, edges, tooltip);
+}
+
+function drawNetwork(svg, nodes, edges, tooltip) {
+    // 기존 내용 지우기
+    svg.innerHTML = '';
+    
+    // 엣지 그리기
+    edges.forEach(edge => {
+        const fromNode = nodes.find(n => n.id === edge.from);
+        const toNode = nodes.find(n => n.id === edge.to);
+        
+        if (fromNode && toNode) {
+            const line = document.createElementNS('http://www.w3.org/2000/svg', 'line');
+            line.setAttribute('x1', fromNode.x);
+            line.setAttribute('y1', fromNode.y);
+            line.setAttribute('x2', toNode.x);
+            line.setAttribute('y2', toNode.y);
+            line.setAttribute('class', 'edge');
+            line.setAttribute('stroke', getConnectionColor(edge.type));
+            line.setAttribute('stroke-width', Math.max(1, edge.strength * 4));
+            
+            svg.appendChild(line);
+        }
+    });
+    
+    // 노드 그리기
+    nodes.forEach(node => {
+        const group = document.createElementNS('http://www.w3.org/2000/svg', 'g');
+        group.setAttribute('class', 'node');
+        group.setAttribute('transform', `translate(${node.x}, ${node.y})`);
+        
+        // 노드 원 그리기
+        const circle = document.createElementNS('http://www.w3.org/2000/svg', 'circle');
+        circle.setAttribute('r', getNodeRadius(node.level));
+        circle.setAttribute('class', `node-level${node.level}`);
+        
+        if (node.level === 0) {
+            circle.setAttribute('fill', '#FFD700');
+            circle.setAttribute('stroke', '#3498db');
+            circle.setAttribute('stroke-width', '3');
+        } else {
+            circle.setAttribute('fill', '#ecf0f1');
+            circle.setAttribute('stroke', getConnectionColor(node.type));
+            circle.setAttribute('stroke-width', '2');
+        }
+        
+        // 노드 텍스트
+        const text = document.createElementNS('http://www.w3.org/2000/svg', 'text');
+        text.setAttribute('class', 'node-text');
+        text.textContent = node.id;
+        
+        // 이벤트 리스너
+        group.addEventListener('mouseenter', (e) => {
+            showTooltip(e, node, tooltip);
+        });
+        
+        group.addEventListener('mouseleave', () => {
+            hideTooltip(tooltip);
+        });
+        
+        group.appendChild(circle);
+        group.appendChild(text);
+        svg.appendChild(group);
+    });
+}
+
+function getNodeRadius(level) {
+    switch(level) {
+        case 0: return 25;
+        case 1: return 20;
+        case 2: return 15;
+        case 3: return 12;
+        default: return 10;
+    }
+}
+
+function getConnectionColor(type) {
+    const colors = {
+        '입법_연결': '#FF6B6B',
+        '위원회_연결': '#4ECDC4',
+        '정치적_연결': '#45B7D1',
+        '지역_연결': '#96CEB4',
+        '정책_연결': '#FFEAA7',
+        '시간_연결': '#DDA0DD'
+    };
+    return colors[type] || '#bdc3c7';
+}
+
+function showTooltip(event, node, tooltip) {
+    const data = node.data;
+    let content = '';
+    
+    if (node.level === 0) {
+        content = `
+            <div style="font-weight: 600; margin-bottom: 5px;">${data.name}</div>
+            <div>${data.party}</div>
+            <div>${data.district}</div>
+            <div>${data.committee}</div>
+            <div style="color: #e74c3c; font-weight: 600; margin-top: 5px;">
+                연결성 점수: ${data.connectivity_score}점
+            </div>
+        `;
+    } else {
+        content = `
+            <div style="font-weight: 600; margin-bottom: 5px;">${data.name}</div>
+            <div>연결 유형: ${data.type}</div>
+            <div>설명: ${data.description}</div>
+            <div style="color: ${getConnectionColor(data.type)}; font-weight: 600; margin-top: 5px;">
+                연결 강도: ${data.strength.toFixed(1)}
+            </div>
+        `;
+    }
+    
+    tooltip.innerHTML = content;
+    tooltip.style.display = 'block';
+    tooltip.style.left = event.pageX + 10 + 'px';
+    tooltip.style.top = event.pageY - 10 + 'px';
+}
+
+function hideTooltip(tooltip) {
+    tooltip.style.display = 'none';
+}
+
+// 페이지 로드 시 네트워크 생성
+window.addEventListener('load', createNetwork);
+window.addEventListener('resize', createNetwork);
+"""
+
+PAGE_CSS = """
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+    padding: 20px;
+}
+
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+    background: white;
+    border-radius: 20px;
+    box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+    overflow: hidden;
+}
+
+.header {
+    background: linear-gradient(135deg, #3498db, #2980b9);
+    color: white;
+    padding: 40px;
+    text-align: center;
+}
+
+.header h1 {
+    font-size: 2.5em;
+    margin-bottom: 15px;
+    font-weight: 600;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+}
+
+.header .info {
+    font-size: 1.1em;
+    opacity: 0.9;
+    margin-bottom: 10px;
+}
+
+.score-badge {
+    display: inline-block;
+    background: rgba(255,255,255,0.2);
+    padding: 12px 24px;
+    border-radius: 25px;
+    margin-top: 15px;
+    font-size: 1.1em;
+    font-weight: 600;
+    backdrop-filter: blur(10px);
+}
+
+.content {
+    padding: 40px;
+}
+
+.widget-section {
+    margin-bottom: 40px;
+}
+
+.widget-section h2 {
+    color: #2c3e50;
+    margin-bottom: 20px;
+    font-size: 1.8em;
+    font-weight: 600;
+    border-bottom: 3px solid #3498db;
+    padding-bottom: 10px;
+}
+
+.widget-container {
+    border: 2px solid #ecf0f1;
+    border-radius: 15px;
+    overflow: hidden;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+    background: #f8f9fa;
+}
+
+.widget-container iframe {
+    width: 100%;
+    height: 600px;
+    border: none;
+}
+
+.back-button {
+    position: fixed;
+    top: 20px;
+    left: 20px;
+    background: rgba(255,255,255,0.9);
+    border: none;
+    padding: 15px 25px;
+    border-radius: 25px;
+    font-family: 'SF Pro Display', -apple-system, sans-serif;
+    font-size: 1em;
+    font-weight: 500;
+    cursor: pointer;
+    box-shadow: 0 5px 15px rgba(0,0,0,0.2);
+    transition: all 0.3s ease;
+    backdrop-filter: blur(10px);
+}
+
+.back-button:hover {
+    background: white;
+    transform: translateY(-2px);
+    box-shadow: 0 8px 20px rgba(0,0,0,0.25);
+}
+"""
+
+INDEX_CSS = """
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+    padding: 20px;
+}
+
+.container {
+    max-width: 1200px;
+    margin: 0 auto;
+}
+
+.header {
+    text-align: center;
+    color: white;
+    margin-bottom: 50px;
+}
+
+.header h1 {
+    font-size: 3.5em;
+    margin-bottom: 20px;
+    font-weight: 600;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+}
+
+.header p {
+    font-size: 1.3em;
+    opacity: 0.9;
+    font-weight: 300;
+}
+
+.politicians-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
+    gap: 30px;
+}
+
+.politician-card {
+    background: white;
+    border-radius: 20px;
+    padding: 30px;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+    transition: transform 0.3s ease, box-shadow 0.3s ease;
+    cursor: pointer;
+    border: 1px solid #ecf0f1;
+}
+
+.politician-card:hover {
+    transform: translateY(-10px);
+    box-shadow: 0 20px 40px rgba(0,0,0,0.2);
+}
+
+.politician-name {
+    font-size: 1.8em;
+    font-weight: 600;
+    color: #2c3e50;
+    margin-bottom: 15px;
+}
+
+.politician-info {
+    color: #7f8c8d;
+    margin-bottom: 20px;
+    line-height: 1.5;
+}
+
+.politician-info p {
+    margin-bottom: 5px;
+}
+
+.score-badge {
+    display: inline-block;
+    background: linear-gradient(135deg, #3498db, #2ecc71);
+    color: white;
+    padding: 12px 24px;
+    border-radius: 25px;
+    font-weight: 600;
+    margin-bottom: 20px;
+}
+
+.view-button {
+    background: linear-gradient(135deg, #3498db, #2980b9);
+    color: white;
+    border: none;
+    padding: 15px 30px;
+    border-radius: 25px;
+    font-family: 'SF Pro Display', -apple-system, sans-serif;
+    font-size: 1em;
+    font-weight: 500;
+    cursor: pointer;
+    margin-top: 20px;
+    width: 100%;
+    transition: all 0.3s ease;
+}
+
+.view-button:hover {
+    background: linear-gradient(135deg, #2980b9, #3498db);
+    transform: translateY(-2px);
+    box-shadow: 0 5px 15px rgba(52, 152, 219, 0.4);
+}
+"""
+
+WIDGET_TEMPLATE = WidgetTemplate("""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>${name} 연결성 네트워크</title>
+    ${stylesheets}
+</head>
+<body>
+    <div class="network-container">
+        <svg class="network-svg" id="networkSvg">
+            <!-- 네트워크 노드와 엣지가 여기에 동적으로 생성됩니다 -->
+        </svg>
+        
+        <div class="tooltip" id="tooltip" style="display: none;"></div>
+        
+        <div class="legend">
+            <h4 style="margin-bottom: 10px; color: #2c3e50;">연결 유형</h4>
+            <div class="legend-item">
+                <div class="legend-color" style="background: #FF6B6B;"></div>
+                <span>입법 연결</span>
+            </div>
+            <div class="legend-item">
+                <div class="legend-color" style="background: #4ECDC4;"></div>
+                <span>위원회 연결</span>
+            </div>
+            <div class="legend-item">
+                <div class="legend-color" style="background: #45B7D1;"></div>
+                <span>정치적 연결</span>
+            </div>
+            <div class="legend-item">
+                <div class="legend-color" style="background: #96CEB4;"></div>
+                <span>지역 연결</span>
+            </div>
+            <div class="legend-item">
+                <div class="legend-color" style="background: #FFEAA7;"></div>
+                <span>정책 연결</span>
+            </div>
+            <div class="legend-item">
+                <div class="legend-color" style="background: #DDA0DD;"></div>
+                <span>시간 연결</span>
+            </div>
+        </div>
+    </div>
+    <script>
+        // 정치인 데이터
+        const politicianData = ${politician_json};
+    </script>
+    ${scripts}
+</body>
+</html>
+""")
+
+PAGE_TEMPLATE = WidgetTemplate("""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>${name} 연결성 분석</title>
+    ${stylesheets}
+</head>
+<body>
+    <button class="back-button" onclick="history.back()">← 뒤로가기</button>
+    
+    <div class="container">
+        <div class="header">
+            <h1>${name}</h1>
+            <div class="info">
+                <p>${party} | ${district}</p>
+                <p>${committee}</p>
+            </div>
+            <div class="score-badge">
+                연결성 점수: ${connectivity_score}점
+            </div>
+        </div>
+        
+        <div class="content">
+            <div class="widget-section">
+                <h2>🌐 연결성 네트워크 시각화</h2>
+                <div class="widget-container">
+                    <iframe src="../widgets/network_${name}.html"></iframe>
+                </div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+INDEX_TEMPLATE = WidgetTemplate("""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>정치인 연결성 분석 - 안정적인 네트워크 시각화</title>
+    ${stylesheets}
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🌐 정치인 연결성 분석</h1>
+            <p>안정적인 네트워크 시각화 시스템</p>
+        </div>
+        
+        <div class="politicians-grid">
+${politician_cards}
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+INDEX_ITEM_TEMPLATE = WidgetTemplate("""
+            <div class="politician-card" onclick="location.href='pages/page_${name}.html'">
+                <div class="politician-name">${name}</div>
+                <div class="politician-info">
+                    <p><strong>정당:</strong> ${party}</p>
+                    <p><strong>지역구:</strong> ${district}</p>
+                    <p><strong>위원회:</strong> ${committee}</p>
+                </div>
+                <div class="score-badge">
+                    연결성 점수: ${connectivity_score}점
+                </div>
+                <button class="view-button" onclick="event.stopPropagation(); location.href='pages/page_${name}.html'">
+                    네트워크 보기
+                </button>
+            </div>
+""")
+
+
 class StableNetworkVisualizer:
     """안정적인 네트워크 시각화 클래스"""
     
@@ -96,6 +841,15 @@ class StableNetworkVisualizer:
         os.makedirs(self.output_dir, exist_ok=True)
         os.makedirs(f"{self.output_dir}/widgets", exist_ok=True)
         os.makedirs(f"{self.output_dir}/pages", exist_ok=True)
+        
+        # 공용 CSS/JS (내용 해시 이름으로 한 번만 기록)
+        self.renderer = WidgetRenderer(self.output_dir)
+        self.widget_assets = {
+            'css': [self.renderer.assets.add('network_widget', WIDGET_CSS, 'css')],
+            'js': [self.renderer.assets.add('network_widget', WIDGET_JS, 'js')],
+        }
+        self.page_assets = {'css': [self.renderer.assets.add('network_page', PAGE_CSS, 'css')]}
+        self.index_assets = {'css': [self.renderer.assets.add('network_index', INDEX_CSS, 'css')]}
     
     def create_network_widget(self, politician_name: str) -> str:
         """안정적인 네트워크 위젯 생성 (HTML/CSS/JS 직접 구현)"""
@@ -106,454 +860,17 @@ class StableNetworkVisualizer:
             
             politician = self.politicians[politician_name]
             
-            # HTML 콘텐츠 생성
-            html_content = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{politician['name']} 연결성 네트워크</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: #f8f9fa;
-            padding: 20px;
-            overflow-x: auto;
-        }}
-        
-        .network-container {{
-            width: 100%;
-            height: 600px;
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-            position: relative;
-            overflow: hidden;
-        }}
-        
-        .network-svg {{
-            width: 100%;
-            height: 100%;
-        }}
-        
-        .node {{
-            cursor: pointer;
-            transition: all 0.3s ease;
-        }}
-        
-        .node:hover {{
-            transform: scale(1.1);
-        }}
-        
-        .node-center {{
-            fill: #FFD700;
-            stroke: #3498db;
-            stroke-width: 3;
-        }}
-        
-        .node-level1 {{
-            fill: #ecf0f1;
-            stroke: #bdc3c7;
-            stroke-width: 2;
-        }}
-        
-        .node-level2 {{
-            fill: #f8f9fa;
-            stroke: #95a5a6;
-            stroke-width: 1.5;
-        }}
-        
-        .node-level3 {{
-            fill: #ffffff;
-            stroke: #7f8c8d;
-            stroke-width: 1;
-        }}
-        
-        .node-text {{
-            font-family: 'SF Pro Display', -apple-system, sans-serif;
-            font-size: 12px;
-            font-weight: 500;
-            text-anchor: middle;
-            dominant-baseline: central;
-            pointer-events: none;
-        }}
-        
-        .node-center .node-text {{
-            font-size: 14px;
-            font-weight: 600;
-            fill: #2c3e50;
-        }}
-        
-        .node-level1 .node-text {{
-            font-size: 12px;
-            fill: #2c3e50;
-        }}
-        
-        .node-level2 .node-text {{
-            font-size: 11px;
-            fill: #7f8c8d;
-        }}
-        
-        .node-level3 .node-text {{
-            font-size: 10px;
-            fill: #95a5a6;
-        }}
-        
-        .edge {{
-            stroke: #bdc3c7;
-            stroke-width: 2;
-            fill: none;
-            opacity: 0.7;
-        }}
-        
-        .edge:hover {{
-            opacity: 1;
-            stroke-width: 3;
-        }}
-        
-        .tooltip {{
-            position: absolute;
-            background: rgba(0,0,0,0.8);
-            color: white;
-            padding: 10px;
-            border-radius: 8px;
-            font-size: 12px;
-            pointer-events: none;
-            z-index: 1000;
-            max-width: 200px;
-            font-family: 'SF Pro Display', -apple-system, sans-serif;
-        }}
-        
-        .legend {{
-            position: absolute;
-            top: 20px;
-            right: 20px;
-            background: white;
-            padding: 15px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            font-size: 11px;
-        }}
-        
-        .legend-item {{
-            display: flex;
-            align-items: center;
-            margin-bottom: 5px;
-        }}
-        
-        .legend-color {{
-            width: 12px;
-            height: 12px;
-            border-radius: 50%;
-            margin-right: 8px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="network-container">
-        <svg class="network-svg" id="networkSvg">
-            <!-- 네트워크 노드와 엣지가 여기에 동적으로 생성됩니다 -->
-        </svg>
-        
-        <div class="tooltip" id="tooltip" style="display: none;"></div>
-        
-        <div class="legend">
-            <h4 style="margin-bottom: 10px; color: #2c3e50;">연결 유형</h4>
-            <div class="legend-item">
-                <div class="legend-color" style="background: #FF6B6B;"></div>
-                <span>입법 연결</span>
-            </div>
-            <div class="legend-item">
-                <div class="legend-color" style="background: #4ECDC4;"></div>
-                <span>위원회 연결</span>
-            </div>
-            <div class="legend-item">
-                <div class="legend-color" style="background: #45B7D1;"></div>
-                <span>정치적 연결</span>
-            </div>
-            <div class="legend-item">
-                <div class="legend-color" style="background: #96CEB4;"></div>
-                <span>지역 연결</span>
-            </div>
-            <div class="legend-item">
-                <div class="legend-color" style="background: #FFEAA7;"></div>
-                <span>정책 연결</span>
-            </div>
-            <div class="legend-item">
-                <div class="legend-color" style="background: #DDA0DD;"></div>
-                <span>시간 연결</span>
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        // 정치인 데이터
-        const politicianData = {json.dumps(politician, ensure_ascii=False, indent=2)};
-        
-        // 네트워크 생성
-        function createNetwork() {{
-            const svg = document.getElementById('networkSvg');
-            const tooltip = document.getElementById('tooltip');
-            
-            // SVG 크기 설정
-            const container = document.querySelector('.network-container');
-            const width = container.clientWidth;
-            const height = container.clientHeight;
-            
-            svg.setAttribute('width', width);
-            svg.setAttribute('height', height);
-            
-            // 중심 노드 위치
-            const centerX = width / 2;
-            const centerY = height / 2;
-            
-            // 노드와 엣지 생성
-            const nodes = [];
-            const edges = [];
-            
-            // 중심 노드 추가
-            nodes.push({{
-                id: politicianData.name,
-                x: centerX,
-                y: centerY,
-                level: 0,
-                type: 'center',
-                data: politicianData
-            }});
-            
-            // 1단계 연결 노드들 (원형 배치)
-            const level1Connections = politicianData.connections.filter(conn => conn.level === 1);
-            const level1Radius = 150;
-            
-            level1Connections.forEach((conn, index) => {{
-                const angle = (2 * Math.PI * index) / level1Connections.length;
-                const x = centerX + level1Radius * Math.cos(angle);
-                const y = centerY + level1Radius * Math.sin(angle);
-                
-                nodes.push({{
-                    id: conn.name,
-                    x: x,
-                    y: y,
-                    level: 1,
-                    type: conn.type,
-                    data: conn
-                }});
-                
-                // 중심 노드와 연결
-                edges.push({{
-                    from: politicianData.name,
-                    to: conn.name,
-                    type: conn.type,
-                    strength: conn.strength
-                }});
-            }});
-            
-            // 2단계 연결 노드들
-            const level2Connections = politicianData.connections.filter(conn => conn.level === 2);
-            level2Connections.forEach((conn, index) => {{
-                const parentNode = nodes.find(node => node.id === conn.parent);
-                if (parentNode) {{
-                    const angle = Math.random() * 2 * Math.PI;
-                    const distance = 100;
-                    const x = parentNode.x + distance * Math.cos(angle);
-                    const y = parentNode.y + distance * Math.sin(angle);
-                    
-                    nodes.push({{
-                        id: conn.name,
-                        x: x,
-                        y: y,
-                        level: 2,
-                        type: conn.type,
-                        data: conn
-                    }});
-                    
-                    // 부모 노드와 연결
-                    edges.push({{
-                        from: conn.parent,
-                        to: conn.name,
-                        type: conn.type,
-                        strength: conn.strength
-                    }});
-                }}
-            }});
-            
-            // 3단계 연결 노드들
-            const level3Connections = politicianData.connections.filter(conn => conn.level === 3);
-            level3Connections.forEach((conn, index) => {{
-                const parentNode = nodes.find(node => node.id === conn.parent);
-                if (parentNode) {{
-                    const angle = Math.random() * 2 * Math.PI;
-                    const distance = 80;
-                    const x = parentNode.x + distance * Math.cos(angle);
-                    const y = parentNode.y + distance * Math.sin(angle);
-                    
-                    nodes.push({{
-                        id: conn.name,
-                        x: x,
-                        y: y,
-                        level: 3,
-                        type: conn.type,
-                        data: conn
-                    }});
-                    
-                    // 부모 노드와 연결
-                    edges.push({{
-                        from: conn.parent,
-                        to: conn.name,
-                        type: conn.type,
-                        strength: conn.strength
-                    }});
-                }}
-            }});
-            
-            // SVG에 노드와 엣지 그리기
-            drawNetwork(svg, nodes, edges, tooltip);
-        }}
-        
-        function drawNetwork(svg, nodes, edges, tooltip) {{
-            // 기존 내용 지우기
-            svg.innerHTML = '';
-            
-            // 엣지 그리기
-            edges.forEach(edge => {{
-                const fromNode = nodes.find(n => n.id === edge.from);
-                const toNode = nodes.find(n => n.id === edge.to);
-                
-                if (fromNode && toNode) {{
-                    const line = document.createElementNS('http://www.w3.org/2000/svg', 'line');
-                    line.setAttribute('x1', fromNode.x);
-                    line.setAttribute('y1', fromNode.y);
-                    line.setAttribute('x2', toNode.x);
-                    line.setAttribute('y2', toNode.y);
-                    line.setAttribute('class', 'edge');
-                    line.setAttribute('stroke', getConnectionColor(edge.type));
-                    line.setAttribute('stroke-width', Math.max(1, edge.strength * 4));
-                    
-                    svg.appendChild(line);
-                }}
-            }});
-            
-            // 노드 그리기
-            nodes.forEach(node => {{
-                const group = document.createElementNS('http://www.w3.org/2000/svg', 'g');
-                group.setAttribute('class', 'node');
-                group.setAttribute('transform', `translate(${{node.x}}, ${{node.y}})`);
-                
-                // 노드 원 그리기
-                const circle = document.createElementNS('http://www.w3.org/2000/svg', 'circle');
-                circle.setAttribute('r', getNodeRadius(node.level));
-                circle.setAttribute('class', `node-level${{node.level}}`);
-                
-                if (node.level === 0) {{
-                    circle.setAttribute('fill', '#FFD700');
-                    circle.setAttribute('stroke', '#3498db');
-                    circle.setAttribute('stroke-width', '3');
-                }} else {{
-                    circle.setAttribute('fill', '#ecf0f1');
-                    circle.setAttribute('stroke', getConnectionColor(node.type));
-                    circle.setAttribute('stroke-width', '2');
-                }}
-                
-                // 노드 텍스트
-                const text = document.createElementNS('http://www.w3.org/2000/svg', 'text');
-                text.setAttribute('class', 'node-text');
-                text.textContent = node.id;
-                
-                // 이벤트 리스너
-                group.addEventListener('mouseenter', (e) => {{
-                    showTooltip(e, node, tooltip);
-                }});
-                
-                group.addEventListener('mouseleave', () => {{
-                    hideTooltip(tooltip);
-                }});
-                
-                group.appendChild(circle);
-                group.appendChild(text);
-                svg.appendChild(group);
-            }});
-        }}
-        
-        function getNodeRadius(level) {{
-            switch(level) {{
-                case 0: return 25;
-                case 1: return 20;
-                case 2: return 15;
-                case 3: return 12;
-                default: return 10;
-            }}
-        }}
-        
-        function getConnectionColor(type) {{
-            const colors = {{
-                '입법_연결': '#FF6B6B',
-                '위원회_연결': '#4ECDC4',
-                '정치적_연결': '#45B7D1',
-                '지역_연결': '#96CEB4',
-                '정책_연결': '#FFEAA7',
-                '시간_연결': '#DDA0DD'
-            }};
-            return colors[type] || '#bdc3c7';
-        }}
-        
-        function showTooltip(event, node, tooltip) {{
-            const data = node.data;
-            let content = '';
-            
-            if (node.level === 0) {{
-                content = `
-                    <div style="font-weight: 600; margin-bottom: 5px;">${{data.name}}</div>
-                    <div>${{data.party}}</div>
-                    <div>${{data.district}}</div>
-                    <div>${{data.committee}}</div>
-                    <div style="color: #e74c3c; font-weight: 600; margin-top: 5px;">
-                        연결성 점수: ${{data.connectivity_score}}점
-                    </div>
-                `;
-            }} else {{
-                content = `
-                    <div style="font-weight: 600; margin-bottom: 5px;">${{data.name}}</div>
-                    <div>연결 유형: ${{data.type}}</div>
-                    <div>설명: ${{data.description}}</div>
-                    <div style="color: ${{getConnectionColor(data.type)}}; font-weight: 600; margin-top: 5px;">
-                        연결 강도: ${{data.strength.toFixed(1)}}
-                    </div>
-                `;
-            }}
-            
-            tooltip.innerHTML = content;
-            tooltip.style.display = 'block';
-            tooltip.style.left = event.pageX + 10 + 'px';
-            tooltip.style.top = event.pageY - 10 + 'px';
-        }}
-        
-        function hideTooltip(tooltip) {{
-            tooltip.style.display = 'none';
-        }}
-        
-        // 페이지 로드 시 네트워크 생성
-        window.addEventListener('load', createNetwork);
-        window.addEventListener('resize', createNetwork);
-    </script>
-</body>
-</html>
-"""
-            
-            # HTML 파일로 저장
+            # 정치인 데이터만 인라인, 네트워크 스크립트는 공용 에셋
             filename = f"network_{politician['name']}.html"
-            filepath = f"{self.output_dir}/widgets/{filename}"
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            logger.info(f"안정적인 네트워크 위젯 생성 완료: {filepath}")
+            html_content = WIDGET_TEMPLATE.render(
+                name=politician['name'],
+                politician_json=json.dumps(politician, ensure_ascii=False, indent=2),
+                **self.renderer.asset_tags(f"widgets/{filename}", **self.widget_assets)
+            )
+            
+            # HTML 파일로 저장 (내용이 같으면 건너뜀)
+            if self.renderer.write(f"widgets/{filename}", html_content):
+                logger.info(f"안정적인 네트워크 위젯 생성 완료: {self.output_dir}/widgets/{filename}")
             return filename
             
         except Exception as e:
@@ -569,347 +886,66 @@ class StableNetworkVisualizer:
             
             politician = self.politicians[politician_name]
             
-            html_content = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{politician['name']} 연결성 분석</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 20px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, #3498db, #2980b9);
-            color: white;
-            padding: 40px;
-            text-align: center;
-        }}
-        
-        .header h1 {{
-            font-size: 2.5em;
-            margin-bottom: 15px;
-            font-weight: 600;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }}
-        
-        .header .info {{
-            font-size: 1.1em;
-            opacity: 0.9;
-            margin-bottom: 10px;
-        }}
-        
-        .score-badge {{
-            display: inline-block;
-            background: rgba(255,255,255,0.2);
-            padding: 12px 24px;
-            border-radius: 25px;
-            margin-top: 15px;
-            font-size: 1.1em;
-            font-weight: 600;
-            backdrop-filter: blur(10px);
-        }}
-        
-        .content {{
-            padding: 40px;
-        }}
-        
-        .widget-section {{
-            margin-bottom: 40px;
-        }}
-        
-        .widget-section h2 {{
-            color: #2c3e50;
-            margin-bottom: 20px;
-            font-size: 1.8em;
-            font-weight: 600;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 10px;
-        }}
-        
-        .widget-container {{
-            border: 2px solid #ecf0f1;
-            border-radius: 15px;
-            overflow: hidden;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-            background: #f8f9fa;
-        }}
-        
-        .widget-container iframe {{
-            width: 100%;
-            height: 600px;
-            border: none;
-        }}
-        
-        .back-button {{
-            position: fixed;
-            top: 20px;
-            left: 20px;
-            background: rgba(255,255,255,0.9);
-            border: none;
-            padding: 15px 25px;
-            border-radius: 25px;
-            font-family: 'SF Pro Display', -apple-system, sans-serif;
-            font-size: 1em;
-            font-weight: 500;
-            cursor: pointer;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-            transition: all 0.3s ease;
-            backdrop-filter: blur(10px);
-        }}
-        
-        .back-button:hover {{
-            background: white;
-            transform: translateY(-2px);
-            box-shadow: 0 8px 20px rgba(0,0,0,0.25);
-        }}
-    </style>
-</head>
-<body>
-    <button class="back-button" onclick="history.back()">← 뒤로가기</button>
-    
-    <div class="container">
-        <div class="header">
-            <h1>{politician['name']}</h1>
-            <div class="info">
-                <p>{politician['party']} | {politician['district']}</p>
-                <p>{politician['committee']}</p>
-            </div>
-            <div class="score-badge">
-                연결성 점수: {politician['connectivity_score']}점
-            </div>
-        </div>
-        
-        <div class="content">
-            <div class="widget-section">
-                <h2>🌐 연결성 네트워크 시각화</h2>
-                <div class="widget-container">
-                    <iframe src="widgets/network_{politician['name']}.html"></iframe>
-                </div>
-            </div>
-        </div>
-    </div>
-</body>
-</html>
-"""
-            
-            # HTML 파일로 저장
             filename = f"page_{politician['name']}.html"
-            filepath = f"{self.output_dir}/pages/{filename}"
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            logger.info(f"정치인 페이지 생성 완료: {filepath}")
+            html_content = PAGE_TEMPLATE.render(
+                politician,
+                **self.renderer.asset_tags(f"pages/{filename}", **self.page_assets)
+            )
+            
+            # HTML 파일로 저장 (내용이 같으면 건너뜀)
+            if self.renderer.write(f"pages/{filename}", html_content):
+                logger.info(f"정치인 페이지 생성 완료: {self.output_dir}/pages/{filename}")
             return filename
             
         except Exception as e:
             logger.error(f"정치인 페이지 생성 실패: {e}")
             return None
     
-    def create_all_widgets(self) -> Dict[str, Any]:
-        """모든 정치인 위젯 생성"""
-        results = {}
+    def _widget_inputs(self, politician_name: str) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """정치인 한 명의 산출물별 (출력 경로, 입력 필드) — 빌드 매니페스트 비교용"""
+        politician = self.politicians[politician_name]
+        return {
+            "widget": (f"widgets/network_{politician_name}.html", {**politician, "assets": self.widget_assets, "generator": GENERATOR_HASH}),
+            "page": (f"pages/page_{politician_name}.html", {**politician, "assets": self.page_assets, "generator": GENERATOR_HASH}),
+        }
+    
+    def _create_politician_widgets(self, job: Tuple[str, Sequence[str]]) -> Dict[str, Any]:
+        """정치인 한 명의 네트워크 위젯/페이지 중 작업에 포함된 것만 생성 (프로세스 풀 작업 단위)"""
+        politician_name, kinds = job
+        builders = {"widget": self.create_network_widget, "page": self.create_politician_page}
+        return {kind: builders[kind](politician_name) for kind in kinds}
+    
+    def create_all_widgets(self, max_workers: Optional[int] = None, changed_only: bool = False) -> Dict[str, Any]:
+        """모든 정치인 위젯 생성 (프로세스 풀 병렬, max_workers=1이면 순차)
         
-        for politician_name in self.politicians.keys():
-            logger.info(f"정치인 위젯 생성 중: {politician_name}")
-            
-            # 네트워크 위젯 생성
-            widget_file = self.create_network_widget(politician_name)
-            
-            # 개인 페이지 생성
-            page_file = self.create_politician_page(politician_name)
-            
-            if widget_file and page_file:
-                results[politician_name] = {
-                    "widget": widget_file,
-                    "page": page_file,
-                    "status": "success"
-                }
+        changed_only=True면 빌드 매니페스트와 입력 해시가 다른 산출물만 다시 생성
+        """
+        artifacts = {name: self._widget_inputs(name) for name in self.politicians}
+        logger.info(f"정치인 위젯 생성 중: {len(artifacts)}명")
+        
+        results = {}
+        for politician_name, files in self.renderer.build(self._create_politician_widgets, artifacts, changed_only, max_workers).items():
+            if all(files.values()):
+                results[politician_name] = {**files, "status": "success"}
         
         return results
     
     def create_index_page(self) -> str:
         """전체 정치인 목록 인덱스 페이지 생성"""
         try:
-            html_content = """
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>정치인 연결성 분석 - 안정적인 네트워크 시각화</title>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'SF Pro Display', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-        
-        .header {
-            text-align: center;
-            color: white;
-            margin-bottom: 50px;
-        }
-        
-        .header h1 {
-            font-size: 3.5em;
-            margin-bottom: 20px;
-            font-weight: 600;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }
-        
-        .header p {
-            font-size: 1.3em;
-            opacity: 0.9;
-            font-weight: 300;
-        }
-        
-        .politicians-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
-            gap: 30px;
-        }
-        
-        .politician-card {
-            background: white;
-            border-radius: 20px;
-            padding: 30px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-            cursor: pointer;
-            border: 1px solid #ecf0f1;
-        }
-        
-        .politician-card:hover {
-            transform: translateY(-10px);
-            box-shadow: 0 20px 40px rgba(0,0,0,0.2);
-        }
-        
-        .politician-name {
-            font-size: 1.8em;
-            font-weight: 600;
-            color: #2c3e50;
-            margin-bottom: 15px;
-        }
-        
-        .politician-info {
-            color: #7f8c8d;
-            margin-bottom: 20px;
-            line-height: 1.5;
-        }
-        
-        .politician-info p {
-            margin-bottom: 5px;
-        }
-        
-        .score-badge {
-            display: inline-block;
-            background: linear-gradient(135deg, #3498db, #2ecc71);
-            color: white;
-            padding: 12px 24px;
-            border-radius: 25px;
-            font-weight: 600;
-            margin-bottom: 20px;
-        }
-        
-        .view-button {
-            background: linear-gradient(135deg, #3498db, #2980b9);
-            color: white;
-            border: none;
-            padding: 15px 30px;
-            border-radius: 25px;
-            font-family: 'SF Pro Display', -apple-system, sans-serif;
-            font-size: 1em;
-            font-weight: 500;
-            cursor: pointer;
-            margin-top: 20px;
-            width: 100%;
-            transition: all 0.3s ease;
-        }
-        
-        .view-button:hover {
-            background: linear-gradient(135deg, #2980b9, #3498db);
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(52, 152, 219, 0.4);
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🌐 정치인 연결성 분석</h1>
-            <p>안정적인 네트워크 시각화 시스템</p>
-        </div>
-        
-        <div class="politicians-grid">
-"""
-            
-            # 각 정치인 카드 추가
-            for politician_name, politician_data in self.politicians.items():
-                html_content += f"""
-            <div class="politician-card" onclick="location.href='pages/page_{politician_name}.html'">
-                <div class="politician-name">{politician_name}</div>
-                <div class="politician-info">
-                    <p><strong>정당:</strong> {politician_data['party']}</p>
-                    <p><strong>지역구:</strong> {politician_data['district']}</p>
-                    <p><strong>위원회:</strong> {politician_data['committee']}</p>
-                </div>
-                <div class="score-badge">
-                    연결성 점수: {politician_data['connectivity_score']}점
-                </div>
-                <button class="view-button" onclick="event.stopPropagation(); location.href='pages/page_{politician_name}.html'">
-                    네트워크 보기
-                </button>
-            </div>
-"""
-            
-            html_content += """
-        </div>
-    </div>
-</body>
-</html>
-"""
-            
-            # HTML 파일로 저장
+            politician_cards = ''.join(
+                INDEX_ITEM_TEMPLATE.render(politician_data, name=politician_name)
+                for politician_name, politician_data in self.politicians.items()
+            )
+            html_content = INDEX_TEMPLATE.render(
+                politician_cards=politician_cards,
+                **self.renderer.asset_tags("index.html", **self.index_assets)
+            )
+            
+            # HTML 파일로 저장 (내용이 같으면 건너뜀)
             filepath = f"{self.output_dir}/index.html"
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            logger.info(f"인덱스 페이지 생성 완료: {filepath}")
+            if self.renderer.write("index.html", html_content):
+                logger.info(f"인덱스 페이지 생성 완료: {filepath}")
             return filepath
             
         except Exception as e:
@@ -918,13 +954,19 @@ class StableNetworkVisualizer:
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="안정적인 네트워크 시각화 생성기")
+    parser.add_argument("--changed-only", action="store_true",
+                        help="빌드 매니페스트와 입력이 달라진 산출물만 다시 생성")
+    parser.add_argument("--workers", type=int, default=None, help="병렬 프로세스 수 (1이면 순차)")
+    args = parser.parse_args()
+    
     try:
         # 안정적인 네트워크 시각화 생성기 초기화
         visualizer = StableNetworkVisualizer()
         
         # 모든 정치인 위젯 생성
         logger.info("안정적인 네트워크 시각화 생성 시작...")
-        results = visualizer.create_all_widgets()
+        results = visualizer.create_all_widgets(args.workers, changed_only=args.changed_only)
         
         # 인덱스 페이지 생성
         logger.info("인덱스 페이지 생성 중...")
@@ -938,8 +980,8 @@ def main():
         
         for politician, result in results.items():
             print(f"  - {politician}:")
-            print(f"    * 네트워크 위젯: {result['widget']}")
-            print(f"    * 개인 페이지: {result['page']}")
+            print(f"    * 네트워크 위젯: {result.get('widget', '변경 없음')}")
+            print(f"    * 개인 페이지: {result.get('page', '변경 없음')}")
         
         print(f"\n🌐 웹에서 보기: {visualizer.output_dir}/index.html")
         
@@ -15,6 +15,9 @@ import re
 from difflib import SequenceMatcher
 import logging
 
+from news_dedup import NewsDeduplicator
+from news_ingestion import IncrementalNewsFetcher
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,6 +30,8 @@ class StableNewsService:
         self.news_cache = {}
         self.last_cleanup = datetime.now()
         self.cleanup_interval = timedelta(hours=4, minutes=15)
+        self.pending_news = []  # 필터는 통과했지만 상위 20개에 들지 못한 기사 원본 (다음 수집에서 다시 후보)
+        self.cache_restored = False  # 재시작 후 저장소에서 캐시 복원 여부
         
         # 정치 관련 키워드 (확장)
         self.political_keywords = [
@@ -51,13 +56,23 @@ class StableNewsService:
         # 요청 세션 (연결 재사용)
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        
+        # 유사 중복 제거 (MinHash LSH, 수집 주기 간 서명 유지)
+        self.deduplicator = NewsDeduplicator()
+        
+        # 증분 수집 (검색어별 high-water mark까지만 날짜순 페이지 조회)
+        self.ingestion = IncrementalNewsFetcher(namespace='stable_news_service', page_size=50)
     
-    def get_news_from_naver(self, query: str, display: int = 100) -> List[Dict]:
-        """네이버 뉴스 API에서 뉴스 가져오기 (안정성 향상)"""
+    def get_news_from_naver(self, query: str, display: int = 100, start: int = 1, sort: str = 'sim') -> Optional[List[Dict]]:
+        """네이버 뉴스 API에서 뉴스 가져오기 (안정성 향상, sort: sim 정확도순 / date 최신순)
+        
+        요청 실패 시 None (빈 페이지와 구분 - 증분 수집이 실패한 페이지를 마지막 페이지로 오인하지 않도록)
+        """
         params = {
             'query': query,
             'display': min(display, 100),  # 최대 100개로 제한
-            'sort': 'sim'  # 정확도순
+            'start': start,
+            'sort': sort
         }
         
         try:
@@ -75,13 +90,13 @@ class StableNewsService:
             
         except requests.exceptions.Timeout:
             logger.error(f"네이버 API 타임아웃: {query}")
-            return []
+            return None
         except requests.exceptions.RequestException as e:
             logger.error(f"네이버 API 요청 오류: {query} - {e}")
-            return []
+            return None
         except Exception as e:
             logger.error(f"네이버 API 예상치 못한 오류: {query} - {e}")
-            return []
+            return None
     
     def get_news_content_safe(self, news_url: str) -> Dict:
         """뉴스 기사 전문 가져오기 (안전한 버전)"""
@@ -227,7 +242,7 @@ class StableNewsService:
         return SequenceMatcher(None, title1, title2).ratio()
     
     def is_duplicate_news(self, new_title: str, existing_news: List[Dict], threshold: float = 0.6) -> bool:
-        """중복 뉴스 확인 (60% 이상 유사도)"""
+        """중복 뉴스 확인 (60% 이상 유사도) - 소량 목록 비교용, 수집 경로는 deduplicator 사용"""
         for news in existing_news:
             if self.calculate_similarity(new_title, news['title']) >= threshold:
                 return True
@@ -252,38 +267,49 @@ class StableNewsService:
                 return True
         return False
     
+    def make_news_entry(self, news: Dict, timestamp: Optional[str] = None) -> Dict:
+        """네이버 검색 결과 → 피드 항목"""
+        return {
+            'title': self.clean_html(news.get('title', '')),
+            'description': self.clean_html(news.get('description', '')),
+            'link': news.get('link', ''),
+            'pubDate': news.get('pubDate', ''),
+            'source': news.get('originallink', ''),
+            'timestamp': timestamp or datetime.now().isoformat()
+        }
+    
     def filter_news(self, news_list: List[Dict]) -> List[Dict]:
-        """뉴스 필터링 (중복 제거, 시간 필터링, 정치 키워드 필터링)"""
+        """뉴스 필터링 (중복 제거, 시간 필터링, 정치 키워드 필터링)
+        
+        서명 등록은 하지 않음 - 실제로 반환하는 기사만 get_political_news에서 등록
+        """
         filtered_news = []
+        batch = self.deduplicator.batch()  # 이번 수집 안에서 서로 중복인 기사
         
         for news in news_list:
             try:
-                # HTML 태그 제거
-                title = self.clean_html(news.get('title', ''))
-                description = self.clean_html(news.get('description', ''))
-                pub_date = news.get('pubDate', '')
+                # 0. 이전 수집에서 이미 노출한 기사는 바로 제외
+                if self.deduplicator.is_seen_link(news.get('link', '')):
+                    continue
+                
+                entry = self.make_news_entry(news)
                 
                 # 1. 최근 뉴스인지 확인 (4시간 이내)
-                if not self.is_recent_news(pub_date):
+                if not self.is_recent_news(entry['pubDate']):
                     continue
                 
                 # 2. 정치 관련 키워드 포함 여부 확인
-                if not self.contains_political_keywords(title, description):
+                if not self.contains_political_keywords(entry['title'], entry['description']):
                     continue
                 
-                # 3. 중복 뉴스 확인 (60% 이상 유사도)
-                if self.is_duplicate_news(title, filtered_news):
+                # 3. 중복 뉴스 확인 (제목/요약 MinHash 유사도, 이전 노출분 + 이번 수집분)
+                if self.deduplicator.is_duplicate(entry['link'], entry['title'], entry['description']):
+                    continue
+                if batch.check_and_add(entry['link'], entry['title'], entry['description']):
                     continue
                 
                 # 필터링 통과한 뉴스 추가
-                filtered_news.append({
-                    'title': title,
-                    'description': description,
-                    'link': news.get('link', ''),
-                    'pubDate': pub_date,
-                    'source': news.get('originallink', ''),
-                    'timestamp': datetime.now().isoformat()
-                })
+                filtered_news.append(entry)
                 
             except Exception as e:
                 logger.warning(f"뉴스 필터링 중 오류: {e}")
@@ -296,27 +322,57 @@ class StableNewsService:
         all_news = []
         
         try:
-            # 단독, 속보 키워드로 검색
+            # 단독, 속보 키워드로 검색 (지난 수집 이후 새 기사만)
             for keyword in self.search_keywords:
-                news_list = self.get_news_from_naver(keyword, display=50)
+                news_list = self.ingestion.fetch_new(keyword, self.get_news_from_naver)
                 all_news.extend(news_list)
                 
                 # API 제한을 위한 대기
                 time.sleep(1)
             
-            # 필터링 적용
-            filtered_news = self.filter_news(all_news)
+            # 필터링 적용 (지난번에 20개 밖으로 밀린 기사도 다시 후보로)
+            candidates = all_news + self.pending_news
+            filtered_news = self.filter_news(candidates)
             
             # 최신순으로 정렬
             filtered_news.sort(key=lambda x: x['pubDate'], reverse=True)
+            selected = filtered_news[:20]  # 상위 20개만 반환
+            raw_by_link = {news.get('link', ''): news for news in candidates}
+            self.pending_news = [raw_by_link[news['link']] for news in filtered_news[20:]]
             
-            logger.info(f"정치 뉴스 필터링 완료: {len(filtered_news)}개")
-            return filtered_news[:20]  # 상위 20개만 반환
+            # 실제로 반환하는 기사만 본 기사로 등록
+            for news in selected:
+                self.deduplicator.add(news['link'], news['title'], news['description'])
+            self.deduplicator.save()
+            self.ingestion.save()
+            
+            logger.info(f"정치 뉴스 필터링 완료: {len(filtered_news)}개 (반환 {len(selected)}개)")
+            return selected
             
         except Exception as e:
             logger.error(f"정치 뉴스 가져오기 오류: {e}")
             return []
     
+    def restore_cache(self):
+        """재시작 후 빈 캐시를 저장소의 최근 노출 기사로 복원
+        
+        노출한 기사는 서명 파일에, 수집 위치는 high-water mark에 남아 있어
+        다시 수집되지 않으므로 복원하지 않으면 피드가 빈 상태로 시작함
+        """
+        self.cache_restored = True
+        cutoff = (datetime.now() - timedelta(hours=4, minutes=15)).isoformat()
+        try:
+            for record in self.ingestion.archive.iter_recent(cutoff, source=self.ingestion.namespace):
+                if not self.deduplicator.is_seen_link(record.get('link', '')):
+                    continue
+                if not self.is_recent_news(record.get('pubDate', '')):
+                    continue
+                news = self.make_news_entry(record, timestamp=record['ingested_at'])
+                self.news_cache[hashlib.md5(news['link'].encode()).hexdigest()] = news
+            logger.info(f"뉴스 캐시 복원: {len(self.news_cache)}개")
+        except Exception as e:
+            logger.warning(f"뉴스 캐시 복원 실패: {e}")
+    
     def cleanup_old_news(self):
         """오래된 뉴스 정리 (4시간 15분 주기)"""
         current_time = datetime.now()
@@ -340,6 +396,10 @@ class StableNewsService:
         """캐시된 뉴스 반환"""
         self.cleanup_old_news()
         
+        # 재시작 직후에는 저장소에서 최근 노출 기사 복원
+        if not self.news_cache and not self.cache_restored:
+            self.restore_cache()
+        
         # 캐시가 비어있으면 새로 가져오기
         if not self.news_cache:
             fresh_news = self.get_political_news()
@@ -0,0 +1,8 @@
+"""backend 모듈을 패키지 없이 바로 import 할 수 있도록 경로 추가"""
+
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
@@ -0,0 +1,106 @@
+"""공용 캐시 엔진 - LRU 순서/TTL/바이트 예산"""
+
+import pytest
+
+import cache_engine
+from cache_engine import BoundedLRUCache, CacheBudget, estimate_size
+
+
+class FakeMonotonic:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeMonotonic()
+    monkeypatch.setattr(cache_engine.time, 'monotonic', fake)
+    return fake
+
+
+def test_lru_evicts_least_recently_used():
+    cache = BoundedLRUCache('lru', max_entries=3)
+    for key in 'abc':
+        cache.put(key, key.upper())
+    assert cache.get('a') == 'A'  # a를 최근 사용으로
+    cache.put('d', 'D')
+
+    assert cache.keys() == ['c', 'a', 'd']
+    assert 'b' not in cache
+    assert cache.evictions == 1
+    # peek은 순서를 바꾸지 않음
+    cache.peek('c')
+    cache.put('e', 'E')
+    assert 'c' not in cache
+
+
+def test_overwrite_replaces_size_and_position():
+    cache = BoundedLRUCache('overwrite', max_bytes=10, sizer=len)
+    cache.put('a', 'xxxx')
+    cache.put('b', 'yyyy')
+    cache.put('a', 'zz')
+    assert cache.size_bytes == 6
+    assert cache.keys() == ['b', 'a']
+
+
+def test_ttl_expires_on_read_and_purge(clock):
+    cache = BoundedLRUCache('ttl', default_ttl=10)
+    cache.put('short', 1, ttl=1)
+    cache.put('default', 2)
+    cache.put('long', 3, ttl=100)
+
+    clock.now += 1
+    assert cache.get('short') is None
+    assert cache.expirations == 1
+    assert cache.get('default') == 2
+
+    clock.now += 9
+    assert 'default' not in cache
+    assert cache.purge_expired() == 1
+    assert cache.keys() == ['long']
+    assert cache.stats()['misses'] == 1
+
+
+def test_byte_limit_and_oversized_items():
+    cache = BoundedLRUCache('bytes', max_bytes=10, sizer=len)
+    assert cache.put('a', 'aaaa')
+    assert cache.put('b', 'bbbb')
+    assert cache.put('c', 'cccc')  # a 제거
+    assert cache.keys() == ['b', 'c']
+    assert cache.size_bytes == 8
+
+    assert not cache.put('huge', 'x' * 11)
+    assert cache.keys() == ['b', 'c']
+    assert cache.fits(2)
+    assert not cache.fits(3)
+
+
+def test_shared_budget_evicts_from_largest_tier():
+    budget = CacheBudget('shared', limit_bytes=20)
+    small = BoundedLRUCache('small', sizer=len, budget=budget)
+    large = BoundedLRUCache('large', sizer=len, budget=budget)
+
+    small.put('s1', 'x' * 4)
+    large.put('l1', 'y' * 8)
+    large.put('l2', 'y' * 8)
+    assert budget.used_bytes == 20
+
+    small.put('s2', 'x' * 4)
+    assert budget.used_bytes <= 20
+    assert 'l1' not in large  # 가장 큰 티어의 LRU 항목부터 제거
+    assert small.keys() == ['s1', 's2']
+    assert budget.evictions == 1
+
+    large.clear()
+    small.pop('s1')
+    assert budget.used_bytes == 4
+    assert budget.stats()['peak_mb'] >= 0
+
+
+def test_estimate_size_uses_encoded_length():
+    assert estimate_size(b'abc') == 3
+    assert estimate_size('가나') == 6
+    assert estimate_size({'a': 1}) == len('{"a":1}')
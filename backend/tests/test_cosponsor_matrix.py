@@ -0,0 +1,52 @@
+"""공동발의 행렬 - 희소 행렬 경로와 조합 누적 경로 결과 비교"""
+
+import sqlite3
+
+import pytest
+
+from cosponsor_matrix import SCIPY_AVAILABLE, CoSponsorshipMatrix
+
+BILLS = [
+    ('B1', ['김', '이', '박'], '2024-01-02'),
+    ('B2', ['이', '박'], '2024-03-01'),
+    ('B3', ['김', '최'], '2023-12-30'),
+    ('B4', ['최', '김', '이', '김'], '2024-02-15'),
+    ('B5', ['단독'], '2024-05-01'),
+]
+
+
+def _matrix(use_sparse):
+    matrix = CoSponsorshipMatrix(use_sparse=use_sparse)
+    matrix.add_bills(BILLS)
+    return matrix
+
+
+@pytest.mark.skipif(not SCIPY_AVAILABLE, reason='scipy 미설치')
+def test_sparse_path_matches_python_path():
+    sparse_matrix = _matrix(True)
+    assert sparse_matrix.stats()['backend'] == 'scipy.sparse'
+    assert sparse_matrix.relationships() == _matrix(False).relationships()
+
+
+def test_counts_and_last_date():
+    relationships = _matrix(None).relationships()
+    assert relationships[('김', '이')] == {'count': 2, 'last_date': '2024-02-15'}
+    assert relationships[('박', '이')] == {'count': 2, 'last_date': '2024-03-01'}
+    assert relationships[('김', '최')] == {'count': 2, 'last_date': '2024-02-15'}
+    assert not any('단독' in pair for pair in relationships)
+
+
+def test_incremental_update_writes_only_changed_pairs():
+    matrix = _matrix(None)
+    conn = sqlite3.connect(':memory:')
+    conn.execute('''CREATE TABLE connectivity_network (
+        politician_a TEXT, politician_b TEXT, connection_strength REAL,
+        connection_type TEXT, bill_count INTEGER, last_collaboration TEXT)''')
+    assert matrix.write_to_db(conn) == len(matrix.pairs)
+
+    assert matrix.add_bills([('B1', ['김', '이', '박'], '2024-01-02'), ('B6', ['박', '최'], '2024-06-01')]) == 1
+    assert matrix.write_to_db(conn) == 1
+    rows = conn.execute('''SELECT bill_count, last_collaboration FROM connectivity_network
+                           WHERE politician_a = '박' AND politician_b = '최' ''').fetchall()
+    assert rows == [(1, '2024-06-01')]
+    assert conn.execute('SELECT COUNT(*) FROM connectivity_network').fetchone()[0] == len(matrix.pairs)
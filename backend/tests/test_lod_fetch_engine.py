@@ -0,0 +1,55 @@
+"""LOD 수집기 - 이름 조회 실패 재시도/미완성 레코드 체크포인트 제외"""
+
+from lod_fetch_engine import CrawlCheckpoint, LODFetchEngine, RDFDocumentCache, rdf_data_url
+
+PARTY_URI = 'http://data.example/party/1'
+LABEL_DOC = b'<rdf><label>Party One</label></rdf>'
+
+
+class StubEngine(LODFetchEngine):
+    """네트워크 대신 dict 응답을 돌려주는 수집기"""
+
+    def __init__(self, documents):
+        super().__init__(max_workers=2, cache=RDFDocumentCache(cache_dir=None))
+        self.documents = documents
+        self.requested = []
+
+    def fetch(self, url, timeout=None):
+        self.requested.append(url)
+        return self.documents.get(url)
+
+
+def _parse(engine):
+    def parse(uri, content):
+        return {'name': uri, 'party': engine.resolve_label(PARTY_URI, ['label'], {})}
+    return parse
+
+
+def test_failed_label_is_not_memoized():
+    engine = StubEngine({})
+    assert engine.resolve_label(PARTY_URI, ['label'], {}) is None
+
+    engine.documents[rdf_data_url(PARTY_URI)] = LABEL_DOC
+    assert engine.resolve_label(PARTY_URI, ['label'], {}) == 'Party One'
+    assert engine.resolve_label(PARTY_URI, ['label'], {}) == 'Party One'
+    assert engine.requested.count(rdf_data_url(PARTY_URI)) == 2
+    assert engine.stats['label_misses'] == 1
+    assert engine.stats['label_hits'] == 1
+
+
+def test_records_with_unresolved_labels_are_not_checkpointed(tmp_path):
+    uris = ['http://data.example/person/1', 'http://data.example/person/2']
+    engine = StubEngine({rdf_data_url(uri): b'<rdf/>' for uri in uris})
+    checkpoint = CrawlCheckpoint('people', checkpoint_dir=str(tmp_path))
+
+    results, failed = engine.crawl(uris, _parse(engine), checkpoint)
+    assert [result['party'] for result in results] == [None, None]
+    assert failed == []
+    assert checkpoint.completed == {}
+    assert engine.stats['incomplete_records'] == 2
+
+    # 다음 실행에서 이름이 조회되면 그때 체크포인트에 기록
+    engine.documents[rdf_data_url(PARTY_URI)] = LABEL_DOC
+    results, _ = engine.crawl(uris, _parse(engine), checkpoint)
+    assert [result['party'] for result in results] == ['Party One', 'Party One']
+    assert set(CrawlCheckpoint('people', checkpoint_dir=str(tmp_path)).completed) == set(uris)
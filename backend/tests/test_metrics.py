@@ -0,0 +1,65 @@
+"""메트릭 - 히스토그램 분위수/창 통계/Prometheus 출력"""
+
+from metrics import LatencyHistogram, MetricsRegistry, WindowedLatencyHistogram
+
+
+def test_histogram_percentiles_within_relative_error():
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.record(ms / 1000)
+
+    summary = histogram.summary()
+    assert summary['count'] == 1000
+    assert abs(summary['avg_seconds'] - 0.5005) < 1e-6
+    assert summary['min_seconds'] == 0.001
+    assert summary['max_seconds'] == 1.0
+    for quantile, expected in ((0.5, 0.5), (0.95, 0.95), (0.99, 0.99)):
+        assert abs(histogram.percentiles([quantile])[quantile] - expected) / expected < 0.02
+
+
+def test_histogram_clamps_to_max():
+    histogram = LatencyHistogram(max_seconds=1.0)
+    histogram.record(5.0)
+    histogram.record(-1.0)
+    assert histogram.summary()['max_seconds'] == 1.0
+    assert histogram.summary()['min_seconds'] == 0.0
+
+
+def test_windowed_histogram_drops_old_slots():
+    window = WindowedLatencyHistogram(window_seconds=60, slots=6)
+    window.record(5.0, now=1000)
+    window.record(0.1, now=1030)
+    window.record(0.3, now=1055)
+
+    summary = window.summary(now=1059)
+    assert summary['count'] == 3
+    assert summary['max_seconds'] == 5.0
+
+    # 1000초 구간이 창 밖으로 밀려나면 최대/평균에서 빠짐
+    summary = window.summary(now=1065)
+    assert summary['count'] == 2
+    assert summary['max_seconds'] == 0.3
+    assert abs(summary['min_seconds'] - 0.1) < 1e-6
+
+    # 같은 링 위치를 다시 쓰면 이전 값은 비워짐
+    window.record(0.2, now=1060)
+    assert window.summary(now=1060)['count'] == 3
+    assert window.summary(now=1200)['count'] == 0
+
+
+def test_prometheus_output():
+    registry = MetricsRegistry(namespace='test', sample_interval=3600)
+    registry.observe('GET', '/api/news', 200, 0.05)
+    registry.observe('GET', '/api/news', 503, 0.2)
+    registry.observe_exception('POST', '/api/search', 0.01)
+
+    text = registry.render_prometheus()
+    assert 'test_http_requests_total{method="GET",route="/api/news",status="200"} 1' in text
+    assert 'test_http_requests_total{method="GET",route="/api/news",status="503"} 1' in text
+    assert 'test_http_requests_total{method="POST",route="/api/search",status="500"} 1' in text
+    assert 'test_http_errors_total{method="GET",route="/api/news"} 1' in text
+    assert 'test_http_errors_total{method="POST",route="/api/search"} 1' in text
+    assert 'test_http_request_duration_seconds_count{method="GET",route="/api/news"} 2' in text
+    assert 'test_http_request_duration_seconds_sum{method="GET",route="/api/news"} 0.250000' in text
+    assert '# TYPE test_http_request_duration_seconds summary' in text
+    assert text.endswith('\n')
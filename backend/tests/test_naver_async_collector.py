@@ -0,0 +1,82 @@
+"""네이버 비동기 수집기 - 로컬 스텁 서버 대상 연결 풀/공유 예산 테스트"""
+
+import asyncio
+import json
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+from aiohttp import web
+
+from naver_async_collector import DailyQuotaBudget, NaverAsyncCollector, NEWS_PATH
+
+
+async def _start_stub(peers):
+    """뉴스 검색 응답을 흉내 내고 요청마다 클라이언트 소켓 주소를 기록하는 서버"""
+
+    async def news(request):
+        peers.append(request.transport.get_extra_info('peername'))
+        await asyncio.sleep(0.01)
+        body = {'items': [{'title': request.query['query'], 'link': 'https://example.com'}]}
+        return web.Response(text=json.dumps(body), content_type='application/json')
+
+    app = web.Application()
+    app.router.add_get(NEWS_PATH, news)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def _quota(news_limit):
+    return DailyQuotaBudget(limits={'news': news_limit, 'datalab': 0}, state_file=None, safety_ratio=1.0)
+
+
+def test_requests_reuse_pooled_connections():
+    peers = []
+
+    async def scenario():
+        runner, base_url = await _start_stub(peers)
+        try:
+            async with NaverAsyncCollector('id', 'secret', base_url=base_url, concurrency=2,
+                                           rate_per_second=1000, quota=_quota(100)) as collector:
+                first = await collector.search_news_many([f'q{i}' for i in range(10)])
+                second = await collector.search_news_many([f'r{i}' for i in range(10)])
+                return first + second
+        finally:
+            await runner.cleanup()
+
+    results = asyncio.run(scenario())
+
+    assert [r['items'][0]['title'] for r in results[:3]] == ['q0', 'q1', 'q2']
+    assert len(peers) == 20
+    # keep-alive 풀: 20건을 동시 실행 수(2)를 넘지 않는 연결로 처리
+    assert len(set(peers)) <= 2
+
+
+def test_collectors_share_daily_quota():
+    peers = []
+    quota = _quota(5)
+
+    async def scenario():
+        runner, base_url = await _start_stub(peers)
+        try:
+            async with NaverAsyncCollector(base_url=base_url, rate_per_second=1000, quota=quota) as a, \
+                    NaverAsyncCollector(base_url=base_url, rate_per_second=1000, quota=quota) as b:
+                first = await a.search_news_many(['a1', 'a2', 'a3'])
+                second = await b.search_news_many(['b1', 'b2', 'b3'])
+                return a, b, first, second
+        finally:
+            await runner.cleanup()
+
+    a, b, first, second = asyncio.run(scenario())
+
+    assert all(result is not None for result in first)
+    assert sum(result is not None for result in second) == 2
+    assert len(peers) == 5
+    assert a.stats['quota_rejected'] == 0
+    assert b.stats['quota_rejected'] == 1
+    assert quota.remaining('news') == 0
+    assert quota.stats()['endpoints']['news']['rejected'] == 1
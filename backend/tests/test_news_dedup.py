@@ -0,0 +1,38 @@
+"""뉴스 중복 제거 - 유사 제목/재수집 링크/shingle 없는 제목"""
+
+from news_dedup import NewsDeduplicator
+
+
+def _dedup(tmp_path=None):
+    return NewsDeduplicator(path=str(tmp_path / 'signatures.json') if tmp_path else None)
+
+
+def test_near_duplicate_titles_and_links():
+    dedup = _dedup()
+    assert not dedup.check_and_add('https://a/1', '[속보] 국회 본회의 예산안 처리 합의')
+    assert dedup.check_and_add('https://b/2', '(종합) 국회 본회의 예산안 처리 합의')
+    assert dedup.check_and_add('https://a/1', '완전히 다른 제목')
+    assert not dedup.check_and_add('https://c/3', '지방선거 후보 등록 마감')
+
+
+def test_titles_without_shingles_use_exact_match():
+    dedup = _dedup()
+    assert not dedup.check_and_add('https://a/1', '!!!')
+    assert not dedup.check_and_add('https://a/2', '...')
+    assert not dedup.check_and_add('https://a/3', '')
+    assert not dedup.check_and_add('https://a/4', '')
+    assert dedup.check_and_add('https://a/5', '!!!')
+    assert dedup.stats['near_duplicates'] == 1
+
+
+def test_signatures_persist_across_instances(tmp_path):
+    dedup = _dedup(tmp_path)
+    dedup.add('https://a/1', '국정감사 일정 확정')
+    dedup.add('https://a/2', '???')
+    dedup.save()
+
+    reloaded = _dedup(tmp_path)
+    assert reloaded.is_seen_link('https://a/1')
+    assert reloaded.is_duplicate('https://b/1', '국정감사 일정 확정')
+    assert reloaded.is_duplicate('https://b/2', '???')
+    assert not reloaded.is_duplicate('https://b/3', '!!!')
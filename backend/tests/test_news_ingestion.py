@@ -0,0 +1,108 @@
+"""뉴스 증분 수집 - high-water mark/이어서 조회/저장소 중복 제외"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from news_ingestion import IncrementalNewsFetcher, IngestionState, NewsArchive
+
+KST = timezone(timedelta(hours=9))
+BASE = datetime(2025, 9, 1, 9, 0, tzinfo=KST)
+
+
+class FakeFeed:
+    """최신순 검색 결과를 흉내 내는 피드 (fail_starts에 있는 start는 요청 실패)"""
+
+    def __init__(self):
+        self.items = []
+        self.fail_starts = set()
+        self.calls = []
+
+    def publish(self, count):
+        first = len(self.items)
+        for n in range(first, first + count):
+            pub_date = (BASE + timedelta(minutes=n)).strftime('%a, %d %b %Y %H:%M:%S %z')
+            self.items.insert(0, {'title': f'기사 {n}', 'link': f'https://news/{n}', 'pubDate': pub_date})
+
+    def __call__(self, query, display, start, sort):
+        self.calls.append(start)
+        if start in self.fail_starts:
+            return None
+        return {'items': self.items[start - 1:start - 1 + display]}
+
+
+@pytest.fixture
+def make_fetcher(tmp_path, monkeypatch):
+    monkeypatch.delenv('NEWS_INGESTION_STATE_FILE', raising=False)
+    monkeypatch.delenv('NEWS_ARCHIVE_FILE', raising=False)
+
+    def make():
+        return IncrementalNewsFetcher(
+            state=IngestionState(str(tmp_path / 'state.json'), save_every=1),
+            archive=NewsArchive(str(tmp_path / 'archive.jsonl')),
+            page_size=10, initial_pages=1, max_pages=3)
+    return make
+
+
+def _numbers(items):
+    return sorted(int(item['title'].split()[1]) for item in items)
+
+
+def test_mark_stops_at_previously_seen_items(make_fetcher):
+    feed = FakeFeed()
+    feed.publish(25)
+    fetcher = make_fetcher()
+
+    # 처음 보는 검색어는 initial_pages만
+    assert _numbers(fetcher.fetch_new('국회', feed)) == list(range(15, 25))
+    assert fetcher.fetch_new('국회', feed) == []
+
+    feed.publish(3)
+    feed.calls.clear()
+    assert _numbers(fetcher.fetch_new('국회', feed)) == [25, 26, 27]
+    assert feed.calls == [1]
+    assert fetcher.stats['stopped_at_mark'] >= 1
+
+
+def test_backlog_resumes_from_cursor_across_restarts(make_fetcher):
+    feed = FakeFeed()
+    feed.publish(10)
+    fetcher = make_fetcher()
+    fetcher.fetch_new('국회', feed)
+
+    feed.publish(45)  # max_pages(3) × page_size(10)를 넘는 밀린 기사
+    first = fetcher.fetch_new('국회', feed)
+    assert len(first) == 30
+    assert fetcher.state.get_resume('국회')['start'] == 31
+
+    # 재시작 후 저장된 위치부터 이어서 조회, 끝나면 mark 전진
+    fetcher.save()
+    restarted = make_fetcher()
+    second = restarted.fetch_new('국회', feed)
+    assert _numbers(first + second) == list(range(10, 55))
+    assert restarted.state.get_resume('국회') is None
+    assert restarted.fetch_new('국회', feed) == []
+
+
+def test_failed_page_keeps_mark_and_archive_has_no_duplicates(make_fetcher, tmp_path):
+    feed = FakeFeed()
+    feed.publish(10)
+    fetcher = make_fetcher()
+    fetcher.fetch_new('국회', feed)
+
+    feed.publish(25)
+    feed.fail_starts = {11}
+    first = fetcher.fetch_new('국회', feed)
+    assert _numbers(first) == list(range(25, 35))
+    assert fetcher.state.get_resume('국회')['start'] == 11
+
+    # 실패 구간 사이 새 기사가 올라와 순위가 밀려도 빠지거나 두 번 저장되는 기사 없음
+    feed.fail_starts = set()
+    feed.publish(5)
+    second = fetcher.fetch_new('국회', feed)
+    third = fetcher.fetch_new('국회', feed)
+    assert _numbers(first + second + third) == list(range(10, 40))
+
+    records = list(NewsArchive(str(tmp_path / 'archive.jsonl')).iter_records('국회'))
+    assert len(records) == 40
+    assert len({record['link_hash'] for record in records}) == 40
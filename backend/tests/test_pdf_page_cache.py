@@ -0,0 +1,34 @@
+"""PDF 페이지 캐시 - 파일 해시 재사용"""
+
+import os
+
+import pdf_page_cache
+from pdf_page_cache import PDFPageCache
+
+
+def test_file_hash_reused_until_file_changes(tmp_path, monkeypatch):
+    calls = []
+    original = pdf_page_cache.pdf_file_hash
+    monkeypatch.setattr(pdf_page_cache, 'pdf_file_hash', lambda path: calls.append(path) or original(path))
+    monkeypatch.delenv('PDF_PAGE_CACHE_PATH', raising=False)
+
+    pdf_path = tmp_path / 'minutes.pdf'
+    pdf_path.write_bytes(b'%PDF-1.4 first')
+    cache = PDFPageCache(cache_path=str(tmp_path / 'cache.db'))
+
+    first = cache._file_hash(str(pdf_path))
+    assert cache._file_hash(str(pdf_path)) == first
+    assert len(calls) == 1
+
+    # 다른 인스턴스(재실행)도 저장된 해시 사용
+    cache.close()
+    cache = PDFPageCache(cache_path=str(tmp_path / 'cache.db'))
+    assert cache._file_hash(str(pdf_path)) == first
+    assert len(calls) == 1
+
+    pdf_path.write_bytes(b'%PDF-1.4 second version')
+    stat = os.stat(pdf_path)
+    os.utime(pdf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert cache._file_hash(str(pdf_path)) != first
+    assert len(calls) == 2
+    cache.close()
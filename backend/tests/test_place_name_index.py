@@ -0,0 +1,30 @@
+"""지명 색인 - 레코드 병합/옛 지명/매칭 종류 필터"""
+
+from place_name_index import PlaceNameIndex
+
+
+def test_records_merge_into_existing_entry():
+    index = PlaceNameIndex()
+    index.add('서울특별시', 'sido', aliases=['서울'])
+    added = index.add_records([
+        {'sido': '서울특별시', 'historical_names': ['한성', '경성']},
+        {'sido': '서울특별시', 'sigungu': '강남구', 'dong': '압구정동'},
+    ])
+
+    assert added == 1
+    assert len(index.entries) == 2
+    best = index.resolve('경성')['best']
+    assert best['name'] == '서울특별시'
+    assert best['historical'] is True
+    assert index.search('압구정')[0]['label'] == '서울특별시 강남구 압구정동 (동장급)'
+
+
+def test_match_type_filter_applies_before_limit():
+    index = PlaceNameIndex()
+    index.add('김철수', 'politician', stem_aliases=False)
+    index.add('새김철수의원회', 'politician', stem_aliases=False)
+
+    # 포함 일치('김철수')가 부분 일치보다 점수가 높아 limit=1이면 부분 일치 후보가 잘려 나간다
+    assert index.search('김철수의원', limit=1)[0]['match_type'] == 'contained'
+    filtered = index.search('김철수의원', limit=1, match_types=('exact', 'prefix', 'infix'))
+    assert [match['name'] for match in filtered] == ['새김철수의원회']
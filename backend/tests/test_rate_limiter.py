@@ -0,0 +1,118 @@
+"""Rate limiter - 슬라이딩 윈도 경계/차단 만료/클라이언트 IP 판별"""
+
+import asyncio
+
+import pytest
+
+import rate_limiter
+from rate_limiter import (RateLimiter, RateLimitMiddleware, _SlidingWindow, client_ip_from_scope,
+                          parse_trusted_proxies)
+
+
+class FakeClock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock(1_000_020.0)  # 분 구간 시작 + 20초
+    monkeypatch.setattr(rate_limiter.time, 'time', fake)
+    return fake
+
+
+def test_sliding_window_weights_previous_window():
+    window = _SlidingWindow(60)
+    for _ in range(10):
+        window.add(60.0)
+    # 구간 끝 직전까지는 현재 구간 전부
+    assert window.estimate(119.999) == pytest.approx(10)
+    # 다음 구간 시작 시점에는 직전 구간이 온전히 반영되고, 구간이 지날수록 선형으로 줄어듦
+    assert window.estimate(120.0) == pytest.approx(10)
+    assert window.estimate(150.0) == pytest.approx(5)
+    assert window.estimate(179.999) == pytest.approx(0, abs=1e-3)
+    # 두 구간 이상 비면 정리 대상, 추정값은 0
+    assert not window.idle_since(239.0)
+    assert window.idle_since(240.0)
+    assert window.estimate(240.0) == 0
+
+
+def test_minute_limit_blocks_until_expiry(clock):
+    limiter = RateLimiter(max_requests_per_minute=3, max_requests_per_hour=100, block_duration=30)
+    assert all(limiter.is_allowed('1.1.1.1')[0] for _ in range(3))
+    allowed, _ = limiter.is_allowed('1.1.1.1')
+    assert not allowed
+    assert limiter.retry_after('1.1.1.1') == 31
+    # 다른 IP는 영향 없음
+    assert limiter.is_allowed('2.2.2.2')[0]
+
+    clock.now += 29.5
+    assert not limiter.is_allowed('1.1.1.1')[0]
+    clock.now += 0.5
+    assert limiter.is_allowed('1.1.1.1')[0]
+    assert limiter.retry_after('1.1.1.1') == 0
+
+
+def test_requests_spread_across_window_boundary(clock):
+    limiter = RateLimiter(max_requests_per_minute=4, max_requests_per_hour=100)
+    clock.now = 1_000_019.0  # 구간 끝 1초 전
+    assert all(limiter.is_allowed('1.1.1.1')[0] for _ in range(4))
+    # 새 구간 시작 직후에는 직전 구간 4건이 거의 그대로 반영되어 고정 윈도처럼 초기화되지 않음
+    clock.now = 1_000_021.0
+    assert not limiter.is_allowed('1.1.1.1')[0]
+
+
+def test_hour_limit(clock):
+    limiter = RateLimiter(max_requests_per_minute=100, max_requests_per_hour=5)
+    for _ in range(5):
+        assert limiter.is_allowed('1.1.1.1')[0]
+        clock.now += 61
+    allowed, message = limiter.is_allowed('1.1.1.1')
+    assert not allowed
+    assert '시간당' in message
+
+
+def _scope(client, forwarded=None):
+    headers = [(b'x-forwarded-for', forwarded.encode())] if forwarded else []
+    return {'type': 'http', 'path': '/api', 'client': (client, 5000), 'headers': headers}
+
+
+def test_forwarded_for_ignored_without_trusted_proxy():
+    assert client_ip_from_scope(_scope('203.0.113.7', '1.2.3.4')) == '203.0.113.7'
+    trusted = parse_trusted_proxies('10.0.0.0/8')
+    assert client_ip_from_scope(_scope('203.0.113.7', '1.2.3.4'), trusted) == '203.0.113.7'
+
+
+def test_forwarded_for_from_trusted_proxy_uses_nearest_untrusted_hop():
+    trusted = parse_trusted_proxies('10.0.0.0/8, 127.0.0.1')
+    # 클라이언트가 앞에 끼워 넣은 주소(1.2.3.4)가 아니라 프록시가 붙인 실제 주소를 사용
+    assert client_ip_from_scope(_scope('10.0.0.5', '1.2.3.4, 198.51.100.9, 10.0.0.3'), trusted) == '198.51.100.9'
+    assert client_ip_from_scope(_scope('10.0.0.5', '10.0.0.3'), trusted) == '10.0.0.5'
+    assert client_ip_from_scope(_scope('10.0.0.5'), trusted) == '10.0.0.5'
+
+
+def test_middleware_keys_on_connection_address():
+    limiter = RateLimiter(max_requests_per_minute=2)
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(scope['client'][0])
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = RateLimitMiddleware(app, limiter=limiter, trusted_proxies=())
+
+    async def run():
+        # X-Forwarded-For를 바꿔 가며 보내도 같은 연결 주소로 집계
+        for i in range(3):
+            await middleware(_scope('203.0.113.7', f'1.2.3.{i}'), None, send)
+
+    asyncio.run(run())
+    assert len(calls) == 2
+    assert sent[0]['status'] == 429
@@ -0,0 +1,70 @@
+"""발언 검색 색인 - 한글 부분 문자열 일치/발언자 필터/증분 동기화"""
+
+import sqlite3
+
+import pytest
+
+from speech_search_index import SpeechSearchIndex, match_expression, tokenize_korean
+
+SPEECHES = [
+    (1, '홍길동', 'm1', '헌법 개정안에 대해 질의하겠습니다'),
+    (2, '홍길동', 'm1', '부동산 법안 심사가 늦어지고 있습니다'),
+    (3, '김철수', 'm2', '교육부는 기본소득 실험 결과를 보고하십시오'),
+    (4, '', 'm2', '정회를 선포합니다'),
+    (5, '김철수', 'm3', 'AI 규제 법률안 논의'),
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    db_path = str(tmp_path / 'meetings.db')
+    conn = sqlite3.connect(db_path)
+    conn.execute('''CREATE TABLE speeches (id INTEGER PRIMARY KEY, speaker_name TEXT,
+                    meeting_id TEXT, speech_content TEXT)''')
+    conn.executemany('INSERT INTO speeches VALUES (?, ?, ?, ?)', SPEECHES)
+    conn.commit()
+    conn.close()
+    index = SpeechSearchIndex(db_path)
+    index.sync()
+    yield index
+    index.close()
+
+
+def test_tokenizer_uses_hangul_bigrams():
+    assert tokenize_korean('기본소득 AI') == ['기본', '본소', '소득', 'ai']
+    assert match_expression(['소득']) == '"소득"'
+
+
+def test_substring_inside_compound_words(index):
+    # '소득'은 '기본소득' 안에, '개정'은 '개정안에' 안에 있음
+    assert index.count('소득') == 1
+    assert index.count('개정') == 1
+    assert index.count('법안') == 1  # '법률안'은 부분 문자열이 아님
+    assert index.count('기본 소득') == 0  # 공백이 있는 구문은 연속 토큰이어야 함
+    assert [hit['id'] for hit in index.search('부동산 법안')] == [2]
+
+
+def test_single_character_terms_match_anywhere_in_word(index):
+    # '법'은 '헌법'(끝 글자), '법안'/'법률안'(첫 글자) 모두 일치
+    assert index.count('법') == 3
+    # '회'는 '정회를'의 가운데 글자 → bigram '회를'의 첫 글자로 일치
+    assert index.count('회') == 1
+    assert not index.contains('꿩')
+
+
+def test_speaker_filter(index):
+    assert index.count('법', speaker='홍길동') == 2
+    assert index.count('법', speaker='김철수') == 1
+    assert index.count('선포', speaker='') == 1
+    assert index.count('선포', speaker='홍길동') == 0
+    assert index.keyword_counts(['소득', '헌법'], speaker='김철수') == {'소득': 1, '헌법': 0}
+
+
+def test_sync_adds_new_rows_and_removes_deleted(index):
+    index.conn.execute("INSERT INTO speeches VALUES (6, '홍길동', 'm4', '소득세 인하 법안')")
+    index.conn.execute('DELETE FROM speeches WHERE id = 3')
+    index.conn.commit()
+
+    assert index.sync() == {'added': 1, 'removed': 1}
+    assert [hit['id'] for hit in index.search('소득')] == [6]
+    assert index.sync() == {'added': 0, 'removed': 0}
@@ -0,0 +1,73 @@
+"""위젯 렌더링 엔진 - 템플릿/변경분(--changed-only) 빌드 계획"""
+
+import os
+
+from widget_render_engine import WidgetRenderer, WidgetTemplate
+
+
+def _artifacts(politicians):
+    return {
+        name: {
+            'card': (f'cards/card_{name}.html', {'party': info['party'], 'generator': 'v1'}),
+            'profile': (f'profiles/{name}.html', {'party': info['party'], 'bills': info['bills']}),
+        }
+        for name, info in politicians.items()
+    }
+
+
+def _build(renderer, politicians, changed_only, fail=()):
+    """빌드 후 렌더링한 (항목, 종류) 목록 반환"""
+    artifacts = _artifacts(politicians)
+    rendered = []
+
+    def render(job):
+        name, kinds = job
+        rendered.extend((name, kind) for kind in kinds)
+        files = {}
+        for kind in kinds:
+            relpath = artifacts[name][kind][0]
+            if (name, kind) not in fail:
+                renderer.write(relpath, f'{name} {kind}')
+            files[kind] = relpath if (name, kind) not in fail else None
+        return files
+
+    renderer.build(render, artifacts, changed_only=changed_only, max_workers=1)
+    return sorted(rendered)
+
+
+def test_changed_only_renders_artifacts_whose_inputs_changed(tmp_path):
+    politicians = {'홍길동': {'party': 'A', 'bills': 3}, '김철수': {'party': 'B', 'bills': 5}}
+    output_dir = str(tmp_path)
+
+    assert len(_build(WidgetRenderer(output_dir), politicians, changed_only=True)) == 4
+    # 새 프로세스(매니페스트 다시 읽음)에서 입력이 같으면 렌더링 없음
+    assert _build(WidgetRenderer(output_dir), politicians, changed_only=True) == []
+
+    # 의안 수만 바뀌면 그 입력을 쓰는 프로필만
+    politicians['김철수']['bills'] = 6
+    assert _build(WidgetRenderer(output_dir), politicians, changed_only=True) == [('김철수', 'profile')]
+
+    # 정당이 바뀌면 카드와 프로필 모두
+    politicians['홍길동']['party'] = 'C'
+    assert _build(WidgetRenderer(output_dir), politicians, changed_only=True) == [
+        ('홍길동', 'card'), ('홍길동', 'profile')]
+
+    # 전체 빌드는 입력과 무관하게 모두 렌더링
+    assert len(_build(WidgetRenderer(output_dir), politicians, changed_only=False)) == 4
+
+
+def test_missing_output_and_failed_render_are_rebuilt(tmp_path):
+    politicians = {'홍길동': {'party': 'A', 'bills': 3}}
+    output_dir = str(tmp_path)
+
+    _build(WidgetRenderer(output_dir), politicians, changed_only=True, fail={('홍길동', 'profile')})
+    # 실패한 산출물은 매니페스트에 기록되지 않아 다음 변경분 빌드에 다시 포함
+    assert _build(WidgetRenderer(output_dir), politicians, changed_only=True) == [('홍길동', 'profile')]
+
+    os.remove(os.path.join(output_dir, 'cards', 'card_홍길동.html'))
+    assert _build(WidgetRenderer(output_dir), politicians, changed_only=True) == [('홍길동', 'card')]
+
+
+def test_template_placeholders_and_escape():
+    template = WidgetTemplate('<h1>${name}</h1><p>$${literal} ${party}</p>')
+    assert template.render(name='홍길동', party='무소속') == '<h1>홍길동</h1><p>${literal} 무소속</p>'
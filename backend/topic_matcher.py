@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+토픽/지역 키워드 다중 패턴 매처
+모든 토픽 키워드와 지역명을 Aho-Corasick 오토마톤 하나로 컴파일해 문장당 한 번만 훑음
+- 지역×토픽 집계가 (지역 수 × 문장 수 × 키워드 수) 부분 문자열 검사에서 텍스트 길이에 선형으로
+- 토큰 단위 양방향 부분 일치(키워드 ⊂ 토큰, 토큰 ⊂ 키워드) 점수는 토큰별로 한 번만 계산해 재사용
+"""
+
+import logging
+from collections import defaultdict, deque
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AhoCorasick:
+    """Aho-Corasick 오토마톤 (순수 파이썬)"""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+        seen = {}
+        for pattern in patterns:
+            if pattern and pattern not in seen:
+                seen[pattern] = len(self.patterns)
+                self.patterns.append(pattern)
+                self._insert(pattern, seen[pattern])
+        self._build_failure_links()
+
+    def _insert(self, pattern: str, pattern_id: int):
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] = self._output[state] + (pattern_id,)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """(끝 위치, 패턴) - 겹치는 일치 포함"""
+        goto, fail, output, patterns = self._goto, self._fail, self._output, self.patterns
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in output[state]:
+                yield index, patterns[pattern_id]
+
+    def matched(self, text: str) -> Set[str]:
+        """텍스트에 한 번이라도 나온 패턴 집합"""
+        goto, fail, output = self._goto, self._fail, self._output
+        found: Set[int] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return {self.patterns[pattern_id] for pattern_id in found}
+
+
+class TopicMatcher:
+    """토픽 키워드 + 지역 키워드 통합 매처
+
+    topics: {토픽: [키워드, ...]}, regions: {지역: [지역 키워드, ...]}
+    키워드 목록에 같은 키워드가 여러 번 있으면 기존 루프와 같게 그 횟수만큼 점수에 반영한다.
+    """
+
+    def __init__(self, topics: Mapping[str, Sequence[str]],
+                 regions: Optional[Mapping[str, Sequence[str]]] = None):
+        self.topics = list(topics)
+        # 키워드 → [(토픽, 목록 내 등장 횟수)]
+        self._keyword_topics: Dict[str, List[Tuple[str, int]]] = defaultdict(list)
+        for topic, keywords in topics.items():
+            counts: Dict[str, int] = defaultdict(int)
+            for keyword in keywords:
+                counts[keyword] += 1
+            for keyword, count in counts.items():
+                self._keyword_topics[keyword].append((topic, count))
+        # 지역 키워드 → [지역]
+        self._keyword_regions: Dict[str, List[str]] = defaultdict(list)
+        for region, keywords in (regions or {}).items():
+            for keyword in dict.fromkeys(keywords):
+                self._keyword_regions[keyword].append(region)
+
+        self.automaton = AhoCorasick(list(self._keyword_topics) + list(self._keyword_regions))
+        # 토큰 ⊂ 키워드 판정용: 키워드의 모든 부분 문자열 → 그 부분 문자열을 포함하는 키워드
+        self._keyword_substrings: Dict[str, Set[str]] = defaultdict(set)
+        for keyword in self._keyword_topics:
+            for start in range(len(keyword)):
+                for end in range(start + 1, len(keyword) + 1):
+                    self._keyword_substrings[keyword[start:end]].add(keyword)
+        self._token_cache: Dict[str, Dict[str, int]] = {}
+
+    # ------------------------------------------------------------------
+    # 문장 단위 (지역 언급 + 토픽 키워드 수)
+    # ------------------------------------------------------------------
+    def sentence_hits(self, sentence: str) -> Tuple[Set[str], Dict[str, int]]:
+        """(언급된 지역 집합, 토픽별 문장 내 키워드 수) - 오토마톤 한 번 통과"""
+        regions: Set[str] = set()
+        topic_counts: Dict[str, int] = defaultdict(int)
+        for keyword in self.automaton.matched(sentence):
+            regions.update(self._keyword_regions.get(keyword, ()))
+            for topic, count in self._keyword_topics.get(keyword, ()):
+                topic_counts[topic] += count
+        return regions, topic_counts
+
+    def scan_sentences(self, sentences: Iterable[str]) -> Dict[str, Dict]:
+        """문장 목록을 한 번 순회해 지역별 {'sentence_indices', 'topic_scores'} 집계 (첫 언급 순)"""
+        result: Dict[str, Dict] = {}
+        for index, sentence in enumerate(sentences):
+            regions, topic_counts = self.sentence_hits(sentence)
+            for region in regions:
+                entry = result.get(region)
+                if entry is None:
+                    entry = result[region] = {'sentence_indices': [], 'topic_scores': defaultdict(int)}
+                entry['sentence_indices'].append(index)
+                for topic, count in topic_counts.items():
+                    entry['topic_scores'][topic] += count
+        for entry in result.values():
+            scores = entry['topic_scores']
+            entry['topic_scores'] = {topic: scores[topic] for topic in self.topics if scores.get(topic)}
+        return result
+
+    # ------------------------------------------------------------------
+    # 토큰 단위 (키워드 ⊂ 토큰 또는 토큰 ⊂ 키워드)
+    # ------------------------------------------------------------------
+    def token_topics(self, token: str) -> Dict[str, int]:
+        """토큰 하나의 토픽별 일치 키워드 수 (토큰별 캐시)"""
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            return cached
+        keywords = {keyword for keyword in self.automaton.matched(token) if keyword in self._keyword_topics}
+        keywords |= self._keyword_substrings.get(token, set())
+        scores: Dict[str, int] = defaultdict(int)
+        for keyword in keywords:
+            for topic, count in self._keyword_topics[keyword]:
+                scores[topic] += count
+        self._token_cache[token] = dict(scores)
+        return self._token_cache[token]
+
+    def score_tokens(self, tokens: Iterable[str]) -> Dict[str, int]:
+        """토큰 목록의 토픽별 점수 (토픽 정의 순서 유지, 0점 토픽 제외)"""
+        scores: Dict[str, int] = defaultdict(int)
+        for token in tokens:
+            for topic, count in self.token_topics(token).items():
+                scores[topic] += count
+        return {topic: scores[topic] for topic in self.topics if scores.get(topic)}
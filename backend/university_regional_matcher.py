@@ -12,7 +12,8 @@ import json
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional
-import re
+
+from address_resolver import get_address_resolver
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,7 @@ class UniversityRegionalMatcher:
     def __init__(self):
         self.university_file_path = "/Users/hopidaay/Downloads/교육부_대학교 주소기반 좌표정보_20241030.xlsx"
         self.regional_data_path = "/Users/hopidaay/Downloads/korea_districts_2025-09-19.json"
+        self.address_resolver = get_address_resolver()
         
         # 대학교 정치적 특성 분석
         self.university_political_characteristics = {
@@ -204,46 +206,15 @@ class UniversityRegionalMatcher:
             return {}
 
     def extract_region_from_address(self, address: str) -> Dict:
-        """주소에서 지역정보 추출"""
+        """주소에서 지역정보 추출 (공용 주소 해석 엔진 사용)"""
         if not isinstance(address, str):
             return {'sido': None, 'sigungu': None, 'detail': None}
         
-        # 시도 추출 (서울특별시, 부산광역시, 경기도 등)
-        sido_patterns = [
-            r'(서울특별시|서울시|서울)',
-            r'(부산광역시|부산시|부산)',
-            r'(대구광역시|대구시|대구)',
-            r'(인천광역시|인천시|인천)',
-            r'(광주광역시|광주시|광주)',
-            r'(대전광역시|대전시|대전)',
-            r'(울산광역시|울산시|울산)',
-            r'(세종특별자치시|세종시|세종)',
-            r'(경기도)',
-            r'(강원도|강원특별자치도)',
-            r'(충청북도|충북)',
-            r'(충청남도|충남)',
-            r'(전라북도|전북|전북특별자치도)',
-            r'(전라남도|전남)',
-            r'(경상북도|경북)',
-            r'(경상남도|경남)',
-            r'(제주특별자치도|제주도|제주)'
-        ]
-        
-        sido = None
-        for pattern in sido_patterns:
-            match = re.search(pattern, address)
-            if match:
-                sido = match.group(1)
-                break
-        
-        # 시군구 추출
-        sigungu_pattern = r'([가-힣]+시|[가-힣]+군|[가-힣]+구)'
-        sigungu_matches = re.findall(sigungu_pattern, address)
-        sigungu = sigungu_matches[0] if sigungu_matches else None
-        
+        resolved = self.address_resolver.resolve(address)
         return {
-            'sido': sido,
-            'sigungu': sigungu,
+            'sido': resolved.sido,
+            'sigungu': resolved.sigungu,
+            'admin_code': resolved.admin_code,
             'detail': address,
             'full_address': address
         }
@@ -294,19 +265,18 @@ class UniversityRegionalMatcher:
             if len(university_df.columns) >= 3:
                 name_col = university_df.columns[2]  # 0-based index
         
-        # 지역별 대학교 매칭
+        # 지역별 대학교 매칭 (주소 컬럼 전체를 한 번에 해석)
         regional_distribution = {}
         
-        for idx, row in university_df.iterrows():
-            university_name = row[name_col] if name_col else f"대학교_{idx+1}"
-            address = row[address_col] if pd.notna(row[address_col]) else ""
-            
-            # 지역정보 추출
-            region_info = self.extract_region_from_address(str(address))
-            
-            if region_info['sido']:
-                sido = region_info['sido']
-                sigungu = region_info['sigungu'] or '기타'
+        addresses = university_df[address_col].where(university_df[address_col].notna(), "")
+        regions = self.address_resolver.resolve_series(addresses)
+        names = (university_df[name_col] if name_col
+                 else pd.Series([f"대학교_{i+1}" for i in range(len(university_df))], index=university_df.index))
+        
+        for university_name, address, sido, sigungu, admin_code in zip(
+                names, addresses, regions['sido'], regions['sigungu'], regions['admin_code']):
+            if pd.notna(sido):
+                sigungu = sigungu if pd.notna(sigungu) else '기타'
                 
                 # 지역별 집계
                 if sido not in regional_distribution:
@@ -320,7 +290,8 @@ class UniversityRegionalMatcher:
                     'address': address,
                     'sido': sido,
                     'sigungu': sigungu,
-                    'coordinates': self._extract_coordinates(row) if hasattr(self, '_extract_coordinates') else None
+                    'admin_code': admin_code,
+                    'coordinates': None
                 }
                 
                 regional_distribution[sido][sigungu].append(university_info)
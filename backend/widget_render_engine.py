@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+정적 위젯 렌더링 엔진
+- 템플릿은 ${name} 자리표시자 기준으로 한 번 컴파일 (리터럴/자리표시자 조각 목록) → 렌더링은 join 한 번
+- 공용 CSS/JS는 내용 해시를 붙인 정적 파일(assets/이름.해시.확장자)로 한 번만 기록, 페이지는 링크만 포함
+- 파일은 내용 해시가 바뀐 경우에만 기록 (임시 파일 + os.replace)
+- 정치인별 렌더링은 프로세스 풀에서 병렬 실행
+- 빌드 매니페스트(build_manifest.json)에 산출물별 입력 해시를 기록 → changed_only 빌드는 입력이 바뀐 산출물만 렌더링
+"""
+
+import os
+import re
+import json
+import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+ASSET_DIR = 'assets'
+ASSET_HASH_LENGTH = 10
+MANIFEST_FILE = 'build_manifest.json'
+MANIFEST_VERSION = 1
+INPUT_HASH_LENGTH = 16
+
+# ${name} 자리표시자, $${ 는 리터럴 '${'
+_PLACEHOLDER = re.compile(r'\$(\$)?\{([_A-Za-z][_A-Za-z0-9]*)\}')
+
+
+def content_hash(content: Union[str, bytes]) -> str:
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return hashlib.sha256(content).hexdigest()
+
+
+def file_hash(path: str) -> Optional[str]:
+    """파일 내용 해시 (없으면 None)"""
+    try:
+        with open(path, 'rb') as f:
+            return content_hash(f.read())
+    except OSError:
+        return None
+
+
+def write_if_changed(path: str, content: Union[str, bytes]) -> bool:
+    """내용 해시가 다를 때만 기록 (원자적 교체). 기록했으면 True"""
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    if file_hash(path) == content_hash(data):
+        return False
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def input_hash(value: Any) -> str:
+    """입력 값 해시 (dict 키 순서와 무관, JSON 직렬화 불가 값은 str())"""
+    encoded = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':'), default=str)
+    return content_hash(encoded)[:INPUT_HASH_LENGTH]
+
+
+class WidgetTemplate:
+    """${name} 자리표시자 템플릿 (생성 시 한 번 파싱)"""
+
+    def __init__(self, source: str):
+        self.source = source
+        # 짝수 위치는 리터럴, 홀수 위치는 자리표시자 이름
+        self.parts: List[str] = []
+        literal: List[str] = []
+        position = 0
+        for match in _PLACEHOLDER.finditer(source):
+            literal.append(source[position:match.start()])
+            if match.group(1):
+                literal.append('${' + match.group(2) + '}')
+            else:
+                self.parts.append(''.join(literal))
+                self.parts.append(match.group(2))
+                literal = []
+            position = match.end()
+        literal.append(source[position:])
+        self.parts.append(''.join(literal))
+        self.placeholders = frozenset(self.parts[1::2])
+
+    def render(self, context: Optional[Dict[str, Any]] = None, **values) -> str:
+        """자리표시자 치환 (값은 str()로 변환, 빠진 이름은 KeyError)"""
+        if context:
+            values = {**context, **values}
+        parts = self.parts[:]
+        for i in range(1, len(parts), 2):
+            parts[i] = str(values[parts[i]])
+        return ''.join(parts)
+
+
+class StaticAssets:
+    """내용 해시 이름의 공용 정적 파일 (같은 내용이면 같은 파일, 다시 쓰지 않음)"""
+
+    def __init__(self, output_dir: str, subdir: str = ASSET_DIR):
+        self.output_dir = output_dir
+        self.subdir = subdir
+        self.paths: Dict[str, str] = {}
+
+    def add(self, name: str, content: str, ext: str) -> str:
+        """에셋 등록 → 출력 디렉토리 기준 상대 경로 (예: assets/id_card.1a2b3c4d5e.css)"""
+        relpath = f"{self.subdir}/{name}.{content_hash(content)[:ASSET_HASH_LENGTH]}.{ext}"
+        if write_if_changed(os.path.join(self.output_dir, relpath), content):
+            logger.info(f"정적 에셋 기록: {relpath}")
+        self.paths[name] = relpath
+        return relpath
+
+
+class BuildManifest:
+    """산출물(출력 디렉토리 기준 경로)별 입력 필드 해시 기록
+
+    {"version": 1, "artifacts": {"cards/card_홍길동.html": {"party": "1a2b...", "generator": "...", ...}}}
+    """
+
+    def __init__(self, output_dir: str, filename: str = MANIFEST_FILE):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, filename)
+        self.artifacts: Dict[str, Dict[str, str]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != MANIFEST_VERSION:
+            logger.info(f"빌드 매니페스트 버전 불일치, 전체 재생성: {self.path}")
+            return {}
+        return data.get('artifacts', {})
+
+    @staticmethod
+    def fingerprint(inputs: Dict[str, Any]) -> Dict[str, str]:
+        """입력 필드별 해시"""
+        return {key: input_hash(value) for key, value in inputs.items()}
+
+    def changed_inputs(self, artifact: str, inputs: Dict[str, Any]) -> List[str]:
+        """기록과 다른 입력 필드 목록 (기록이 없거나 산출물 파일이 없으면 전체 필드)"""
+        current = self.fingerprint(inputs)
+        recorded = self.artifacts.get(artifact)
+        if recorded is None or not os.path.exists(os.path.join(self.output_dir, artifact)):
+            return sorted(current)
+        return sorted(key for key in current.keys() | recorded.keys() if current.get(key) != recorded.get(key))
+
+    def record(self, artifact: str, inputs: Dict[str, Any]):
+        self.artifacts[artifact] = self.fingerprint(inputs)
+
+    def save(self) -> bool:
+        """매니페스트 기록 (내용이 같으면 건너뜀)"""
+        data = {'version': MANIFEST_VERSION, 'artifacts': dict(sorted(self.artifacts.items()))}
+        return write_if_changed(self.path, json.dumps(data, ensure_ascii=False, indent=2))
+
+
+# 항목별 산출물: {항목: {종류: (출력 경로, 입력 필드)}}
+ArtifactInputs = Dict[Any, Dict[str, Tuple[str, Dict[str, Any]]]]
+# 렌더링 작업: (항목, 렌더링할 종류들)
+RenderJob = Tuple[Any, Tuple[str, ...]]
+
+
+class WidgetRenderer:
+    """출력 디렉토리 단위 렌더러 (에셋 링크, 변경분 기록, 병렬 실행, 빌드 매니페스트)"""
+
+    def __init__(self, output_dir: str, max_workers: Optional[int] = None):
+        self.output_dir = output_dir
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.assets = StaticAssets(output_dir)
+        self.manifest = BuildManifest(output_dir)
+
+    def href(self, asset_path: str, page_path: str) -> str:
+        """페이지(출력 디렉토리 기준 상대 경로)에서 에셋으로 가는 상대 링크"""
+        return os.path.relpath(asset_path, os.path.dirname(page_path) or '.').replace(os.sep, '/')
+
+    def asset_tags(self, page_path: str, css: Sequence[str] = (), js: Sequence[str] = ()) -> Dict[str, str]:
+        """템플릿용 ${stylesheets} / ${scripts} 태그"""
+        return {
+            'stylesheets': '\n'.join(f'<link rel="stylesheet" href="{self.href(path, page_path)}">' for path in css),
+            'scripts': '\n'.join(f'<script src="{self.href(path, page_path)}"></script>' for path in js),
+        }
+
+    def write(self, relpath: str, content: Union[str, bytes]) -> bool:
+        """출력 디렉토리 기준 경로에 기록 (내용이 같으면 건너뜀)"""
+        return write_if_changed(os.path.join(self.output_dir, relpath), content)
+
+    def render_all(self, render: Callable[[Any], Any], items: Iterable[Any],
+                   max_workers: Optional[int] = None) -> List[Any]:
+        """항목별 render를 프로세스 풀에서 실행 (결과는 입력 순서). max_workers=1이면 순차 실행
+
+        render는 피클 가능해야 함 (모듈 함수 또는 피클 가능한 인스턴스의 메서드).
+        """
+        items = list(items)
+        workers = min(max_workers or self.max_workers, len(items))
+        if workers <= 1:
+            return [render(item) for item in items]
+        chunksize = max(1, len(items) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(render, items, chunksize=chunksize))
+
+    def plan(self, artifacts: ArtifactInputs, changed_only: bool = False) -> List[RenderJob]:
+        """렌더링 작업 목록. changed_only면 입력 해시가 매니페스트와 다른 산출물만 포함"""
+        jobs = []
+        for item, outputs in artifacts.items():
+            kinds = []
+            for kind, (relpath, inputs) in outputs.items():
+                if changed_only:
+                    changed = self.manifest.changed_inputs(relpath, inputs)
+                    if not changed:
+                        continue
+                    logger.info(f"입력 변경: {relpath} ({', '.join(changed)})")
+                kinds.append(kind)
+            if kinds:
+                jobs.append((item, tuple(kinds)))
+        if changed_only:
+            total = sum(len(outputs) for outputs in artifacts.values())
+            logger.info(f"변경분 빌드: 산출물 {total}개 중 {sum(len(kinds) for _, kinds in jobs)}개 렌더링")
+        return jobs
+
+    def record(self, artifacts: ArtifactInputs, jobs: Sequence[RenderJob], results: Sequence[Dict[str, Any]]) -> bool:
+        """생성에 성공한 산출물의 입력 해시를 매니페스트에 기록하고 저장"""
+        for (item, kinds), files in zip(jobs, results):
+            for kind in kinds:
+                if files.get(kind):
+                    relpath, inputs = artifacts[item][kind]
+                    self.manifest.record(relpath, inputs)
+        return self.manifest.save()
+
+    def build(self, render: Callable[[RenderJob], Dict[str, Any]], artifacts: ArtifactInputs,
+              changed_only: bool = False, max_workers: Optional[int] = None) -> Dict[Any, Dict[str, Any]]:
+        """plan → render_all → record. 렌더링한 항목별 결과 {항목: {종류: 결과}}
+
+        render는 (항목, 종류들) 작업을 받아 {종류: 결과}를 반환 (결과가 거짓이면 매니페스트에 기록하지 않음).
+        """
+        jobs = self.plan(artifacts, changed_only)
+        results = self.render_all(render, jobs, max_workers)
+        self.record(artifacts, jobs, results)
+        return {item: files for (item, _), files in zip(jobs, results)}
@@ -8,8 +8,13 @@ import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 import os
+import sys
 from dotenv import load_dotenv
 
+# backend 모듈 (비동기 수집 엔진) 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+from naver_async_collector import AIOHTTP_AVAILABLE, NaverAsyncCollector, naver_quota, run_sync
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -45,6 +50,10 @@ class NaverNewsCollector:
             "sort": sort
         }
         
+        if not naver_quota.try_consume("news"):
+            print("뉴스 API 일일 호출 예산이 소진되었습니다.")
+            return {}
+        
         try:
             response = requests.get(self.base_url, headers=self.headers, params=params)
             response.raise_for_status()
@@ -64,40 +73,44 @@ class NaverNewsCollector:
         Returns:
             수집된 뉴스 목록
         """
-        all_news = []
-        
+        # (키워드, 날짜별 검색어) 목록 - 최근 N일간의 뉴스 수집
+        searches = []
         for keyword in keywords:
-            print(f"'{keyword}' 키워드로 뉴스 수집 중...")
-            
-            # 최근 N일간의 뉴스 수집
             for i in range(days):
                 date = datetime.now() - timedelta(days=i)
                 date_str = date.strftime("%Y%m%d")
-                
-                # 날짜별 검색
-                query = f"{keyword} {date_str}"
-                result = self.search_news(query, display=100, sort="date")
-                
-                if "items" in result:
-                    for item in result["items"]:
-                        # 중복 제거를 위한 ID 생성
-                        news_id = f"{item['title']}_{item['pubDate']}"
-                        
-                        news_item = {
-                            "id": news_id,
-                            "title": item["title"],
-                            "description": item["description"],
-                            "link": item["link"],
-                            "pubDate": item["pubDate"],
-                            "keyword": keyword,
-                            "collected_at": datetime.now().isoformat()
-                        }
-                        
-                        all_news.append(news_item)
+                searches.append((keyword, f"{keyword} {date_str}"))
+        
+        if AIOHTTP_AVAILABLE:
+            print(f"{len(searches)}개 검색어 동시 수집 중...")
+            results = run_sync(self._search_many([query for _, query in searches]))
+        else:
+            results = []
+            for keyword, query in searches:
+                print(f"'{query}' 검색 중...")
+                results.append(self.search_news(query, display=100, sort="date"))
                 
                 # API 호출 제한을 위한 대기
                 time.sleep(0.1)
         
+        all_news = []
+        for (keyword, _), result in zip(searches, results):
+            for item in (result or {}).get("items", []):
+                # 중복 제거를 위한 ID 생성
+                news_id = f"{item['title']}_{item['pubDate']}"
+                
+                news_item = {
+                    "id": news_id,
+                    "title": item["title"],
+                    "description": item["description"],
+                    "link": item["link"],
+                    "pubDate": item["pubDate"],
+                    "keyword": keyword,
+                    "collected_at": datetime.now().isoformat()
+                }
+                
+                all_news.append(news_item)
+        
         # 중복 제거
         unique_news = []
         seen_ids = set()
@@ -110,6 +123,13 @@ class NaverNewsCollector:
         print(f"총 {len(unique_news)}개의 뉴스를 수집했습니다.")
         return unique_news
     
+    async def _search_many(self, queries: List[str]) -> List[Dict[str, Any]]:
+        """연결 풀/호출 예산을 공유하는 비동기 수집기로 동시 검색"""
+        async with NaverAsyncCollector(self.client_id, self.client_secret) as collector:
+            results = await collector.search_news_many(queries, display=100, sort="date")
+            print(f"비동기 수집 통계: {collector.get_stats()}")
+        return results
+    
     def save_to_json(self, news_list: List[Dict[str, Any]], filename: str = None):
         """뉴스 데이터를 JSON 파일로 저장"""
         if filename is None: